@@ -17,14 +17,17 @@ _src = os.path.join(_project_root, "src")
 if _src not in sys.path:
     sys.path.insert(0, _src)
 
+from football_engine.infrastructure.db.async_session import sync_database_url
 from football_engine.infrastructure.db.models import Base
 
 config = context.config
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
-# Prefer DATABASE_URL env; else use alembic.ini sqlalchemy.url
-database_url = os.environ.get("DATABASE_URL") or config.get_main_option("sqlalchemy.url")
+# Prefer DATABASE_URL env; else use alembic.ini sqlalchemy.url. Async URLs migrate via the sync driver.
+database_url = sync_database_url(
+    os.environ.get("DATABASE_URL") or config.get_main_option("sqlalchemy.url")
+)
 config.set_main_option("sqlalchemy.url", database_url)
 
 target_metadata = Base.metadata
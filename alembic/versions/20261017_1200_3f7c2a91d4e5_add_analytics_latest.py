@@ -0,0 +1,50 @@
+"""add analytics_latest
+
+Revision ID: 3f7c2a91d4e5
+Revises: 140984494088
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '3f7c2a91d4e5'
+down_revision: Union[str, Sequence[str], None] = '140984494088'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COLUMNS = (
+    "match_id, snapshot_id, period, minute, second, features_by_window, derived_metrics, "
+    "deltas, why, model_version, created_at_utc"
+)
+
+
+def upgrade() -> None:
+    op.create_table('analytics_latest',
+    sa.Column('match_id', sa.String(length=64), nullable=False),
+    sa.Column('snapshot_id', sa.String(length=64), nullable=False),
+    sa.Column('period', sa.Integer(), nullable=False),
+    sa.Column('minute', sa.Integer(), nullable=False),
+    sa.Column('second', sa.Integer(), nullable=False),
+    sa.Column('features_by_window', sa.JSON(), nullable=False),
+    sa.Column('derived_metrics', sa.JSON(), nullable=False),
+    sa.Column('deltas', sa.JSON(), nullable=False),
+    sa.Column('why', sa.JSON(), nullable=False),
+    sa.Column('model_version', sa.String(length=32), nullable=False),
+    sa.Column('created_at_utc', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['match_id'], ['matches.match_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('match_id')
+    )
+    # Backfill: newest history row per match
+    op.execute(
+        f"INSERT INTO analytics_latest ({_COLUMNS}) "
+        f"SELECT {_COLUMNS} FROM analytics_snapshots "
+        "WHERE id IN (SELECT MAX(id) FROM analytics_snapshots GROUP BY match_id)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('analytics_latest')
@@ -0,0 +1,45 @@
+"""add clock_seconds and clock_key to events and analytics_snapshots
+
+Revision ID: 8b1d5e07c3a2
+Revises: 3f7c2a91d4e5
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '8b1d5e07c3a2'
+down_revision: Union[str, Sequence[str], None] = '3f7c2a91d4e5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match football_engine.domain.value_objects.PERIOD_STRIDE_SECONDS
+_PERIOD_STRIDE_SECONDS = 10000
+_TABLES = ('events', 'analytics_snapshots')
+
+
+def upgrade() -> None:
+    for table in _TABLES:
+        op.add_column(table, sa.Column('clock_seconds', sa.Integer(), nullable=True))
+        op.add_column(table, sa.Column('clock_key', sa.Integer(), nullable=True))
+        op.execute(
+            f"UPDATE {table} SET clock_seconds = minute * 60 + second, "
+            f"clock_key = period * {_PERIOD_STRIDE_SECONDS} + minute * 60 + second"
+        )
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column('clock_seconds', existing_type=sa.Integer(), nullable=False)
+            batch_op.alter_column('clock_key', existing_type=sa.Integer(), nullable=False)
+    op.create_index('ix_events_match_period_clock', 'events', ['match_id', 'period', 'clock_seconds'], unique=False)
+    op.create_index('ix_analytics_snapshots_match_period_clock', 'analytics_snapshots', ['match_id', 'period', 'clock_seconds'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_analytics_snapshots_match_period_clock', table_name='analytics_snapshots')
+    op.drop_index('ix_events_match_period_clock', table_name='events')
+    for table in _TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column('clock_key')
+            batch_op.drop_column('clock_seconds')
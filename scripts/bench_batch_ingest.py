@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Benchmark single-event vs batch ingest on a file-backed SQLite database (in-process app)."""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from fastapi.testclient import TestClient
+
+from football_engine.api.dependencies.session import get_session_factory
+from football_engine.infrastructure.db.models import Base
+from football_engine.infrastructure.db.session import create_engine_and_factory
+from football_engine.main import app
+
+_TYPES = ("SHOT", "SHOT_ON_TARGET", "CORNER", "FOUL", "SHOT", "CORNER", "YELLOW", "SUB")
+
+
+def _burst(match_id: str, count: int) -> list[dict]:
+    """Dense burst of events spread over one half, in clock order."""
+    events = []
+    for i in range(count):
+        seconds = i * 2700 // count
+        events.append(
+            {
+                "event_id": f"{match_id}-ev-{i}",
+                "match_id": match_id,
+                "clock": {"period": 1, "minute": seconds // 60, "second": seconds % 60},
+                "team_side": "HOME" if i % 3 else "AWAY",
+                "event_type": _TYPES[i % len(_TYPES)],
+                "payload": {"xg": 0.12} if _TYPES[i % len(_TYPES)] == "SHOT" else None,
+            }
+        )
+    return events
+
+
+def _run(client: TestClient, match_id: str, events: list[dict], batch_size: int) -> float:
+    client.post(
+        "/api/v1/matches", json={"match_id": match_id, "home_team": "H", "away_team": "A"}
+    )
+    start = time.perf_counter()
+    if batch_size <= 1:
+        for e in events:
+            r = client.post("/api/v1/events", json=e)
+            r.raise_for_status()
+    else:
+        for i in range(0, len(events), batch_size):
+            r = client.post("/api/v1/events:batch", json={"events": events[i : i + batch_size]})
+            r.raise_for_status()
+    return len(events) / (time.perf_counter() - start)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare single vs batch ingest throughput")
+    parser.add_argument("--events", type=int, default=1000, help="Events per run")
+    parser.add_argument("--batch-size", type=int, default=100, help="Events per batch request")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine, factory = create_engine_and_factory(f"sqlite:///{tmp}/bench.db")
+        Base.metadata.create_all(engine)
+
+        app.dependency_overrides[get_session_factory] = lambda: factory
+        try:
+            client = TestClient(app)
+            single = _run(client, "bench-single", _burst("bench-single", args.events), 1)
+            batch = _run(
+                client, "bench-batch", _burst("bench-batch", args.events), args.batch_size
+            )
+        finally:
+            app.dependency_overrides.pop(get_session_factory, None)
+            engine.dispose()
+
+    print(f"single-event ingest: {single:10.1f} events/sec")
+    print(f"batch ingest ({args.batch_size:>4}): {batch:10.1f} events/sec")
+    print(f"speedup:             {batch / single:10.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
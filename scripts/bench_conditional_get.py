@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Benchmark polling GET /matches/{id}/state: uncached vs cached body vs If-None-Match 304.
+
+"uncached" clears the match and response caches before every request, which is what each
+poll cost before: a query, the DTO and its encoding. Times include the in-process
+TestClient round trip, which is the floor for all three.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare polling costs of the state read")
+    parser.add_argument("--requests", type=int, default=500, help="GETs per variant")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["DATABASE_URL"] = f"sqlite:///{tmp}/bench.db"
+        os.environ["WARM_CACHES_ON_STARTUP"] = "false"
+        from fastapi.testclient import TestClient
+
+        from football_engine.api.app_factory import create_app
+        from football_engine.infrastructure.db.models import Base
+
+        app = create_app()
+        container = app.state.container
+        Base.metadata.create_all(container.session_factory.kw["bind"])
+        client = TestClient(app)
+        client.post("/api/v1/matches", json={"match_id": "m1", "home_team": "H", "away_team": "A"})
+        client.post(
+            "/api/v1/events",
+            json={
+                "event_id": "e1",
+                "match_id": "m1",
+                "clock": {"period": 1, "minute": 1, "second": 0},
+                "team_side": "HOME",
+                "event_type": "SHOT",
+            },
+        )
+        etag = client.get("/api/v1/matches/m1/state").headers["etag"]
+
+        def _uncached() -> None:
+            container.match_cache.clear()
+            container.response_cache.clear()
+
+        variants = {
+            "uncached (query + encode)": ({}, _uncached, 200),
+            "cached body": ({}, None, 200),
+            "If-None-Match -> 304": ({"If-None-Match": etag}, None, 304),
+        }
+        print(f"{args.requests} GET /api/v1/matches/m1/state per variant")
+        for name, (headers, before, status) in variants.items():
+            elapsed = 0.0
+            for _ in range(args.requests):
+                if before is not None:
+                    before()
+                start = time.perf_counter()
+                r = client.get("/api/v1/matches/m1/state", headers=headers)
+                elapsed += time.perf_counter() - start
+                assert r.status_code == status, r.status_code
+            print(
+                f"{name:28s} {elapsed * 1000 / args.requests:7.3f} ms/request  "
+                f"body {len(r.content):4d} B"
+            )
+        container.ingest_pipeline.shutdown(wait=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Benchmark event dedup under feed replays: probe-then-insert vs INSERT ... ON CONFLICT DO NOTHING.
+
+Providers resend whole feeds, so most writes are duplicates. Each run stores one feed
+and then replays it; every event is its own transaction (per-event path) or each
+replay chunk is one transaction (bulk path).
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from football_engine.domain.entities import Event, Match
+from football_engine.domain.enums import EventType, MatchStatus, TeamSide
+from football_engine.domain.value_objects import MatchClock, Score
+from football_engine.infrastructure.db.models import Base
+from football_engine.infrastructure.db.session import create_engine_and_factory
+from football_engine.infrastructure.mappers.match_mapper import match_to_orm
+from football_engine.infrastructure.repositories import event_repository_impl
+from football_engine.infrastructure.repositories.event_repository_impl import EventRepositoryImpl
+
+
+def _feed(match_id: str, count: int) -> list[Event]:
+    now = datetime.now(timezone.utc)
+    return [
+        Event(
+            event_id=f"{match_id}-ev-{i}",
+            match_id=match_id,
+            provider_name="bench",
+            provider_event_id=str(i),
+            clock=MatchClock(
+                period=1, minute=(i * 2700 // count) // 60, second=(i * 2700 // count) % 60
+            ),
+            team_side=TeamSide.HOME if i % 3 else TeamSide.AWAY,
+            event_type=EventType.SHOT,
+            payload={"xg": 0.1},
+            ingested_at_utc=now,
+        )
+        for i in range(count)
+    ]
+
+
+def _match(match_id: str) -> Match:
+    return Match(
+        match_id=match_id,
+        home_team="H",
+        away_team="A",
+        status=MatchStatus.LIVE,
+        clock=MatchClock(period=1, minute=0, second=0),
+        score=Score(home=0, away=0),
+        home_red_cards=0,
+        away_red_cards=0,
+        version=1,
+    )
+
+
+def _run(factory, match_id: str, events: int, replays: int, chunk: int) -> tuple[float, int]:
+    """Returns (writes/sec, inserted) over the initial feed plus replays."""
+    with factory() as db:
+        db.add(match_to_orm(_match(match_id)))
+        db.commit()
+    feed = _feed(match_id, events)
+    inserted = 0
+    start = time.perf_counter()
+    for _ in range(replays + 1):
+        if chunk <= 1:
+            for e in feed:
+                with factory() as db:
+                    inserted += EventRepositoryImpl(db).add_event_if_new(e)
+                    db.commit()
+        else:
+            for i in range(0, len(feed), chunk):
+                with factory() as db:
+                    inserted += len(EventRepositoryImpl(db).add_events_if_new(feed[i : i + chunk]))
+                    db.commit()
+    return events * (replays + 1) / (time.perf_counter() - start), inserted
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare dedup strategies on replayed feeds")
+    parser.add_argument("--events", type=int, default=1000, help="Events per feed")
+    parser.add_argument("--replays", type=int, default=4, help="Times the whole feed is resent")
+    parser.add_argument("--chunk", type=int, default=200, help="Events per bulk call")
+    args = parser.parse_args()
+
+    results: dict[str, tuple[float, int]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        engine, factory = create_engine_and_factory(f"sqlite:///{tmp}/bench.db")
+        Base.metadata.create_all(engine)
+        original = event_repository_impl.supports_insert_if_new
+        try:
+            # Probe-then-insert: the path used on dialects without ON CONFLICT ... RETURNING
+            event_repository_impl.supports_insert_if_new = lambda _: False
+            results["probe+insert, per event"] = _run(
+                factory, "probe-1", args.events, args.replays, 1
+            )
+            results["probe+insert, bulk"] = _run(
+                factory, "probe-n", args.events, args.replays, args.chunk
+            )
+        finally:
+            event_repository_impl.supports_insert_if_new = original
+        results["on conflict, per event"] = _run(
+            factory, "conflict-1", args.events, args.replays, 1
+        )
+        results["on conflict, bulk"] = _run(
+            factory, "conflict-n", args.events, args.replays, args.chunk
+        )
+        engine.dispose()
+
+    print(
+        f"{args.events} events, {args.replays} replays ({args.replays / (args.replays + 1):.0%} duplicates)"
+    )
+    for name, (rate, inserted) in results.items():
+        print(f"{name:26s} {rate:10.1f} writes/sec  inserted={inserted}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""Measure memory allocated per ingested event with tracemalloc.
+
+"compute" is the in-memory hot path of an ingest: fold the event into window state and
+compute the snapshot against the previous one. "render" turns that snapshot into the API
+dict. "ingest" is a whole IngestEventService.ingest on SQLite, persistence included. Each
+prints the peak bytes allocated above the starting point per event; "kept" is what one
+snapshot keeps alive (what analytics_latest caches and the next ingest diffs against).
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from football_engine.application.dto.match_state_dto import analytics_snapshot_to_dto
+from football_engine.application.services import IngestEventService
+from football_engine.domain.entities import Event, Match
+from football_engine.domain.enums import EventType, MatchStatus, TeamSide
+from football_engine.domain.services import AnalyticsEngine
+from football_engine.domain.value_objects import MatchClock, Score, parse_windows
+from football_engine.infrastructure.db.models import Base
+from football_engine.infrastructure.db.session import create_engine_and_factory, session_scope
+from football_engine.infrastructure.mappers.match_mapper import match_to_orm
+from football_engine.infrastructure.repositories.analytics_repository_impl import (
+    AnalyticsRepositoryImpl,
+)
+from football_engine.infrastructure.repositories.event_repository_impl import EventRepositoryImpl
+from football_engine.infrastructure.repositories.match_repository_impl import MatchRepositoryImpl
+
+
+def _events(match_id: str, count: int, rng: random.Random) -> list[Event]:
+    now = datetime.now(timezone.utc)
+    events = []
+    for i in range(count):
+        sec = i * 2700 // count
+        event_type = rng.choice(list(EventType))
+        events.append(
+            Event(
+                event_id=f"{match_id}-ev-{i}",
+                match_id=match_id,
+                provider_name="bench",
+                provider_event_id=str(i),
+                clock=MatchClock(period=1, minute=sec // 60, second=sec % 60),
+                team_side=rng.choice(list(TeamSide)),
+                event_type=event_type,
+                payload={"xg": 0.12} if event_type == EventType.SHOT else None,
+                ingested_at_utc=now,
+            )
+        )
+    return events
+
+
+def _match(match_id: str) -> Match:
+    return Match(
+        match_id=match_id,
+        home_team="H",
+        away_team="A",
+        status=MatchStatus.LIVE,
+        clock=MatchClock(period=1, minute=0, second=0),
+        score=Score(home=0, away=0),
+        home_red_cards=0,
+        away_red_cards=0,
+        version=1,
+    )
+
+
+def _peak_per_event(steps, events: list[Event]) -> list[float]:
+    """Mean peak bytes allocated above the pre-call level, per event, for each step in turn.
+
+    steps are called in order with the event and the previous step's result.
+    """
+    totals = [0] * len(steps)
+    for e in events:
+        result = e
+        for i, step in enumerate(steps):
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            result = step(e, result)
+            totals[i] += tracemalloc.get_traced_memory()[1] - before
+        del result
+    return [total / len(events) for total in totals]
+
+
+def _retained(make, count: int) -> float:
+    """Mean bytes kept alive per object returned by make()."""
+    start = tracemalloc.take_snapshot()
+    kept = [make() for _ in range(count)]
+    stats = tracemalloc.take_snapshot().compare_to(start, "filename")
+    del kept
+    return sum(s.size_diff for s in stats) / count
+
+
+def _analytics(events: list[Event], windows) -> tuple[float, float, float]:
+    engine = AnalyticsEngine(windows=windows)
+    match = _match("m1")
+    state = {"previous": None}
+    engine.rebuild_windows(match.match_id, events[0].clock, [])
+
+    def compute(e: Event, _):
+        features = engine.observe(match.match_id, [e], e.clock)
+        snapshot = engine.compute_from_features(match, features, e.clock, state["previous"])
+        state["previous"] = snapshot
+        return snapshot
+
+    def render(e: Event, snapshot):
+        return analytics_snapshot_to_dto(snapshot)
+
+    compute(events[0], None)
+    compute_peak, render_peak = _peak_per_event([compute, render], events[1:])
+    last = events[-1].clock
+    features = engine.observe(match.match_id, [], last)
+    retained = _retained(
+        lambda: engine.compute_from_features(match, features, last, state["previous"]), 200
+    )
+    return compute_peak, render_peak, retained
+
+
+def _ingest(events: list[Event], windows) -> float:
+    with tempfile.TemporaryDirectory() as tmp:
+        db_engine, factory = create_engine_and_factory(f"sqlite:///{tmp}/bench.db")
+        Base.metadata.create_all(db_engine)
+        with session_scope(factory) as db:
+            db.add(match_to_orm(_match("m1")))
+        engine = AnalyticsEngine(windows=windows)
+
+        def step(e: Event, _) -> None:
+            with session_scope(factory) as db:
+                IngestEventService(
+                    MatchRepositoryImpl(db),
+                    EventRepositoryImpl(db),
+                    AnalyticsRepositoryImpl(db),
+                    engine,
+                ).ingest(e)
+
+        step(events[0], None)
+        (peak,) = _peak_per_event([step], events[1:])
+        db_engine.dispose()
+    return peak
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Allocations per ingested event")
+    parser.add_argument("--events", type=int, default=600, help="Events in the stream")
+    parser.add_argument("--windows", default="5m,10m", help="Analytics windows, e.g. 5m,10m,half")
+    args = parser.parse_args()
+
+    events = _events("m1", args.events, random.Random(25))
+    windows = parse_windows(args.windows)
+    tracemalloc.start()
+    compute, render, retained = _analytics(events, windows)
+    print(f"{args.events} events, windows {args.windows}")
+    print(f"compute  {compute / 1024:6.2f} KiB peak/event  kept {retained / 1024:.2f} KiB/snapshot")
+    print(f"render   {render / 1024:6.2f} KiB peak/event")
+    print(f"ingest   {_ingest(events, windows) / 1024:6.2f} KiB peak/event")
+    tracemalloc.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
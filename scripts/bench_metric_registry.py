@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Benchmark derived metrics per snapshot: computing every metric vs selective recompute.
+
+Each event of a 90-minute match is folded into window state and the metrics evaluated, as
+on the ingest hot path. "all" computes every metric (a registry of cheap metrics);
+"selective" declares the same metrics expensive, so window state tracks changed features
+and only metrics whose inputs changed are recomputed. The "+ slow" rows add a plug-in
+metric that costs about --slow-us microseconds. Values are checked to be identical.
+"""
+
+import argparse
+import random
+import sys
+import time
+from dataclasses import replace
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from football_engine.domain.entities import Event, Match
+from football_engine.domain.enums import EventType, MatchStatus, TeamSide
+from football_engine.domain.services import DEFAULT_WINDOWS
+from football_engine.domain.services.metric_registry import (
+    Metric,
+    MetricEvaluator,
+    MetricRegistry,
+)
+from football_engine.domain.services.metrics_v1 import V1_METRICS
+from football_engine.domain.services.window_state import WindowStateStore
+from football_engine.domain.value_objects import MatchClock, Score
+
+
+def _events(count: int, rng: random.Random) -> list[Event]:
+    now = datetime.now(timezone.utc)
+    half = count // 2
+    events = []
+    for n in range(count):
+        period, seconds = (1, n * 2700 // half) if n < half else (2, (n - half) * 2700 // half)
+        event_type = rng.choice(list(EventType))
+        events.append(
+            Event(
+                event_id=f"e{n}",
+                match_id="m1",
+                provider_name="bench",
+                provider_event_id=None,
+                clock=MatchClock(period=period, minute=seconds // 60, second=seconds % 60),
+                team_side=rng.choice(list(TeamSide)),
+                event_type=event_type,
+                payload={"xg": 0.12} if event_type == EventType.SHOT else None,
+                ingested_at_utc=now,
+            )
+        )
+    return events
+
+
+def _slow_metric(cost_us: float) -> Metric:
+    def _compute(features, match, inputs):
+        deadline = time.perf_counter() + cost_us / 1e6
+        while time.perf_counter() < deadline:
+            pass
+        return {"HOME": inputs["momentum"]["HOME"], "AWAY": inputs["momentum"]["AWAY"]}
+
+    return Metric("slow_model", _compute, depends_on=("momentum",))
+
+
+def _selective(registry: MetricRegistry) -> MetricRegistry:
+    return MetricRegistry(replace(m, expensive=True) for m in registry.metrics)
+
+
+def _run(registry: MetricRegistry, events: list[Event], match: Match) -> tuple:
+    """(µs per snapshot folding window state, evaluating metrics; values; recompute ratio)."""
+    store = WindowStateStore(DEFAULT_WINDOWS, track_changes=registry.selective)
+    evaluator = MetricEvaluator(registry)
+    store.rebuild(match.match_id, MatchClock(period=1, minute=0, second=0), [])
+    values = []
+    fold = evaluate = 0.0
+    for e in events:
+        start = time.perf_counter()
+        features = store.observe(match.match_id, [e], e.clock)
+        changes = store.changes(match.match_id, features) if registry.selective else None
+        folded = time.perf_counter()
+        values.append(evaluator.evaluate(features, match, changes))
+        evaluate += time.perf_counter() - folded
+        fold += folded - start
+    per_event = 1e6 / len(events)
+    ratio = evaluator.counters()["recompute_ratio"]
+    return fold * per_event, evaluate * per_event, values, ratio
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Metric evaluation per snapshot")
+    parser.add_argument("--events", type=int, default=1500, help="Events in the match")
+    parser.add_argument("--rounds", type=int, default=5, help="Replays of the match (best of)")
+    parser.add_argument("--slow-us", type=float, default=50.0, help="Cost of the slow metric")
+    args = parser.parse_args()
+
+    events = _events(args.events, random.Random(24))
+    match = Match(
+        match_id="m1",
+        home_team="H",
+        away_team="A",
+        status=MatchStatus.LIVE,
+        clock=MatchClock(period=1, minute=0, second=0),
+        score=Score(home=0, away=0),
+        home_red_cards=0,
+        away_red_cards=0,
+        version=1,
+    )
+    slow = _slow_metric(args.slow_us)
+    slow_expensive = replace(slow, expensive=True)
+    cases = [
+        ("v1, all", V1_METRICS),
+        ("v1, selective", _selective(V1_METRICS)),
+        ("v1 + slow, all", V1_METRICS.with_metrics(slow)),
+        ("v1 + slow, selective", V1_METRICS.with_metrics(slow_expensive)),
+    ]
+
+    print(f"{args.events} events, µs per snapshot, best of {args.rounds}")
+    print(f"{'':22s} {'window state':>12s} {'metrics':>8s}")
+    baseline = None
+    for label, registry in cases:
+        runs = [_run(registry, events, match) for _ in range(args.rounds)]
+        fold = min(run[0] for run in runs)
+        evaluate = min(run[1] for run in runs)
+        _, _, values, ratio = runs[0]
+        if baseline is None or len(values[0]) != len(baseline[0]):
+            baseline = values
+        assert values == baseline, f"{label}: values differ"
+        print(f"{label:22s} {fold:12.2f} {evaluate:8.2f}  (recompute ratio {ratio:.2f})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
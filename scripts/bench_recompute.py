@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Benchmark recomputing a full 90-minute match: replay through ingest vs prefix-sum timeline.
+
+"replay" feeds every stored event through IngestEventService in its own unit of work on an
+empty copy of the match, which is how history was recomputed before. "recompute" is
+RecomputeMatchService: one event read, prefix sums, one bulk insert.
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from football_engine.application.services import IngestEventService, RecomputeMatchService
+from football_engine.domain.entities import Event, Match
+from football_engine.domain.enums import EventType, MatchStatus, TeamSide
+from football_engine.domain.services import AnalyticsEngine
+from football_engine.domain.services.snapshot_timeline import TimelineMode
+from football_engine.domain.value_objects import MatchClock, Score
+from football_engine.infrastructure.db.models import Base
+from football_engine.infrastructure.db.session import create_engine_and_factory, session_scope
+from football_engine.infrastructure.repositories.analytics_repository_impl import (
+    AnalyticsRepositoryImpl,
+)
+from football_engine.infrastructure.repositories.event_repository_impl import EventRepositoryImpl
+from football_engine.infrastructure.repositories.match_repository_impl import MatchRepositoryImpl
+
+
+def _events(match_id: str, count: int, rng: random.Random) -> list[Event]:
+    now = datetime.now(timezone.utc)
+    half = count // 2
+    events = []
+    for i in range(count):
+        period, j = (1, i) if i < half else (2, i - half)
+        sec = j * 2820 // half
+        event_type = rng.choice(list(EventType))
+        events.append(
+            Event(
+                event_id=f"{match_id}-ev-{i}",
+                match_id=match_id,
+                provider_name="bench",
+                provider_event_id=str(i),
+                clock=MatchClock(period=period, minute=sec // 60, second=sec % 60),
+                team_side=rng.choice(list(TeamSide)),
+                event_type=event_type,
+                payload={"xg": 0.12} if event_type == EventType.SHOT else None,
+                ingested_at_utc=now,
+            )
+        )
+    return events
+
+
+def _match(match_id: str) -> Match:
+    return Match(
+        match_id=match_id,
+        home_team="H",
+        away_team="A",
+        status=MatchStatus.SCHEDULED,
+        clock=MatchClock(period=1, minute=0, second=0),
+        score=Score(home=0, away=0),
+        home_red_cards=0,
+        away_red_cards=0,
+        version=1,
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare whole-match recompute strategies")
+    parser.add_argument("--events", type=int, default=1500, help="Events in the match")
+    args = parser.parse_args()
+
+    events = _events("m1", args.events, random.Random(22))
+    with tempfile.TemporaryDirectory() as tmp:
+        engine, factory = create_engine_and_factory(f"sqlite:///{tmp}/bench.db")
+        Base.metadata.create_all(engine)
+        with session_scope(factory) as db:
+            MatchRepositoryImpl(db).create_match(_match("m1"))
+
+        analytics = AnalyticsEngine()
+        start = time.perf_counter()
+        for e in events:
+            with session_scope(factory) as db:
+                IngestEventService(
+                    MatchRepositoryImpl(db),
+                    EventRepositoryImpl(db),
+                    AnalyticsRepositoryImpl(db),
+                    analytics,
+                ).ingest(e)
+        replay = (time.perf_counter() - start) * 1000
+
+        print(f"90-minute match, {args.events} events, SQLite file")
+        print(f"replay through ingest      {replay:9.1f} ms  ({args.events} snapshots)")
+        for mode in TimelineMode:
+            start = time.perf_counter()
+            with session_scope(factory) as db:
+                snapshots = RecomputeMatchService(
+                    MatchRepositoryImpl(db), EventRepositoryImpl(db), AnalyticsRepositoryImpl(db)
+                ).recompute("m1", f"bench-{mode.value}", mode)
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"recompute, {mode.value:8s}        {elapsed:9.1f} ms  ({len(snapshots)} snapshots)")
+        engine.dispose()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
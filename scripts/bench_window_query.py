@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""Benchmark the rolling-window event query: minute*60+second expression vs clock_seconds range.
+
+The expression form cannot use an index on the clock, so SQLite scans every event of
+the match. The clock_seconds form is a range seek on ix_events_match_period_clock.
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sqlalchemy import insert, select
+
+from football_engine.domain.entities import Event, Match
+from football_engine.domain.enums import EventType, MatchStatus, TeamSide
+from football_engine.domain.value_objects import MatchClock, RollingWindow, Score
+from football_engine.infrastructure.db.models import Base, EventModel
+from football_engine.infrastructure.db.session import create_engine_and_factory
+from football_engine.infrastructure.mappers.event_mapper import event_to_values
+from football_engine.infrastructure.mappers.match_mapper import match_to_orm
+from football_engine.infrastructure.repositories.event_repository_impl import EventRepositoryImpl
+
+
+def _events(match_id: str, count: int) -> list[Event]:
+    now = datetime.now(timezone.utc)
+    per_period = count // 2
+    events = []
+    for i in range(count):
+        period, j = (1, i) if i < per_period else (2, i - per_period)
+        sec = j * 2700 // per_period
+        events.append(
+            Event(
+                event_id=f"{match_id}-ev-{i}",
+                match_id=match_id,
+                provider_name="bench",
+                provider_event_id=str(i),
+                clock=MatchClock(period=period, minute=sec // 60, second=sec % 60),
+                team_side=TeamSide.HOME if i % 3 else TeamSide.AWAY,
+                event_type=EventType.SHOT,
+                payload={"xg": 0.1},
+                ingested_at_utc=now,
+            )
+        )
+    return events
+
+
+def _match(match_id: str) -> Match:
+    return Match(
+        match_id=match_id,
+        home_team="H",
+        away_team="A",
+        status=MatchStatus.LIVE,
+        clock=MatchClock(period=2, minute=45, second=0),
+        score=Score(home=0, away=0),
+        home_red_cards=0,
+        away_red_cards=0,
+        version=1,
+    )
+
+
+def _bounds(end: MatchClock, window: RollingWindow) -> tuple[int, int]:
+    """Same bounds as EventRepositoryImpl.list_events_in_window."""
+    return max(0, end.minute - window.minutes) * 60, end.total_seconds_in_period()
+
+
+def _expression_query(match_id: str, end: MatchClock, window: RollingWindow):
+    """The pre-clock_seconds query, kept here only for comparison."""
+    start_sec, end_sec = _bounds(end, window)
+    total = EventModel.minute * 60 + EventModel.second
+    return (
+        select(EventModel)
+        .where(
+            EventModel.match_id == match_id,
+            EventModel.period == end.period,
+            total >= start_sec,
+            total <= end_sec,
+        )
+        .order_by(EventModel.period, EventModel.minute, EventModel.second, EventModel.id)
+    )
+
+
+def _range_query(match_id: str, end: MatchClock, window: RollingWindow):
+    start_sec, end_sec = _bounds(end, window)
+    return (
+        select(EventModel)
+        .where(
+            EventModel.match_id == match_id,
+            EventModel.period == end.period,
+            EventModel.clock_seconds.between(start_sec, end_sec),
+        )
+        .order_by(EventModel.period, EventModel.clock_seconds, EventModel.id)
+    )
+
+
+def _plan(engine, stmt) -> list[str]:
+    compiled = stmt.compile(engine, compile_kwargs={"literal_binds": True})
+    with engine.connect() as conn:
+        return [row[-1] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}")]
+
+
+def _time(factory, stmt, queries: int) -> float:
+    """Mean milliseconds per query."""
+    with factory() as db:
+        start = time.perf_counter()
+        for _ in range(queries):
+            db.execute(stmt).scalars().all()
+        return (time.perf_counter() - start) * 1000 / queries
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare rolling-window query forms")
+    parser.add_argument("--events", type=int, default=10_000, help="Events per match")
+    parser.add_argument("--matches", type=int, default=1, help="Matches stored")
+    parser.add_argument("--queries", type=int, default=200, help="Queries per form")
+    args = parser.parse_args()
+
+    match_id = "bench-0"
+    end = MatchClock(period=2, minute=40, second=0)
+    window = RollingWindow(minutes=10)
+    with tempfile.TemporaryDirectory() as tmp:
+        engine, factory = create_engine_and_factory(f"sqlite:///{tmp}/bench.db")
+        Base.metadata.create_all(engine)
+        with factory() as db:
+            for m in range(args.matches):
+                mid = f"bench-{m}"
+                db.add(match_to_orm(_match(mid)))
+                db.flush()
+                db.execute(
+                    insert(EventModel), [event_to_values(e) for e in _events(mid, args.events)]
+                )
+            db.commit()
+        with engine.connect() as conn:
+            conn.exec_driver_sql("ANALYZE")
+
+        forms = {
+            "minute*60+second": _expression_query(match_id, end, window),
+            "clock_seconds range": _range_query(match_id, end, window),
+        }
+        with factory() as db:
+            expected = len(EventRepositoryImpl(db).list_events_in_window(match_id, end, window))
+        print(
+            f"{args.matches} match(es) x {args.events} events, {window.minutes}m window "
+            f"ending {end.period}:{end.minute:02d}:{end.second:02d} -> {expected} rows"
+        )
+        for name, stmt in forms.items():
+            with factory() as db:
+                rows = len(db.execute(stmt).scalars().all())
+            # ids only: isolates the index lookup from ORM row hydration
+            ids = stmt.with_only_columns(EventModel.id)
+            print(
+                f"{name:22s} {_time(factory, stmt, args.queries):8.3f} ms/query  "
+                f"ids only {_time(factory, ids, args.queries):7.3f} ms  rows={rows}"
+            )
+            for line in _plan(engine, stmt):
+                print(f"    plan: {line}")
+        engine.dispose()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""Microbenchmark WebSocket broadcast: send_json per subscriber vs one pre-encoded frame.
+
+Subscribers are in-process fakes with Starlette's send_json/send_text behaviour and a
+no-op transport, so the numbers are the server-side encode and dispatch cost only.
+A broadcast is timed until every subscriber's writer has sent the frame. The slow-client
+rows put one subscriber whose sends take --slow-ms first in line and time delivery to
+the others.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from football_engine.api.ws.v2 import payloads, stream_manager
+from football_engine.api.ws.v2.payloads import event_to_minimal_dto
+from football_engine.api.ws.v2.stream_manager import StreamManager
+from football_engine.application.dto import analytics_snapshot_to_dto, match_to_state_dto
+from football_engine.domain.entities import Event, Match
+from football_engine.domain.enums import EventType, MatchStatus, TeamSide
+from football_engine.domain.services import AnalyticsEngine
+from football_engine.domain.value_objects import MatchClock, Score
+
+_TYPES = (EventType.SHOT, EventType.CORNER, EventType.FOUL, EventType.SHOT_ON_TARGET)
+
+
+class _FakeWebSocket:
+    """send_json/send_text as in starlette.websockets.WebSocket, minus the transport."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.sent = 0
+        self._delay = delay
+
+    async def send(self, message: dict[str, Any]) -> None:
+        if self._delay:
+            await asyncio.sleep(self._delay)
+        self.sent += 1
+
+    async def send_text(self, data: str) -> None:
+        await self.send({"type": "websocket.send", "text": data})
+
+    async def send_json(self, data: Any) -> None:
+        text = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+        await self.send({"type": "websocket.send", "text": text})
+
+
+def _update() -> tuple[str, dict[str, Any], dict[str, Any], dict[str, Any]]:
+    """A realistic update: state and snapshot DTOs after a busy ten minutes."""
+    clock = MatchClock(period=1, minute=30, second=0)
+    match = Match(
+        match_id="bench",
+        home_team="Home FC",
+        away_team="Away United",
+        status=MatchStatus.LIVE,
+        clock=clock,
+        score=Score(home=1, away=0),
+        home_red_cards=0,
+        away_red_cards=0,
+        version=40,
+    )
+    now = datetime.now(timezone.utc)
+    events = [
+        Event(
+            event_id=f"ev-{i}",
+            match_id="bench",
+            provider_name="bench",
+            provider_event_id=str(i),
+            clock=MatchClock(period=1, minute=20 + i // 6, second=(i * 10) % 60),
+            team_side=TeamSide.HOME if i % 3 else TeamSide.AWAY,
+            event_type=_TYPES[i % len(_TYPES)],
+            payload={"xg": 0.1},
+            ingested_at_utc=now,
+        )
+        for i in range(60)
+    ]
+    snapshot = AnalyticsEngine().compute(match, events[30:], events, clock, None)
+    return (
+        "bench",
+        event_to_minimal_dto(events[-1]),
+        match_to_state_dto(match),
+        analytics_snapshot_to_dto(snapshot),
+    )
+
+
+async def _send_json_each(manager: StreamManager, match_id: str, *parts: Any) -> None:
+    """The previous broadcast loop: every subscriber encodes the payload again."""
+    event, match_state, analytics_latest = parts
+    payload = {
+        "type": "update",
+        "event": event,
+        "match_state": match_state,
+        "analytics_latest": analytics_latest,
+    }
+    for ws in manager._subscribers[match_id]:
+        await ws.send_json(payload)
+
+
+async def _time(
+    broadcast, manager: StreamManager, update: tuple, rounds: int, fast: list[_FakeWebSocket]
+) -> float:
+    """Mean milliseconds per broadcast, until every fast subscriber has sent it."""
+    start = time.perf_counter()
+    for i in range(1, rounds + 1):
+        await broadcast(manager, *update)
+        while any(ws.sent < i for ws in fast):
+            await asyncio.sleep(0)
+    return (time.perf_counter() - start) * 1000 / rounds
+
+
+async def _run(subscribers: int, rounds: int) -> dict[str, float]:
+    update = _update()
+    manager = StreamManager(send_queue_size=rounds)
+    fast = [_FakeWebSocket() for _ in range(subscribers)]
+    for ws in fast:
+        manager.subscribe(update[0], ws)
+    results = {
+        "send_json per subscriber": await _time(_send_json_each, manager, update, rounds, [])
+    }
+    for ws in fast:
+        ws.sent = 0
+    orjson = payloads.orjson
+    try:
+        payloads.orjson = None
+        results["encode once (json)"] = await _time(
+            StreamManager.broadcast, manager, update, rounds, fast
+        )
+    finally:
+        payloads.orjson = orjson
+    for ws in fast:
+        ws.sent = 0
+    if orjson is not None:
+        results["encode once (orjson)"] = await _time(
+            StreamManager.broadcast, manager, update, rounds, fast
+        )
+    return results
+
+
+async def _run_slow(subscribers: int, rounds: int, slow_ms: float) -> dict[str, float]:
+    update = _update()
+    manager = StreamManager(send_queue_size=8)
+    manager.subscribe(update[0], _FakeWebSocket(delay=slow_ms / 1000))
+    fast = [_FakeWebSocket() for _ in range(subscribers - 1)]
+    for ws in fast:
+        manager.subscribe(update[0], ws)
+    results = {
+        "1 slow, sequential sends": await _time(_send_json_each, manager, update, rounds, [])
+    }
+    for ws in fast:
+        ws.sent = 0
+    results["1 slow, queued fan-out"] = await _time(
+        StreamManager.broadcast, manager, update, rounds, fast
+    )
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare per-subscriber vs pre-encoded broadcast")
+    parser.add_argument(
+        "--subscribers", type=int, nargs="+", default=[20, 100, 1000], help="Subscriber counts"
+    )
+    parser.add_argument("--rounds", type=int, default=200, help="Broadcasts per measurement")
+    parser.add_argument("--slow-ms", type=float, default=20.0, help="Send time of the slow client")
+    args = parser.parse_args()
+
+    # Lift the connection limits; the fakes cost nothing to hold
+    stream_manager.MAX_CONNECTIONS_PER_MATCH = max(args.subscribers)
+    stream_manager.MAX_TOTAL_CONNECTIONS = max(args.subscribers)
+
+    _, event, match_state, analytics_latest = _update()
+    frame = payloads.encode_frame(
+        {
+            "type": "update",
+            "event": event,
+            "match_state": match_state,
+            "analytics_latest": analytics_latest,
+        }
+    )
+    print(f"payload ~{len(frame)} bytes, orjson {'on' if payloads.orjson else 'not installed'}")
+    for n in args.subscribers:
+        results = asyncio.run(_run(n, args.rounds))
+        baseline = results["send_json per subscriber"]
+        for name, ms in results.items():
+            print(f"{n:5d} subscribers  {name:26s} {ms:8.3f} ms/broadcast  x{baseline / ms:5.1f}")
+        slow = asyncio.run(_run_slow(n, max(1, args.rounds // 10), args.slow_ms))
+        for name, ms in slow.items():
+            print(f"{n:5d} subscribers  {name:26s} {ms:8.3f} ms/broadcast")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
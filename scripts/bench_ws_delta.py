@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Bytes per subscriber for a busy match: full updates vs delta mode with keyframes.
+
+Replays a synthetic match through the real AnalyticsEngine and StreamManager and counts
+the text each kind of subscriber receives.
+"""
+
+import argparse
+import asyncio
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from football_engine.api.ws.v2.payloads import event_to_minimal_dto
+from football_engine.api.ws.v2.stream_manager import StreamManager
+from football_engine.application.dto import analytics_snapshot_to_dto, match_to_state_dto
+from football_engine.domain.entities import Event, Match
+from football_engine.domain.enums import EventType, MatchStatus, TeamSide
+from football_engine.domain.services import AnalyticsEngine
+from football_engine.domain.value_objects import MatchClock, Score
+
+_TYPES = (
+    EventType.SHOT,
+    EventType.FOUL,
+    EventType.CORNER,
+    EventType.SHOT_ON_TARGET,
+    EventType.FOUL,
+    EventType.SUB,
+    EventType.YELLOW,
+    EventType.SHOT,
+)
+
+
+class _CountingWebSocket:
+    def __init__(self) -> None:
+        self.frames = 0
+        self.bytes = 0
+
+    async def send_text(self, data: str) -> None:
+        self.frames += 1
+        self.bytes += len(data.encode())
+
+
+def _events(count: int) -> list[Event]:
+    now = datetime.now(timezone.utc)
+    events = []
+    for i in range(count):
+        sec = i * 5400 // count
+        period, sec = (1, sec) if sec < 2700 else (2, sec - 2700)
+        event_type = EventType.GOAL if i % 97 == 96 else _TYPES[i % len(_TYPES)]
+        events.append(
+            Event(
+                event_id=f"ev-{i}",
+                match_id="bench",
+                provider_name="bench",
+                provider_event_id=str(i),
+                clock=MatchClock(period=period, minute=sec // 60, second=sec % 60),
+                team_side=TeamSide.HOME if i % 5 < 3 else TeamSide.AWAY,
+                event_type=event_type,
+                payload={"xg": 0.08} if event_type == EventType.SHOT else None,
+                ingested_at_utc=now,
+            )
+        )
+    return events
+
+
+def _in_window(events: list[Event], end: MatchClock, minutes: int) -> list[Event]:
+    end_sec = end.total_seconds_in_period()
+    return [
+        e
+        for e in events
+        if e.clock.period == end.period
+        and end_sec - minutes * 60 <= e.clock.total_seconds_in_period() <= end_sec
+    ]
+
+
+async def _run(count: int, keyframe_interval: int) -> tuple[_CountingWebSocket, _CountingWebSocket]:
+    manager = StreamManager(send_queue_size=count + 1, keyframe_interval=keyframe_interval)
+    full, delta = _CountingWebSocket(), _CountingWebSocket()
+    manager.subscribe("bench", full)
+    manager.subscribe("bench", delta)
+    manager.set_mode(delta, "delta")
+
+    engine = AnalyticsEngine()
+    match = Match(
+        match_id="bench",
+        home_team="Home FC",
+        away_team="Away United",
+        status=MatchStatus.LIVE,
+        clock=MatchClock(period=1, minute=0, second=0),
+        score=Score(home=0, away=0),
+        home_red_cards=0,
+        away_red_cards=0,
+        version=1,
+    )
+    seen: list[Event] = []
+    previous = None
+    for event in _events(count):
+        match = match.apply_event(event)
+        seen.append(event)
+        snapshot = engine.compute(
+            match,
+            _in_window(seen, event.clock, 5),
+            _in_window(seen, event.clock, 10),
+            event.clock,
+            previous,
+        )
+        previous = snapshot
+        await manager.broadcast(
+            "bench",
+            event_to_minimal_dto(event),
+            match_to_state_dto(match),
+            analytics_snapshot_to_dto(snapshot),
+        )
+        await asyncio.sleep(0)
+    for _ in range(5):
+        await asyncio.sleep(0)
+    manager.unsubscribe("bench", full)
+    manager.unsubscribe("bench", delta)
+    await asyncio.sleep(0)
+    return full, delta
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare full vs delta stream bandwidth")
+    parser.add_argument("--events", type=int, default=1500, help="Events in the match")
+    parser.add_argument("--keyframe-interval", type=int, default=20, help="Updates per keyframe")
+    args = parser.parse_args()
+
+    full, delta = asyncio.run(_run(args.events, args.keyframe_interval))
+    print(f"{args.events} updates, keyframe every {args.keyframe_interval}")
+    for name, ws in (("full", full), ("delta", delta)):
+        print(
+            f"{name:6s} {ws.frames:6d} frames {ws.bytes / 1024:10.1f} KiB "
+            f"{ws.bytes / ws.frames:8.0f} B/frame"
+        )
+    print(f"reduction x{full.bytes / delta.bytes:.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
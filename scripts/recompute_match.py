@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Recompute the snapshot history of finished matches under a new model version.
+
+Reads each match's events once and bulk-writes its whole timeline to analytics_snapshots
+(RecomputeMatchService). Rerunning with the same --model-version replaces that version's
+rows; live state and latest snapshots are not touched.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from football_engine.api.dependencies.container import AppSettings
+from football_engine.application.services import RecomputeMatchService
+from football_engine.domain.services.analytics_engine import MODEL_VERSION
+from football_engine.domain.services.snapshot_timeline import TimelineMode
+from football_engine.domain.value_objects import parse_windows
+from football_engine.infrastructure.db.async_session import sync_database_url
+from football_engine.infrastructure.db.session import create_session_factory, session_scope
+from football_engine.infrastructure.repositories.analytics_repository_impl import (
+    AnalyticsRepositoryImpl,
+)
+from football_engine.infrastructure.repositories.event_repository_impl import EventRepositoryImpl
+from football_engine.infrastructure.repositories.match_repository_impl import MatchRepositoryImpl
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Recompute match snapshot timelines offline")
+    parser.add_argument("match_ids", nargs="+", help="Matches to recompute")
+    parser.add_argument("--model-version", required=True, help="Version to write, e.g. v1-r2")
+    parser.add_argument(
+        "--mode",
+        choices=[m.value for m in TimelineMode],
+        default=TimelineMode.EVENTS.value,
+        help="Snapshot at every event clock (default) or every clock second",
+    )
+    parser.add_argument(
+        "--database-url", default=None, help="Defaults to DATABASE_URL / app settings"
+    )
+    args = parser.parse_args()
+    if args.model_version == MODEL_VERSION:
+        parser.error(f"--model-version must differ from the live model ({MODEL_VERSION})")
+
+    settings = AppSettings()
+    windows = parse_windows(settings.analytics_windows)
+    url = sync_database_url(args.database_url or settings.database_url)
+    factory = create_session_factory(url)
+    status = 0
+    for match_id in args.match_ids:
+        start = time.perf_counter()
+        with session_scope(factory) as db:
+            snapshots = RecomputeMatchService(
+                MatchRepositoryImpl(db),
+                EventRepositoryImpl(db),
+                AnalyticsRepositoryImpl(db),
+                windows,
+            ).recompute(match_id, args.model_version, TimelineMode(args.mode))
+        elapsed = (time.perf_counter() - start) * 1000
+        if snapshots is None:
+            print(f"{match_id}: not found", file=sys.stderr)
+            status = 1
+            continue
+        print(f"{match_id}: {len(snapshots)} snapshots as {args.model_version} in {elapsed:.1f} ms")
+    return status
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,20 +1,71 @@
 """FastAPI application factory."""
 
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import partial
+
 from fastapi import FastAPI
+from sqlalchemy.exc import SQLAlchemyError
 
-from football_engine.api.dependencies.container import build_container
+from football_engine.api.dependencies.container import build_container, forget_match
 from football_engine.api.http.v1.router import api_v1_router
+from football_engine.api.ws.v2.bus import BroadcastBackend, UnixDatagramBus
 from football_engine.api.ws.v2.routes import ws_v2_router
+from football_engine.api.ws.v2.stream_manager import get_stream_manager
+from football_engine.infrastructure.cache.warmup import warm_live_matches
+
+logger = logging.getLogger(__name__)
 
 
 def create_app() -> FastAPI:
     container = build_container()
+    stream_manager = get_stream_manager()
+    stream_manager.configure(
+        container.settings.ws_send_queue_size,
+        container.settings.ws_overflow_policy,
+        container.settings.ws_keyframe_interval,
+        container.settings.ws_replay_buffer_size,
+        container.settings.ws_replay_max_matches,
+    )
+
+    @asynccontextmanager
+    async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+        bus = None
+        if BroadcastBackend(container.settings.ws_broadcast_backend) == BroadcastBackend.UNIX:
+            bus = UnixDatagramBus(
+                container.settings.ws_bus_dir,
+                stream_manager.deliver,
+                match_changed=partial(forget_match, container),
+            )
+            bus.start()
+            stream_manager.set_bus(bus)
+        if container.settings.warm_caches_on_startup:
+            try:
+                await asyncio.to_thread(
+                    warm_live_matches,
+                    container.session_factory,
+                    container.match_cache,
+                    container.seen_event_ids,
+                    container.snapshot_cache,
+                    container.settings.seen_event_ids_per_match,
+                )
+            except SQLAlchemyError as e:
+                # Cold caches only cost DB round trips; never block startup on them
+                logger.warning(f"Cache warmup skipped: {e}")
+        yield
+        container.ingest_pipeline.shutdown(wait=True)
+        if bus is not None:
+            stream_manager.set_bus(None)
+            bus.close()
 
     app = FastAPI(
         title=container.settings.app_name,
         version="0.1.0",
         docs_url="/docs",
         redoc_url="/redoc",
+        lifespan=lifespan,
     )
 
     app.state.container = container
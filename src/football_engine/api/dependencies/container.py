@@ -4,8 +4,25 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from fastapi import Request
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from football_engine.application.services import (
+    IngestPipeline,
+    MatchVersionWaiters,
+    SnapshotCoalescer,
+)
+from football_engine.domain.enums import EventType
+from football_engine.domain.services import AnalyticsEngine
+from football_engine.domain.value_objects import parse_windows
+from football_engine.infrastructure.cache import (
+    EncodedResponseCache,
+    LatestSnapshotCache,
+    MatchCache,
+    SeenEventIds,
+)
+from football_engine.infrastructure.repositories.analytics_latest import SnapshotHistory
+
 
 class AppSettings(BaseSettings):
     app_name: str = "football-engine"
@@ -13,6 +30,50 @@ class AppSettings(BaseSettings):
     api_prefix: str = "/api/v1"
     log_level: str = "INFO"
     database_url: str = "sqlite:///./football_engine.db"
+    # Matches whose rolling-window state is kept in memory (LRU)
+    window_state_max_matches: int = 256
+    # Windows in features_by_window: Nm (any minutes), half (period so far), full (match so
+    # far). All come from one fetch of the widest; must include 5m and 10m (v1 metrics)
+    analytics_windows: str = "5m,10m"
+    # Write-through cache of live match state
+    match_cache_max_entries: int = 1024
+    match_cache_ttl_seconds: float = 300.0
+    # In-memory dedup filter (exact per-match event_id sets) and latest-snapshot cache
+    seen_event_ids_per_match: int = 50_000
+    seen_event_ids_max_matches: int = 256
+    snapshot_cache_max_entries: int = 1024
+    # Encoded state / analytics-latest response bodies (latest version per match)
+    response_cache_max_entries: int = 2048
+    # Upper bound on ?wait= for long-polls of match state
+    long_poll_max_wait_seconds: float = 60.0
+    # Warm caches and the dedup filter for live matches on startup
+    warm_caches_on_startup: bool = True
+    # Ingest pipeline: single-writer workers (matches are sharded across them)
+    ingest_workers: int = 4
+    ingest_max_pending_per_match: int = 1000
+    # Snapshot coalescing under bursts: off | debounce | clock_second
+    snapshot_coalescing: str = "off"
+    snapshot_debounce_ms: int = 50
+    # Event types that always compute (and broadcast) a snapshot at once; empty to disable
+    snapshot_force_flush_on: str = "GOAL,RED"
+    # Append-only analytics_snapshots history: all | sampled | off (latest reads never use it)
+    analytics_history_mode: str = "all"
+    analytics_history_sample_seconds: int = 60
+    # WebSocket fan-out: frames queued per subscriber, and what happens when a slow
+    # client's queue is full: drop_oldest | conflate | disconnect (close code 1013)
+    ws_send_queue_size: int = 64
+    ws_overflow_policy: str = "drop_oldest"
+    # Delta-mode WebSocket subscribers get a full keyframe every N updates
+    ws_keyframe_interval: int = 20
+    # Update frames kept per match for reconnects with ?since=<seq>, and matches kept
+    ws_replay_buffer_size: int = 256
+    ws_replay_max_matches: int = 256
+    # Broadcast to subscribers of this process only (local), or to every uvicorn worker
+    # sharing ws_bus_dir over Unix datagram sockets (unix)
+    ws_broadcast_backend: str = "local"
+    ws_bus_dir: str = "/tmp/football-engine-ws-bus"
+    # Idle Server-Sent Events streams get a comment line this often
+    sse_heartbeat_seconds: float = 15.0
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
 
@@ -21,11 +82,92 @@ class AppSettings(BaseSettings):
 class AppContainer:
     settings: AppSettings
     session_factory: object  # sessionmaker[Session]
+    async_session_factory: object | None  # async_sessionmaker[AsyncSession] for async URLs
+    analytics_engine: AnalyticsEngine
+    match_cache: MatchCache
+    seen_event_ids: SeenEventIds
+    snapshot_cache: LatestSnapshotCache
+    ingest_pipeline: IngestPipeline
+    snapshot_coalescer: SnapshotCoalescer
+    snapshot_history: SnapshotHistory
+    response_cache: EncodedResponseCache
+    version_waiters: MatchVersionWaiters
 
 
 def build_container() -> AppContainer:
+    from football_engine.infrastructure.db.async_session import (
+        create_async_engine_and_factory,
+        is_async_database_url,
+        sync_database_url,
+    )
     from football_engine.infrastructure.db.session import create_session_factory
 
     settings = AppSettings()
-    session_factory = create_session_factory(settings.database_url)
-    return AppContainer(settings=settings, session_factory=session_factory)
+    # An async driver URL (e.g. sqlite+aiosqlite) serves ingest and state/analytics reads
+    # natively on the event loop; the remaining sync routes use the same DB's sync driver.
+    session_factory = create_session_factory(sync_database_url(settings.database_url))
+    async_session_factory = None
+    if is_async_database_url(settings.database_url):
+        _, async_session_factory = create_async_engine_and_factory(settings.database_url)
+    analytics_engine = AnalyticsEngine(
+        max_window_states=settings.window_state_max_matches,
+        windows=parse_windows(settings.analytics_windows),
+    )
+    match_cache = MatchCache(
+        max_entries=settings.match_cache_max_entries,
+        ttl_seconds=settings.match_cache_ttl_seconds,
+    )
+    seen_event_ids = SeenEventIds(
+        max_ids_per_match=settings.seen_event_ids_per_match,
+        max_matches=settings.seen_event_ids_max_matches,
+    )
+    snapshot_cache = LatestSnapshotCache(max_entries=settings.snapshot_cache_max_entries)
+    ingest_pipeline = IngestPipeline(
+        workers=settings.ingest_workers,
+        max_pending_per_match=settings.ingest_max_pending_per_match,
+    )
+    snapshot_coalescer = SnapshotCoalescer(
+        mode=settings.snapshot_coalescing,
+        debounce_ms=settings.snapshot_debounce_ms,
+        force_flush_on=frozenset(
+            EventType(name.strip())
+            for name in settings.snapshot_force_flush_on.split(",")
+            if name.strip()
+        ),
+    )
+    snapshot_history = SnapshotHistory(
+        mode=settings.analytics_history_mode,
+        interval_seconds=settings.analytics_history_sample_seconds,
+    )
+    response_cache = EncodedResponseCache(max_entries=settings.response_cache_max_entries)
+    return AppContainer(
+        settings=settings,
+        session_factory=session_factory,
+        async_session_factory=async_session_factory,
+        analytics_engine=analytics_engine,
+        match_cache=match_cache,
+        seen_event_ids=seen_event_ids,
+        snapshot_cache=snapshot_cache,
+        ingest_pipeline=ingest_pipeline,
+        snapshot_coalescer=snapshot_coalescer,
+        snapshot_history=snapshot_history,
+        response_cache=response_cache,
+        version_waiters=MatchVersionWaiters(),
+    )
+
+
+def forget_match(container: AppContainer, match_id: str, version: int) -> None:
+    """Another worker committed match_id at version: drop what this process holds for it.
+
+    Cached Match, latest snapshot and window state are reloaded from the DB on next use
+    (encoded responses are keyed by those versions, so they miss too), and long-polls
+    parked here on an older version wake up.
+    """
+    container.match_cache.invalidate(match_id)
+    container.snapshot_cache.invalidate(match_id)
+    container.analytics_engine.invalidate_windows(match_id)
+    container.version_waiters.notify(match_id, version)
+
+
+def get_container(request: Request) -> AppContainer:
+    return request.app.state.container
@@ -1,19 +1,42 @@
-"""Build application services from request-scoped session."""
+"""Build application services from request-scoped session.
+
+Read services come from the async stack when DATABASE_URL selects an async driver;
+routes call them through `call_service`, which awaits async services natively and
+runs sync ones in the threadpool.
+"""
+
+import inspect
+from collections.abc import Callable
+from typing import Any
 
 from fastapi import Depends
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from football_engine.api.dependencies.session import get_db
+from football_engine.api.dependencies.container import AppContainer, get_container
+from football_engine.api.dependencies.session import get_async_db, get_db
 from football_engine.application.services import (
+    AsyncGetLatestAnalyticsService,
+    AsyncGetMatchStateService,
+    AsyncIngestEventService,
     CreateMatchService,
     GetLatestAnalyticsService,
     GetMatchStateService,
     IngestEventService,
 )
-from football_engine.domain.services import AnalyticsEngine
 from football_engine.infrastructure.repositories.analytics_repository_impl import (
     AnalyticsRepositoryImpl,
 )
+from football_engine.infrastructure.repositories.async_analytics_repository_impl import (
+    AsyncAnalyticsRepositoryImpl,
+)
+from football_engine.infrastructure.repositories.async_event_repository_impl import (
+    AsyncEventRepositoryImpl,
+)
+from football_engine.infrastructure.repositories.async_match_repository_impl import (
+    AsyncMatchRepositoryImpl,
+)
 from football_engine.infrastructure.repositories.event_repository_impl import (
     EventRepositoryImpl,
 )
@@ -22,26 +45,80 @@ from football_engine.infrastructure.repositories.match_repository_impl import (
 )
 
 
-def get_create_match_service(db: Session = Depends(get_db)) -> CreateMatchService:
-    return CreateMatchService(match_repository=MatchRepositoryImpl(db))
+def get_create_match_service(
+    db: Session = Depends(get_db),
+    container: AppContainer = Depends(get_container),
+) -> CreateMatchService:
+    return CreateMatchService(match_repository=MatchRepositoryImpl(db, container.match_cache))
+
+
+def get_ingest_event_service(
+    db: Session = Depends(get_db),
+    container: AppContainer = Depends(get_container),
+) -> IngestEventService:
+    return build_ingest_event_service(db, container)
 
 
-def get_ingest_event_service(db: Session = Depends(get_db)) -> IngestEventService:
-    match_repo = MatchRepositoryImpl(db)
-    event_repo = EventRepositoryImpl(db)
-    analytics_repo = AnalyticsRepositoryImpl(db)
-    engine = AnalyticsEngine()
+def build_ingest_event_service(db: Session, container: AppContainer) -> IngestEventService:
+    """Wire IngestEventService on a session; also used by ingest pipeline jobs."""
+    match_repo = MatchRepositoryImpl(db, container.match_cache)
+    event_repo = EventRepositoryImpl(db, container.seen_event_ids)
+    analytics_repo = AnalyticsRepositoryImpl(
+        db, container.snapshot_cache, container.snapshot_history
+    )
+    engine = container.analytics_engine
     return IngestEventService(
         match_repository=match_repo,
         event_repository=event_repo,
         analytics_repository=analytics_repo,
         analytics_engine=engine,
+        snapshot_coalescer=container.snapshot_coalescer,
+    )
+
+
+def build_async_ingest_event_service(
+    db: AsyncSession, container: AppContainer
+) -> AsyncIngestEventService:
+    """Wire AsyncIngestEventService on an async session."""
+    return AsyncIngestEventService(
+        match_repository=AsyncMatchRepositoryImpl(db, container.match_cache),
+        event_repository=AsyncEventRepositoryImpl(db, container.seen_event_ids),
+        analytics_repository=AsyncAnalyticsRepositoryImpl(
+            db, container.snapshot_cache, container.snapshot_history
+        ),
+        analytics_engine=container.analytics_engine,
+        snapshot_coalescer=container.snapshot_coalescer,
     )
 
 
-def get_state_service(db: Session = Depends(get_db)) -> GetMatchStateService:
-    return GetMatchStateService(match_repository=MatchRepositoryImpl(db))
+def get_state_service(
+    db: Session = Depends(get_db),
+    async_db: AsyncSession | None = Depends(get_async_db),
+    container: AppContainer = Depends(get_container),
+) -> GetMatchStateService | AsyncGetMatchStateService:
+    if async_db is not None:
+        return AsyncGetMatchStateService(
+            match_repository=AsyncMatchRepositoryImpl(async_db, container.match_cache)
+        )
+    return GetMatchStateService(match_repository=MatchRepositoryImpl(db, container.match_cache))
+
+
+def get_analytics_service(
+    db: Session = Depends(get_db),
+    async_db: AsyncSession | None = Depends(get_async_db),
+    container: AppContainer = Depends(get_container),
+) -> GetLatestAnalyticsService | AsyncGetLatestAnalyticsService:
+    if async_db is not None:
+        return AsyncGetLatestAnalyticsService(
+            analytics_repository=AsyncAnalyticsRepositoryImpl(async_db, container.snapshot_cache)
+        )
+    return GetLatestAnalyticsService(
+        analytics_repository=AnalyticsRepositoryImpl(db, container.snapshot_cache)
+    )
 
 
-def get_analytics_service(db: Session = Depends(get_db)) -> GetLatestAnalyticsService:
-    return GetLatestAnalyticsService(analytics_repository=AnalyticsRepositoryImpl(db))
+async def call_service(fn: Callable[..., Any], *args: Any) -> Any:
+    """Await async service methods on the loop; run sync ones in the threadpool."""
+    if inspect.iscoroutinefunction(fn):
+        return await fn(*args)
+    return await run_in_threadpool(fn, *args)
@@ -1,15 +1,40 @@
 """Request-scoped database session dependency."""
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 
-from fastapi import Request
-from sqlalchemy.orm import Session
+from fastapi import Depends, Request
+from sqlalchemy.orm import Session, sessionmaker
 
 from football_engine.api.dependencies.container import AppContainer
+from football_engine.infrastructure.db.async_session import async_session_scope
 from football_engine.infrastructure.db.session import get_session
 
 
-def get_db(request: Request) -> Generator[Session, None, None]:
+def get_session_factory(request: Request) -> sessionmaker[Session]:
+    """Session factory for work that outlives the request (ingest pipeline jobs)."""
+    container: AppContainer = request.app.state.container
+    return container.session_factory
+
+
+def get_db(
+    session_factory: sessionmaker[Session] = Depends(get_session_factory),
+) -> Generator[Session, None, None]:
     """Yield a request-scoped DB session. Commit on success, rollback on error."""
+    yield from get_session(session_factory)
+
+
+def get_async_session_factory(request: Request) -> object | None:
+    """Async session factory when DATABASE_URL selects an async driver, else None."""
     container: AppContainer = request.app.state.container
-    yield from get_session(container.session_factory)
+    return container.async_session_factory
+
+
+async def get_async_db(
+    session_factory: object | None = Depends(get_async_session_factory),
+) -> AsyncGenerator[object | None, None]:
+    """Yield a request-scoped AsyncSession, or None when running on the sync stack."""
+    if session_factory is None:
+        yield None
+        return
+    async with async_session_scope(session_factory) as session:
+        yield session
@@ -1,86 +1,340 @@
-"""Event ingest API route."""
+"""Event ingest API routes.
 
-from datetime import datetime, timezone
+Ingest runs on the per-match single-writer pipeline, off the event loop. With
+`wait=false` the route answers 202 as soon as the event is queued and broadcasts
+once the job completes. With an async DATABASE_URL the job runs natively on the
+loop (still serialized per match) instead of on a worker thread. With snapshot
+coalescing on, a job whose snapshot was deferred schedules one flush job per match
+window instead of broadcasting itself.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from functools import partial
 from typing import Any
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Response
+from sqlalchemy.orm import Session, sessionmaker
 
-from football_engine.api.dependencies.session import get_db
-from football_engine.api.dependencies.services import get_ingest_event_service
-from football_engine.api.schemas.event_schemas import IngestEventRequest
+from football_engine.api.dependencies.container import AppContainer, get_container
+from football_engine.api.dependencies.services import (
+    build_async_ingest_event_service,
+    build_ingest_event_service,
+)
+from football_engine.api.dependencies.session import (
+    get_async_session_factory,
+    get_session_factory,
+)
+from football_engine.api.schemas.event_schemas import IngestEventBatchRequest, IngestEventRequest
 from football_engine.api.ws.v2.payloads import event_to_minimal_dto
 from football_engine.api.ws.v2.stream_manager import get_stream_manager
 from football_engine.application.dto import (
     analytics_snapshot_to_dto,
+    ingest_batch_result_dto,
     ingest_result_dto,
     match_to_state_dto,
 )
-from football_engine.application.services import IngestEventService
+from football_engine.application.services import IngestQueueFullError
 from football_engine.domain.entities import Event
 from football_engine.domain.enums import EventType, TeamSide
 from football_engine.domain.value_objects import MatchClock
+from football_engine.infrastructure.db.async_session import async_session_scope
+from football_engine.infrastructure.db.session import session_scope
+
+logger = logging.getLogger(__name__)
 
 events_router = APIRouter(prefix="/events", tags=["events"])
 
+# (accepted, deduplicated, match_state, analytics_latest, snapshot_deferred) from a pipeline job
+IngestJobResult = tuple[bool, Any, dict[str, Any], dict[str, Any] | None, bool]
+# (latest deferred event, match_state, analytics_latest) as built by a flush job
+FlushJobResult = tuple[Event | None, dict[str, Any], dict[str, Any] | None]
+
 
 @events_router.post("")
 async def ingest_event(
     body: IngestEventRequest,
     background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db),
-    service: IngestEventService = Depends(get_ingest_event_service),
+    response: Response,
+    wait: bool = True,
+    session_factory: sessionmaker[Session] = Depends(get_session_factory),
+    async_session_factory: Any = Depends(get_async_session_factory),
+    container: AppContainer = Depends(get_container),
+) -> dict:
+    event = _event_from_request(body, datetime.now(UTC))
+    if async_session_factory is not None:
+        job = partial(_async_ingest_job, async_session_factory, container, event)
+        pending = _enqueue_async(container, event.match_id, job)
+    else:
+        job = partial(_ingest_job, session_factory, container, event)
+        pending = _enqueue(container, event.match_id, job)
+    flush = partial(
+        _flush_when_due, container, session_factory, async_session_factory, event.match_id
+    )
+    if not wait:
+        background_tasks.add_task(_broadcast_when_done, pending, [event], flush)
+        response.status_code = 202
+        return {"queued": True, "match_id": event.match_id, "event_ids": [event.event_id]}
+
+    accepted, deduplicated, state_dto, snapshot_dto, deferred = await pending
+    if not accepted:
+        raise HTTPException(status_code=404, detail="match not found")
+    logger.info(f"Event ingested: match={event.match_id}, deduplicated={deduplicated}")
+
+    # Only new events are broadcast; late subscribers catch up from the stream's replay buffer
+    if deferred:
+        background_tasks.add_task(flush)
+    elif not deduplicated:
+        background_tasks.add_task(_broadcast_update, event, state_dto, snapshot_dto)
+
+    return ingest_result_dto(
+        accepted=accepted,
+        deduplicated=deduplicated,
+        match_state=state_dto,
+        analytics_latest=snapshot_dto,
+    )
+
+
+@events_router.post(":batch")
+async def ingest_event_batch(
+    body: IngestEventBatchRequest,
+    background_tasks: BackgroundTasks,
+    response: Response,
+    wait: bool = True,
+    session_factory: sessionmaker[Session] = Depends(get_session_factory),
+    async_session_factory: Any = Depends(get_async_session_factory),
+    container: AppContainer = Depends(get_container),
 ) -> dict:
-    clock = MatchClock(
-        period=body.clock.period,
-        minute=body.clock.minute,
-        second=body.clock.second,
+    """Ingest an ordered burst of events for one match in a single transaction."""
+    now = datetime.now(UTC)
+    events = [_event_from_request(item, now) for item in body.events]
+    match_id = events[0].match_id
+    if async_session_factory is not None:
+        job = partial(_async_ingest_batch_job, async_session_factory, container, match_id, events)
+        pending = _enqueue_async(container, match_id, job)
+    else:
+        job = partial(_ingest_batch_job, session_factory, container, match_id, events)
+        pending = _enqueue(container, match_id, job)
+    flush = partial(_flush_when_due, container, session_factory, async_session_factory, match_id)
+    if not wait:
+        background_tasks.add_task(_broadcast_when_done, pending, events, flush)
+        response.status_code = 202
+        return {"queued": True, "match_id": match_id, "event_ids": [e.event_id for e in events]}
+
+    accepted, deduplicated, state_dto, snapshot_dto, deferred = await pending
+    if not accepted:
+        raise HTTPException(status_code=404, detail="match not found")
+    last_event = _latest_new_event(events, deduplicated)
+    if deferred:
+        background_tasks.add_task(flush)
+    elif last_event is not None:
+        background_tasks.add_task(_broadcast_update, last_event, state_dto, snapshot_dto)
+
+    return ingest_batch_result_dto(
+        event_ids=[e.event_id for e in events],
+        deduplicated=deduplicated,
+        match_state=state_dto,
+        analytics_latest=snapshot_dto,
     )
-    event = Event(
+
+
+def _enqueue(container: AppContainer, match_id: str, job: Any) -> "asyncio.Future[IngestJobResult]":
+    try:
+        return asyncio.wrap_future(container.ingest_pipeline.submit(match_id, job))
+    except IngestQueueFullError as e:
+        raise _queue_full(e) from e
+
+
+def _enqueue_async(
+    container: AppContainer, match_id: str, job: Any
+) -> "asyncio.Task[IngestJobResult]":
+    try:
+        return container.ingest_pipeline.submit_async(match_id, job)
+    except IngestQueueFullError as e:
+        raise _queue_full(e) from e
+
+
+def _queue_full(error: IngestQueueFullError) -> HTTPException:
+    return HTTPException(status_code=503, detail=str(error), headers={"Retry-After": "1"})
+
+
+def _ingest_job(
+    session_factory: sessionmaker[Session], container: AppContainer, event: Event
+) -> IngestJobResult:
+    """Runs on a pipeline worker thread."""
+    with session_scope(session_factory) as db:
+        service = build_ingest_event_service(db, container)
+        accepted, deduplicated, match, snapshot = service.ingest(event)
+    return _job_result(container, event.match_id, accepted, deduplicated, match, snapshot)
+
+
+def _ingest_batch_job(
+    session_factory: sessionmaker[Session],
+    container: AppContainer,
+    match_id: str,
+    events: list[Event],
+) -> IngestJobResult:
+    """Runs on a pipeline worker thread."""
+    with session_scope(session_factory) as db:
+        service = build_ingest_event_service(db, container)
+        accepted, deduplicated, match, snapshot = service.ingest_batch(match_id, events)
+    return _job_result(container, match_id, accepted, deduplicated, match, snapshot)
+
+
+async def _async_ingest_job(
+    session_factory: Any, container: AppContainer, event: Event
+) -> IngestJobResult:
+    """Runs on the event loop, serialized per match by the pipeline."""
+    async with async_session_scope(session_factory) as db:
+        service = build_async_ingest_event_service(db, container)
+        accepted, deduplicated, match, snapshot = await service.ingest(event)
+    return _job_result(container, event.match_id, accepted, deduplicated, match, snapshot)
+
+
+async def _async_ingest_batch_job(
+    session_factory: Any,
+    container: AppContainer,
+    match_id: str,
+    events: list[Event],
+) -> IngestJobResult:
+    """Runs on the event loop, serialized per match by the pipeline."""
+    async with async_session_scope(session_factory) as db:
+        service = build_async_ingest_event_service(db, container)
+        accepted, deduplicated, match, snapshot = await service.ingest_batch(match_id, events)
+    return _job_result(container, match_id, accepted, deduplicated, match, snapshot)
+
+
+def _flush_job(
+    session_factory: sessionmaker[Session], container: AppContainer, match_id: str
+) -> FlushJobResult:
+    """Runs on a pipeline worker thread, after the ingest jobs it coalesces."""
+    with session_scope(session_factory) as db:
+        service = build_ingest_event_service(db, container)
+        event, match, snapshot = service.flush_snapshot(match_id)
+    if match is not None:
+        get_stream_manager().publish_match_changed(match_id, match.version)
+    return (event, *_job_dtos(match, snapshot))
+
+
+async def _async_flush_job(
+    session_factory: Any, container: AppContainer, match_id: str
+) -> FlushJobResult:
+    """Runs on the event loop, after the ingest jobs it coalesces."""
+    async with async_session_scope(session_factory) as db:
+        service = build_async_ingest_event_service(db, container)
+        event, match, snapshot = await service.flush_snapshot(match_id)
+    if match is not None:
+        get_stream_manager().publish_match_changed(match_id, match.version)
+    return (event, *_job_dtos(match, snapshot))
+
+
+def _job_result(
+    container: AppContainer,
+    match_id: str,
+    accepted: bool,
+    deduplicated: Any,
+    match: Any,
+    snapshot: Any,
+) -> IngestJobResult:
+    state_dto, snapshot_dto = _job_dtos(match, snapshot)
+    if match is not None:
+        # Committed: wake long-polls of the match state
+        container.version_waiters.notify(match_id, match.version)
+        all_duplicates = deduplicated is True or (
+            isinstance(deduplicated, list) and all(deduplicated)
+        )
+        if not all_duplicates:
+            get_stream_manager().publish_match_changed(match_id, match.version)
+    deferred = container.snapshot_coalescer.is_pending(match_id)
+    return accepted, deduplicated, state_dto, snapshot_dto, deferred
+
+
+def _job_dtos(match: Any, snapshot: Any) -> tuple[dict[str, Any], dict[str, Any] | None]:
+    state_dto = match_to_state_dto(match) if match else {}
+    snapshot_dto = analytics_snapshot_to_dto(snapshot) if snapshot else None
+    return state_dto, snapshot_dto
+
+
+def _latest_new_event(events: list[Event], deduplicated: list[bool]) -> Event | None:
+    """Latest new event by clock; one broadcast per batch carries it."""
+    new_events = [e for e, dup in zip(events, deduplicated) if not dup]
+    if not new_events:
+        return None
+    return max(new_events, key=lambda e: (e.clock.period, e.clock.total_seconds_in_period()))
+
+
+def _event_from_request(body: IngestEventRequest, ingested_at_utc: datetime) -> Event:
+    return Event(
         event_id=body.event_id,
         match_id=body.match_id,
         provider_name=body.provider_name,
         provider_event_id=body.provider_event_id,
-        clock=clock,
+        clock=MatchClock(
+            period=body.clock.period,
+            minute=body.clock.minute,
+            second=body.clock.second,
+        ),
         team_side=TeamSide(body.team_side),
         event_type=EventType(body.event_type),
         payload=body.payload,
-        ingested_at_utc=datetime.now(timezone.utc),
+        ingested_at_utc=ingested_at_utc,
     )
-    accepted, deduplicated, match, snapshot = service.ingest(event)
+
+
+async def _broadcast_when_done(
+    pending: Awaitable[IngestJobResult],
+    events: list[Event],
+    flush: Callable[[], Awaitable[None]],
+) -> None:
+    """Await a queued ingest job, then broadcast its outcome (wait=false path)."""
+    try:
+        accepted, deduplicated, state_dto, snapshot_dto, deferred = await pending
+    except Exception as e:
+        logger.warning(f"Queued ingest failed for match {events[0].match_id}: {e}", exc_info=True)
+        return
     if not accepted:
-        raise HTTPException(status_code=404, detail="match not found")
-    db.commit()
-    state_dto = match_to_state_dto(match) if match else {}
-    snapshot_dto = analytics_snapshot_to_dto(snapshot) if snapshot else None
+        logger.warning(f"Queued ingest dropped: match {events[0].match_id} not found")
+        return
+    if deferred:
+        await flush()
+        return
+    flags = deduplicated if isinstance(deduplicated, list) else [deduplicated]
+    last_event = _latest_new_event(events, flags)
+    if last_event is not None:
+        await _broadcast_update(last_event, state_dto, snapshot_dto)
 
-    # Broadcast to WebSocket subscribers (non-blocking, runs after response)
-    import logging
-    logger = logging.getLogger(__name__)
-    
-    logger.info(f"Event ingested: match={event.match_id}, deduplicated={deduplicated}, match_obj={match is not None}")
-    
-    # Broadcast if match exists AND (event is new OR there are subscribers who might need current state)
-    if match:
-        manager = get_stream_manager()
-        has_subscribers = manager.get_subscriber_count(event.match_id) > 0
-        
-        if not deduplicated:
-            logger.info(f"Scheduling broadcast for NEW event in match {event.match_id}")
-            background_tasks.add_task(_broadcast_update, event, state_dto, snapshot_dto)
-        elif has_subscribers:
-            # Even if deduplicated, broadcast to subscribers who might have just connected
-            logger.info(f"Scheduling broadcast for DEDUPLICATED event (subscribers present) in match {event.match_id}")
-            background_tasks.add_task(_broadcast_update, event, state_dto, snapshot_dto)
-        else:
-            logger.debug(f"Skipping broadcast: deduplicated={deduplicated}, no subscribers")
 
-    return ingest_result_dto(
-        accepted=accepted,
-        deduplicated=deduplicated,
-        match_state=state_dto,
-        analytics_latest=snapshot_dto,
-    )
+async def _flush_when_due(
+    container: AppContainer,
+    session_factory: sessionmaker[Session],
+    async_session_factory: Any,
+    match_id: str,
+) -> None:
+    """After the debounce delay, flush the match's deferred snapshot and broadcast it.
+
+    Only the caller that claims the pending window runs the flush; the others return.
+    """
+    coalescer = container.snapshot_coalescer
+    if not coalescer.claim_flush(match_id):
+        return
+    await asyncio.sleep(coalescer.delay_seconds)
+    try:
+        if async_session_factory is not None:
+            job = partial(_async_flush_job, async_session_factory, container, match_id)
+            result = await container.ingest_pipeline.submit_async(match_id, job)
+        else:
+            job = partial(_flush_job, session_factory, container, match_id)
+            result = await container.ingest_pipeline.run(match_id, job)
+    except Exception as e:
+        # Drop the window; the next ingest for the match computes a fresh snapshot
+        coalescer.take(match_id)
+        logger.warning(f"Snapshot flush failed for match {match_id}: {e}", exc_info=True)
+        return
+    event, state_dto, snapshot_dto = result
+    if event is not None and snapshot_dto is not None:
+        await _broadcast_update(event, state_dto, snapshot_dto)
 
 
 async def _broadcast_update(
@@ -89,13 +343,12 @@ async def _broadcast_update(
     analytics_latest: dict[str, Any] | None,
 ) -> None:
     """Non-blocking broadcast to WebSocket subscribers."""
-    import logging
-    logger = logging.getLogger(__name__)
-    
     try:
         manager = get_stream_manager()
         event_dto = event_to_minimal_dto(event)
-        logger.info(f"Broadcasting update for match {event.match_id} to {manager.get_subscriber_count(event.match_id)} subscribers")
+        logger.info(
+            f"Broadcasting update for match {event.match_id} to {manager.get_subscriber_count(event.match_id)} subscribers"
+        )
         await manager.broadcast(event.match_id, event_dto, match_state, analytics_latest)
         logger.debug(f"Broadcast completed for match {event.match_id}")
     except Exception as e:
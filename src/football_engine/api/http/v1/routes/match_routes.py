@@ -1,24 +1,55 @@
 """Match API routes."""
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
 
-from football_engine.api.dependencies.session import get_db
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response, StreamingResponse
+from sqlalchemy.orm import Session, sessionmaker
+
+from football_engine.api.dependencies.container import AppContainer, get_container
 from football_engine.api.dependencies.services import (
+    call_service,
     get_analytics_service,
     get_create_match_service,
     get_state_service,
 )
+from football_engine.api.dependencies.session import (
+    get_async_session_factory,
+    get_db,
+    get_session_factory,
+)
 from football_engine.api.schemas.match_schemas import CreateMatchRequest
+from football_engine.api.ws.v2.filters import StreamFilter
+from football_engine.api.ws.v2.payloads import encode_frame
+from football_engine.api.ws.v2.sse import (
+    SSE_HEARTBEAT,
+    SSE_PREAMBLE,
+    SSEChannel,
+    parse_event_id,
+)
+from football_engine.api.ws.v2.stream_manager import get_stream_manager
 from football_engine.application.dto import analytics_snapshot_to_dto, match_to_state_dto
 from football_engine.application.services import (
+    AsyncGetLatestAnalyticsService,
+    AsyncGetMatchStateService,
     CreateMatchService,
     GetLatestAnalyticsService,
     GetMatchStateService,
 )
+from football_engine.domain.entities import Match
+from football_engine.infrastructure.cache import EncodedResponseCache
+from football_engine.infrastructure.db.async_session import async_session_scope
+from football_engine.infrastructure.repositories.async_match_repository_impl import (
+    AsyncMatchRepositoryImpl,
+)
 from football_engine.infrastructure.repositories.event_repository_impl import (
     EventRepositoryImpl,
 )
+from football_engine.infrastructure.repositories.match_repository_impl import (
+    MatchRepositoryImpl,
+)
 
 matches_router = APIRouter(prefix="/matches", tags=["matches"])
 
@@ -44,25 +75,86 @@ def create_match(
 
 
 @matches_router.get("/{match_id}/state")
-def get_match_state(
+async def get_match_state(
     match_id: str,
-    service: GetMatchStateService = Depends(get_state_service),
-) -> dict:
-    match = service.get(match_id)
-    if match is None:
-        raise HTTPException(status_code=404, detail="match not found")
-    return match_to_state_dto(match)
+    after_version: int | None = None,
+    wait: float = Query(default=30.0, ge=0),
+    if_none_match: str | None = Header(default=None),
+    service: GetMatchStateService | AsyncGetMatchStateService = Depends(get_state_service),
+    session_factory: sessionmaker[Session] = Depends(get_session_factory),
+    async_session_factory: object | None = Depends(get_async_session_factory),
+    container: AppContainer = Depends(get_container),
+) -> Response:
+    """Strong ETag from Match.version. A hot (cached) match answers If-None-Match with 304
+    and encoded bodies are reused per version, so polling between events costs no query.
+
+    Long-poll: with after_version, answers as soon as the version is above it, waiting up
+    to `wait` seconds for an ingest to commit one, else answers with the current state
+    like a plain read (304 only if If-None-Match matches it). A parked request holds only
+    a future: no thread and no pooled connection (each read opens a short-lived session
+    and returns its connection before the request parks)."""
+    if after_version is None:
+        match = container.match_cache.get(match_id) or await call_service(service.get, match_id)
+        if match is None:
+            raise HTTPException(status_code=404, detail="match not found")
+        return _state_response(container, match, if_none_match)
+
+    def _load() -> Awaitable[Match | None]:
+        return _load_match(container, session_factory, async_session_factory, match_id)
+
+    waiters = container.version_waiters
+    parked = waiters.park(match_id, after_version)
+    try:
+        match = await _load()
+        if match is None:
+            raise HTTPException(status_code=404, detail="match not found")
+        if match.version <= after_version:
+            timeout = min(wait, container.settings.long_poll_max_wait_seconds)
+            try:
+                await asyncio.wait_for(parked, timeout)
+            except TimeoutError:
+                # Nothing newer: the current state, 304 if the client already has it
+                return _state_response(container, match, if_none_match)
+            match = await _load() or match
+    finally:
+        waiters.release(match_id, parked)
+    return _state_response(container, match, if_none_match)
+
+
+def _state_response(container: AppContainer, match: Match, if_none_match: str | None) -> Response:
+    return _cached_json(
+        container.response_cache,
+        "state",
+        match.match_id,
+        str(match.version),
+        if_none_match,
+        lambda: match_to_state_dto(match),
+    )
 
 
 @matches_router.get("/{match_id}/analytics/latest")
-def get_latest_analytics(
+async def get_latest_analytics(
     match_id: str,
-    service: GetLatestAnalyticsService = Depends(get_analytics_service),
-) -> dict:
-    snapshot = service.get(match_id)
+    if_none_match: str | None = Header(default=None),
+    service: GetLatestAnalyticsService | AsyncGetLatestAnalyticsService = Depends(
+        get_analytics_service
+    ),
+    container: AppContainer = Depends(get_container),
+) -> Response:
+    """Strong ETag from snapshot_id; conditional and cached like the state read."""
+    snapshot = container.snapshot_cache.get(match_id)
     if snapshot is None:
-        raise HTTPException(status_code=404, detail="no analytics snapshot found")
-    return analytics_snapshot_to_dto(snapshot)
+        snapshot = await call_service(service.get, match_id)
+        if snapshot is None:
+            raise HTTPException(status_code=404, detail="no analytics snapshot found")
+    return _cached_json(
+        container.response_cache,
+        "analytics_latest",
+        match_id,
+        snapshot.snapshot_id,
+        if_none_match,
+        lambda: analytics_snapshot_to_dto(snapshot),
+    )
 
 
 @matches_router.get("/{match_id}/events/recent")
@@ -70,8 +162,9 @@ def get_recent_events(
     match_id: str,
     limit: int = 50,
     db: Session = Depends(get_db),
-    state_service: GetMatchStateService = Depends(get_state_service),
+    container: AppContainer = Depends(get_container),
 ) -> list[dict]:
+    state_service = GetMatchStateService(MatchRepositoryImpl(db, container.match_cache))
     if state_service.get(match_id) is None:
         raise HTTPException(status_code=404, detail="match not found")
     event_repo = EventRepositoryImpl(db)
@@ -89,3 +182,116 @@ def get_recent_events(
     ]
 
 
+@matches_router.get("/{match_id}/events/stream")
+async def stream_match_events(
+    match_id: str,
+    last_event_id: str | None = Header(default=None),
+    since: int | None = None,
+    epoch: str | None = None,
+    event_types: str | None = None,
+    team_side: str | None = None,
+    match_state: str | None = None,
+    analytics: str | None = None,
+    session_factory: sessionmaker[Session] = Depends(get_session_factory),
+    async_session_factory: object | None = Depends(get_async_session_factory),
+    container: AppContainer = Depends(get_container),
+) -> StreamingResponse:
+    """Server-Sent Events stream of the match's WebSocket `update` frames (`data:` is the
+    same JSON, `id:` "<epoch>:<seq>"). Resumes after `Last-Event-ID` (or `?since=&epoch=`)
+    from the replay buffer, else starts with a `snapshot`. Filters as on the WebSocket
+    stream."""
+    if await _load_match(container, session_factory, async_session_factory, match_id) is None:
+        raise HTTPException(status_code=404, detail="match not found")
+    try:
+        stream_filter = StreamFilter.from_dict(
+            {
+                "event_types": event_types,
+                "team_side": team_side,
+                "match_state": match_state,
+                "analytics": analytics,
+            }
+        )
+        if last_event_id is not None:
+            since, epoch = parse_event_id(last_event_id)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+
+    manager = get_stream_manager()
+    channel = SSEChannel()
+    if manager.subscribe(match_id, channel, stream_filter) is None:
+        raise HTTPException(status_code=503, detail="stream connection limit reached")
+    manager.resume(match_id, channel, since=since, epoch=epoch)
+    heartbeat = container.settings.sse_heartbeat_seconds
+
+    async def _body() -> AsyncIterator[str]:
+        try:
+            yield SSE_PREAMBLE
+            while True:
+                try:
+                    chunk = await channel.next_chunk(heartbeat)
+                except TimeoutError:
+                    yield SSE_HEARTBEAT
+                    continue
+                if chunk is None:
+                    return
+                yield chunk
+        finally:
+            manager.unsubscribe(match_id, channel)
+
+    return StreamingResponse(
+        _body(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _load_match(
+    container: AppContainer,
+    session_factory: sessionmaker[Session],
+    async_session_factory: object | None,
+    match_id: str,
+) -> Match | None:
+    """Cache first, else a session of its own: for requests that stay open (streams,
+    long-polls), a request-scoped session would hold a pooled connection throughout."""
+    match = container.match_cache.get(match_id)
+    if match is not None:
+        return match
+    if async_session_factory is not None:
+        async with async_session_scope(async_session_factory) as session:
+            repository = AsyncMatchRepositoryImpl(session, container.match_cache)
+            return await AsyncGetMatchStateService(repository).get(match_id)
+
+    def _get() -> Match | None:
+        with session_factory() as session:
+            repository = MatchRepositoryImpl(session, container.match_cache)
+            return GetMatchStateService(repository).get(match_id)
+
+    return await run_in_threadpool(_get)
+
+
+def _cached_json(
+    cache: EncodedResponseCache,
+    kind: str,
+    match_id: str,
+    tag: str,
+    if_none_match: str | None,
+    build_dto: Callable[[], dict],
+) -> Response:
+    """304 if the client has tag, else the body for tag, encoded once per tag."""
+    headers = {"ETag": f'"{tag}"', "Cache-Control": "no-cache"}
+    if if_none_match is not None and _etag_matches(if_none_match, tag):
+        return Response(status_code=304, headers=headers)
+    body = cache.get(kind, match_id, tag)
+    if body is None:
+        body = encode_frame(build_dto()).encode()
+        cache.put(kind, match_id, tag, body)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _etag_matches(if_none_match: str, tag: str) -> bool:
+    """If-None-Match uses weak comparison: W/ prefixes are ignored, "*" matches anything."""
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == f'"{tag}"':
+            return True
+    return False
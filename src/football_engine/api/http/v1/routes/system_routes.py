@@ -1,9 +1,12 @@
 """System and health endpoints."""
 
+from typing import Any
+
 from fastapi import APIRouter, Depends
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from football_engine.api.dependencies.container import AppContainer, get_container
 from football_engine.api.dependencies.session import get_db
 
 system_router = APIRouter(tags=["system"])
@@ -19,3 +22,9 @@ def ready(db: Session = Depends(get_db)) -> dict[str, str]:
     """Readiness: checks DB connectivity."""
     db.execute(text("SELECT 1"))
     return {"status": "ready"}
+
+
+@system_router.get("/stats")
+def stats(container: AppContainer = Depends(get_container)) -> dict[str, Any]:
+    """Counters of this worker process since start."""
+    return {"analytics": container.analytics_engine.metric_counters()}
@@ -1,6 +1,6 @@
 """Pydantic request/response schemas."""
 
+from football_engine.api.schemas.event_schemas import IngestEventBatchRequest, IngestEventRequest
 from football_engine.api.schemas.match_schemas import CreateMatchRequest
-from football_engine.api.schemas.event_schemas import IngestEventRequest
 
-__all__ = ["CreateMatchRequest", "IngestEventRequest"]
+__all__ = ["CreateMatchRequest", "IngestEventBatchRequest", "IngestEventRequest"]
@@ -2,7 +2,9 @@
 
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
+
+MAX_BATCH_EVENTS = 1000
 
 
 class ClockSchema(BaseModel):
@@ -23,3 +25,15 @@ class IngestEventRequest(BaseModel):
     payload: dict[str, Any] | None = None
     provider_name: str = Field(default="api", max_length=64)
     provider_event_id: str | None = Field(default=None, max_length=128)
+
+
+class IngestEventBatchRequest(BaseModel):
+    """Ordered events for a single match."""
+
+    events: list[IngestEventRequest] = Field(..., min_length=1, max_length=MAX_BATCH_EVENTS)
+
+    @model_validator(mode="after")
+    def _single_match(self) -> "IngestEventBatchRequest":
+        if len({e.match_id for e in self.events}) > 1:
+            raise ValueError("all events in a batch must share the same match_id")
+        return self
@@ -0,0 +1,145 @@
+"""Cross-worker broadcast over Unix datagram sockets. No external service.
+
+Every worker binds one socket in a shared directory. Publishing sends one datagram per
+peer socket found there; a receiver thread hands peer updates to the local StreamManager.
+Workers also announce every committed change to a match ({match_id, version}) so peers
+drop the per-process ingest state they hold for it.
+"""
+
+import json
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from enum import StrEnum
+from pathlib import Path
+from typing import Any
+
+from football_engine.api.ws.v2.payloads import encode_frame
+
+logger = logging.getLogger(__name__)
+
+# Largest update accepted from a peer; stream documents are a few KB
+MAX_DATAGRAM_BYTES = 256 * 1024
+# How long the peer list (a directory listing) is reused between publishes
+PEER_REFRESH_SECONDS = 1.0
+
+
+class BroadcastBackend(StrEnum):
+    # Updates reach subscribers of this process only
+    LOCAL = "local"
+    # Updates are also published to every worker sharing WS_BUS_DIR
+    UNIX = "unix"
+
+
+class UnixDatagramBus:
+    """One worker's endpoint on the local bus.
+
+    publish() never blocks: a peer whose receive buffer is full misses that update (its
+    subscribers fall back to keyframes or a snapshot, as after any drop). Sockets left
+    behind by dead workers are removed on the first failed send.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        deliver: Callable[[str, dict[str, Any]], None],
+        match_changed: Callable[[str, int], None] | None = None,
+    ) -> None:
+        self.directory = Path(directory)
+        self.path = self.directory / f"{os.getpid()}-{uuid.uuid4().hex[:8]}.sock"
+        self.dropped = 0
+        self._deliver = deliver
+        self._match_changed = match_changed
+        self._sock: socket.socket | None = None
+        self._thread: threading.Thread | None = None
+        self._stopping = False
+        self._peers: list[str] = []
+        self._peers_at = 0.0
+
+    def start(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sock.bind(str(self.path))
+        self._sock = sock
+        self._thread = threading.Thread(target=self._receive, name="ws-bus", daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        if self._sock is None:
+            return
+        self._stopping = True
+        try:
+            # Wake the receiver out of recv()
+            with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as waker:
+                waker.sendto(b"", str(self.path))
+        except OSError:
+            pass
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+        self._sock.close()
+        self._sock = None
+        self.path.unlink(missing_ok=True)
+
+    def publish(self, match_id: str, document: dict[str, Any]) -> None:
+        """Send one update to every other worker."""
+        if self._sock is None:
+            return
+        data = encode_frame({"match_id": match_id, "document": document}).encode()
+        if len(data) > MAX_DATAGRAM_BYTES:
+            logger.warning(f"Update for match {match_id} too large for the bus ({len(data)} B)")
+            return
+        self._send_to_peers(data)
+
+    def publish_match_changed(self, match_id: str, version: int) -> None:
+        """Tell every other worker that match_id was committed at version."""
+        if self._sock is None:
+            return
+        self._send_to_peers(encode_frame({"match_id": match_id, "version": version}).encode())
+
+    def _send_to_peers(self, data: bytes) -> None:
+        for peer in self._peer_paths():
+            try:
+                self._sock.sendto(data, socket.MSG_DONTWAIT, peer)
+            except (FileNotFoundError, ConnectionRefusedError):
+                # Worker gone without cleaning up
+                Path(peer).unlink(missing_ok=True)
+                self._peers_at = 0.0
+            except OSError as e:
+                self.dropped += 1
+                logger.debug(f"Bus send to {peer} failed: {e}")
+
+    def _peer_paths(self) -> list[str]:
+        now = time.monotonic()
+        if now - self._peers_at >= PEER_REFRESH_SECONDS:
+            own = str(self.path)
+            self._peers = [str(p) for p in self.directory.glob("*.sock") if str(p) != own]
+            self._peers_at = now
+        return self._peers
+
+    def _receive(self) -> None:
+        sock = self._sock
+        while not self._stopping and sock is not None:
+            try:
+                data = sock.recv(MAX_DATAGRAM_BYTES)
+            except OSError:
+                return
+            if not data:
+                continue
+            try:
+                message = json.loads(data)
+                match_id = message["match_id"]
+            except (json.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError) as e:
+                logger.warning(f"Dropped malformed bus message: {e}")
+                continue
+            try:
+                if "document" in message:
+                    self._deliver(match_id, message["document"])
+                elif "version" in message and self._match_changed is not None:
+                    self._match_changed(match_id, message["version"])
+            except Exception:
+                # A bug in a handler must not stop the receiver; log it with its traceback
+                logger.exception(f"Bus message for match {match_id} failed")
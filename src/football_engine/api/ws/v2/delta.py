@@ -0,0 +1,50 @@
+"""Merge-patch diffs between consecutive stream documents.
+
+The format is RFC 7396's except for null: here a null sets the value to null (stream
+documents carry nulls, e.g. `analytics_latest` before the first snapshot), where RFC 7396
+would delete the key. A key removed from the document also comes as null.
+"""
+
+import copy
+from typing import Any
+
+
+def merge_patch(old: dict[str, Any], new: dict[str, Any]) -> dict[str, Any]:
+    """Patch that turns old into new: changed objects nest, other changed values are
+    replaced whole, values that became null (or keys removed) are null.
+
+    Merge patches share path prefixes, so for this repo's documents (many counters and
+    floats nested a few objects deep) they are far smaller than RFC 6902 operation
+    lists.
+    """
+    patch: dict[str, Any] = {}
+    for key in old:
+        if key not in new:
+            patch[key] = None
+    for key, value in new.items():
+        if key not in old:
+            patch[key] = value
+            continue
+        previous = old[key]
+        if previous == value and type(previous) is type(value):
+            continue
+        if isinstance(previous, dict) and isinstance(value, dict):
+            patch[key] = merge_patch(previous, value)
+        else:
+            patch[key] = value
+    return patch
+
+
+def apply_merge_patch(document: dict[str, Any], patch: dict[str, Any]) -> dict[str, Any]:
+    """Apply a merge patch to a copy of document. Reference client for tests and tools.
+
+    A null sets the value to null; unlike RFC 7396 it does not remove the key.
+    """
+    result = copy.deepcopy(document)
+    for key, value in patch.items():
+        previous = result.get(key)
+        if isinstance(value, dict) and isinstance(previous, dict):
+            result[key] = apply_merge_patch(previous, value)
+        else:
+            result[key] = copy.deepcopy(value)
+    return result
@@ -0,0 +1,108 @@
+"""Server-side subscription filters: which updates a subscriber gets, and which fields."""
+
+from dataclasses import dataclass
+from typing import Any
+
+from football_engine.domain.enums import EventType, TeamSide
+
+
+@dataclass(frozen=True)
+class StreamFilter:
+    """Hashable, so subscribers with equal filters share one projection and one encode.
+
+    event_types / team_side select updates by their event; None means any.
+    match_state_fields / analytics_fields are dotted paths kept in match_state and
+    analytics_latest (e.g. "score", "derived_metrics.momentum"); None keeps everything.
+    """
+
+    event_types: frozenset[str] | None = None
+    team_side: str | None = None
+    match_state_fields: tuple[str, ...] | None = None
+    analytics_fields: tuple[str, ...] | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> "StreamFilter":
+        """Parse {"event_types", "team_side", "match_state", "analytics"}. Lists may also be
+        comma-separated strings (query parameters). Raises ValueError on unknown values and
+        TypeError if data is not a dict."""
+        if not data:
+            return ALL
+        if not isinstance(data, dict):
+            raise TypeError("filter must be a JSON object")
+        event_types = _names(data.get("event_types"), "event_types")
+        if event_types is not None:
+            event_types = frozenset(EventType(name).value for name in event_types)
+        team_side = data.get("team_side")
+        if team_side is not None:
+            team_side = TeamSide(team_side).value
+        match_state = _names(data.get("match_state"), "match_state")
+        analytics = _names(data.get("analytics"), "analytics")
+        return cls(
+            event_types=event_types,
+            team_side=team_side,
+            match_state_fields=_paths(match_state),
+            analytics_fields=_paths(analytics),
+        )
+
+    @property
+    def is_identity(self) -> bool:
+        return self == ALL
+
+    def accepts(self, event: dict[str, Any] | None) -> bool:
+        """True if an update carrying this event (minimal DTO) passes the filter."""
+        if event is None:
+            return self.event_types is None and self.team_side is None
+        if self.event_types is not None and event.get("event_type") not in self.event_types:
+            return False
+        return self.team_side is None or event.get("team_side") == self.team_side
+
+    def project(self, document: dict[str, Any]) -> dict[str, Any]:
+        """The {event, match_state, analytics_latest} document with only the selected fields."""
+        if self.match_state_fields is None and self.analytics_fields is None:
+            return document
+        return {
+            "event": document.get("event"),
+            "match_state": _select(document.get("match_state"), self.match_state_fields),
+            "analytics_latest": _select(document.get("analytics_latest"), self.analytics_fields),
+        }
+
+
+ALL = StreamFilter()
+
+
+def _names(value: Any, name: str) -> list[str] | None:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return [part.strip() for part in value.split(",") if part.strip()]
+    if isinstance(value, list) and all(isinstance(v, str) for v in value):
+        return value
+    raise ValueError(f"{name} must be a list of strings")
+
+
+def _paths(names: list[str] | None) -> tuple[str, ...] | None:
+    """Canonical form: sorted, without paths already covered by a selected parent."""
+    if names is None:
+        return None
+    unique = set(names)
+    return tuple(sorted(p for p in unique if not any(p.startswith(f"{q}.") for q in unique)))
+
+
+def _select(source: dict[str, Any] | None, paths: tuple[str, ...] | None) -> Any:
+    """Copy the values at dotted paths into a new nested dict; missing paths are skipped."""
+    if source is None or paths is None:
+        return source
+    result: dict[str, Any] = {}
+    for path in paths:
+        *parents, leaf = path.split(".")
+        value: Any = source
+        for key in (*parents, leaf):
+            if not isinstance(value, dict) or key not in value:
+                break
+            value = value[key]
+        else:
+            target = result
+            for key in parents:
+                target = target.setdefault(key, {})
+            target[leaf] = value
+    return result
@@ -1,9 +1,15 @@
 """Minimal payload builders for WebSocket. Keep small for Pi efficiency."""
 
+import json
 from typing import Any
 
 from football_engine.domain.entities import Event
 
+try:
+    import orjson
+except ImportError:  # optional `speedups` extra
+    orjson = None
+
 
 def event_to_minimal_dto(event: Event) -> dict[str, Any]:
     """Minimal event summary for WebSocket (small payload)."""
@@ -17,3 +23,13 @@ def event_to_minimal_dto(event: Event) -> dict[str, Any]:
         "team_side": event.team_side.value,
         "event_type": event.event_type.value,
     }
+
+
+def encode_frame(payload: dict[str, Any]) -> str:
+    """Encode a message once for every subscriber.
+
+    Uses orjson when installed, else compact json (the same text send_json produces).
+    """
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
@@ -1,10 +1,14 @@
 """WebSocket v2 streaming routes. Minimal payloads for Pi efficiency."""
 
+import json
 import logging
 
 from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect
 
-from football_engine.api.ws.v2.stream_manager import get_stream_manager
+from football_engine.api.ws.v2.filters import StreamFilter
+from football_engine.api.ws.v2.payloads import encode_frame
+from football_engine.api.ws.v2.stream_manager import StreamManager, get_stream_manager
+from football_engine.api.ws.v2.subscriber import StreamMode, Subscriber
 
 logger = logging.getLogger(__name__)
 
@@ -12,28 +16,72 @@ ws_v2_router = APIRouter(prefix="/ws/v2", tags=["websocket"])
 
 
 @ws_v2_router.websocket("/matches/{match_id}/stream")
-async def stream_match_updates(websocket: WebSocket, match_id: str) -> None:
+async def stream_match_updates(
+    websocket: WebSocket,
+    match_id: str,
+    mode: str = "full",
+    since: int | None = None,
+    epoch: str | None = None,
+    event_types: str | None = None,
+    team_side: str | None = None,
+    match_state: str | None = None,
+    analytics: str | None = None,
+) -> None:
     """
     WebSocket stream for live match updates.
-    
+
     Pushes JSON messages on each event ingest:
     {
       "type": "update",
+      "seq": 1,
       "event": {...},
       "match_state": {...},
       "analytics_latest": {...}
     }
+
+    With `?mode=delta` (or a first client message `{"mode": "delta"}`) updates come as
+    `keyframe` messages (same shape as `update`) on connect and every N updates, and as
+    `{"type": "delta", "seq": n, "base_seq": b, "patch": {...}}` merge patches against
+    the document sent at seq b between.
+
+    On connect the client is caught up from memory: with `?since=<seq>&epoch=<epoch>` it
+    gets the `update` frames it missed, and otherwise (or if they are no longer buffered,
+    or were numbered in another epoch) one `snapshot` frame (same shape as `update`) of
+    the latest update. The `connected` frame carries the epoch its seqs are numbered in.
+
+    Optional filters (comma-separated): `event_types` and `team_side` select which updates
+    are sent; `match_state` and `analytics` list the (dotted) fields to keep.
     """
     await websocket.accept()
     manager = get_stream_manager()
 
-    if not manager.subscribe(match_id, websocket):
+    if mode not in tuple(StreamMode):
+        await websocket.close(code=1008, reason=f"Unsupported mode {mode!r}")
+        return
+    try:
+        stream_filter = StreamFilter.from_dict(
+            {
+                "event_types": event_types,
+                "team_side": team_side,
+                "match_state": match_state,
+                "analytics": analytics,
+            }
+        )
+    except ValueError as e:
+        await websocket.close(code=1008, reason=f"Invalid filter: {e}")
+        return
+
+    subscriber = manager.subscribe(match_id, websocket, stream_filter)
+    if subscriber is None:
         await websocket.close(code=1008, reason="Connection limit reached")
         return
 
     try:
-        # Send initial welcome (optional)
-        await websocket.send_json({"type": "connected", "match_id": match_id})
+        # All sends go through the subscriber's queue so they never interleave with updates
+        subscriber.push(
+            encode_frame({"type": "connected", "match_id": match_id, "epoch": manager.epoch})
+        )
+        manager.resume(match_id, websocket, mode, since, epoch)
 
         # Keep connection alive, wait for client disconnect
         while True:
@@ -42,26 +90,129 @@ async def stream_match_updates(websocket: WebSocket, match_id: str) -> None:
                 data = await websocket.receive_text()
                 # Echo or handle client messages if needed
                 if data == "ping":
-                    await websocket.send_json({"type": "pong"})
+                    subscriber.push(encode_frame({"type": "pong"}))
+                elif data.startswith("{"):
+                    _handle_client_message(manager, websocket, subscriber, data)
             except WebSocketDisconnect:
                 break
     except WebSocketDisconnect:
         pass
-    except Exception as e:
-        logger.error(f"WebSocket error for {match_id}: {e}")
+    except RuntimeError as e:
+        # Socket closed under us (e.g. by the subscriber's writer); anything else propagates
+        logger.warning(f"WebSocket for {match_id} closed: {e}")
     finally:
         manager.unsubscribe(match_id, websocket)
 
 
+@ws_v2_router.websocket("/stream")
+async def stream_many_matches(websocket: WebSocket, mode: str = "full") -> None:
+    """
+    Multiplexed WebSocket stream: one connection, any set of matches.
+
+    Client messages (JSON text):
+    {"action": "subscribe", "match_ids": ["m1", "m2"], "since": {"m1": 41}, "epoch": "...",
+     "filter": {"event_types": ["SHOT"], "match_state": ["score"]}}
+    {"action": "unsubscribe", "match_ids": ["m2"]}
+    {"mode": "full" | "delta"}
+
+    Every stream frame carries `match_id` and is the same as on
+    `/ws/v2/matches/{match_id}/stream`. A subscribe first catches each new match up (as on
+    connect there; `epoch` is the one from the `connected` frame), then acks with
+    `{"type": "subscribed", "match_ids": [...], "rejected": [...]}`.
+    """
+    await websocket.accept()
+    manager = get_stream_manager()
+
+    if mode not in tuple(StreamMode):
+        await websocket.close(code=1008, reason=f"Unsupported mode {mode!r}")
+        return
+
+    subscriber = manager.connect(websocket)
+    if subscriber is None:
+        await websocket.close(code=1008, reason="Connection limit reached")
+        return
+
+    try:
+        manager.set_mode(websocket, mode)
+        subscriber.push(encode_frame({"type": "connected", "epoch": manager.epoch}))
+        while True:
+            try:
+                data = await websocket.receive_text()
+                if data == "ping":
+                    subscriber.push(encode_frame({"type": "pong"}))
+                elif data.startswith("{"):
+                    _handle_client_message(manager, websocket, subscriber, data, multiplexed=True)
+            except WebSocketDisconnect:
+                break
+    except WebSocketDisconnect:
+        pass
+    except RuntimeError as e:
+        # Socket closed under us (e.g. by the subscriber's writer); anything else propagates
+        logger.warning(f"Multiplexed WebSocket closed: {e}")
+    finally:
+        manager.disconnect(websocket)
+
+
+def _handle_client_message(
+    manager: StreamManager,
+    websocket: WebSocket,
+    subscriber: Subscriber,
+    data: str,
+    multiplexed: bool = False,
+) -> None:
+    """JSON control messages. `{"mode": "full" | "delta"}` switches the protocol; on the
+    multiplexed route `subscribe` and `unsubscribe` actions change the match set."""
+    try:
+        message = json.loads(data)
+        if not isinstance(message, dict):
+            raise TypeError("expected a JSON object")
+        if "mode" in message:
+            manager.set_mode(websocket, message["mode"])
+        action = message.get("action")
+        if action is None:
+            return
+        if not multiplexed:
+            raise ValueError(f"unsupported action {action!r}")
+        match_ids = message.get("match_ids")
+        if not isinstance(match_ids, list) or not all(isinstance(m, str) for m in match_ids):
+            raise ValueError("match_ids must be a list of strings")
+        if action == "subscribe":
+            since = message.get("since") or {}
+            if not isinstance(since, dict) or not all(
+                isinstance(seq, int) and not isinstance(seq, bool) for seq in since.values()
+            ):
+                raise ValueError("since must map match_id to seq")
+            epoch = message.get("epoch")
+            if epoch is not None and not isinstance(epoch, str):
+                raise TypeError("epoch must be a string")
+            stream_filter = StreamFilter.from_dict(message.get("filter"))
+            subscribed, rejected = manager.subscribe_many(
+                websocket, match_ids, since, stream_filter, epoch
+            )
+            subscriber.push(
+                encode_frame({"type": "subscribed", "match_ids": subscribed, "rejected": rejected})
+            )
+        elif action == "unsubscribe":
+            for match_id in match_ids:
+                manager.unsubscribe(match_id, websocket, close_if_idle=False)
+            subscriber.push(encode_frame({"type": "unsubscribed", "match_ids": match_ids}))
+        else:
+            raise ValueError(f"unsupported action {action!r}")
+    except (ValueError, TypeError) as e:
+        subscriber.push(encode_frame({"type": "error", "message": str(e)}))
+
+
 @ws_v2_router.post("/matches/{match_id}/test-broadcast")
 async def test_broadcast(match_id: str) -> dict:
     """Test endpoint to manually trigger a WebSocket broadcast."""
     manager = get_stream_manager()
     subscriber_count = manager.get_subscriber_count(match_id)
-    
+
     if subscriber_count == 0:
-        raise HTTPException(status_code=404, detail=f"No WebSocket subscribers for match {match_id}")
-    
+        raise HTTPException(
+            status_code=404, detail=f"No WebSocket subscribers for match {match_id}"
+        )
+
     test_payload = {
         "type": "update",
         "event": {
@@ -77,9 +228,14 @@ async def test_broadcast(match_id: str) -> dict:
         },
         "analytics_latest": None,
     }
-    
-    await manager.broadcast(match_id, test_payload["event"], test_payload["match_state"], test_payload["analytics_latest"])
-    
+
+    await manager.broadcast(
+        match_id,
+        test_payload["event"],
+        test_payload["match_state"],
+        test_payload["analytics_latest"],
+    )
+
     return {
         "status": "broadcast_sent",
         "match_id": match_id,
@@ -0,0 +1,41 @@
+"""Server-Sent Events on the WebSocket fan-out: a WebSocket-shaped sink for a Subscriber."""
+
+import asyncio
+
+# Sent as the first chunk: client reconnect delay, and it flushes the response headers
+SSE_PREAMBLE = "retry: 2000\n\n"
+# Comment line; keeps proxies from timing out an idle stream
+SSE_HEARTBEAT = ": heartbeat\n\n"
+
+
+def sse_event(event_id: str, frame: str) -> str:
+    """One SSE message for an encoded JSON frame (single line). The browser sends event_id
+    ("<epoch>:<seq>", see StreamManager.event_id) back as Last-Event-ID on reconnect."""
+    return f"id: {event_id}\ndata: {frame}\n\n"
+
+
+def parse_event_id(event_id: str) -> tuple[int, str | None]:
+    """(seq, epoch) of a Last-Event-ID: "<epoch>:<seq>", or a bare seq without an epoch.
+    Raises ValueError if it is neither."""
+    epoch, _, seq = event_id.rpartition(":")
+    return int(seq), epoch or None
+
+
+class SSEChannel:
+    """Stands in for the WebSocket of a Subscriber. The subscriber's writer task hands each
+    queued chunk over here, and the response body takes it with next_chunk(); the hand-over
+    holds one chunk, so a slow client backs up the subscriber's own bounded queue."""
+
+    def __init__(self) -> None:
+        self._chunks: asyncio.Queue[str | None] = asyncio.Queue(maxsize=1)
+
+    async def send_text(self, data: str) -> None:
+        await self._chunks.put(data)
+
+    async def close(self, code: int = 1000) -> None:
+        # The subscriber shed this client (overflow policy "disconnect"): end the response
+        await self._chunks.put(None)
+
+    async def next_chunk(self, timeout: float) -> str | None:
+        """The next chunk, None once closed. Raises TimeoutError after timeout seconds."""
+        return await asyncio.wait_for(self._chunks.get(), timeout)
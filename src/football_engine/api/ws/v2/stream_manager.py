@@ -1,48 +1,384 @@
 """Lightweight WebSocket stream manager. Pi-optimized: minimal memory, async broadcast."""
 
+import json
 import logging
-from collections import defaultdict
+import threading
+import uuid
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
 from typing import Any
 
 from fastapi import WebSocket
 
+from football_engine.api.ws.v2.bus import UnixDatagramBus
+from football_engine.api.ws.v2.delta import merge_patch
+from football_engine.api.ws.v2.filters import ALL, StreamFilter
+from football_engine.api.ws.v2.payloads import encode_frame
+from football_engine.api.ws.v2.sse import sse_event
+from football_engine.api.ws.v2.subscriber import OverflowPolicy, StreamMode, Subscriber
+
 logger = logging.getLogger(__name__)
 
-# Limits for Pi: max connections per match, max total
+# Limits for Pi: max subscriptions per match, max total connections, max matches per
+# (multiplexed) connection
 MAX_CONNECTIONS_PER_MATCH = 20
 MAX_TOTAL_CONNECTIONS = 100
+MAX_MATCHES_PER_CONNECTION = 64
+
+
+@dataclass
+class _FilteredView:
+    """Last projected document sent to the subscribers of one non-identity filter."""
+
+    seq: int = 0
+    document: dict[str, Any] = field(default_factory=dict)
+    since_keyframe: int = 0
+
+
+@dataclass
+class _MatchStream:
+    """Per-match stream position: last sequence number, the document it carried, and
+    the most recent full update frames for replay."""
+
+    match_id: str
+    replay_size: int
+    seq: int = 0
+    document: dict[str, Any] = field(default_factory=dict)
+    since_keyframe: int = 0
+    # (seq, encoded "update" frame), oldest first
+    frames: deque[tuple[int, str]] = field(init=False)
+    # Encoded "snapshot" frame for the current seq, built on first use
+    snapshot: str | None = None
+    # Filters in use by subscribers of this match -> what their group last received
+    views: dict[StreamFilter, _FilteredView] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self.frames = deque(maxlen=max(1, self.replay_size))
+
+    def catch_up(
+        self, since: int | None, stream_filter: StreamFilter = ALL
+    ) -> list[tuple[int, str]]:
+        """(seq, frame) pairs that bring a client from since to seq: the buffered updates
+        after since, or one snapshot if since is missing, unknown or out of the buffer."""
+        if not self.seq or since == self.seq:
+            return []
+        if since is not None and 0 <= since < self.seq and self.frames[0][0] <= since + 1:
+            missed = [(seq, frame) for seq, frame in self.frames if seq > since]
+            if stream_filter.is_identity:
+                return missed
+            # Filtered replays are rare; re-filter the buffered frames instead of keeping
+            # every document in memory
+            documents = ((seq, json.loads(frame)) for seq, frame in missed)
+            return [
+                (seq, _encode("update", self.match_id, seq, stream_filter.project(document)))
+                for seq, document in documents
+                if stream_filter.accepts(document["event"])
+            ]
+        if not stream_filter.is_identity:
+            document = stream_filter.project(self.document)
+            return [(self.seq, _encode("snapshot", self.match_id, self.seq, document))]
+        if self.snapshot is None:
+            self.snapshot = _encode("snapshot", self.match_id, self.seq, self.document)
+        return [(self.seq, self.snapshot)]
 
 
 class StreamManager:
-    """Manages WebSocket subscriptions per match. Thread-safe for async FastAPI."""
+    """Manages WebSocket connections and their match subscriptions.
+
+    A connection (Subscriber) may be subscribed to one match (the per-match stream route)
+    or to many (the multiplexed route). Subscriptions are indexed by match, so a broadcast
+    touches only the connections interested in that match. Every frame carries its
+    match_id.
+
+    Each connection has a bounded send queue drained by its own writer task, so broadcast
+    only enqueues and never waits on a socket. When a queue is full, overflow_policy
+    decides: drop the oldest frame, conflate to the latest, or disconnect (code 1013).
+    State is guarded by a lock: broadcasts may come from another loop or thread.
+
+    Every update is numbered per match (seq). Delta-mode subscribers get a keyframe on
+    connect and every keyframe_interval updates, and a merge patch (see delta) against the
+    previous update otherwise. Each frame kind is built and encoded at most once per update.
+
+    A subscription may carry a StreamFilter. Subscribers of a match are grouped by filter:
+    each group's updates are selected and projected once per broadcast, and deltas chain
+    over the updates that group actually received (base_seq).
+
+    Matches that have had a subscriber keep their last replay_buffer_size update frames in
+    memory, also while nobody is connected (at most replay_max_matches matches, least
+    recently updated dropped first). A client connecting with since=<seq> gets the frames
+    it missed, or a single snapshot frame if they are no longer buffered. Server-Sent
+    Events clients (SSEChannel) get the same update frames, framed once per update.
 
-    def __init__(self) -> None:
-        # match_id -> list of WebSocket connections
-        self._subscribers: dict[str, list[WebSocket]] = defaultdict(list)
-        self._total_connections = 0
+    seq numbers are only meaningful within one epoch: a random id of this manager, sent
+    to clients in the `connected` frame and in SSE event ids. A since from another epoch
+    (another worker, or before a restart) gets a snapshot instead of a replay; a since
+    without an epoch is trusted only while no bus is attached (a single worker).
 
-    def subscribe(self, match_id: str, websocket: WebSocket) -> bool:
-        """Add subscriber. Returns True if added, False if limit reached."""
-        if self._total_connections >= MAX_TOTAL_CONNECTIONS:
+    With several workers, an attached UnixDatagramBus carries each broadcast to the other
+    workers, which deliver it to their own subscribers. Each worker numbers updates itself.
+    The bus also carries match-changed notices (publish_match_changed) for cache invalidation.
+    """
+
+    def __init__(
+        self,
+        send_queue_size: int = 64,
+        overflow_policy: OverflowPolicy | str = OverflowPolicy.DROP_OLDEST,
+        keyframe_interval: int = 20,
+        replay_buffer_size: int = 256,
+        replay_max_matches: int = 256,
+    ) -> None:
+        # websocket -> connection
+        self._connections: dict[WebSocket, Subscriber] = {}
+        # match_id -> websocket -> connection subscribed to that match
+        self._subscribers: dict[str, dict[WebSocket, Subscriber]] = {}
+        # match_id -> stream, least recently updated first
+        self._streams: OrderedDict[str, _MatchStream] = OrderedDict()
+        self._lock = threading.Lock()
+        self._bus: UnixDatagramBus | None = None
+        self.epoch = uuid.uuid4().hex[:12]
+        self.configure(
+            send_queue_size,
+            overflow_policy,
+            keyframe_interval,
+            replay_buffer_size,
+            replay_max_matches,
+        )
+
+    def configure(
+        self,
+        send_queue_size: int,
+        overflow_policy: OverflowPolicy | str,
+        keyframe_interval: int = 20,
+        replay_buffer_size: int = 256,
+        replay_max_matches: int = 256,
+    ) -> None:
+        """Queue size and overflow policy for subscribers added from now on; keyframe and
+        replay settings for streams created from now on."""
+        self.send_queue_size = send_queue_size
+        self.overflow_policy = OverflowPolicy(overflow_policy)
+        self.keyframe_interval = max(1, keyframe_interval)
+        self.replay_buffer_size = replay_buffer_size
+        self.replay_max_matches = max(1, replay_max_matches)
+
+    def set_bus(self, bus: UnixDatagramBus | None) -> None:
+        """Attach (or with None, detach) the cross-worker bus broadcast publishes to."""
+        self._bus = bus
+
+    def event_id(self, seq: int) -> str:
+        """SSE event id of seq: "<epoch>:<seq>", see parse_event_id."""
+        return f"{self.epoch}:{seq}"
+
+    def publish_match_changed(self, match_id: str, version: int) -> None:
+        """Announce a committed change of match_id to the other workers, if a bus is attached."""
+        bus = self._bus
+        if bus is not None:
+            bus.publish_match_changed(match_id, version)
+
+    def connect(self, websocket: WebSocket) -> Subscriber | None:
+        """Register a connection and start its writer on the running loop. None if the
+        connection limit is reached."""
+        with self._lock:
+            return self._connect(websocket)
+
+    def _connect(self, websocket: WebSocket) -> Subscriber | None:
+        subscriber = self._connections.get(websocket)
+        if subscriber is not None:
+            return subscriber
+        if len(self._connections) >= MAX_TOTAL_CONNECTIONS:
             logger.warning(f"Max total connections ({MAX_TOTAL_CONNECTIONS}) reached")
+            return None
+        subscriber = Subscriber(
+            websocket,
+            max_queue=self.send_queue_size,
+            overflow=self.overflow_policy,
+            on_close=lambda s: self._disconnect(s.websocket),
+        )
+        self._connections[websocket] = subscriber
+        return subscriber
+
+    def subscribe(
+        self,
+        match_id: str,
+        websocket: WebSocket,
+        stream_filter: StreamFilter = ALL,
+    ) -> Subscriber | None:
+        """Connect (if needed) and subscribe to match_id. None if a limit is reached."""
+        with self._lock:
+            created = websocket not in self._connections
+            subscriber = self._connect(websocket)
+            if subscriber is None:
+                return None
+            if not self._add(subscriber, match_id, stream_filter):
+                if created:
+                    self._connections.pop(websocket, None)
+                    subscriber.close()
+                return None
+            return subscriber
+
+    def subscribe_many(
+        self,
+        websocket: WebSocket,
+        match_ids: list[str],
+        since: dict[str, int] | None = None,
+        stream_filter: StreamFilter = ALL,
+        epoch: str | None = None,
+    ) -> tuple[list[str], list[str]]:
+        """Subscribe a connection to several matches and catch each up (see resume).
+        Subscribing again to a match only replaces its filter. Returns (subscribed,
+        rejected by limits)."""
+        subscribed: list[str] = []
+        rejected: list[str] = []
+        with self._lock:
+            subscriber = self._connections.get(websocket)
+            if subscriber is None:
+                return [], list(match_ids)
+            for match_id in match_ids:
+                if match_id in subscriber.matches:
+                    self._add(subscriber, match_id, stream_filter)
+                    subscribed.append(match_id)
+                elif self._add(subscriber, match_id, stream_filter):
+                    self._catch_up(subscriber, match_id, (since or {}).get(match_id), epoch)
+                    subscribed.append(match_id)
+                else:
+                    rejected.append(match_id)
+        return subscribed, rejected
+
+    def _add(
+        self, subscriber: Subscriber, match_id: str, stream_filter: StreamFilter = ALL
+    ) -> bool:
+        if match_id in subscriber.matches:
+            self._set_filter(subscriber, match_id, stream_filter)
+            return True
+        if len(subscriber.matches) >= MAX_MATCHES_PER_CONNECTION:
+            logger.warning(f"Max matches per connection ({MAX_MATCHES_PER_CONNECTION}) reached")
             return False
-        if len(self._subscribers[match_id]) >= MAX_CONNECTIONS_PER_MATCH:
+        if len(self._subscribers.get(match_id, ())) >= MAX_CONNECTIONS_PER_MATCH:
             logger.warning(f"Max connections for match {match_id} reached")
             return False
-        self._subscribers[match_id].append(websocket)
-        self._total_connections += 1
+        self._subscribers.setdefault(match_id, {})[subscriber.websocket] = subscriber
+        subscriber.matches.add(match_id)
+        self._set_filter(subscriber, match_id, stream_filter)
+        if match_id not in self._streams:
+            self._streams[match_id] = _MatchStream(match_id, self.replay_buffer_size)
+            self._evict_streams()
         return True
 
-    def unsubscribe(self, match_id: str, websocket: WebSocket) -> None:
-        """Remove subscriber."""
-        if match_id in self._subscribers:
-            try:
-                self._subscribers[match_id].remove(websocket)
-                self._total_connections -= 1
-                if not self._subscribers[match_id]:
-                    del self._subscribers[match_id]
-            except ValueError:
-                pass
+    @staticmethod
+    def _set_filter(subscriber: Subscriber, match_id: str, stream_filter: StreamFilter) -> None:
+        if stream_filter.is_identity:
+            subscriber.filters.pop(match_id, None)
+        elif subscriber.filters.get(match_id) != stream_filter:
+            subscriber.filters[match_id] = stream_filter
+            # The next delta-mode update is a keyframe of the new projection
+            subscriber.last_seq.pop(match_id, None)
+
+    def resume(
+        self,
+        match_id: str,
+        websocket: WebSocket,
+        mode: StreamMode | str | None = None,
+        since: int | None = None,
+        epoch: str | None = None,
+    ) -> None:
+        """Set the connection's protocol (if given) and catch it up on match_id from memory:
+        the buffered updates after since, or one snapshot frame of the latest update. No
+        database access. epoch is the one since was numbered in (see the class docs)."""
+        with self._lock:
+            subscriber = self._subscribers.get(match_id, {}).get(websocket)
+            if subscriber is None:
+                return
+            if mode is not None:
+                subscriber.mode = StreamMode(mode)
+            self._catch_up(subscriber, match_id, since, epoch)
+
+    def _catch_up(
+        self, subscriber: Subscriber, match_id: str, since: int | None, epoch: str | None
+    ) -> None:
+        stream = self._streams.get(match_id)
+        if stream is None:
+            return
+        if epoch != self.epoch and (epoch is not None or self._bus is not None):
+            # Numbered by another worker or an earlier process: start from a snapshot
+            since = None
+        stream_filter = subscriber.filters.get(match_id, ALL)
+        for seq, frame in stream.catch_up(since, stream_filter):
+            subscriber.push(sse_event(self.event_id(seq), frame) if subscriber.sse else frame)
+        if stream_filter.is_identity:
+            subscriber.last_seq[match_id] = stream.seq
+        else:
+            # Catch-up frames are not part of the filter's delta chain
+            subscriber.last_seq.pop(match_id, None)
+
+    def set_mode(self, websocket: WebSocket, mode: StreamMode | str) -> None:
+        """Switch a connection's protocol. Switching to delta sends a keyframe of the last
+        update of each subscribed match."""
+        mode = StreamMode(mode)
+        with self._lock:
+            subscriber = self._connections.get(websocket)
+            if subscriber is None or subscriber.mode == mode:
+                return
+            subscriber.mode = mode
+            if mode != StreamMode.DELTA:
+                return
+            for match_id in subscriber.matches:
+                stream = self._streams.get(match_id)
+                if stream is None:
+                    continue
+                stream_filter = subscriber.filters.get(match_id, ALL)
+                if stream_filter.is_identity:
+                    base = stream
+                else:
+                    base = stream.views.get(stream_filter)
+                if base is not None and base.seq:
+                    subscriber.last_seq[match_id] = base.seq
+                    subscriber.push(_encode("keyframe", match_id, base.seq, base.document))
+
+    def unsubscribe(self, match_id: str, websocket: WebSocket, close_if_idle: bool = True) -> None:
+        """Remove the subscription. A connection left with no subscriptions is closed
+        (its writer stopped) unless close_if_idle is False, as on the multiplexed route."""
+        with self._lock:
+            subscriber = self._connections.get(websocket)
+            if subscriber is None:
+                return
+            self._remove(subscriber, match_id)
+            if subscriber.matches or not close_if_idle:
+                return
+            del self._connections[websocket]
+        subscriber.close()
+
+    def disconnect(self, websocket: WebSocket) -> None:
+        """Drop the connection and all its subscriptions, and stop its writer."""
+        subscriber = self._disconnect(websocket)
+        if subscriber is not None:
+            subscriber.close()
+
+    def _disconnect(self, websocket: WebSocket) -> Subscriber | None:
+        with self._lock:
+            subscriber = self._connections.pop(websocket, None)
+            if subscriber is not None:
+                for match_id in list(subscriber.matches):
+                    self._remove(subscriber, match_id)
+            return subscriber
+
+    def _remove(self, subscriber: Subscriber, match_id: str) -> None:
+        subscriber.matches.discard(match_id)
+        subscriber.last_seq.pop(match_id, None)
+        subscriber.filters.pop(match_id, None)
+        subscribers = self._subscribers.get(match_id)
+        if subscribers is not None:
+            subscribers.pop(subscriber.websocket, None)
+            if not subscribers:
+                del self._subscribers[match_id]
+
+    def _evict_streams(self) -> None:
+        """Drop the least recently updated streams without subscribers beyond the limit."""
+        excess = len(self._streams) - self.replay_max_matches
+        for match_id in list(self._streams):
+            if excess <= 0:
+                break
+            if match_id not in self._subscribers:
+                del self._streams[match_id]
+                excess -= 1
 
     async def broadcast(
         self,
@@ -51,31 +387,141 @@ class StreamManager:
         match_state: dict[str, Any],
         analytics_latest: dict[str, Any] | None,
     ) -> None:
-        """Broadcast update to all subscribers for match_id. Non-blocking, handles disconnects."""
-        if match_id not in self._subscribers:
-            return
-
-        payload = {
-            "type": "update",
+        """Queue an update for all subscribers of match_id, and publish it to the other
+        workers if a bus is attached. Never waits on a socket."""
+        document = {
             "event": event,
             "match_state": match_state,
             "analytics_latest": analytics_latest,
         }
+        self.deliver(match_id, document)
+        if self._bus is not None:
+            self._bus.publish(match_id, document)
+
+    def deliver(self, match_id: str, document: dict[str, Any]) -> None:
+        """Queue an {event, match_state, analytics_latest} update for the subscribers of
+        this process. Called by broadcast and by the bus for updates of other workers.
+
+        Runs under the lock so sequence numbers reach every queue in order. Matches with
+        a stream are numbered and buffered even while no one is subscribed.
+        """
+        event = document["event"]
+        with self._lock:
+            stream = self._streams.get(match_id)
+            if stream is None:
+                return
+            self._streams.move_to_end(match_id)
+            previous = stream.document
+            stream.seq += 1
+            stream.document = document
+            stream.snapshot = None
+            stream.since_keyframe += 1
+            keyframe_due = stream.since_keyframe >= self.keyframe_interval
+            if keyframe_due:
+                stream.since_keyframe = 0
+
+            seq = stream.seq
+            update = _encode("update", match_id, seq, document)
+            stream.frames.append((seq, update))
 
-        disconnected: list[WebSocket] = []
-        for ws in self._subscribers[match_id]:
-            try:
-                await ws.send_json(payload)
-            except Exception as e:
-                logger.debug(f"Failed to send to subscriber: {e}")
-                disconnected.append(ws)
+            groups: dict[StreamFilter, list[Subscriber]] = {}
+            for subscriber in self._subscribers.get(match_id, {}).values():
+                groups.setdefault(subscriber.filters.get(match_id, ALL), []).append(subscriber)
+            # Views of filters nobody uses any more
+            for stream_filter in [f for f in stream.views if f not in groups]:
+                del stream.views[stream_filter]
 
-        for ws in disconnected:
-            self.unsubscribe(match_id, ws)
+            for stream_filter, subscribers in groups.items():
+                if stream_filter.is_identity:
+                    self._send(
+                        match_id,
+                        seq,
+                        subscribers,
+                        document,
+                        previous,
+                        seq - 1,
+                        keyframe_due,
+                        update,
+                    )
+                    continue
+                if not stream_filter.accepts(event):
+                    continue
+                view = stream.views.setdefault(stream_filter, _FilteredView())
+                projected = stream_filter.project(document)
+                base_seq, view_previous = view.seq, view.document
+                view.seq, view.document = seq, projected
+                view.since_keyframe += 1
+                view_keyframe_due = view.since_keyframe >= self.keyframe_interval
+                if view_keyframe_due:
+                    view.since_keyframe = 0
+                self._send(
+                    match_id,
+                    seq,
+                    subscribers,
+                    projected,
+                    view_previous,
+                    base_seq,
+                    view_keyframe_due,
+                )
+
+    def _send(
+        self,
+        match_id: str,
+        seq: int,
+        subscribers: list[Subscriber],
+        document: dict[str, Any],
+        previous: dict[str, Any],
+        base_seq: int,
+        keyframe_due: bool,
+        update: str | None = None,
+    ) -> None:
+        """Queue one update to subscribers sharing a filter. previous is the document
+        they were last sent (at base_seq); each frame kind is encoded at most once."""
+        frames: dict[str, str] = {} if update is None else {"update": update}
+        for subscriber in subscribers:
+            if subscriber.sse:
+                kind = "sse"
+            elif subscriber.mode == StreamMode.FULL:
+                kind = "update"
+            elif keyframe_due or not previous or subscriber.last_seq.get(match_id) != base_seq:
+                kind = "keyframe"
+            else:
+                kind = "delta"
+            subscriber.last_seq[match_id] = seq
+            frame = frames.get(kind)
+            if frame is None:
+                if kind == "delta":
+                    frame = encode_frame(
+                        {
+                            "type": "delta",
+                            "match_id": match_id,
+                            "seq": seq,
+                            "base_seq": base_seq,
+                            "patch": merge_patch(previous, document),
+                        }
+                    )
+                elif kind == "sse":
+                    if "update" not in frames:
+                        frames["update"] = _encode("update", match_id, seq, document)
+                    frame = sse_event(self.event_id(seq), frames["update"])
+                else:
+                    frame = _encode(kind, match_id, seq, document)
+                frames[kind] = frame
+            subscriber.push(frame)
 
     def get_subscriber_count(self, match_id: str) -> int:
         """Return number of active subscribers for a match."""
-        return len(self._subscribers.get(match_id, []))
+        with self._lock:
+            return len(self._subscribers.get(match_id, ()))
+
+    def get_connection_count(self) -> int:
+        """Return number of open connections (a multiplexed one counts once)."""
+        with self._lock:
+            return len(self._connections)
+
+
+def _encode(kind: str, match_id: str, seq: int, document: dict[str, Any]) -> str:
+    return encode_frame({"type": kind, "match_id": match_id, "seq": seq, **document})
 
 
 # Global singleton (FastAPI app will hold reference)
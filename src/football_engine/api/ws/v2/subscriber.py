@@ -0,0 +1,139 @@
+"""One WebSocket subscriber: a bounded outbound queue drained by its own writer task."""
+
+import asyncio
+import logging
+from collections import deque
+from collections.abc import Callable
+from enum import StrEnum
+
+from fastapi import WebSocket, WebSocketDisconnect
+
+from football_engine.api.ws.v2.filters import StreamFilter
+from football_engine.api.ws.v2.sse import SSEChannel
+
+logger = logging.getLogger(__name__)
+
+# RFC 6455 "Try Again Later": the server shed this client
+CLOSE_TRY_AGAIN_LATER = 1013
+
+
+class OverflowPolicy(StrEnum):
+    # Drop the oldest queued frame to make room for the new one
+    DROP_OLDEST = "drop_oldest"
+    # Drop everything queued; the client only gets the latest frame
+    CONFLATE = "conflate"
+    # Close the connection with 1013 so the client reconnects (and resyncs)
+    DISCONNECT = "disconnect"
+
+
+class StreamMode(StrEnum):
+    # Every update carries the full match_state and analytics_latest
+    FULL = "full"
+    # Keyframes on connect and every N updates, merge-patch deltas in between
+    DELTA = "delta"
+
+
+class Subscriber:
+    """One connection, subscribed to one or more matches.
+
+    Frames are queued with push() from any thread or loop and sent in order by a
+    writer task on the loop that owns the websocket, so a slow client only delays itself.
+
+    on_close runs once, on the owner loop, when the writer stops for any reason.
+    In delta mode a dropped frame breaks the patch chain, so any drop forgets last_seq
+    and the next update of every match to this subscriber is a keyframe.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket | SSEChannel,
+        max_queue: int = 64,
+        overflow: OverflowPolicy | str = OverflowPolicy.DROP_OLDEST,
+        on_close: Callable[["Subscriber"], None] | None = None,
+    ) -> None:
+        self.websocket = websocket
+        self.overflow = OverflowPolicy(overflow)
+        self.mode = StreamMode.FULL
+        # Server-Sent Events client: full updates only, framed as SSE messages
+        self.sse = isinstance(websocket, SSEChannel)
+        # Matches this connection is subscribed to (maintained by StreamManager)
+        self.matches: set[str] = set()
+        # match_id -> seq of the last update frame queued for that match
+        self.last_seq: dict[str, int] = {}
+        # match_id -> filter of that subscription; absent means everything
+        self.filters: dict[str, StreamFilter] = {}
+        self.dropped = 0
+        self._max_queue = max(1, max_queue)
+        self._queue: deque[str] = deque()
+        self._on_close = on_close
+        self._close_code: int | None = None
+        self._loop = asyncio.get_running_loop()
+        self._ready = asyncio.Event()
+        self._task = self._loop.create_task(self._write())
+
+    @property
+    def closed(self) -> bool:
+        return self._task.done() or self._close_code is not None
+
+    def push(self, frame: str) -> None:
+        """Queue a frame without waiting. Safe to call from any thread or event loop."""
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._enqueue(frame)
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._enqueue, frame)
+        except RuntimeError:
+            # Owner loop already closed; the connection is gone
+            pass
+
+    def close(self) -> None:
+        """Stop the writer. Queued frames are discarded. Safe from any thread or loop."""
+        try:
+            self._loop.call_soon_threadsafe(self._task.cancel)
+        except RuntimeError:
+            pass
+
+    def _enqueue(self, frame: str) -> None:
+        if self.closed:
+            return
+        if len(self._queue) >= self._max_queue:
+            self.dropped += len(self._queue) if self.overflow == OverflowPolicy.CONFLATE else 1
+            self.last_seq.clear()
+            if self.overflow == OverflowPolicy.DISCONNECT:
+                self._close_code = CLOSE_TRY_AGAIN_LATER
+                self._queue.clear()
+                self._ready.set()
+                return
+            if self.overflow == OverflowPolicy.CONFLATE:
+                self._queue.clear()
+            else:
+                self._queue.popleft()
+        self._queue.append(frame)
+        self._ready.set()
+
+    async def _write(self) -> None:
+        try:
+            while True:
+                await self._ready.wait()
+                self._ready.clear()
+                if self._close_code is not None:
+                    logger.info(f"Closing slow WebSocket subscriber ({self.dropped} dropped)")
+                    await self.websocket.close(code=self._close_code)
+                    return
+                while self._queue and self._close_code is None:
+                    await self.websocket.send_text(self._queue.popleft())
+        except asyncio.CancelledError:
+            pass
+        except (WebSocketDisconnect, RuntimeError) as e:
+            # The client went away, or the socket was closed under the writer
+            logger.debug(f"Failed to send to subscriber: {e}")
+        except Exception:
+            logger.exception("WebSocket subscriber writer failed")
+        finally:
+            self._queue.clear()
+            if self._on_close is not None:
+                self._on_close(self)
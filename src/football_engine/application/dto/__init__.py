@@ -1,9 +1,17 @@
 """Application DTOs for responses."""
 
-from football_engine.application.dto.ingest_result_dto import ingest_result_dto
+from football_engine.application.dto.ingest_result_dto import (
+    ingest_batch_result_dto,
+    ingest_result_dto,
+)
 from football_engine.application.dto.match_state_dto import (
     analytics_snapshot_to_dto,
     match_to_state_dto,
 )
 
-__all__ = ["match_to_state_dto", "analytics_snapshot_to_dto", "ingest_result_dto"]
+__all__ = [
+    "analytics_snapshot_to_dto",
+    "ingest_batch_result_dto",
+    "ingest_result_dto",
+    "match_to_state_dto",
+]
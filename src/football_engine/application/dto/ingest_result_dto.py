@@ -1,4 +1,4 @@
-"""Result of ingesting an event."""
+"""Result of ingesting an event or a batch of events."""
 
 from typing import Any
 
@@ -15,3 +15,20 @@ def ingest_result_dto(
         "match_state": match_state,
         "analytics_latest": analytics_latest,
     }
+
+
+def ingest_batch_result_dto(
+    event_ids: list[str],
+    deduplicated: list[bool],
+    match_state: dict[str, Any],
+    analytics_latest: dict[str, Any] | None,
+) -> dict[str, Any]:
+    return {
+        "accepted": True,
+        "results": [
+            {"event_id": event_id, "accepted": True, "deduplicated": dup}
+            for event_id, dup in zip(event_ids, deduplicated)
+        ],
+        "match_state": match_state,
+        "analytics_latest": analytics_latest,
+    }
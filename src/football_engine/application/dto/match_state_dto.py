@@ -44,9 +44,9 @@ def analytics_snapshot_to_dto(snapshot: AnalyticsSnapshot) -> dict[str, Any]:
             "minute": snapshot.clock.minute,
             "second": snapshot.clock.second,
         },
-        "features_by_window": snapshot.features_by_window,
+        "features_by_window": snapshot.features_dict(),
         "derived_metrics": snapshot.derived_metrics,
-        "deltas": snapshot.deltas,
+        "deltas": snapshot.deltas_dict(),
         "why": snapshot.why,
         "model_version": snapshot.model_version,
         "created_at_utc": snapshot.created_at_utc.isoformat(),
@@ -1,13 +1,45 @@
 """Application (use-case) services."""
 
+from football_engine.application.services.async_ingest_event_service import (
+    AsyncIngestEventService,
+)
 from football_engine.application.services.create_match_service import CreateMatchService
-from football_engine.application.services.get_analytics_service import GetLatestAnalyticsService
-from football_engine.application.services.get_state_service import GetMatchStateService
-from football_engine.application.services.ingest_event_service import IngestEventService
+from football_engine.application.services.get_analytics_service import (
+    AsyncGetLatestAnalyticsService,
+    GetLatestAnalyticsService,
+)
+from football_engine.application.services.get_state_service import (
+    AsyncGetMatchStateService,
+    GetMatchStateService,
+)
+from football_engine.application.services.ingest_event_service import (
+    IngestEventService,
+    MatchWriteConflictError,
+)
+from football_engine.application.services.ingest_pipeline import (
+    IngestPipeline,
+    IngestQueueFullError,
+)
+from football_engine.application.services.recompute_match_service import RecomputeMatchService
+from football_engine.application.services.snapshot_coalescer import (
+    CoalescingMode,
+    SnapshotCoalescer,
+)
+from football_engine.application.services.version_waiters import MatchVersionWaiters
 
 __all__ = [
+    "AsyncGetLatestAnalyticsService",
+    "AsyncGetMatchStateService",
+    "AsyncIngestEventService",
+    "CoalescingMode",
     "CreateMatchService",
-    "IngestEventService",
-    "GetMatchStateService",
     "GetLatestAnalyticsService",
+    "GetMatchStateService",
+    "IngestEventService",
+    "IngestPipeline",
+    "IngestQueueFullError",
+    "MatchVersionWaiters",
+    "MatchWriteConflictError",
+    "RecomputeMatchService",
+    "SnapshotCoalescer",
 ]
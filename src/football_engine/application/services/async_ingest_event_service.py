@@ -0,0 +1,149 @@
+"""Async ingest on asyncio repositories. Same contract as IngestEventService."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from football_engine.application.services.ingest_event_service import (
+    SAVE_ATTEMPTS,
+    MatchWriteConflictError,
+    apply_in_clock_order,
+    split_new_events,
+)
+from football_engine.application.services.snapshot_coalescer import SnapshotCoalescer
+from football_engine.domain.entities import Event, Match
+from football_engine.domain.enums import MatchStatus
+from football_engine.domain.repositories import (
+    AsyncAnalyticsRepository,
+    AsyncEventRepository,
+    AsyncMatchRepository,
+)
+from football_engine.domain.services import AnalyticsEngine
+from football_engine.domain.value_objects import MatchClock
+
+if TYPE_CHECKING:
+    from football_engine.domain.entities import AnalyticsSnapshot
+
+
+class AsyncIngestEventService:
+    def __init__(
+        self,
+        match_repository: AsyncMatchRepository,
+        event_repository: AsyncEventRepository,
+        analytics_repository: AsyncAnalyticsRepository,
+        analytics_engine: AnalyticsEngine,
+        snapshot_coalescer: SnapshotCoalescer | None = None,
+    ) -> None:
+        self._match_repo = match_repository
+        self._event_repo = event_repository
+        self._analytics_repo = analytics_repository
+        self._engine = analytics_engine
+        self._coalescer = snapshot_coalescer
+
+    async def ingest(
+        self, event: Event
+    ) -> tuple[bool, bool, Match | None, AnalyticsSnapshot | None]:
+        """Returns (accepted, deduplicated, match_state, analytics_latest)."""
+        match = await self._match_repo.get_match(event.match_id)
+        if match is None:
+            return False, False, None, None
+
+        known = await self._event_repo.known_event_ids(event.match_id, [event.event_id])
+        if known or not await self._event_repo.add_event_if_new(event):
+            snapshot = await self._analytics_repo.get_latest_snapshot(event.match_id)
+            return True, True, match, snapshot
+
+        match, updated_match, _ = await self._apply_and_save(match, [event])
+        late = event.clock < match.clock
+        snapshot = await self._snapshot_after(updated_match, event.clock, [event], late)
+        return True, False, updated_match, snapshot
+
+    async def ingest_batch(
+        self, match_id: str, events: list[Event]
+    ) -> tuple[bool, list[bool], Match | None, AnalyticsSnapshot | None]:
+        """Returns (accepted, deduplicated flag per input event, match_state, analytics_latest)."""
+        match = await self._match_repo.get_match(match_id)
+        if match is None:
+            return False, [], None, None
+
+        known = await self._event_repo.known_event_ids(match_id, [e.event_id for e in events])
+        repeated, candidates = split_new_events(events, known)
+        inserted = await self._event_repo.add_events_if_new(candidates)
+        deduplicated = [dup or e.event_id not in inserted for e, dup in zip(events, repeated)]
+        new_events = [e for e in candidates if e.event_id in inserted]
+        if not new_events:
+            snapshot = await self._analytics_repo.get_latest_snapshot(match_id)
+            return True, deduplicated, match, snapshot
+
+        match, updated_match, ordered = await self._apply_and_save(match, new_events)
+        clock = ordered[-1].clock
+        snapshot = await self._snapshot_after(updated_match, clock, ordered, clock < match.clock)
+        return True, deduplicated, updated_match, snapshot
+
+    async def _apply_and_save(
+        self, match: Match, events: list[Event]
+    ) -> tuple[Match, Match, list[Event]]:
+        """See IngestEventService._apply_and_save."""
+        for _ in range(SAVE_ATTEMPTS):
+            updated, ordered = apply_in_clock_order(match, events)
+            saved = await self._match_repo.save_match(updated, expected_version=match.version)
+            if saved is not None:
+                return match, updated, ordered
+            reloaded = await self._match_repo.get_match(match.match_id)
+            if reloaded is None:
+                break
+            match = reloaded
+        raise MatchWriteConflictError(match.match_id)
+
+    async def flush_snapshot(
+        self, match_id: str
+    ) -> tuple[Event | None, Match | None, AnalyticsSnapshot | None]:
+        """See IngestEventService.flush_snapshot."""
+        pending = self._coalescer.take(match_id) if self._coalescer is not None else None
+        if pending is None:
+            return None, None, None
+        event, late = pending
+        match = await self._match_repo.get_match(match_id)
+        if match is None:
+            return None, None, None
+        snapshot = await self._compute_snapshot(match, event.clock, [], late)
+        self._coalescer.computed(match_id, event.clock, match.status == MatchStatus.FT)
+        return event, match, snapshot
+
+    async def _snapshot_after(
+        self, match: Match, clock: MatchClock, new_events: list[Event], late: bool
+    ) -> AnalyticsSnapshot | None:
+        """See IngestEventService._snapshot_after."""
+        match_id = match.match_id
+        if self._coalescer is not None and self._coalescer.defer(match_id, new_events):
+            if self._engine.observe(match_id, new_events, clock, match.version) is None:
+                self._engine.invalidate_windows(match_id)
+            return await self._analytics_repo.get_latest_snapshot(match_id)
+        snapshot = await self._compute_snapshot(match, clock, new_events, late)
+        if self._coalescer is not None:
+            self._coalescer.computed(match_id, clock, match.status == MatchStatus.FT)
+        return snapshot
+
+    async def _compute_snapshot(
+        self, match: Match, clock: MatchClock, new_events: list[Event], late: bool
+    ) -> AnalyticsSnapshot:
+        """See IngestEventService._compute_snapshot."""
+        match_id = match.match_id
+        try:
+            previous = await self._analytics_repo.get_latest_snapshot(match_id)
+            features = self._engine.observe(match_id, new_events, clock, match.version)
+            if features is None:
+                # Every window is a suffix of the widest one: a single fetch serves all
+                widest = await self._event_repo.list_events_in_window(
+                    match_id, clock, self._engine.widest_window
+                )
+                if late:
+                    features = self._engine.window_features(widest, clock)
+                else:
+                    features = self._engine.rebuild_windows(match_id, clock, widest, match.version)
+            snapshot = self._engine.compute_from_features(match, features, clock, previous)
+            await self._analytics_repo.save_snapshot(snapshot)
+        except Exception:
+            self._engine.invalidate_windows(match_id)
+            raise
+        return snapshot
@@ -1,7 +1,7 @@
 """Get latest analytics snapshot for a match."""
 
 from football_engine.domain.entities import AnalyticsSnapshot
-from football_engine.domain.repositories import AnalyticsRepository
+from football_engine.domain.repositories import AnalyticsRepository, AsyncAnalyticsRepository
 
 
 class GetLatestAnalyticsService:
@@ -10,3 +10,11 @@ class GetLatestAnalyticsService:
 
     def get(self, match_id: str) -> AnalyticsSnapshot | None:
         return self._analytics_repo.get_latest_snapshot(match_id)
+
+
+class AsyncGetLatestAnalyticsService:
+    def __init__(self, analytics_repository: AsyncAnalyticsRepository) -> None:
+        self._analytics_repo = analytics_repository
+
+    async def get(self, match_id: str) -> AnalyticsSnapshot | None:
+        return await self._analytics_repo.get_latest_snapshot(match_id)
@@ -1,7 +1,7 @@
 """Get current match state."""
 
 from football_engine.domain.entities import Match
-from football_engine.domain.repositories import MatchRepository
+from football_engine.domain.repositories import AsyncMatchRepository, MatchRepository
 
 
 class GetMatchStateService:
@@ -10,3 +10,11 @@ class GetMatchStateService:
 
     def get(self, match_id: str) -> Match | None:
         return self._match_repo.get_match(match_id)
+
+
+class AsyncGetMatchStateService:
+    def __init__(self, match_repository: AsyncMatchRepository) -> None:
+        self._match_repo = match_repository
+
+    async def get(self, match_id: str) -> Match | None:
+        return await self._match_repo.get_match(match_id)
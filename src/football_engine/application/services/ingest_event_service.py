@@ -1,17 +1,54 @@
-"""Ingest one event: dedup, persist, update match state, compute and store analytics."""
+"""Ingest events: dedup, persist, update match state, compute and store analytics."""
 
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from football_engine.application.services.snapshot_coalescer import SnapshotCoalescer
 from football_engine.domain.entities import Event, Match
-from football_engine.domain.repositories import AnalyticsRepository, EventRepository, MatchRepository
+from football_engine.domain.enums import MatchStatus
+from football_engine.domain.repositories import (
+    AnalyticsRepository,
+    EventRepository,
+    MatchRepository,
+)
 from football_engine.domain.services import AnalyticsEngine
-from football_engine.domain.value_objects import RollingWindow
+from football_engine.domain.value_objects import MatchClock
 
 if TYPE_CHECKING:
     from football_engine.domain.entities import AnalyticsSnapshot
 
+# Conditional match writes tried before giving up on a contended match
+SAVE_ATTEMPTS = 3
+
+
+class MatchWriteConflictError(Exception):
+    """The match kept changing under a conditional write (SAVE_ATTEMPTS times)."""
+
+
+def split_new_events(events: list[Event], existing_ids: set[str]) -> tuple[list[bool], list[Event]]:
+    """Deduplicated flag per event (stored or repeated in the batch) and the new events."""
+    seen = set(existing_ids)
+    deduplicated: list[bool] = []
+    new_events: list[Event] = []
+    for e in events:
+        if e.event_id in seen:
+            deduplicated.append(True)
+            continue
+        seen.add(e.event_id)
+        new_events.append(e)
+        deduplicated.append(False)
+    return deduplicated, new_events
+
+
+def apply_in_clock_order(match: Match, events: list[Event]) -> tuple[Match, list[Event]]:
+    """Apply events to match sorted by clock (stable). Returns (updated match, ordered events)."""
+    ordered = sorted(events, key=lambda e: (e.clock.period, e.clock.total_seconds_in_period()))
+    updated = match
+    for e in ordered:
+        updated = updated.apply_event(e)
+    return updated, ordered
+
 
 class IngestEventService:
     def __init__(
@@ -20,40 +57,132 @@ class IngestEventService:
         event_repository: EventRepository,
         analytics_repository: AnalyticsRepository,
         analytics_engine: AnalyticsEngine,
+        snapshot_coalescer: SnapshotCoalescer | None = None,
     ) -> None:
         self._match_repo = match_repository
         self._event_repo = event_repository
         self._analytics_repo = analytics_repository
         self._engine = analytics_engine
+        self._coalescer = snapshot_coalescer
 
-    def ingest(self, event: Event) -> tuple[bool, bool, Match | None, "AnalyticsSnapshot | None"]:
+    def ingest(self, event: Event) -> tuple[bool, bool, Match | None, AnalyticsSnapshot | None]:
         """Returns (accepted, deduplicated, match_state, analytics_latest)."""
         match = self._match_repo.get_match(event.match_id)
         if match is None:
             return False, False, None, None
 
-        inserted = self._event_repo.add_event_if_new(event)
-        if not inserted:
-            match = self._match_repo.get_match(event.match_id)
+        known = self._event_repo.known_event_ids(event.match_id, [event.event_id])
+        if known or not self._event_repo.add_event_if_new(event):
             snapshot = self._analytics_repo.get_latest_snapshot(event.match_id)
             return True, True, match, snapshot
 
-        updated_match = match.apply_event(event)
-        self._match_repo.save_match(updated_match)
-
-        clock = event.clock
-        window_5 = RollingWindow(minutes=5)
-        window_10 = RollingWindow(minutes=10)
-        events_5m = self._event_repo.list_events_in_window(
-            event.match_id, clock, window_5
-        )
-        events_10m = self._event_repo.list_events_in_window(
-            event.match_id, clock, window_10
-        )
-        previous = self._analytics_repo.get_latest_snapshot(event.match_id)
-        snapshot = self._engine.compute(
-            updated_match, events_5m, events_10m, clock, previous
-        )
-        self._analytics_repo.save_snapshot(snapshot)
-
+        match, updated_match, _ = self._apply_and_save(match, [event])
+        late = event.clock < match.clock
+        snapshot = self._snapshot_after(updated_match, event.clock, [event], late)
         return True, False, updated_match, snapshot
+
+    def ingest_batch(
+        self, match_id: str, events: list[Event]
+    ) -> tuple[bool, list[bool], Match | None, AnalyticsSnapshot | None]:
+        """Ingest an ordered batch for one match in a single unit of work.
+
+        Dedups and bulk-inserts in one conflict-free insert, applies the new events to the
+        match in clock order and computes one snapshot at the latest clock.
+        Returns (accepted, deduplicated flag per input event, match_state, analytics_latest).
+        """
+        match = self._match_repo.get_match(match_id)
+        if match is None:
+            return False, [], None, None
+
+        known = self._event_repo.known_event_ids(match_id, [e.event_id for e in events])
+        repeated, candidates = split_new_events(events, known)
+        inserted = self._event_repo.add_events_if_new(candidates)
+        deduplicated = [dup or e.event_id not in inserted for e, dup in zip(events, repeated)]
+        new_events = [e for e in candidates if e.event_id in inserted]
+        if not new_events:
+            snapshot = self._analytics_repo.get_latest_snapshot(match_id)
+            return True, deduplicated, match, snapshot
+
+        match, updated_match, ordered = self._apply_and_save(match, new_events)
+        clock = ordered[-1].clock
+        snapshot = self._snapshot_after(updated_match, clock, ordered, clock < match.clock)
+        return True, deduplicated, updated_match, snapshot
+
+    def _apply_and_save(
+        self, match: Match, events: list[Event]
+    ) -> tuple[Match, Match, list[Event]]:
+        """(match the events were applied to, updated match, events in clock order).
+
+        The write is conditional on match.version. When another writer got there first
+        (match came from a stale cache), the match is read again and the events re-applied.
+        """
+        for _ in range(SAVE_ATTEMPTS):
+            updated, ordered = apply_in_clock_order(match, events)
+            if self._match_repo.save_match(updated, expected_version=match.version) is not None:
+                return match, updated, ordered
+            reloaded = self._match_repo.get_match(match.match_id)
+            if reloaded is None:
+                break
+            match = reloaded
+        raise MatchWriteConflictError(match.match_id)
+
+    def flush_snapshot(
+        self, match_id: str
+    ) -> tuple[Event | None, Match | None, AnalyticsSnapshot | None]:
+        """Compute the coalesced snapshot for deferred events, if any are still pending.
+
+        Returns (latest deferred event, match_state, analytics_latest); all None when there
+        was nothing to flush.
+        """
+        pending = self._coalescer.take(match_id) if self._coalescer is not None else None
+        if pending is None:
+            return None, None, None
+        event, late = pending
+        match = self._match_repo.get_match(match_id)
+        if match is None:
+            return None, None, None
+        snapshot = self._compute_snapshot(match, event.clock, [], late)
+        self._coalescer.computed(match_id, event.clock, match.status == MatchStatus.FT)
+        return event, match, snapshot
+
+    def _snapshot_after(
+        self, match: Match, clock: MatchClock, new_events: list[Event], late: bool
+    ) -> AnalyticsSnapshot | None:
+        """Compute the snapshot now, or fold the events into window state and defer it."""
+        match_id = match.match_id
+        if self._coalescer is not None and self._coalescer.defer(match_id, new_events):
+            if self._engine.observe(match_id, new_events, clock, match.version) is None:
+                self._engine.invalidate_windows(match_id)
+            return self._analytics_repo.get_latest_snapshot(match_id)
+        snapshot = self._compute_snapshot(match, clock, new_events, late)
+        if self._coalescer is not None:
+            self._coalescer.computed(match_id, clock, match.status == MatchStatus.FT)
+        return snapshot
+
+    def _compute_snapshot(
+        self, match: Match, clock: MatchClock, new_events: list[Event], late: bool
+    ) -> AnalyticsSnapshot:
+        """Window features come from the engine's in-memory state; DB windows only on a miss.
+
+        A late event on a cold state is computed from the DB without seeding, since the
+        window ending at its clock would not include events already stored after it.
+        """
+        match_id = match.match_id
+        try:
+            previous = self._analytics_repo.get_latest_snapshot(match_id)
+            features = self._engine.observe(match_id, new_events, clock, match.version)
+            if features is None:
+                # Every window is a suffix of the widest one: a single fetch serves all
+                widest = self._event_repo.list_events_in_window(
+                    match_id, clock, self._engine.widest_window
+                )
+                if late:
+                    features = self._engine.window_features(widest, clock)
+                else:
+                    features = self._engine.rebuild_windows(match_id, clock, widest, match.version)
+            snapshot = self._engine.compute_from_features(match, features, clock, previous)
+            self._analytics_repo.save_snapshot(snapshot)
+        except Exception:
+            self._engine.invalidate_windows(match_id)
+            raise
+        return snapshot
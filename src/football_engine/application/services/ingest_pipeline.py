@@ -0,0 +1,95 @@
+"""Per-match single-writer ingest pipeline. Runs ingest jobs off the event loop, in order per match."""
+
+import asyncio
+import threading
+import zlib
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+class IngestQueueFullError(Exception):
+    """Raised when a match already has the maximum number of pending ingest jobs."""
+
+
+class IngestPipeline:
+    """Shards matches over single-thread workers.
+
+    Each match hashes to one worker, so its jobs run strictly in submission order and
+    never concurrently, while different matches proceed in parallel on other workers.
+    Pending jobs per match are bounded; submit fails fast instead of queueing forever.
+    With an async DB stack, submit_async gives the same per-match ordering on the event
+    loop itself (a FIFO lock per match) instead of a worker thread.
+    """
+
+    def __init__(self, workers: int = 4, max_pending_per_match: int = 1000) -> None:
+        self._workers = [
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"ingest-{i}")
+            for i in range(workers)
+        ]
+        self._max_pending = max_pending_per_match
+        self._pending: dict[str, int] = {}
+        self._async_locks: dict[str, asyncio.Lock] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, match_id: str, job: Callable[[], T]) -> "Future[T]":
+        """Enqueue job for match_id. Raises IngestQueueFullError when the match is backlogged."""
+        self._reserve(match_id)
+        worker = self._workers[zlib.crc32(match_id.encode()) % len(self._workers)]
+        try:
+            future = worker.submit(job)
+        except RuntimeError:
+            self._release(match_id)
+            raise
+        future.add_done_callback(lambda _: self._release(match_id))
+        return future
+
+    async def run(self, match_id: str, job: Callable[[], T]) -> T:
+        """Enqueue job and await its result without blocking the event loop."""
+        return await asyncio.wrap_future(self.submit(match_id, job))
+
+    def submit_async(self, match_id: str, job: Callable[[], Awaitable[T]]) -> "asyncio.Task[T]":
+        """Schedule a coroutine job on the running loop, after earlier async jobs of the match.
+
+        The slot is reserved immediately, so a backlogged match raises here, not in the task.
+        """
+        self._reserve(match_id)
+        try:
+            return asyncio.ensure_future(self._run_reserved(match_id, job))
+        except BaseException:
+            self._release(match_id)
+            raise
+
+    async def _run_reserved(self, match_id: str, job: Callable[[], Awaitable[T]]) -> T:
+        try:
+            lock = self._async_locks.setdefault(match_id, asyncio.Lock())
+            async with lock:
+                return await job()
+        finally:
+            self._release(match_id)
+
+    def pending(self, match_id: str) -> int:
+        with self._lock:
+            return self._pending.get(match_id, 0)
+
+    def shutdown(self, wait: bool = True) -> None:
+        for worker in self._workers:
+            worker.shutdown(wait=wait)
+
+    def _reserve(self, match_id: str) -> None:
+        with self._lock:
+            pending = self._pending.get(match_id, 0)
+            if pending >= self._max_pending:
+                raise IngestQueueFullError(f"ingest queue full for match {match_id}")
+            self._pending[match_id] = pending + 1
+
+    def _release(self, match_id: str) -> None:
+        with self._lock:
+            remaining = self._pending.get(match_id, 1) - 1
+            if remaining > 0:
+                self._pending[match_id] = remaining
+            else:
+                self._pending.pop(match_id, None)
+                self._async_locks.pop(match_id, None)
@@ -0,0 +1,59 @@
+"""Offline recompute of a match's snapshot history from its stored events."""
+
+from dataclasses import replace
+
+from football_engine.domain.entities import AnalyticsSnapshot
+from football_engine.domain.enums import MatchStatus
+from football_engine.domain.repositories import (
+    AnalyticsRepository,
+    EventRepository,
+    MatchRepository,
+)
+from football_engine.domain.services.analytics_engine import DEFAULT_WINDOWS, MODEL_VERSION
+from football_engine.domain.services.snapshot_timeline import TimelineMode, build_timeline
+from football_engine.domain.value_objects import MatchClock, RollingWindow, Score
+
+
+class RecomputeMatchService:
+    """Rebuild the whole snapshot timeline of a match in one pass (prefix sums).
+
+    Reads the event stream once and bulk-writes the timeline to analytics_snapshots under a
+    new model_version, replacing an earlier recompute with the same version. Live state,
+    the latest snapshot and the live model's history are not touched.
+    """
+
+    def __init__(
+        self,
+        match_repository: MatchRepository,
+        event_repository: EventRepository,
+        analytics_repository: AnalyticsRepository,
+        windows: tuple[RollingWindow, ...] = DEFAULT_WINDOWS,
+    ) -> None:
+        self._match_repo = match_repository
+        self._event_repo = event_repository
+        self._analytics_repo = analytics_repository
+        self._windows = windows
+
+    def recompute(
+        self, match_id: str, model_version: str, mode: TimelineMode = TimelineMode.EVENTS
+    ) -> list[AnalyticsSnapshot] | None:
+        """Written snapshots in clock order, or None if the match does not exist."""
+        if model_version == MODEL_VERSION:
+            raise ValueError(f"model_version must differ from the live model ({MODEL_VERSION})")
+        match = self._match_repo.get_match(match_id)
+        if match is None:
+            return None
+        # State at kick-off, as CreateMatchService stores it
+        start = replace(
+            match,
+            status=MatchStatus.SCHEDULED,
+            clock=MatchClock(period=1, minute=0, second=0),
+            score=Score(home=0, away=0),
+            home_red_cards=0,
+            away_red_cards=0,
+            version=1,
+        )
+        events = self._event_repo.list_match_events(match_id)
+        snapshots = build_timeline(start, events, model_version, mode, self._windows)
+        self._analytics_repo.replace_history(match_id, model_version, snapshots)
+        return snapshots
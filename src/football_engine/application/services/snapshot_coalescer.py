@@ -0,0 +1,114 @@
+"""Per-match coalescing of analytics snapshots under bursts of events."""
+
+import threading
+from collections import OrderedDict
+from enum import StrEnum
+
+from football_engine.domain.entities import Event
+from football_engine.domain.enums import EventType
+from football_engine.domain.value_objects import MatchClock
+
+
+class CoalescingMode(StrEnum):
+    OFF = "off"
+    # Defer every snapshot; one flush debounce_ms after the first deferred event
+    DEBOUNCE = "debounce"
+    # First event of each new match-clock second computes at once; the rest of that
+    # second is deferred to a trailing flush
+    CLOCK_SECOND = "clock_second"
+
+
+def _clock_key(clock: MatchClock) -> tuple[int, int]:
+    return clock.period, clock.total_seconds_in_period()
+
+
+class SnapshotCoalescer:
+    """Decides per ingest whether to compute the snapshot now or defer it to one flush.
+
+    Deferred events are applied to match state and window state right away; only the
+    snapshot (write and broadcast) waits. Event types in force_flush_on always compute
+    immediately, which also covers anything pending. Thread-safe: ingest jobs run on
+    pipeline workers, flush scheduling on the event loop.
+
+    The last computed clock is kept for at most max_matches matches (least recently
+    computed dropped first) and dropped when a match finishes; a match without one simply
+    computes its next snapshot at once.
+    """
+
+    def __init__(
+        self,
+        mode: CoalescingMode | str = CoalescingMode.OFF,
+        debounce_ms: int = 50,
+        force_flush_on: frozenset[EventType] = frozenset({EventType.GOAL, EventType.RED}),
+        max_matches: int = 1024,
+    ) -> None:
+        self.mode = CoalescingMode(mode)
+        self.delay_seconds = debounce_ms / 1000
+        self._force = force_flush_on
+        self._pending: dict[str, Event] = {}
+        self._computed: OrderedDict[str, tuple[int, int]] = OrderedDict()
+        self._max_matches = max_matches
+        self._scheduled: set[str] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != CoalescingMode.OFF
+
+    def defer(self, match_id: str, events: list[Event]) -> bool:
+        """True if the snapshot for these new events (clock order) should wait for a flush."""
+        if not self.enabled or not events:
+            return False
+        if any(e.event_type in self._force for e in events):
+            return False
+        latest = events[-1]
+        with self._lock:
+            if self.mode == CoalescingMode.CLOCK_SECOND:
+                computed = self._computed.get(match_id)
+                if computed is None or _clock_key(latest.clock) > computed:
+                    return False
+            pending = self._pending.get(match_id)
+            if pending is None or _clock_key(latest.clock) >= _clock_key(pending.clock):
+                self._pending[match_id] = latest
+            return True
+
+    def computed(self, match_id: str, clock: MatchClock, finished: bool = False) -> None:
+        """A snapshot at clock was computed; it covers everything pending.
+
+        finished (the match is FT) forgets the match instead of recording the clock.
+        """
+        with self._lock:
+            self._pending.pop(match_id, None)
+            if finished:
+                self._computed.pop(match_id, None)
+                return
+            key = _clock_key(clock)
+            self._computed[match_id] = max(key, self._computed.get(match_id, key))
+            self._computed.move_to_end(match_id)
+            while len(self._computed) > self._max_matches:
+                self._computed.popitem(last=False)
+
+    def is_pending(self, match_id: str) -> bool:
+        with self._lock:
+            return match_id in self._pending
+
+    def claim_flush(self, match_id: str) -> bool:
+        """True for the one caller that should schedule the flush of the pending window."""
+        with self._lock:
+            if match_id not in self._pending or match_id in self._scheduled:
+                return False
+            self._scheduled.add(match_id)
+            return True
+
+    def take(self, match_id: str) -> tuple[Event, bool] | None:
+        """Pop the pending window: (latest deferred event, late). None if nothing is pending.
+
+        late means a snapshot at a later clock was already computed.
+        """
+        with self._lock:
+            self._scheduled.discard(match_id)
+            event = self._pending.pop(match_id, None)
+            if event is None:
+                return None
+            computed = self._computed.get(match_id)
+            return event, computed is not None and _clock_key(event.clock) < computed
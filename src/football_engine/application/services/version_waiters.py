@@ -0,0 +1,61 @@
+"""Long-poll parking: coroutines waiting for a match to pass a state version."""
+
+import asyncio
+import threading
+
+
+class MatchVersionWaiters:
+    """Per-match futures resolved when ingest commits a newer Match.version.
+
+    A parked waiter is one future on its own event loop: no thread, no DB session.
+    notify() may run on a pipeline worker thread or any loop; it resolves each future on
+    the loop that owns it. Register with park() before reading the current version, so a
+    commit between the read and the wait is not missed.
+    """
+
+    def __init__(self) -> None:
+        self._waiters: dict[str, list[tuple[int, asyncio.Future[int]]]] = {}
+        self._lock = threading.Lock()
+
+    def park(self, match_id: str, after_version: int) -> "asyncio.Future[int]":
+        """Future for the first committed version above after_version. Call on the loop
+        that will await it, and always release() it afterwards."""
+        future: asyncio.Future[int] = asyncio.get_running_loop().create_future()
+        with self._lock:
+            self._waiters.setdefault(match_id, []).append((after_version, future))
+        return future
+
+    def release(self, match_id: str, future: "asyncio.Future[int]") -> None:
+        with self._lock:
+            waiters = self._waiters.get(match_id)
+            if waiters is None:
+                return
+            waiters[:] = [(v, f) for v, f in waiters if f is not future]
+            if not waiters:
+                del self._waiters[match_id]
+
+    def notify(self, match_id: str, version: int) -> None:
+        """Wake the waiters of match_id whose after_version is below version."""
+        with self._lock:
+            waiters = self._waiters.get(match_id)
+            if not waiters:
+                return
+            woken = [f for v, f in waiters if version > v]
+            waiters[:] = [(v, f) for v, f in waiters if version <= v]
+            if not waiters:
+                del self._waiters[match_id]
+        for future in woken:
+            try:
+                future.get_loop().call_soon_threadsafe(_resolve, future, version)
+            except RuntimeError:
+                # Owner loop closed; the request is gone
+                pass
+
+    def parked(self, match_id: str) -> int:
+        with self._lock:
+            return len(self._waiters.get(match_id, ()))
+
+
+def _resolve(future: "asyncio.Future[int]", version: int) -> None:
+    if not future.done():
+        future.set_result(version)
@@ -4,17 +4,42 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
-from football_engine.domain.value_objects import MatchClock
+from football_engine.domain.value_objects import MatchClock, WindowFeatures
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AnalyticsSnapshot:
+    """features_by_window, and deltas["features_by_window"], are WindowFeatures (plain
+    dicts are converted); features_dict() / deltas_dict() give the stored and API form."""
+
     snapshot_id: str
     match_id: str
     clock: MatchClock
-    features_by_window: dict[str, Any]
+    features_by_window: WindowFeatures
     derived_metrics: dict[str, Any]
     deltas: dict[str, Any]
     why: list[str]
     model_version: str
     created_at_utc: datetime
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.features_by_window, WindowFeatures):
+            object.__setattr__(
+                self, "features_by_window", WindowFeatures.from_dict(self.features_by_window)
+            )
+        delta_features = self.deltas.get("features_by_window", {})
+        if not isinstance(delta_features, WindowFeatures):
+            object.__setattr__(
+                self,
+                "deltas",
+                {**self.deltas, "features_by_window": WindowFeatures.from_dict(delta_features)},
+            )
+
+    def features_dict(self) -> dict[str, Any]:
+        return self.features_by_window.to_dict()
+
+    def deltas_dict(self) -> dict[str, Any]:
+        return {
+            "features_by_window": self.deltas["features_by_window"].to_dict(),
+            "derived_metrics": self.deltas.get("derived_metrics", {}),
+        }
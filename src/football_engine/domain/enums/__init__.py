@@ -1,6 +1,6 @@
 """Domain enums. Use string values for ORM/serialization."""
 
-from enum import StrEnum
+from enum import IntEnum, StrEnum
 
 
 class TeamSide(StrEnum):
@@ -25,3 +25,21 @@ class EventType(StrEnum):
     RED = "RED"
     SUB = "SUB"
     GOAL = "GOAL"
+
+
+class FeatureName(IntEnum):
+    """Team window features; the value is the position in a feature vector."""
+
+    SHOTS = 0
+    SHOTS_ON_TARGET = 1
+    CORNERS = 2
+    FOULS = 3
+    YELLOWS = 4
+    REDS = 5
+    XG_SUM = 6
+    ATTACKING_ACTIONS_COUNT = 7
+
+    @property
+    def key(self) -> str:
+        """Key in the API / stored form, e.g. "shots_on_target"."""
+        return self.name.lower()
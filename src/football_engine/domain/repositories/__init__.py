@@ -1,7 +1,23 @@
 """Repository interfaces (ports). Implementations live in infrastructure."""
 
-from football_engine.domain.repositories.analytics_repository import AnalyticsRepository
-from football_engine.domain.repositories.event_repository import EventRepository
-from football_engine.domain.repositories.match_repository import MatchRepository
+from football_engine.domain.repositories.analytics_repository import (
+    AnalyticsRepository,
+    AsyncAnalyticsRepository,
+)
+from football_engine.domain.repositories.event_repository import (
+    AsyncEventRepository,
+    EventRepository,
+)
+from football_engine.domain.repositories.match_repository import (
+    AsyncMatchRepository,
+    MatchRepository,
+)
 
-__all__ = ["MatchRepository", "EventRepository", "AnalyticsRepository"]
+__all__ = [
+    "AnalyticsRepository",
+    "AsyncAnalyticsRepository",
+    "AsyncEventRepository",
+    "AsyncMatchRepository",
+    "EventRepository",
+    "MatchRepository",
+]
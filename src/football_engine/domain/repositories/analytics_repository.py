@@ -8,11 +8,25 @@ from football_engine.domain.entities import AnalyticsSnapshot
 class AnalyticsRepository(Protocol):
     """Store and retrieve latest snapshot (and optional history)."""
 
-    def save_snapshot(self, snapshot: AnalyticsSnapshot) -> AnalyticsSnapshot:
-        ...
+    def save_snapshot(self, snapshot: AnalyticsSnapshot) -> AnalyticsSnapshot: ...
 
-    def get_latest_snapshot(self, match_id: str) -> AnalyticsSnapshot | None:
-        ...
+    def get_latest_snapshot(self, match_id: str) -> AnalyticsSnapshot | None: ...
 
-    def list_recent_snapshots(self, match_id: str, limit: int) -> list[AnalyticsSnapshot]:
+    def list_recent_snapshots(self, match_id: str, limit: int) -> list[AnalyticsSnapshot]: ...
+
+    def replace_history(
+        self, match_id: str, model_version: str, snapshots: list[AnalyticsSnapshot]
+    ) -> None:
+        """Bulk-write snapshots as the history of match_id under model_version, replacing
+        any stored under it. The latest snapshot is left alone."""
         ...
+
+
+class AsyncAnalyticsRepository(Protocol):
+    """Async counterpart of AnalyticsRepository (asyncio DB drivers)."""
+
+    async def save_snapshot(self, snapshot: AnalyticsSnapshot) -> AnalyticsSnapshot: ...
+
+    async def get_latest_snapshot(self, match_id: str) -> AnalyticsSnapshot | None: ...
+
+    async def list_recent_snapshots(self, match_id: str, limit: int) -> list[AnalyticsSnapshot]: ...
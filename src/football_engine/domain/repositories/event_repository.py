@@ -9,10 +9,32 @@ from football_engine.domain.value_objects import MatchClock, RollingWindow
 class EventRepository(Protocol):
     """Events with dedup and window queries."""
 
+    def known_event_ids(self, match_id: str, event_ids: list[str]) -> set[str]:
+        """Subset of event_ids certainly stored, answered from memory without DB access.
+
+        May be incomplete: an id not returned can still be a duplicate.
+        """
+        ...
+
     def add_event_if_new(self, event: Event) -> bool:
         """Persist event if not duplicate. Return True if inserted, False if duplicate."""
         ...
 
+    def add_events_if_new(self, events: list[Event]) -> set[str]:
+        """Persist events that are not duplicates. Return the event_ids actually inserted.
+
+        Safe under concurrent writers; repeated event_ids in events keep the first.
+        """
+        ...
+
+    def list_existing_event_ids(self, event_ids: list[str]) -> set[str]:
+        """Subset of event_ids already persisted (single IN probe)."""
+        ...
+
+    def add_events(self, events: list[Event]) -> None:
+        """Bulk persist events already known to be new."""
+        ...
+
     def list_events_in_window(
         self, match_id: str, end_clock: MatchClock, window: RollingWindow
     ) -> list[Event]:
@@ -22,3 +44,29 @@ class EventRepository(Protocol):
     def list_recent_events(self, match_id: str, limit: int) -> list[Event]:
         """Most recent events for the match (newest first)."""
         ...
+
+    def list_match_events(self, match_id: str) -> list[Event]:
+        """Every event of the match, sorted by clock (insertion order within a second)."""
+        ...
+
+
+class AsyncEventRepository(Protocol):
+    """Async counterpart of EventRepository (asyncio DB drivers)."""
+
+    async def known_event_ids(self, match_id: str, event_ids: list[str]) -> set[str]: ...
+
+    async def add_event_if_new(self, event: Event) -> bool: ...
+
+    async def add_events_if_new(self, events: list[Event]) -> set[str]: ...
+
+    async def list_existing_event_ids(self, event_ids: list[str]) -> set[str]: ...
+
+    async def add_events(self, events: list[Event]) -> None: ...
+
+    async def list_events_in_window(
+        self, match_id: str, end_clock: MatchClock, window: RollingWindow
+    ) -> list[Event]: ...
+
+    async def list_recent_events(self, match_id: str, limit: int) -> list[Event]: ...
+
+    async def list_match_events(self, match_id: str) -> list[Event]: ...
@@ -8,11 +8,22 @@ from football_engine.domain.entities import Match
 class MatchRepository(Protocol):
     """Create, get, and persist matches."""
 
-    def create_match(self, match: Match) -> Match:
-        ...
+    def create_match(self, match: Match) -> Match: ...
 
-    def get_match(self, match_id: str) -> Match | None:
-        ...
+    def get_match(self, match_id: str) -> Match | None: ...
 
-    def save_match(self, match: Match) -> Match:
+    def save_match(self, match: Match, expected_version: int | None = None) -> Match | None:
+        """None if expected_version is given and the stored match is no longer at it."""
         ...
+
+
+class AsyncMatchRepository(Protocol):
+    """Async counterpart of MatchRepository (asyncio DB drivers)."""
+
+    async def create_match(self, match: Match) -> Match: ...
+
+    async def get_match(self, match_id: str) -> Match | None: ...
+
+    async def save_match(
+        self, match: Match, expected_version: int | None = None
+    ) -> Match | None: ...
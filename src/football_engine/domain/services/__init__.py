@@ -1,5 +1,5 @@
 """Domain services."""
 
-from football_engine.domain.services.analytics_engine import AnalyticsEngine
+from football_engine.domain.services.analytics_engine import DEFAULT_WINDOWS, AnalyticsEngine
 
-__all__ = ["AnalyticsEngine"]
+__all__ = ["DEFAULT_WINDOWS", "AnalyticsEngine"]
@@ -5,150 +5,100 @@ from datetime import datetime, timezone
 from typing import Any
 
 from football_engine.domain.entities import AnalyticsSnapshot, Event, Match
-from football_engine.domain.enums import EventType
-from football_engine.domain.value_objects import MatchClock
-
+from football_engine.domain.enums import FeatureName
+from football_engine.domain.services.metric_registry import MetricEvaluator, MetricRegistry
+from football_engine.domain.services.metrics_v1 import V1_METRICS
+from football_engine.domain.services.window_state import (
+    FEATURE_KEYS,
+    WindowStateStore,
+    add_event_to_vector,
+    sweep_window_features,
+)
+from football_engine.domain.value_objects import MatchClock, RollingWindow, WindowFeatures
 
 MODEL_VERSION = "v1"
 
-# Weights for pressure (attacking events)
-PRESSURE_WEIGHTS: dict[str, float] = {
-    EventType.SHOT: 1.0,
-    EventType.SHOT_ON_TARGET: 1.5,
-    EventType.CORNER: 0.8,
-    EventType.GOAL: 3.0,
-}
+# Windows every engine computes: derived metrics read 10m, why reads 5m and 10m
+DEFAULT_WINDOWS: tuple[RollingWindow, ...] = (RollingWindow(minutes=5), RollingWindow(minutes=10))
 
 
-def _aggregate_events_by_team(events: list[Event]) -> dict[str, dict[str, Any]]:
-    """Build feature counts per team from events."""
-    out: dict[str, dict[str, Any]] = {"HOME": _empty_features(), "AWAY": _empty_features()}
+def _aggregate_events_by_team(events: list[Event]) -> tuple[int, ...]:
+    """Window vector (HOME then AWAY feature counts) from events."""
+    vectors = {"HOME": [0] * len(FEATURE_KEYS), "AWAY": [0] * len(FEATURE_KEYS)}
     for e in events:
-        side = e.team_side.value
-        f = out[side]
-        if e.event_type == EventType.SHOT:
-            f["shots"] += 1
-        if e.event_type == EventType.SHOT_ON_TARGET:
-            f["shots_on_target"] += 1
-        if e.event_type == EventType.CORNER:
-            f["corners"] += 1
-        if e.event_type == EventType.FOUL:
-            f["fouls"] += 1
-        if e.event_type == EventType.YELLOW:
-            f["yellows"] += 1
-        if e.event_type == EventType.RED:
-            f["reds"] += 1
-        xg = e.xg_value()
-        if xg is not None:
-            f["xg_sum"] += xg
-        if e.is_attacking_action():
-            f["attacking_actions_count"] += 1
-    return out
-
-
-def _empty_features() -> dict[str, Any]:
-    return {
-        "shots": 0,
-        "shots_on_target": 0,
-        "corners": 0,
-        "fouls": 0,
-        "yellows": 0,
-        "reds": 0,
-        "xg_sum": 0.0,
-        "attacking_actions_count": 0,
-    }
-
-
-def _pressure_score(features: dict[str, Any]) -> float:
-    """Single pressure score from features (weighted attacking events)."""
-    return (
-        features["shots"] * PRESSURE_WEIGHTS.get(EventType.SHOT, 1.0)
-        + features["shots_on_target"] * PRESSURE_WEIGHTS.get(EventType.SHOT_ON_TARGET, 1.5)
-        + features["corners"] * PRESSURE_WEIGHTS.get(EventType.CORNER, 0.8)
-        + (features.get("xg_sum") or 0) * 2.0
-    )
+        add_event_to_vector(vectors[e.team_side.value], e)
+    return (*vectors["HOME"], *vectors["AWAY"])
 
 
-def _build_derived(
-    features_by_window: dict[str, Any], match: Match
-) -> dict[str, Any]:
-    """Derived metrics from 10m window and match state."""
-    f10 = features_by_window.get("10m", {})
-    home_f = f10.get("HOME", _empty_features())
-    away_f = f10.get("AWAY", _empty_features())
-    p_home = _pressure_score(home_f)
-    p_away = _pressure_score(away_f)
-    total = p_home + p_away
-    if total <= 0:
-        momentum_home = momentum_away = 0.5
-        tilt_home = tilt_away = 0.5
-    else:
-        momentum_home = round(p_home / total, 4)
-        momentum_away = round(p_away / total, 4)
-        att_home = home_f["attacking_actions_count"]
-        att_away = away_f["attacking_actions_count"]
-        att_total = att_home + att_away
-        if att_total <= 0:
-            tilt_home = tilt_away = 0.5
-        else:
-            tilt_home = round(att_home / att_total, 4)
-            tilt_away = round(att_away / att_total, 4)
-
-    # Danger next 5m: bounded 0..1 from momentum and man-advantage
-    man_adv = match.home_red_cards - match.away_red_cards
-    danger_home = min(1.0, max(0.0, momentum_home + 0.1 * (-man_adv)))
-    danger_away = min(1.0, max(0.0, momentum_away + 0.1 * man_adv))
-
-    return {
-        "pressure_index": {"HOME": round(p_home, 4), "AWAY": round(p_away, 4)},
-        "momentum": {"HOME": momentum_home, "AWAY": momentum_away},
-        "field_tilt": {"HOME": tilt_home, "AWAY": tilt_away},
-        "danger_next_5m": {"HOME": round(danger_home, 4), "AWAY": round(danger_away, 4)},
-    }
-
-
-def _build_deltas(
-    features_by_window: dict[str, Any],
+def build_deltas(
+    features_by_window: WindowFeatures,
     derived_metrics: dict[str, Any],
     previous: AnalyticsSnapshot | None,
 ) -> dict[str, Any]:
     """Delta vs previous snapshot (simple diff)."""
     if previous is None:
-        return {"features_by_window": {}, "derived_metrics": {}}
-    prev_f = previous.features_by_window
+        return {"features_by_window": WindowFeatures({}), "derived_metrics": {}}
     prev_d = previous.derived_metrics
-    delta_f: dict[str, Any] = {}
-    for win, teams in features_by_window.items():
-        delta_f[win] = {}
-        for side, feats in teams.items():
-            prev_feats = (prev_f.get(win) or {}).get(side) or _empty_features()
-            delta_f[win][side] = {k: feats.get(k, 0) - prev_feats.get(k, 0) for k in feats}
     delta_d: dict[str, Any] = {}
     for metric, sides in derived_metrics.items():
         delta_d[metric] = {}
         for side, v in sides.items():
             prev_v = (prev_d.get(metric) or {}).get(side, 0)
             delta_d[metric][side] = round(v - prev_v, 4)
-    return {"features_by_window": delta_f, "derived_metrics": delta_d}
+    return {
+        "features_by_window": features_by_window.minus(previous.features_by_window),
+        "derived_metrics": delta_d,
+    }
 
 
-def _build_why(features_by_window: dict[str, Any]) -> list[str]:
+def build_why(features_by_window: WindowFeatures) -> list[str]:
     """Human-readable drivers per window."""
     lines: list[str] = []
     for window in ("5m", "10m"):
-        wins = features_by_window.get(window, {})
         for side in ("HOME", "AWAY"):
-            f = wins.get(side, _empty_features())
-            shot = f.get("shots", 0)
-            sot = f.get("shots_on_target", 0)
-            cor = f.get("corners", 0)
+            f = features_by_window.team(window, side)
+            shot = f[FeatureName.SHOTS]
+            sot = f[FeatureName.SHOTS_ON_TARGET]
+            cor = f[FeatureName.CORNERS]
             if shot or cor:
-                lines.append(f"{side}: {shot} shots ({sot} on target) + {cor} corners in last {window}")
+                lines.append(
+                    f"{side}: {shot} shots ({sot} on target) + {cor} corners in last {window}"
+                )
     return lines if lines else ["No attacking actions in window"]
 
 
 class AnalyticsEngine:
-    """Compute analytics snapshot from match state and window events."""
+    """Compute analytics snapshot from match state and window features.
+
+    Keeps per-match incremental window state so the hot path folds new events in
+    memory; callers rebuild it from stored events only on a miss (first event, restart).
+    windows is the deployment's window set (features_by_window keys); it must contain
+    DEFAULT_WINDOWS, which the v1 metrics read. metrics is the derived-metric registry;
+    plug in more with V1_METRICS.with_metrics(...). If one is expensive, only metrics whose
+    inputs changed since the match's previous snapshot are recomputed.
+    """
+
+    def __init__(
+        self,
+        max_window_states: int = 256,
+        windows: tuple[RollingWindow, ...] = DEFAULT_WINDOWS,
+        metrics: MetricRegistry = V1_METRICS,
+    ) -> None:
+        labels = [w.label for w in windows]
+        if len(set(labels)) != len(labels):
+            raise ValueError(f"duplicate analytics windows: {labels}")
+        missing = [w.label for w in DEFAULT_WINDOWS if w not in windows]
+        if missing:
+            raise ValueError(f"analytics windows must include {', '.join(missing)}")
+        self.windows = windows
+        self._window_states = WindowStateStore(
+            self.windows, max_matches=max_window_states, track_changes=metrics.selective
+        )
+        self._metrics = MetricEvaluator(metrics, max_matches=max_window_states)
+
+    @property
+    def widest_window(self) -> RollingWindow:
+        return max(self.windows, key=lambda w: w.reach)
 
     def compute(
         self,
@@ -158,12 +108,31 @@ class AnalyticsEngine:
         clock: MatchClock,
         previous: AnalyticsSnapshot | None,
     ) -> AnalyticsSnapshot:
-        features_5m = _aggregate_events_by_team(events_5m)
-        features_10m = _aggregate_events_by_team(events_10m)
-        features_by_window = {"5m": features_5m, "10m": features_10m}
-        derived_metrics = _build_derived(features_by_window, match)
-        deltas = _build_deltas(features_by_window, derived_metrics, previous)
-        why = _build_why(features_by_window)
+        """Snapshot over the 5m and 10m windows only; see window_features for the rest."""
+        features_by_window = WindowFeatures(
+            {
+                "5m": _aggregate_events_by_team(events_5m),
+                "10m": _aggregate_events_by_team(events_10m),
+            }
+        )
+        return self.compute_from_features(match, features_by_window, clock, previous)
+
+    def compute_from_features(
+        self,
+        match: Match,
+        features_by_window: WindowFeatures,
+        clock: MatchClock,
+        previous: AnalyticsSnapshot | None,
+    ) -> AnalyticsSnapshot:
+        # Features from window state come with what changed since its previous read
+        changes = (
+            self._window_states.changes(match.match_id, features_by_window)
+            if self._metrics.registry.selective
+            else None
+        )
+        derived_metrics = self._metrics.evaluate(features_by_window, match, changes)
+        deltas = build_deltas(features_by_window, derived_metrics, previous)
+        why = build_why(features_by_window)
         return AnalyticsSnapshot(
             snapshot_id=str(uuid.uuid4()),
             match_id=match.match_id,
@@ -175,3 +144,40 @@ class AnalyticsEngine:
             model_version=MODEL_VERSION,
             created_at_utc=datetime.now(timezone.utc),
         )
+
+    def observe(
+        self,
+        match_id: str,
+        events: list[Event],
+        clock: MatchClock,
+        version: int | None = None,
+    ) -> WindowFeatures | None:
+        """Fold newly persisted events into window state; features at clock, or None on miss.
+
+        version is the match version after events; state built at another version (the
+        match was ingested elsewhere meanwhile) is a miss.
+        """
+        return self._window_states.observe(match_id, events, clock, version)
+
+    def window_features(self, widest_events: list[Event], clock: MatchClock) -> WindowFeatures:
+        """Features per window ending at clock from the widest window's events (one fetch
+        serves every window). Window state is left alone."""
+        return sweep_window_features(widest_events, clock, self.windows)
+
+    def rebuild_windows(
+        self,
+        match_id: str,
+        clock: MatchClock,
+        widest_events: list[Event],
+        version: int | None = None,
+    ) -> WindowFeatures:
+        """Seed window state from the widest window's events ending at clock (match at
+        version)."""
+        return self._window_states.rebuild(match_id, clock, widest_events, version)
+
+    def invalidate_windows(self, match_id: str) -> None:
+        self._window_states.invalidate(match_id)
+
+    def metric_counters(self) -> dict[str, float]:
+        """Derived metrics evaluated and recomputed since start, and the recompute ratio."""
+        return self._metrics.counters()
@@ -0,0 +1,227 @@
+"""Analytics v1 for many matches at once, on columnar event arrays (NumPy).
+
+Same features, derived metrics, deltas and why as AnalyticsEngine for each match, but
+window selection and per-team aggregation run as a few array operations over the events
+of every match together, as do metrics that have a batched form (compute_batch). Needs
+the `batch` extra (numpy).
+"""
+
+import uuid
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from football_engine.domain.entities import AnalyticsSnapshot, Event, Match
+from football_engine.domain.enums import EventType, TeamSide
+from football_engine.domain.services.analytics_engine import (
+    DEFAULT_WINDOWS,
+    MODEL_VERSION,
+    build_deltas,
+    build_why,
+)
+from football_engine.domain.services.metric_registry import MetricRegistry
+from football_engine.domain.services.metrics_v1 import V1_METRICS
+from football_engine.domain.services.window_state import add_event_to_vector, window_start_second
+from football_engine.domain.value_objects import (
+    FEATURE_KEYS,
+    PERIOD_STRIDE_SECONDS,
+    XG_SCALE,
+    MatchClock,
+    RollingWindow,
+    WindowFeatures,
+)
+
+try:
+    import numpy as np
+except ImportError:  # optional `batch` extra
+    np = None
+
+# Type codes in the columnar format: position in EventType
+TYPE_CODES: dict[EventType, int] = {t: i for i, t in enumerate(EventType)}
+SIDE_CODES = {"HOME": 0, "AWAY": 1}
+_SIDES = ("HOME", "AWAY")
+
+
+def _feature_table() -> "np.ndarray":
+    """(len(EventType), len(FEATURE_KEYS)) counts each event type adds, xG excluded.
+
+    Built by folding one payload-free event of each type, as window state does.
+    """
+    table = np.zeros((len(EventType), len(FEATURE_KEYS)), dtype=np.int64)
+    for event_type, code in TYPE_CODES.items():
+        vec = [0] * len(FEATURE_KEYS)
+        add_event_to_vector(
+            vec,
+            Event(
+                event_id="",
+                match_id="",
+                provider_name="",
+                provider_event_id=None,
+                clock=MatchClock(period=1, minute=0, second=0),
+                team_side=TeamSide.HOME,
+                event_type=event_type,
+                payload=None,
+                ingested_at_utc=datetime.now(UTC),
+            ),
+        )
+        table[code] = vec
+    return table
+
+
+@dataclass(frozen=True)
+class EventColumns:
+    """Events of many matches as parallel arrays, one entry per event.
+
+    match_index: position of the event's match in the batch
+    clock_key: MatchClock.ordering_key() (period * 10000 + seconds in period)
+    side: SIDE_CODES; type_code: TYPE_CODES
+    xg_micro: payload xG in micro-units (round(xg * XG_SCALE)), 0 when absent
+    """
+
+    match_index: "np.ndarray"
+    clock_key: "np.ndarray"
+    side: "np.ndarray"
+    type_code: "np.ndarray"
+    xg_micro: "np.ndarray"
+
+    @classmethod
+    def from_events(cls, events_by_match: list[list[Event]]) -> "EventColumns":
+        rows = [
+            (
+                i,
+                e.clock.ordering_key(),
+                SIDE_CODES[e.team_side.value],
+                TYPE_CODES[e.event_type],
+                round(xg * XG_SCALE) if (xg := e.xg_value()) is not None else 0,
+            )
+            for i, events in enumerate(events_by_match)
+            for e in events
+        ]
+        columns = np.array(rows, dtype=np.int64).reshape(len(rows), 5).T
+        return cls(*columns)
+
+
+class BatchAnalyticsEngine:
+    """Stateless batched counterpart of AnalyticsEngine (MODEL_VERSION v1).
+
+    windows and metrics are those of the AnalyticsEngine it stands in for. Metrics without
+    compute_batch are computed per match.
+    """
+
+    def __init__(
+        self,
+        windows: tuple[RollingWindow, ...] = DEFAULT_WINDOWS,
+        metrics: MetricRegistry = V1_METRICS,
+    ) -> None:
+        if np is None:
+            raise RuntimeError("BatchAnalyticsEngine needs numpy (install the `batch` extra)")
+        missing = [w.label for w in DEFAULT_WINDOWS if w not in windows]
+        if missing:
+            raise ValueError(f"analytics windows must include {', '.join(missing)}")
+        self.windows = windows
+        self.metrics = metrics
+        self._feature_table = _feature_table()
+
+    def compute_many(
+        self,
+        matches: list[Match],
+        columns: EventColumns,
+        clocks: list[MatchClock],
+        previous: list[AnalyticsSnapshot | None],
+    ) -> list[AnalyticsSnapshot]:
+        """One snapshot per match at clocks[i]; columns may hold any of the match's events
+        (e.g. all of them), those outside each window are ignored."""
+        sums = {w.label: self._window_sums(columns, clocks, w) for w in self.windows}
+        features = [
+            WindowFeatures(
+                {label: tuple(window[i].ravel().tolist()) for label, window in sums.items()}
+            )
+            for i in range(len(matches))
+        ]
+        derived = self._derived(sums, features, matches)
+        now = datetime.now(UTC)
+        snapshots = []
+        for i, match in enumerate(matches):
+            features_by_window = features[i]
+            derived_metrics = {
+                metric: {side: values[s][i] for s, side in enumerate(_SIDES)}
+                for metric, values in derived.items()
+            }
+            snapshots.append(
+                AnalyticsSnapshot(
+                    snapshot_id=str(uuid.uuid4()),
+                    match_id=match.match_id,
+                    clock=clocks[i],
+                    features_by_window=features_by_window,
+                    derived_metrics=derived_metrics,
+                    deltas=build_deltas(features_by_window, derived_metrics, previous[i]),
+                    why=build_why(features_by_window),
+                    model_version=MODEL_VERSION,
+                    created_at_utc=now,
+                )
+            )
+        return snapshots
+
+    def _window_sums(
+        self, columns: EventColumns, clocks: list[MatchClock], window: RollingWindow
+    ) -> "np.ndarray":
+        """(matches, 2 sides, len(FEATURE_KEYS)) int64 feature sums of the window ending
+        at each match's clock (same period, whole-minute start as the repository query;
+        whole-match windows reach back into earlier periods)."""
+        count = len(clocks)
+        hi = np.array([c.ordering_key() for c in clocks], dtype=np.int64)
+        lo = np.array(
+            [
+                (
+                    0
+                    if window.whole_match
+                    else c.period * PERIOD_STRIDE_SECONDS
+                    + window_start_second(c.total_seconds_in_period(), window)
+                )
+                for c in clocks
+            ],
+            dtype=np.int64,
+        )
+        key = columns.clock_key
+        inside = (key >= lo[columns.match_index]) & (key <= hi[columns.match_index])
+        group = (columns.match_index * 2 + columns.side)[inside]
+        # Events per (match, side, type), then type -> feature counts in one product
+        types = len(TYPE_CODES)
+        per_type = np.bincount(
+            group * types + columns.type_code[inside], minlength=count * 2 * types
+        ).reshape(count * 2, types)
+        out = per_type @ self._feature_table
+        # Float sums of integer micro-units stay exact below 2**53
+        xg = np.bincount(group, weights=columns.xg_micro[inside], minlength=count * 2)
+        out[:, FEATURE_KEYS.index("xg_sum")] = np.rint(xg).astype(np.int64)
+        return out.reshape(count, 2, len(FEATURE_KEYS))
+
+    def _derived(
+        self, sums: dict[str, "np.ndarray"], features: list[WindowFeatures], matches: list[Match]
+    ) -> dict[str, Any]:
+        """Derived metrics per side as lists of per-match floats, in registration order."""
+        values: dict[str, np.ndarray] = {}
+        for m in self.metrics.in_dependency_order:
+            inputs = {name: values[name] for name in m.depends_on}
+            if m.compute_batch is not None:
+                values[m.name] = m.compute_batch(sums, matches, inputs)
+                continue
+            rows = []
+            for i, (f, match) in enumerate(zip(features, matches)):
+                side_values = m.compute(f, match, _row_inputs(inputs, i))
+                rows.append((side_values["HOME"], side_values["AWAY"]))
+            values[m.name] = np.array(rows, dtype=np.float64).reshape(len(matches), 2)
+        return {name: _per_side(values[name]) for name in self.metrics.names}
+
+
+def _row_inputs(inputs: dict[str, "np.ndarray"], i: int) -> dict[str, dict[str, float]]:
+    """Dependency values of match i in the per-match form compute takes."""
+    return {
+        name: {side: float(values[i, s]) for s, side in enumerate(_SIDES)}
+        for name, values in inputs.items()
+    }
+
+
+def _per_side(values: "np.ndarray") -> list[list[float]]:
+    """(matches, 2) array -> [home values, away values] as Python floats."""
+    return [values[:, 0].tolist(), values[:, 1].tolist()]
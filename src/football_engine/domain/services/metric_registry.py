@@ -0,0 +1,268 @@
+"""Derived metrics as a registry: declared inputs, dependency order, selective recompute."""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from football_engine.domain.entities import Match
+from football_engine.domain.value_objects import FEATURE_KEYS, WindowFeatures
+
+# {"HOME": value, "AWAY": value}
+SideValues = dict[str, float]
+
+
+# Feature positions (FeatureName, either side) that changed per window label
+ChangedFeatures = dict[str, set[int]]
+
+
+@dataclass(frozen=True)
+class Metric:
+    """A derived metric with one value per side.
+
+    features: (window label, feature key) pairs it reads, for both sides.
+    match_fields: Match attributes it reads. depends_on: metrics whose values it reads.
+    compute(features_by_window, match, inputs) gets the depends_on values in inputs and
+    must be a pure function of the declared inputs. expensive marks a metric worth skipping
+    while its inputs are unchanged (see MetricRegistry.selective). compute_batch, optional,
+    is the same metric over many matches at once
+    for BatchAnalyticsEngine: (window sums by label as (matches, 2, features) arrays,
+    matches, depends_on values as (matches, 2) arrays) -> (matches, 2) array, equal to
+    compute per match.
+    """
+
+    name: str
+    compute: Callable[[WindowFeatures, Match, dict[str, SideValues]], SideValues]
+    features: tuple[tuple[str, str], ...] = ()
+    match_fields: tuple[str, ...] = ()
+    depends_on: tuple[str, ...] = ()
+    expensive: bool = False
+    compute_batch: Callable[[dict[str, Any], list[Match], dict[str, Any]], Any] | None = None
+
+    @property
+    def feature_indices(self) -> tuple[tuple[str, frozenset[int]], ...]:
+        """Per window read, the FeatureName positions it reads (the same for both sides)."""
+        groups: dict[str, set[int]] = {}
+        for window, key in self.features:
+            if key not in FEATURE_KEYS:
+                raise ValueError(f"metric {self.name} reads unknown feature {key}")
+            groups.setdefault(window, set()).add(FEATURE_KEYS.index(key))
+        return tuple((window, frozenset(indices)) for window, indices in groups.items())
+
+
+class MetricMemo:
+    """Features, match inputs and values of a match's last evaluation.
+
+    Guarded by its own lock, so evaluations of different matches do not wait on each other.
+    """
+
+    __slots__ = ("features", "lock", "match_inputs", "values")
+
+    def __init__(self) -> None:
+        self.features: WindowFeatures | None = None
+        self.match_inputs: tuple = ()
+        self.values: dict[str, SideValues] = {}
+        self.lock = threading.Lock()
+
+
+class MetricRegistry:
+    """Ordered set of metrics; evaluated in dependency order, reported in registration order.
+
+    A registry with an expensive metric is selective: evaluate with a memo recomputes only
+    metrics whose inputs changed. Otherwise tracking changes costs more than computing
+    every metric, so each evaluation computes them all.
+
+    Raises ValueError on duplicate names, unknown features or dependencies, or cycles.
+    """
+
+    def __init__(self, metrics: Iterable[Metric]) -> None:
+        self._metrics = tuple(metrics)
+        by_name = {m.name: m for m in self._metrics}
+        if len(by_name) != len(self._metrics):
+            raise ValueError("duplicate metric names")
+        for m in self._metrics:
+            unknown = [d for d in m.depends_on if d not in by_name]
+            if unknown:
+                raise ValueError(f"metric {m.name} depends on unknown {', '.join(unknown)}")
+        self._order = _dependency_order(self._metrics)
+        self._inputs = {m.name: m.feature_indices for m in self._metrics}
+        self._windows = tuple(dict.fromkeys(w for m in self._metrics for w, _ in m.features))
+        self._match_fields = tuple(dict.fromkeys(f for m in self._metrics for f in m.match_fields))
+        self._selective = any(m.expensive for m in self._metrics)
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        return tuple(m.name for m in self._metrics)
+
+    @property
+    def metrics(self) -> tuple[Metric, ...]:
+        return self._metrics
+
+    @property
+    def selective(self) -> bool:
+        return self._selective
+
+    @property
+    def in_dependency_order(self) -> tuple[Metric, ...]:
+        return self._order
+
+    def with_metrics(self, *metrics: Metric) -> "MetricRegistry":
+        """A new registry with metrics added after these."""
+        return MetricRegistry(self._metrics + metrics)
+
+    def evaluate(
+        self,
+        features_by_window: WindowFeatures,
+        match: Match,
+        memo: MetricMemo | None = None,
+        changes: tuple[WindowFeatures, ChangedFeatures] | None = None,
+    ) -> tuple[dict[str, SideValues], int]:
+        """(values by metric, number of metrics recomputed).
+
+        Unless the registry is selective, every metric is computed and memo and changes are
+        ignored. memo holds the previous evaluation of the same match and is updated in
+        place; a metric is recomputed only if a window feature, match field or dependency it
+        reads changed since. changes is (features they are relative to, changed positions per
+        window), as window state reports them from the events folded in and the buckets
+        expired; when it is not relative to memo.features, changed windows are found by
+        comparing each window vector once.
+        """
+        if not self._selective:
+            return self._compute_all(features_by_window, match), len(self._metrics)
+        if memo is None or memo.features is None:
+            changed: ChangedFeatures | None = None
+        elif changes is not None and changes[0] is memo.features:
+            changed = changes[1]
+        else:
+            changed = self._changed_windows(memo.features, features_by_window)
+        match_inputs = tuple(getattr(match, field) for field in self._match_fields)
+        changed_fields: set[str] = set()
+        if changed is not None:
+            for field, old, new in zip(self._match_fields, memo.match_inputs, match_inputs):
+                if old != new:
+                    changed_fields.add(field)
+        previous = memo.values if memo is not None else {}
+        values: dict[str, SideValues] = {}
+        moved: set[str] = set()
+        recomputed = 0
+        try:
+            for m in self._order:
+                if (
+                    changed is not None
+                    and m.name in previous
+                    and not any(d in moved for d in m.depends_on)
+                    and not any(f in changed_fields for f in m.match_fields)
+                    and not any(
+                        indices.intersection(changed.get(window, ()))
+                        for window, indices in self._inputs[m.name]
+                    )
+                ):
+                    values[m.name] = previous[m.name]
+                    continue
+                inputs = {name: values[name] for name in m.depends_on}
+                values[m.name] = m.compute(features_by_window, match, inputs)
+                recomputed += 1
+                if values[m.name] != previous.get(m.name):
+                    moved.add(m.name)
+        except Exception:
+            if memo is not None:
+                memo.features = None
+            raise
+        if memo is not None:
+            memo.features, memo.match_inputs, memo.values = features_by_window, match_inputs, values
+        return {m.name: dict(values[m.name]) for m in self._metrics}, recomputed
+
+    def _compute_all(
+        self, features_by_window: WindowFeatures, match: Match
+    ) -> dict[str, SideValues]:
+        values: dict[str, SideValues] = {}
+        for m in self._order:
+            values[m.name] = m.compute(
+                features_by_window, match, {name: values[name] for name in m.depends_on}
+            )
+        return {m.name: values[m.name] for m in self._metrics}
+
+    def _changed_windows(
+        self, previous: WindowFeatures, current: WindowFeatures
+    ) -> ChangedFeatures:
+        """Changed positions of each window the metrics read: one comparison per window."""
+        width = len(FEATURE_KEYS)
+        changed: ChangedFeatures = {}
+        for window in self._windows:
+            old, new = previous.vector(window), current.vector(window)
+            if old is new or old == new:
+                continue
+            old = old or (0,) * (2 * width)
+            new = new or (0,) * (2 * width)
+            changed[window] = {i % width for i, (a, b) in enumerate(zip(old, new)) if a != b}
+        return changed
+
+
+def _dependency_order(metrics: tuple[Metric, ...]) -> tuple[Metric, ...]:
+    """Topological order, registration order among independent metrics."""
+    done: dict[str, Metric] = {}
+    pending = list(metrics)
+    while pending:
+        ready = [m for m in pending if all(d in done for d in m.depends_on)]
+        if not ready:
+            raise ValueError(f"metric dependency cycle among {', '.join(m.name for m in pending)}")
+        for m in ready:
+            done[m.name] = m
+        pending = [m for m in pending if m.name not in done]
+    return tuple(done.values())
+
+
+class MetricEvaluator:
+    """Evaluates a registry per match, recomputing only metrics whose inputs changed.
+
+    For a selective registry it keeps a MetricMemo per match (LRU); otherwise every metric
+    is computed each time. Counts metrics evaluated and recomputed.
+    Thread-safe: the evaluator's lock covers only the LRU and counters; evaluations hold
+    their match's memo lock.
+    """
+
+    def __init__(self, registry: MetricRegistry, max_matches: int = 256) -> None:
+        self.registry = registry
+        self._max_matches = max_matches
+        self._memos: OrderedDict[str, MetricMemo] = OrderedDict()
+        self._evaluated = 0
+        self._recomputed = 0
+        self._lock = threading.Lock()
+
+    def evaluate(
+        self,
+        features_by_window: WindowFeatures,
+        match: Match,
+        changes: tuple[WindowFeatures, ChangedFeatures] | None = None,
+    ) -> dict[str, SideValues]:
+        """changes: see MetricRegistry.evaluate."""
+        if not self.registry.selective:
+            values, recomputed = self.registry.evaluate(features_by_window, match)
+            with self._lock:
+                self._evaluated += recomputed
+                self._recomputed += recomputed
+            return values
+        with self._lock:
+            memo = self._memos.get(match.match_id)
+            if memo is None:
+                memo = self._memos[match.match_id] = MetricMemo()
+            self._memos.move_to_end(match.match_id)
+            while len(self._memos) > self._max_matches:
+                self._memos.popitem(last=False)
+        with memo.lock:
+            values, recomputed = self.registry.evaluate(features_by_window, match, memo, changes)
+        with self._lock:
+            self._evaluated += len(values)
+            self._recomputed += recomputed
+        return values
+
+    def counters(self) -> dict[str, float]:
+        """metrics_evaluated, metrics_recomputed and their ratio since start."""
+        with self._lock:
+            evaluated, recomputed = self._evaluated, self._recomputed
+        return {
+            "metrics_evaluated": evaluated,
+            "metrics_recomputed": recomputed,
+            "recompute_ratio": round(recomputed / evaluated, 4) if evaluated else 0.0,
+        }
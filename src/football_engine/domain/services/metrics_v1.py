@@ -0,0 +1,177 @@
+"""Analytics v1 derived metrics: pressure, momentum, field tilt, danger (10m window).
+
+Each metric also has a batched form over NumPy arrays for BatchAnalyticsEngine, with the
+same operations in the same order, so both give identical values.
+"""
+
+from football_engine.domain.entities import Match
+from football_engine.domain.enums import EventType, FeatureName
+from football_engine.domain.services.metric_registry import Metric, MetricRegistry, SideValues
+from football_engine.domain.value_objects import XG_SCALE, WindowFeatures
+
+try:
+    import numpy as np
+except ImportError:  # optional `batch` extra; only the batched forms need it
+    np = None
+
+# Weights for pressure (attacking events)
+PRESSURE_WEIGHTS: dict[str, float] = {
+    EventType.SHOT: 1.0,
+    EventType.SHOT_ON_TARGET: 1.5,
+    EventType.CORNER: 0.8,
+    EventType.GOAL: 3.0,
+}
+
+# Resolved once: IntEnum indexing and enum-keyed lookups cost more than the arithmetic
+_SHOTS, _SHOTS_ON_TARGET, _CORNERS, _XG_SUM, _ATTACKING = (
+    int(FeatureName.SHOTS),
+    int(FeatureName.SHOTS_ON_TARGET),
+    int(FeatureName.CORNERS),
+    int(FeatureName.XG_SUM),
+    int(FeatureName.ATTACKING_ACTIONS_COUNT),
+)
+_SHOT_WEIGHT = PRESSURE_WEIGHTS.get(EventType.SHOT, 1.0)
+_SHOT_ON_TARGET_WEIGHT = PRESSURE_WEIGHTS.get(EventType.SHOT_ON_TARGET, 1.5)
+_CORNER_WEIGHT = PRESSURE_WEIGHTS.get(EventType.CORNER, 0.8)
+
+_PRESSURE_FEATURES = tuple(
+    ("10m", key) for key in ("shots", "shots_on_target", "corners", "xg_sum")
+)
+
+
+def _pressure_score(team: tuple[int, ...]) -> float:
+    """Single pressure score from a team feature vector (weighted attacking events)."""
+    return (
+        team[_SHOTS] * _SHOT_WEIGHT
+        + team[_SHOTS_ON_TARGET] * _SHOT_ON_TARGET_WEIGHT
+        + team[_CORNERS] * _CORNER_WEIGHT
+        + team[_XG_SUM] / XG_SCALE * 2.0
+    )
+
+
+def _teams_10m(features_by_window: WindowFeatures) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    return features_by_window.team("10m", "HOME"), features_by_window.team("10m", "AWAY")
+
+
+def _pressure_index(features_by_window: WindowFeatures, match: Match, inputs: dict) -> SideValues:
+    home, away = _teams_10m(features_by_window)
+    return {"HOME": round(_pressure_score(home), 4), "AWAY": round(_pressure_score(away), 4)}
+
+
+def _momentum(features_by_window: WindowFeatures, match: Match, inputs: dict) -> SideValues:
+    """Pressure share (unrounded pressure); 0.5 each without attacking pressure."""
+    home, away = _teams_10m(features_by_window)
+    p_home, p_away = _pressure_score(home), _pressure_score(away)
+    total = p_home + p_away
+    if total <= 0:
+        return {"HOME": 0.5, "AWAY": 0.5}
+    return {"HOME": round(p_home / total, 4), "AWAY": round(p_away / total, 4)}
+
+
+def _field_tilt(features_by_window: WindowFeatures, match: Match, inputs: dict) -> SideValues:
+    """Attacking-action share; 0.5 each without attacking pressure or actions."""
+    home, away = _teams_10m(features_by_window)
+    if _pressure_score(home) + _pressure_score(away) <= 0:
+        return {"HOME": 0.5, "AWAY": 0.5}
+    att_home, att_away = home[_ATTACKING], away[_ATTACKING]
+    att_total = att_home + att_away
+    if att_total <= 0:
+        return {"HOME": 0.5, "AWAY": 0.5}
+    return {"HOME": round(att_home / att_total, 4), "AWAY": round(att_away / att_total, 4)}
+
+
+def _danger_next_5m(features_by_window: WindowFeatures, match: Match, inputs: dict) -> SideValues:
+    """Danger next 5m: bounded 0..1 from momentum and man-advantage."""
+    momentum = inputs["momentum"]
+    man_adv = match.home_red_cards - match.away_red_cards
+    danger_home = min(1.0, max(0.0, momentum["HOME"] + 0.1 * (-man_adv)))
+    danger_away = min(1.0, max(0.0, momentum["AWAY"] + 0.1 * man_adv))
+    return {"HOME": round(danger_home, 4), "AWAY": round(danger_away, 4)}
+
+
+def round4(values: "np.ndarray") -> "np.ndarray":
+    """Python's round(v, 4) elementwise.
+
+    Rounds at scale 10**4 with np.rint; only values within float error of a tie, where
+    that can differ from Python's correctly rounded result, go through round().
+    """
+    scaled = values * 10_000
+    out = np.rint(scaled) / 10_000
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_tie.any():
+        out[near_tie] = [round(v, 4) for v in values[near_tie].tolist()]
+    return out
+
+
+def _pressure_scores(sums: dict) -> "np.ndarray":
+    """(matches, 2) _pressure_score of each team from 10m window sums."""
+    team = sums["10m"].astype(np.float64)
+    shots_on_target = team[:, :, FeatureName.SHOTS_ON_TARGET]
+    return (
+        team[:, :, FeatureName.SHOTS] * _SHOT_WEIGHT
+        + shots_on_target * _SHOT_ON_TARGET_WEIGHT
+        + team[:, :, FeatureName.CORNERS] * _CORNER_WEIGHT
+        + sums["10m"][:, :, FeatureName.XG_SUM] / XG_SCALE * 2.0
+    )
+
+
+def _shares(parts: "np.ndarray", gate: "np.ndarray") -> "np.ndarray":
+    """Rounded share of each side in parts where gate, else 0.5 each."""
+    total = parts[:, 0] + parts[:, 1]
+    safe_total = np.where(gate, total, 1).astype(np.float64)
+    return np.where(gate[:, None], round4(parts / safe_total[:, None]), 0.5)
+
+
+def _pressure_index_batch(sums: dict, matches: list[Match], inputs: dict) -> "np.ndarray":
+    return round4(_pressure_scores(sums))
+
+
+def _momentum_batch(sums: dict, matches: list[Match], inputs: dict) -> "np.ndarray":
+    pressure = _pressure_scores(sums)
+    return _shares(pressure, pressure[:, 0] + pressure[:, 1] > 0)
+
+
+def _field_tilt_batch(sums: dict, matches: list[Match], inputs: dict) -> "np.ndarray":
+    pressure = _pressure_scores(sums)
+    attacking = sums["10m"][:, :, FeatureName.ATTACKING_ACTIONS_COUNT]
+    active = (pressure[:, 0] + pressure[:, 1] > 0) & (attacking[:, 0] + attacking[:, 1] > 0)
+    return _shares(attacking, active)
+
+
+def _danger_next_5m_batch(sums: dict, matches: list[Match], inputs: dict) -> "np.ndarray":
+    momentum = inputs["momentum"]
+    man_adv = np.array([m.home_red_cards - m.away_red_cards for m in matches], dtype=np.float64)
+    danger = np.stack(
+        [
+            np.minimum(1.0, np.maximum(0.0, momentum[:, 0] + 0.1 * (-man_adv))),
+            np.minimum(1.0, np.maximum(0.0, momentum[:, 1] + 0.1 * man_adv)),
+        ],
+        axis=1,
+    )
+    return round4(danger)
+
+
+V1_METRICS = MetricRegistry(
+    [
+        Metric(
+            "pressure_index",
+            _pressure_index,
+            features=_PRESSURE_FEATURES,
+            compute_batch=_pressure_index_batch,
+        ),
+        Metric("momentum", _momentum, features=_PRESSURE_FEATURES, compute_batch=_momentum_batch),
+        Metric(
+            "field_tilt",
+            _field_tilt,
+            features=_PRESSURE_FEATURES + (("10m", "attacking_actions_count"),),
+            compute_batch=_field_tilt_batch,
+        ),
+        Metric(
+            "danger_next_5m",
+            _danger_next_5m,
+            match_fields=("home_red_cards", "away_red_cards"),
+            depends_on=("momentum",),
+            compute_batch=_danger_next_5m_batch,
+        ),
+    ]
+)
@@ -0,0 +1,154 @@
+"""Whole-match snapshot timeline from per-second prefix sums of team features.
+
+Offline counterpart of replaying every event through ingest: the event stream is read
+once, each window at any clock is a difference of two cumulative vectors, and the whole
+timeline costs O(events + seconds) instead of window queries per event.
+"""
+
+import uuid
+from datetime import UTC, datetime
+from enum import StrEnum
+
+from football_engine.domain.entities import AnalyticsSnapshot, Event, Match
+from football_engine.domain.services.analytics_engine import (
+    DEFAULT_WINDOWS,
+    build_deltas,
+    build_why,
+)
+from football_engine.domain.services.metric_registry import MetricMemo, MetricRegistry
+from football_engine.domain.services.metrics_v1 import V1_METRICS
+from football_engine.domain.services.window_state import (
+    FEATURE_KEYS,
+    add_event_to_vector,
+    add_into,
+    window_start_second,
+)
+from football_engine.domain.value_objects import MatchClock, RollingWindow, WindowFeatures
+
+_SIDES = ("HOME", "AWAY")
+_WIDTH = len(FEATURE_KEYS)
+
+
+class TimelineMode(StrEnum):
+    """Which clocks get a snapshot."""
+
+    EVENTS = "events"  # every distinct event clock (events sharing a second share one)
+    SECONDS = "seconds"  # every second of each period, up to its last event
+
+
+class FeaturePrefixSums:
+    """Cumulative team feature vectors per clock second of each period.
+
+    cumulative[period][side][s] sums the events of that period with seconds < s, so the
+    window [start, end] is cumulative[end + 1] - cumulative[start], O(1) per window.
+    """
+
+    def __init__(self, events: list[Event]) -> None:
+        buckets: dict[int, dict[int, list[list[int]]]] = {}
+        for e in events:
+            per_second = buckets.setdefault(e.clock.period, {})
+            sec = e.clock.total_seconds_in_period()
+            if sec not in per_second:
+                per_second[sec] = [[0] * _WIDTH for _ in _SIDES]
+            bucket = per_second[sec]
+            add_event_to_vector(bucket[_SIDES.index(e.team_side.value)], e)
+
+        self._last_second: dict[int, int] = {}
+        self._cumulative: dict[int, list[list[list[int]]]] = {}
+        for period, per_second in buckets.items():
+            last = max(per_second)
+            sides: list[list[list[int]]] = [[[0] * _WIDTH] for _ in _SIDES]
+            for sec in range(last + 1):
+                bucket = per_second.get(sec)
+                for i, cumulative in enumerate(sides):
+                    prev = cumulative[-1]
+                    cumulative.append(
+                        prev if bucket is None else [a + b for a, b in zip(prev, bucket[i])]
+                    )
+            self._last_second[period] = last
+            self._cumulative[period] = sides
+
+    @property
+    def periods(self) -> list[int]:
+        return sorted(self._last_second)
+
+    def last_second(self, period: int) -> int:
+        """Last second in period with an event (-1 when the period has none)."""
+        return self._last_second.get(period, -1)
+
+    def window(self, clock: MatchClock, window: RollingWindow) -> tuple[int, ...]:
+        """Vector (HOME then AWAY) of the window ending at clock, as the repository sees it."""
+        totals = [[0] * _WIDTH for _ in _SIDES]
+        if window.whole_match:
+            for period in self.periods:
+                if period < clock.period:
+                    for total, cumulative in zip(totals, self._cumulative[period]):
+                        add_into(total, cumulative[-1])
+        last = self.last_second(clock.period)
+        end = min(clock.total_seconds_in_period(), last) + 1
+        start = min(window_start_second(clock.total_seconds_in_period(), window), last + 1)
+        if start < end:
+            for total, cumulative in zip(totals, self._cumulative[clock.period]):
+                add_into(total, [a - b for a, b in zip(cumulative[end], cumulative[start])])
+        return (*totals[0], *totals[1])
+
+
+def timeline_clocks(
+    sums: FeaturePrefixSums, events: list[Event], mode: TimelineMode
+) -> list[MatchClock]:
+    """Snapshot clocks in order for mode; events must be sorted by clock."""
+    if mode == TimelineMode.SECONDS:
+        return [
+            MatchClock(period=period, minute=sec // 60, second=sec % 60)
+            for period in sums.periods
+            for sec in range(sums.last_second(period) + 1)
+        ]
+    clocks: list[MatchClock] = []
+    for e in events:
+        if not clocks or clocks[-1] != e.clock:
+            clocks.append(e.clock)
+    return clocks
+
+
+def build_timeline(
+    match: Match,
+    events: list[Event],
+    model_version: str,
+    mode: TimelineMode = TimelineMode.EVENTS,
+    windows: tuple[RollingWindow, ...] = DEFAULT_WINDOWS,
+    metrics: MetricRegistry = V1_METRICS,
+) -> list[AnalyticsSnapshot]:
+    """Snapshots over the whole match, each computed as ingest would with every event known.
+
+    match is the state before the first event; it is advanced through the events so match
+    inputs (red cards) are those at each snapshot's clock. A snapshot at clock t sees every
+    event at or before t, deltas are against the previous snapshot of the timeline.
+    """
+    ordered = sorted(events, key=lambda e: e.clock.ordering_key())
+    sums = FeaturePrefixSums(ordered)
+    created_at = datetime.now(UTC)
+    snapshots: list[AnalyticsSnapshot] = []
+    previous: AnalyticsSnapshot | None = None
+    memo = MetricMemo()
+    state = match
+    applied = 0
+    for clock in timeline_clocks(sums, ordered, mode):
+        key = clock.ordering_key()
+        while applied < len(ordered) and ordered[applied].clock.ordering_key() <= key:
+            state = state.apply_event(ordered[applied])
+            applied += 1
+        features_by_window = WindowFeatures({w.label: sums.window(clock, w) for w in windows})
+        derived_metrics, _ = metrics.evaluate(features_by_window, state, memo)
+        previous = AnalyticsSnapshot(
+            snapshot_id=str(uuid.uuid4()),
+            match_id=match.match_id,
+            clock=clock,
+            features_by_window=features_by_window,
+            derived_metrics=derived_metrics,
+            deltas=build_deltas(features_by_window, derived_metrics, previous),
+            why=build_why(features_by_window),
+            model_version=model_version,
+            created_at_utc=created_at,
+        )
+        snapshots.append(previous)
+    return snapshots
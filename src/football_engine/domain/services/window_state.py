@@ -0,0 +1,346 @@
+"""Incremental rolling-window features per match: per-second ring of counters, O(1) add and expiry."""
+
+import threading
+from collections import OrderedDict
+
+from football_engine.domain.entities import Event
+from football_engine.domain.enums import EventType, FeatureName
+from football_engine.domain.value_objects import (
+    FEATURE_KEYS,
+    PERIOD_STRIDE_SECONDS,
+    XG_SCALE,
+    MatchClock,
+    RollingWindow,
+    WindowFeatures,
+)
+
+_XG = FeatureName.XG_SUM
+_ATTACKING = FeatureName.ATTACKING_ACTIONS_COUNT
+_COUNTED_TYPES = {
+    EventType.SHOT: FeatureName.SHOTS,
+    EventType.SHOT_ON_TARGET: FeatureName.SHOTS_ON_TARGET,
+    EventType.CORNER: FeatureName.CORNERS,
+    EventType.FOUL: FeatureName.FOULS,
+    EventType.YELLOW: FeatureName.YELLOWS,
+    EventType.RED: FeatureName.REDS,
+}
+_SIDES = ("HOME", "AWAY")
+_WIDTH = len(FEATURE_KEYS)
+
+
+def add_event_to_vector(vec: list[int], event: Event) -> None:
+    """Fold one event into a team feature vector (FeatureName order, xG in micro-units)."""
+    idx = _COUNTED_TYPES.get(event.event_type)
+    if idx is not None:
+        vec[idx] += 1
+    xg = event.xg_value()
+    if xg is not None:
+        vec[_XG] += round(xg * XG_SCALE)
+    if event.is_attacking_action():
+        vec[_ATTACKING] += 1
+
+
+def to_window_features(sums: dict[str, list[list[int]]]) -> WindowFeatures:
+    """WindowFeatures from [HOME vector, AWAY vector] per window label."""
+    return WindowFeatures({label: (*home, *away) for label, (home, away) in sums.items()})
+
+
+def window_start_second(end_second: int, window: RollingWindow) -> int:
+    """First clock second (in period) covered by window ending at end_second."""
+    return window.start_second(end_second)
+
+
+class MatchWindowState:
+    """Window features for one match period.
+
+    Buckets live in a ring of per-second slots sized to the widest minute window, and each
+    window keeps a running sum that is adjusted as its start advances by whole minutes.
+    Period ("half") and whole-match ("full") windows never expire; the latter also carries
+    the totals of earlier periods.
+
+    With track_changes it also tracks which feature positions of each window changed
+    (events folded in, buckets expired) since the features last read at head, so derived
+    metrics that read none of them need not be recomputed.
+    """
+
+    def __init__(
+        self,
+        period: int,
+        windows: tuple[RollingWindow, ...],
+        head: int = -1,
+        version: int | None = None,
+        track_changes: bool = True,
+    ) -> None:
+        # Match.version the folded events add up to (None: not tracked)
+        self.version = version
+        self._track_changes = track_changes
+        self._windows = windows
+        self._span = (max((w.minutes or 0 for w in windows), default=0) + 1) * 60
+        self._carry = [[0] * _WIDTH for _ in _SIDES]
+        # Features last returned by features_at, and what changed since (None: unknown)
+        self.last_features: WindowFeatures | None = None
+        self.last_changes: tuple[WindowFeatures, dict[str, set[int]]] | None = None
+        self._at_head = False
+        self._reset(period, head)
+
+    def _reset(self, period: int, head: int) -> None:
+        self._changed: dict[str, set[int]] | None = None
+        self.period = period
+        self.head = head
+        self._slot_second = [-1] * self._span
+        self._slots: list[list[list[int]] | None] = [None] * self._span
+        self._starts = {w.label: window_start_second(max(head, 0), w) for w in self._windows}
+        self._sums = {
+            w.label: (
+                [list(v) for v in self._carry] if w.whole_match else [[0] * _WIDTH for _ in _SIDES]
+            )
+            for w in self._windows
+        }
+
+    def add(self, event: Event) -> bool:
+        """Fold a persisted event into the state. False if it falls outside what the state covers."""
+        clock = event.clock
+        side = _SIDES.index(event.team_side.value)
+        vec = [0] * _WIDTH
+        add_event_to_vector(vec, event)
+        if clock.period < self.period:
+            # Only the whole-match windows reach back into earlier periods
+            full = [w.label for w in self._windows if w.whole_match]
+            for label in full:
+                add_into(self._sums[label][side], vec)
+                self._touch(label, vec)
+            if full:
+                add_into(self._carry[side], vec)
+            return bool(full)
+        if clock.period > self.period:
+            for w in self._windows:
+                if w.whole_match:
+                    self._carry = [list(v) for v in self._sums[w.label]]
+            self._reset(clock.period, -1)
+        t = clock.total_seconds_in_period()
+        if t > self.head:
+            self._advance(t)
+
+        if t > self.head - self._span:
+            slot = t % self._span
+            bucket = self._slots[slot]
+            if bucket is None or self._slot_second[slot] != t:
+                bucket = [[0] * _WIDTH for _ in _SIDES]
+                self._slots[slot] = bucket
+                self._slot_second[slot] = t
+            add_into(bucket[side], vec)
+        for label, start in self._starts.items():
+            if t >= start:
+                add_into(self._sums[label][side], vec)
+                self._touch(label, vec)
+        return True
+
+    def take_changes(self) -> dict[str, set[int]] | None:
+        """Positions changed per window between the last two reads at head; None if unknown.
+
+        Call after each features_at; starts tracking afresh from that read.
+        """
+        changed = self._changed if self._at_head else None
+        self._changed = {} if self._at_head and self._track_changes else None
+        return changed
+
+    def _touch(self, label: str, vec: list[int]) -> None:
+        if self._changed is not None:
+            indices = [i for i, v in enumerate(vec) if v]
+            if indices:
+                self._changed.setdefault(label, set()).update(indices)
+
+    def features_at(self, clock: MatchClock) -> WindowFeatures | None:
+        """Features per window ending at clock, or None if the state cannot answer."""
+        if clock.period != self.period:
+            return None
+        t = clock.total_seconds_in_period()
+        self._at_head = t == self.head
+        if t == self.head:
+            return to_window_features(self._sums)
+        if t > self.head:
+            return None
+        out: dict[str, list[list[int]]] = {}
+        for w in self._windows:
+            if w.minutes is None:
+                # Never expires: the running sum minus what came after t
+                if t < self.head - self._span:
+                    return None
+                sums = [list(v) for v in self._sums[w.label]]
+                for sec in range(t + 1, self.head + 1):
+                    bucket = self._bucket(sec)
+                    if bucket is not None:
+                        for i in range(len(_SIDES)):
+                            _sub_from(sums[i], bucket[i])
+            else:
+                start = window_start_second(t, w)
+                if start <= self.head - self._span:
+                    return None
+                sums = [[0] * _WIDTH for _ in _SIDES]
+                for sec in range(start, t + 1):
+                    bucket = self._bucket(sec)
+                    if bucket is not None:
+                        for i in range(len(_SIDES)):
+                            add_into(sums[i], bucket[i])
+            out[w.label] = sums
+        return to_window_features(out)
+
+    def _bucket(self, sec: int) -> list[list[int]] | None:
+        slot = sec % self._span
+        return self._slots[slot] if self._slot_second[slot] == sec else None
+
+    def _advance(self, t: int) -> None:
+        """Move head to t, expiring buckets that drop out of each window."""
+        for w in self._windows:
+            old_start = self._starts[w.label]
+            new_start = window_start_second(t, w)
+            sums = self._sums[w.label]
+            for sec in range(old_start, min(new_start, self.head + 1)):
+                bucket = self._bucket(sec)
+                if bucket is not None:
+                    for i in range(len(_SIDES)):
+                        _sub_from(sums[i], bucket[i])
+                        self._touch(w.label, bucket[i])
+            self._starts[w.label] = max(old_start, new_start)
+        self.head = t
+
+
+def sweep_window_features(
+    events: list[Event], clock: MatchClock, windows: tuple[RollingWindow, ...]
+) -> WindowFeatures:
+    """Features per window ending at clock from one fetch of the widest window's events.
+
+    events are sorted by clock. Every window ends at clock, so each is a suffix of the
+    events: one backward sweep fills the narrowest first and keeps accumulating outwards.
+    """
+    end_key = clock.ordering_key()
+
+    def start_key(w: RollingWindow) -> int:
+        if w.whole_match:
+            return 0
+        return clock.period * PERIOD_STRIDE_SECONDS + window_start_second(
+            clock.total_seconds_in_period(), w
+        )
+
+    sums = [[0] * _WIDTH for _ in _SIDES]
+    out: dict[str, list[list[int]]] = {}
+    i = len(events) - 1
+    for w in sorted(windows, key=start_key, reverse=True):
+        start = start_key(w)
+        while i >= 0 and events[i].clock.ordering_key() >= start:
+            e = events[i]
+            i -= 1
+            if e.clock.ordering_key() <= end_key:
+                add_event_to_vector(sums[_SIDES.index(e.team_side.value)], e)
+        out[w.label] = [list(v) for v in sums]
+    return to_window_features({w.label: out[w.label] for w in windows})
+
+
+def add_into(acc: list[int], vec: list[int]) -> None:
+    """Add a feature vector into acc, in place."""
+    for i in range(_WIDTH):
+        acc[i] += vec[i]
+
+
+def _sub_from(acc: list[int], vec: list[int]) -> None:
+    for i in range(_WIDTH):
+        acc[i] -= vec[i]
+
+
+class WindowStateStore:
+    """Process-level LRU of MatchWindowState by match_id. Thread-safe.
+
+    Each state records the Match.version it reflects. Another process ingesting the same
+    match moves the stored version past it; the state is then stale and treated as a miss,
+    so callers rebuild it from the database. track_changes: see MatchWindowState.
+    """
+
+    def __init__(
+        self,
+        windows: tuple[RollingWindow, ...],
+        max_matches: int = 256,
+        track_changes: bool = True,
+    ) -> None:
+        self._windows = windows
+        self._track_changes = track_changes
+        self._max_matches = max_matches
+        self._states: OrderedDict[str, MatchWindowState] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def observe(
+        self,
+        match_id: str,
+        events: list[Event],
+        clock: MatchClock,
+        version: int | None = None,
+    ) -> WindowFeatures | None:
+        """Fold new events (clock order) and return features at clock. None on cache miss.
+
+        version is the match version after events (one per event, as Match.apply_event);
+        a state not exactly len(events) versions behind it is dropped as stale.
+        """
+        with self._lock:
+            state = self._states.get(match_id)
+            if state is None:
+                return None
+            if version is not None:
+                if state.version is None or state.version + len(events) != version:
+                    del self._states[match_id]
+                    return None
+                state.version = version
+            self._states.move_to_end(match_id)
+            for e in events:
+                state.add(e)
+            return _read(state, clock)
+
+    def rebuild(
+        self,
+        match_id: str,
+        clock: MatchClock,
+        events: list[Event],
+        version: int | None = None,
+    ) -> WindowFeatures:
+        """Seed state from the widest window's events ending at clock; return features at clock.
+
+        version is the match version those events bring the match to.
+        """
+        state = MatchWindowState(
+            clock.period,
+            self._windows,
+            head=clock.total_seconds_in_period(),
+            version=version,
+            track_changes=self._track_changes,
+        )
+        for e in events:
+            state.add(e)
+        features = _read(state, clock)
+        with self._lock:
+            self._states[match_id] = state
+            self._states.move_to_end(match_id)
+            while len(self._states) > self._max_matches:
+                self._states.popitem(last=False)
+        return features  # type: ignore[return-value]
+
+    def changes(
+        self, match_id: str, features: WindowFeatures
+    ) -> tuple[WindowFeatures, dict[str, set[int]]] | None:
+        """(earlier features, positions changed since) if features is the match's last read."""
+        with self._lock:
+            state = self._states.get(match_id)
+            if state is None or state.last_features is not features:
+                return None
+            return state.last_changes
+
+    def invalidate(self, match_id: str) -> None:
+        with self._lock:
+            self._states.pop(match_id, None)
+
+
+def _read(state: MatchWindowState, clock: MatchClock) -> WindowFeatures | None:
+    """Features at clock, recording what changed since the state's previous read."""
+    since = state.last_features
+    features = state.features_at(clock)
+    changed = state.take_changes()
+    state.last_features = features
+    state.last_changes = (since, changed) if since is not None and changed is not None else None
+    return features
@@ -1,6 +1,14 @@
 """Domain value objects. Immutable."""
 
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass
+from operator import sub
+from typing import Any
+
+from football_engine.domain.enums import FeatureName
+
+# Seconds reserved per period in MatchClock.ordering_key (no period runs this long)
+PERIOD_STRIDE_SECONDS = 10_000
 
 
 @dataclass(frozen=True)
@@ -18,6 +26,10 @@ class MatchClock:
     def total_seconds_in_period(self) -> int:
         return self.minute * 60 + self.second
 
+    def ordering_key(self) -> int:
+        """Monotonic across periods: period * PERIOD_STRIDE_SECONDS + seconds in period."""
+        return self.period * PERIOD_STRIDE_SECONDS + self.total_seconds_in_period()
+
     def __lt__(self, other: "MatchClock") -> bool:
         if not isinstance(other, MatchClock):
             return NotImplemented
@@ -43,12 +55,155 @@ class Score:
 
 @dataclass(frozen=True)
 class RollingWindow:
-    minutes: int
+    """Window of a match ending at a clock.
+
+    minutes: the last N whole minutes of the period (label "Nm"). Without minutes it is the
+    whole period so far ("half"), or with whole_match the whole match so far ("full").
+    """
+
+    minutes: int | None = None
+    whole_match: bool = False
 
     def __post_init__(self) -> None:
-        if self.minutes not in (5, 10):
-            raise ValueError("minutes must be 5 or 10")
+        if self.minutes is not None and self.minutes < 1:
+            raise ValueError("minutes must be >= 1")
+        if self.whole_match and self.minutes is not None:
+            raise ValueError("a whole-match window has no minutes")
+
+    @classmethod
+    def parse(cls, label: str) -> "RollingWindow":
+        """From a label: "Nm", "half" or "full"."""
+        label = label.strip()
+        if label == "half":
+            return cls()
+        if label == "full":
+            return cls(whole_match=True)
+        if label.endswith("m") and label[:-1].isdigit():
+            return cls(minutes=int(label[:-1]))
+        raise ValueError(f"unknown window {label!r} (expected Nm, half or full)")
 
     @property
     def label(self) -> str:
+        if self.whole_match:
+            return "full"
+        if self.minutes is None:
+            return "half"
         return f"{self.minutes}m"
+
+    @property
+    def reach(self) -> tuple[bool, bool, int]:
+        """Sort key: a window covers every window with a smaller reach."""
+        return (self.whole_match, self.minutes is None, self.minutes or 0)
+
+    def start_second(self, end_second: int) -> int:
+        """First clock second (in the end clock's period) covered when ending at end_second."""
+        if self.minutes is None:
+            return 0
+        return max(0, end_second // 60 - self.minutes) * 60
+
+
+def parse_windows(spec: str) -> tuple[RollingWindow, ...]:
+    """Comma-separated window labels ("5m,10m,half") to windows, in order."""
+    return tuple(RollingWindow.parse(label) for label in spec.split(",") if label.strip())
+
+
+FEATURE_KEYS = tuple(f.key for f in FeatureName)
+TEAM_SIDES = ("HOME", "AWAY")
+
+# xG is accumulated as integer micro-units so add/expire never drifts and every
+# aggregation order (incremental or from a DB fetch) yields the same float.
+XG_SCALE = 1_000_000
+
+_WIDTH = len(FeatureName)
+
+
+class WindowFeatures(Mapping[str, dict[str, dict[str, Any]]]):
+    """Team features per window, stored as one flat int vector per window label.
+
+    A vector is HOME then AWAY, each in FeatureName order, xG in micro-units. Read it with
+    team() / value(); the {label: {side: {feature key: value}}} form the API and the
+    database use is only built on mapping access or to_dict(), and not kept.
+    """
+
+    __slots__ = ("_vectors",)
+
+    def __init__(self, vectors: dict[str, tuple[int, ...]]) -> None:
+        self._vectors = vectors
+
+    @classmethod
+    def from_dict(cls, features_by_window: Mapping[str, Any]) -> "WindowFeatures":
+        """From the {label: {side: {feature key: value}}} form; missing features are 0."""
+        if isinstance(features_by_window, WindowFeatures):
+            return features_by_window
+        vectors = {}
+        for label, sides in features_by_window.items():
+            vec = []
+            for side in TEAM_SIDES:
+                features = sides.get(side) or {}
+                vec.extend(features.get(k, 0) for k in FEATURE_KEYS)
+            for i in (FeatureName.XG_SUM, _WIDTH + FeatureName.XG_SUM):
+                vec[i] = round((vec[i] or 0) * XG_SCALE)
+            vectors[label] = tuple(vec)
+        return cls(vectors)
+
+    def vector(self, label: str) -> tuple[int, ...] | None:
+        return self._vectors.get(label)
+
+    def team(self, label: str, side: str) -> tuple[int, ...]:
+        """One side's vector in label (all zeros if the window is absent)."""
+        vec = self._vectors.get(label)
+        if vec is None:
+            return (0,) * _WIDTH
+        start = TEAM_SIDES.index(side) * _WIDTH
+        return vec[start : start + _WIDTH]
+
+    def value(self, label: str, side: str, feature: FeatureName) -> float:
+        """One feature as the API reports it (xG as a float)."""
+        raw = self.team(label, side)[feature]
+        return raw / XG_SCALE if feature == FeatureName.XG_SUM else raw
+
+    def minus(self, previous: "WindowFeatures | None") -> "WindowFeatures":
+        """Per-window difference with previous (windows it lacks count as zeros)."""
+        prev = previous._vectors if previous is not None else {}
+        return WindowFeatures(
+            {
+                label: tuple(map(sub, vec, prev[label])) if label in prev else vec
+                for label, vec in self._vectors.items()
+            }
+        )
+
+    def to_dict(self) -> dict[str, dict[str, dict[str, Any]]]:
+        return {label: _sides_dict(vec) for label, vec in self._vectors.items()}
+
+    def __getitem__(self, label: str) -> dict[str, dict[str, Any]]:
+        return _sides_dict(self._vectors[label])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._vectors)
+
+    def __len__(self) -> int:
+        return len(self._vectors)
+
+    def __contains__(self, label: object) -> bool:
+        return label in self._vectors
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, WindowFeatures):
+            return self._vectors == other._vectors
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"WindowFeatures({self._vectors!r})"
+
+
+def _sides_dict(vec: tuple[int, ...]) -> dict[str, dict[str, Any]]:
+    out: dict[str, dict[str, Any]] = {}
+    for i, side in enumerate(TEAM_SIDES):
+        features: dict[str, Any] = dict(zip(FEATURE_KEYS, vec[i * _WIDTH : (i + 1) * _WIDTH]))
+        features["xg_sum"] = vec[i * _WIDTH + FeatureName.XG_SUM] / XG_SCALE
+        out[side] = features
+    return out
@@ -0,0 +1,16 @@
+"""Process-level in-memory caches for hot read paths."""
+
+from football_engine.infrastructure.cache.event_id_filter import SeenEventIds
+from football_engine.infrastructure.cache.match_cache import MatchCache
+from football_engine.infrastructure.cache.response_cache import EncodedResponseCache
+from football_engine.infrastructure.cache.snapshot_cache import LatestSnapshotCache
+from football_engine.infrastructure.cache.staging import is_staged, stage_after_commit
+
+__all__ = [
+    "EncodedResponseCache",
+    "LatestSnapshotCache",
+    "MatchCache",
+    "SeenEventIds",
+    "is_staged",
+    "stage_after_commit",
+]
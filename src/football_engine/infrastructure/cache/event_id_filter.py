@@ -0,0 +1,60 @@
+"""Per-match set of event_ids known to be stored. Bounded LRU, exact (no false positives)."""
+
+import threading
+from collections import OrderedDict
+
+
+class SeenEventIds:
+    """Thread-safe exact filter of stored event_ids per match.
+
+    A hit means the event is certainly stored, so a duplicate can be rejected without
+    touching the DB. A miss means unknown (never seen, evicted, or the match is cold)
+    and callers must ask the DB. Hence exact LRU sets rather than a Bloom filter, whose
+    false positives would drop new events. Ids are evicted oldest-first per match and
+    whole matches least-recently-used first.
+    """
+
+    def __init__(self, max_ids_per_match: int = 50_000, max_matches: int = 256) -> None:
+        self._max_ids = max_ids_per_match
+        self._max_matches = max_matches
+        self._matches: OrderedDict[str, OrderedDict[str, None]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def known(self, match_id: str, event_ids: list[str]) -> set[str]:
+        """Subset of event_ids certainly stored for match_id."""
+        with self._lock:
+            ids = self._matches.get(match_id)
+            if not ids:
+                return set()
+            self._matches.move_to_end(match_id)
+            return {event_id for event_id in event_ids if event_id in ids}
+
+    def add(self, match_id: str, event_ids: list[str]) -> None:
+        """Record event_ids as stored. Call only after the insert is committed."""
+        if not event_ids:
+            return
+        with self._lock:
+            ids = self._matches.get(match_id)
+            if ids is None:
+                ids = self._matches[match_id] = OrderedDict()
+            self._matches.move_to_end(match_id)
+            for event_id in event_ids:
+                ids[event_id] = None
+                ids.move_to_end(event_id)
+            while len(ids) > self._max_ids:
+                ids.popitem(last=False)
+            while len(self._matches) > self._max_matches:
+                self._matches.popitem(last=False)
+
+    def size(self, match_id: str) -> int:
+        with self._lock:
+            ids = self._matches.get(match_id)
+            return len(ids) if ids else 0
+
+    def invalidate(self, match_id: str) -> None:
+        with self._lock:
+            self._matches.pop(match_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._matches.clear()
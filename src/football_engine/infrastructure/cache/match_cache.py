@@ -0,0 +1,55 @@
+"""Write-through cache of live Match entities keyed by match_id. LRU + TTL, version-checked."""
+
+import threading
+import time
+from collections import OrderedDict
+
+from football_engine.domain.entities import Match
+from football_engine.domain.enums import MatchStatus
+
+
+class MatchCache:
+    """Thread-safe LRU of Match by match_id.
+
+    Entries only move forward in Match.version, so a late write of an older state
+    never replaces a newer one. Finished (FT) matches are evicted instead of cached.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 300.0) -> None:
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._entries: OrderedDict[str, tuple[Match, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, match_id: str) -> Match | None:
+        with self._lock:
+            entry = self._entries.get(match_id)
+            if entry is None:
+                return None
+            match, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._entries[match_id]
+                return None
+            self._entries.move_to_end(match_id)
+            return match
+
+    def put(self, match: Match) -> None:
+        if match.status == MatchStatus.FT:
+            self.invalidate(match.match_id)
+            return
+        with self._lock:
+            current = self._entries.get(match.match_id)
+            if current is not None and current[0].version > match.version:
+                return
+            self._entries[match.match_id] = (match, time.monotonic() + self._ttl)
+            self._entries.move_to_end(match.match_id)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, match_id: str) -> None:
+        with self._lock:
+            self._entries.pop(match_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,37 @@
+"""Pre-serialized read responses keyed by what identifies their content exactly."""
+
+import threading
+from collections import OrderedDict
+
+
+class EncodedResponseCache:
+    """Thread-safe LRU of encoded response bodies by (kind, match_id).
+
+    Each entry holds the body for one content tag (Match.version, snapshot_id); a get with
+    any other tag misses, so a newer version never gets an older body. Only the latest
+    tag per match is kept.
+    """
+
+    def __init__(self, max_entries: int = 2048) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], tuple[str, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, kind: str, match_id: str, tag: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get((kind, match_id))
+            if entry is None or entry[0] != tag:
+                return None
+            self._entries.move_to_end((kind, match_id))
+            return entry[1]
+
+    def put(self, kind: str, match_id: str, tag: str, body: bytes) -> None:
+        with self._lock:
+            self._entries[(kind, match_id)] = (tag, body)
+            self._entries.move_to_end((kind, match_id))
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,49 @@
+"""Latest analytics snapshot per match, for answering duplicates and reads without a query."""
+
+import threading
+from collections import OrderedDict
+
+from football_engine.domain.entities import AnalyticsSnapshot
+
+
+class LatestSnapshotCache:
+    """Thread-safe LRU of the latest stored snapshot by match_id.
+
+    Filled after commit only. Ingest for one match is single-writer, so commit order
+    is insert order and the last put is the latest snapshot.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, AnalyticsSnapshot] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, match_id: str) -> AnalyticsSnapshot | None:
+        with self._lock:
+            snapshot = self._entries.get(match_id)
+            if snapshot is not None:
+                self._entries.move_to_end(match_id)
+            return snapshot
+
+    def put(self, snapshot: AnalyticsSnapshot) -> None:
+        with self._lock:
+            self._entries[snapshot.match_id] = snapshot
+            self._entries.move_to_end(snapshot.match_id)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def put_if_absent(self, snapshot: AnalyticsSnapshot) -> None:
+        """Fill a missing entry (DB loads); never replaces a snapshot put by a writer."""
+        with self._lock:
+            if snapshot.match_id not in self._entries:
+                self._entries[snapshot.match_id] = snapshot
+                while len(self._entries) > self._max_entries:
+                    self._entries.popitem(last=False)
+
+    def invalidate(self, match_id: str) -> None:
+        with self._lock:
+            self._entries.pop(match_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,40 @@
+"""Commit-gated cache updates: callbacks staged on a session run after commit, never after rollback."""
+
+from collections.abc import Callable, Hashable
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+_STAGED_KEY = "cache_staged_updates"
+
+
+def stage_after_commit(
+    session: Session, callback: Callable[[], None], key: Hashable | None = None
+) -> None:
+    """Run callback once the session's transaction commits.
+
+    A later call with the same key replaces the earlier callback; unkeyed callbacks all run.
+    """
+    info = session.info
+    if _STAGED_KEY not in info:
+        info[_STAGED_KEY] = {}
+
+        def _on_commit(committed: Session) -> None:
+            staged = committed.info[_STAGED_KEY]
+            callbacks = list(staged.values())
+            staged.clear()
+            for staged_callback in callbacks:
+                staged_callback()
+
+        def _on_rollback(rolled_back: Session) -> None:
+            rolled_back.info[_STAGED_KEY].clear()
+
+        event.listen(session, "after_commit", _on_commit)
+        event.listen(session, "after_rollback", _on_rollback)
+    info[_STAGED_KEY][object() if key is None else key] = callback
+
+
+def is_staged(session: Session, key: Hashable) -> bool:
+    """True if an update for key is waiting for this session's commit."""
+    staged = session.info.get(_STAGED_KEY)
+    return bool(staged) and key in staged
@@ -0,0 +1,45 @@
+"""Warm in-memory caches from the DB for matches in play (startup)."""
+
+import logging
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session, sessionmaker
+
+from football_engine.domain.enums import MatchStatus
+from football_engine.infrastructure.cache.event_id_filter import SeenEventIds
+from football_engine.infrastructure.cache.match_cache import MatchCache
+from football_engine.infrastructure.cache.snapshot_cache import LatestSnapshotCache
+from football_engine.infrastructure.db.models import AnalyticsLatestModel, EventModel, MatchModel
+from football_engine.infrastructure.db.session import session_scope
+from football_engine.infrastructure.mappers.analytics_mapper import analytics_snapshot_from_orm
+from football_engine.infrastructure.mappers.match_mapper import match_from_orm
+
+logger = logging.getLogger(__name__)
+
+_IN_PLAY = (MatchStatus.LIVE.value, MatchStatus.HT.value, MatchStatus.PAUSED.value)
+
+
+def warm_live_matches(
+    session_factory: sessionmaker[Session],
+    match_cache: MatchCache,
+    seen_event_ids: SeenEventIds,
+    snapshot_cache: LatestSnapshotCache,
+    max_ids_per_match: int,
+) -> int:
+    """Load state, latest snapshot and most recent event_ids of in-play matches. Returns match count."""
+    with session_scope(session_factory) as db:
+        matches = db.scalars(select(MatchModel).where(MatchModel.status.in_(_IN_PLAY))).all()
+        for row in matches:
+            match_cache.put(match_from_orm(row))
+            event_ids = db.scalars(
+                select(EventModel.event_id)
+                .where(EventModel.match_id == row.match_id)
+                .order_by(EventModel.id.desc())
+                .limit(max_ids_per_match)
+            ).all()
+            seen_event_ids.add(row.match_id, list(reversed(event_ids)))
+            snapshot = db.get(AnalyticsLatestModel, row.match_id)
+            if snapshot is not None:
+                snapshot_cache.put_if_absent(analytics_snapshot_from_orm(snapshot))
+    logger.info(f"Warmed caches for {len(matches)} in-play matches")
+    return len(matches)
@@ -1,8 +1,9 @@
 """Database layer: ORM models, engine, session factory."""
 
 from football_engine.infrastructure.db.models import (
-    Base,
+    AnalyticsLatestModel,
     AnalyticsSnapshotModel,
+    Base,
     EventModel,
     MatchModel,
 )
@@ -10,14 +11,17 @@ from football_engine.infrastructure.db.session import (
     create_engine_and_factory,
     create_session_factory,
     get_session,
+    session_scope,
 )
 
 __all__ = [
+    "AnalyticsLatestModel",
+    "AnalyticsSnapshotModel",
     "Base",
-    "MatchModel",
     "EventModel",
-    "AnalyticsSnapshotModel",
+    "MatchModel",
     "create_engine_and_factory",
     "create_session_factory",
     "get_session",
+    "session_scope",
 ]
@@ -0,0 +1,75 @@
+"""SQLAlchemy asyncio engine and session factory. Selected when DATABASE_URL names an async driver."""
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
+
+from sqlalchemy.engine import make_url
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+# Async driver -> sync driver for the same database (used by sync-only routes and Alembic)
+_SYNC_DRIVERS = {
+    "sqlite+aiosqlite": "sqlite",
+    "postgresql+asyncpg": "postgresql",
+    "postgresql+psycopg_async": "postgresql+psycopg",
+    "mysql+aiomysql": "mysql+pymysql",
+    "mysql+asyncmy": "mysql+pymysql",
+}
+
+
+def is_async_database_url(database_url: str) -> bool:
+    """True if the URL selects an asyncio DBAPI driver (e.g. sqlite+aiosqlite)."""
+    return make_url(database_url).drivername in _SYNC_DRIVERS
+
+
+def sync_database_url(database_url: str) -> str:
+    """Same database through its sync driver. Sync URLs are returned unchanged."""
+    url = make_url(database_url)
+    driver = _SYNC_DRIVERS.get(url.drivername)
+    if driver is None:
+        return database_url
+    return url.set(drivername=driver).render_as_string(hide_password=False)
+
+
+def create_async_engine_and_factory(
+    database_url: str,
+) -> tuple["AsyncEngine", "async_sessionmaker[AsyncSession]"]:
+    """Create async engine and session factory. Requires the `async` extra."""
+    from sqlalchemy import event
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    engine = create_async_engine(database_url, echo=False)
+
+    if database_url.startswith("sqlite"):
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def _set_sqlite_pragma(dbapi_connection: object, _: object) -> None:
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA foreign_keys=ON")
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.close()
+
+    factory = async_sessionmaker(
+        bind=engine,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+    return engine, factory
+
+
+@asynccontextmanager
+async def async_session_scope(
+    session_factory: "async_sessionmaker[AsyncSession]",
+) -> AsyncIterator["AsyncSession"]:
+    """Async unit of work. Commit on success, rollback on error."""
+    session = session_factory()
+    try:
+        yield session
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
@@ -0,0 +1,21 @@
+"""Dialect-specific INSERT constructs (ON CONFLICT) for SQLite and PostgreSQL."""
+
+from collections.abc import Callable
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Dialect
+
+_INSERT_BY_DIALECT: dict[str, Callable] = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+
+def supports_on_conflict(dialect: Dialect) -> bool:
+    """INSERT ... ON CONFLICT with RETURNING (SQLite >= 3.35, PostgreSQL)."""
+    return dialect.name in _INSERT_BY_DIALECT and dialect.insert_returning
+
+
+def on_conflict_insert(dialect_name: str) -> Callable:
+    """insert() construct of the dialect, exposing on_conflict_do_nothing/do_update."""
+    return _INSERT_BY_DIALECT[dialect_name]
@@ -3,7 +3,7 @@
 from datetime import datetime, timezone
 from typing import Any
 
-from sqlalchemy import JSON, DateTime, ForeignKey, Integer, String
+from sqlalchemy import JSON, DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -57,6 +57,10 @@ class EventModel(Base):
     period: Mapped[int] = mapped_column(Integer, nullable=False)
     minute: Mapped[int] = mapped_column(Integer, nullable=False)
     second: Mapped[int] = mapped_column(Integer, nullable=False)
+    # minute * 60 + second, so clock ranges are index range scans
+    clock_seconds: Mapped[int] = mapped_column(Integer, nullable=False)
+    # MatchClock.ordering_key: orders events across periods
+    clock_key: Mapped[int] = mapped_column(Integer, nullable=False)
     team_side: Mapped[str] = mapped_column(String(16), nullable=False)
     event_type: Mapped[str] = mapped_column(String(32), nullable=False)
     payload: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
@@ -64,6 +68,8 @@ class EventModel(Base):
 
     match = relationship("MatchModel", back_populates="events")
 
+    __table_args__ = (Index("ix_events_match_period_clock", "match_id", "period", "clock_seconds"),)
+
 
 class AnalyticsSnapshotModel(Base):
     __tablename__ = "analytics_snapshots"
@@ -76,6 +82,8 @@ class AnalyticsSnapshotModel(Base):
     period: Mapped[int] = mapped_column(Integer, nullable=False)
     minute: Mapped[int] = mapped_column(Integer, nullable=False)
     second: Mapped[int] = mapped_column(Integer, nullable=False)
+    clock_seconds: Mapped[int] = mapped_column(Integer, nullable=False)
+    clock_key: Mapped[int] = mapped_column(Integer, nullable=False)
     features_by_window: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
     derived_metrics: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
     deltas: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
@@ -84,3 +92,27 @@ class AnalyticsSnapshotModel(Base):
     created_at_utc: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
     match = relationship("MatchModel", back_populates="analytics_snapshots")
+
+    __table_args__ = (
+        Index("ix_analytics_snapshots_match_period_clock", "match_id", "period", "clock_seconds"),
+    )
+
+
+class AnalyticsLatestModel(Base):
+    """Latest snapshot per match, upserted on every save. Latest reads are a primary-key lookup."""
+
+    __tablename__ = "analytics_latest"
+
+    match_id: Mapped[str] = mapped_column(
+        String(64), ForeignKey("matches.match_id", ondelete="CASCADE"), primary_key=True
+    )
+    snapshot_id: Mapped[str] = mapped_column(String(64), nullable=False)
+    period: Mapped[int] = mapped_column(Integer, nullable=False)
+    minute: Mapped[int] = mapped_column(Integer, nullable=False)
+    second: Mapped[int] = mapped_column(Integer, nullable=False)
+    features_by_window: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
+    derived_metrics: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
+    deltas: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
+    why: Mapped[list[str]] = mapped_column(JSON, nullable=False)
+    model_version: Mapped[str] = mapped_column(String(32), nullable=False)
+    created_at_utc: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
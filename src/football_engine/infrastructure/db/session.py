@@ -1,6 +1,7 @@
 """SQLAlchemy engine and session factory."""
 
-from collections.abc import Generator
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
 from sqlalchemy import create_engine
@@ -63,3 +64,9 @@ def get_session(
         raise
     finally:
         session.close()
+
+
+@contextmanager
+def session_scope(session_factory: sessionmaker[Session]) -> Iterator[Session]:
+    """Unit of work outside a request (worker jobs). Commit on success, rollback on error."""
+    yield from get_session(session_factory)
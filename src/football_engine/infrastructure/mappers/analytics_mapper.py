@@ -1,27 +1,43 @@
-"""Map AnalyticsSnapshot entity <-> AnalyticsSnapshotModel."""
+"""Map AnalyticsSnapshot entity <-> AnalyticsSnapshotModel / AnalyticsLatestModel."""
 
 from football_engine.domain.entities import AnalyticsSnapshot
 from football_engine.domain.value_objects import MatchClock
-from football_engine.infrastructure.db.models import AnalyticsSnapshotModel
+from football_engine.infrastructure.db.models import AnalyticsLatestModel, AnalyticsSnapshotModel
 
 
 def analytics_snapshot_to_orm(snapshot: AnalyticsSnapshot) -> AnalyticsSnapshotModel:
-    return AnalyticsSnapshotModel(
-        snapshot_id=snapshot.snapshot_id,
-        match_id=snapshot.match_id,
-        period=snapshot.clock.period,
-        minute=snapshot.clock.minute,
-        second=snapshot.clock.second,
-        features_by_window=snapshot.features_by_window,
-        derived_metrics=snapshot.derived_metrics,
-        deltas=snapshot.deltas,
-        why=snapshot.why,
-        model_version=snapshot.model_version,
-        created_at_utc=snapshot.created_at_utc,
-    )
+    return AnalyticsSnapshotModel(**analytics_snapshot_to_history_values(snapshot))
+
+
+def analytics_snapshot_to_history_values(snapshot: AnalyticsSnapshot) -> dict:
+    """Column values of an analytics_snapshots row (for bulk inserts)."""
+    return {
+        **analytics_snapshot_to_values(snapshot),
+        "clock_seconds": snapshot.clock.total_seconds_in_period(),
+        "clock_key": snapshot.clock.ordering_key(),
+    }
+
+
+def analytics_snapshot_to_values(snapshot: AnalyticsSnapshot) -> dict:
+    """Column values shared by analytics_snapshots and analytics_latest."""
+    return {
+        "snapshot_id": snapshot.snapshot_id,
+        "match_id": snapshot.match_id,
+        "period": snapshot.clock.period,
+        "minute": snapshot.clock.minute,
+        "second": snapshot.clock.second,
+        "features_by_window": snapshot.features_dict(),
+        "derived_metrics": snapshot.derived_metrics,
+        "deltas": snapshot.deltas_dict(),
+        "why": snapshot.why,
+        "model_version": snapshot.model_version,
+        "created_at_utc": snapshot.created_at_utc,
+    }
 
 
-def analytics_snapshot_from_orm(m: AnalyticsSnapshotModel) -> AnalyticsSnapshot:
+def analytics_snapshot_from_orm(
+    m: AnalyticsSnapshotModel | AnalyticsLatestModel,
+) -> AnalyticsSnapshot:
     return AnalyticsSnapshot(
         snapshot_id=m.snapshot_id,
         match_id=m.match_id,
@@ -7,19 +7,26 @@ from football_engine.infrastructure.db.models import EventModel
 
 
 def event_to_orm(event: Event) -> EventModel:
-    return EventModel(
-        event_id=event.event_id,
-        match_id=event.match_id,
-        provider_name=event.provider_name,
-        provider_event_id=event.provider_event_id,
-        period=event.clock.period,
-        minute=event.clock.minute,
-        second=event.clock.second,
-        team_side=event.team_side.value,
-        event_type=event.event_type.value,
-        payload=event.payload,
-        ingested_at_utc=event.ingested_at_utc,
-    )
+    return EventModel(**event_to_values(event))
+
+
+def event_to_values(event: Event) -> dict:
+    """Column values for a Core insert of the event."""
+    return {
+        "event_id": event.event_id,
+        "match_id": event.match_id,
+        "provider_name": event.provider_name,
+        "provider_event_id": event.provider_event_id,
+        "period": event.clock.period,
+        "minute": event.clock.minute,
+        "second": event.clock.second,
+        "clock_seconds": event.clock.total_seconds_in_period(),
+        "clock_key": event.clock.ordering_key(),
+        "team_side": event.team_side.value,
+        "event_type": event.event_type.value,
+        "payload": event.payload,
+        "ingested_at_utc": event.ingested_at_utc,
+    }
 
 
 def event_from_orm(m: EventModel) -> Event:
@@ -1,5 +1,7 @@
 """Map Match entity <-> MatchModel."""
 
+from typing import Any
+
 from football_engine.domain.entities import Match
 from football_engine.domain.enums import MatchStatus
 from football_engine.domain.value_objects import MatchClock, Score
@@ -23,6 +25,23 @@ def match_to_orm(match: Match) -> MatchModel:
     )
 
 
+def match_to_values(match: Match) -> dict[str, Any]:
+    """Column values for an UPDATE of an existing row."""
+    return {
+        "home_team": match.home_team,
+        "away_team": match.away_team,
+        "status": match.status.value,
+        "period": match.clock.period,
+        "minute": match.clock.minute,
+        "second": match.clock.second,
+        "home_score": match.score.home,
+        "away_score": match.score.away,
+        "home_red_cards": match.home_red_cards,
+        "away_red_cards": match.away_red_cards,
+        "version": match.version,
+    }
+
+
 def match_from_orm(m: MatchModel) -> Match:
     return Match(
         match_id=m.match_id,
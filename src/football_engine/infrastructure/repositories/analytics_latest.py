@@ -0,0 +1,56 @@
+"""analytics_latest upsert and sampling of the append-only snapshot history."""
+
+import threading
+from collections import OrderedDict
+from functools import cache
+
+from sqlalchemy import Insert
+
+from football_engine.domain.entities import AnalyticsSnapshot
+from football_engine.infrastructure.db.dialect import on_conflict_insert
+from football_engine.infrastructure.db.models import AnalyticsLatestModel
+
+
+@cache
+def latest_upsert_statement(dialect_name: str) -> Insert:
+    """INSERT ... ON CONFLICT(match_id) DO UPDATE, executed with one row of values."""
+    table = AnalyticsLatestModel.__table__
+    insert = on_conflict_insert(dialect_name)(table)
+    return insert.on_conflict_do_update(
+        index_elements=[table.c.match_id],
+        set_={c.name: insert.excluded[c.name] for c in table.c if c.name != "match_id"},
+    )
+
+
+class SnapshotHistory:
+    """Decides which snapshots are also appended to analytics_snapshots.
+
+    mode "all" keeps every snapshot, "off" none, and "sampled" the first snapshot of
+    each interval_seconds bucket of match time per match. Latest reads never use the
+    history table, so thinning it only affects replay and debugging.
+    """
+
+    MODES = ("all", "sampled", "off")
+
+    def __init__(self, mode: str = "all", interval_seconds: int = 60, max_matches: int = 4096):
+        if mode not in self.MODES:
+            raise ValueError(f"snapshot history mode must be one of {self.MODES}, got {mode!r}")
+        self.mode = mode
+        self._interval = max(1, interval_seconds)
+        self._max_matches = max_matches
+        self._last_bucket: OrderedDict[str, tuple[int, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def should_record(self, snapshot: AnalyticsSnapshot) -> bool:
+        if self.mode != "sampled":
+            return self.mode == "all"
+        clock = snapshot.clock
+        bucket = (clock.period, clock.total_seconds_in_period() // self._interval)
+        with self._lock:
+            if self._last_bucket.get(snapshot.match_id) == bucket:
+                return False
+            self._last_bucket[snapshot.match_id] = bucket
+            self._last_bucket.move_to_end(snapshot.match_id)
+            while len(self._last_bucket) > self._max_matches:
+                self._last_bucket.popitem(last=False)
+            return True
@@ -1,34 +1,76 @@
 """SQLAlchemy implementation of AnalyticsRepository."""
 
+from functools import partial
+
+from sqlalchemy import delete, insert, update
+from sqlalchemy.orm import Session
+
 from football_engine.domain.entities import AnalyticsSnapshot
-from football_engine.infrastructure.db.models import AnalyticsSnapshotModel
+from football_engine.infrastructure.cache import LatestSnapshotCache, is_staged, stage_after_commit
+from football_engine.infrastructure.db.dialect import supports_on_conflict
+from football_engine.infrastructure.db.models import AnalyticsLatestModel, AnalyticsSnapshotModel
 from football_engine.infrastructure.mappers.analytics_mapper import (
     analytics_snapshot_from_orm,
+    analytics_snapshot_to_history_values,
     analytics_snapshot_to_orm,
+    analytics_snapshot_to_values,
+)
+from football_engine.infrastructure.repositories.analytics_latest import (
+    SnapshotHistory,
+    latest_upsert_statement,
 )
-from sqlalchemy.orm import Session
+
+_CACHE_KEY = "latest_snapshot"
 
 
 class AnalyticsRepositoryImpl:
-    def __init__(self, session: Session) -> None:
+    """Latest snapshot per match lives in analytics_latest (upserted on save).
+
+    analytics_snapshots is append-only history, written per the SnapshotHistory policy.
+    Optionally backed by a LatestSnapshotCache, updated after commit.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        cache: LatestSnapshotCache | None = None,
+        history: SnapshotHistory | None = None,
+    ) -> None:
         self._session = session
+        self._cache = cache
+        self._history = history
 
     def save_snapshot(self, snapshot: AnalyticsSnapshot) -> AnalyticsSnapshot:
-        m = analytics_snapshot_to_orm(snapshot)
-        self._session.add(m)
+        values = analytics_snapshot_to_values(snapshot)
+        dialect = self._session.get_bind().dialect
+        if supports_on_conflict(dialect):
+            self._session.execute(latest_upsert_statement(dialect.name), values)
+        else:
+            result = self._session.execute(
+                update(AnalyticsLatestModel)
+                .where(AnalyticsLatestModel.match_id == snapshot.match_id)
+                .values(**values)
+            )
+            if result.rowcount == 0:
+                self._session.add(AnalyticsLatestModel(**values))
+        if self._history is None or self._history.should_record(snapshot):
+            self._session.add(analytics_snapshot_to_orm(snapshot))
         self._session.flush()
-        return analytics_snapshot_from_orm(m)
+        if self._cache is not None:
+            stage_snapshot_for_cache(self._session, self._cache, snapshot)
+        return snapshot
 
     def get_latest_snapshot(self, match_id: str) -> AnalyticsSnapshot | None:
-        row = (
-            self._session.query(AnalyticsSnapshotModel)
-            .where(AnalyticsSnapshotModel.match_id == match_id)
-            .order_by(AnalyticsSnapshotModel.id.desc())
-            .first()
-        )
+        cached = cached_latest_snapshot(self._session, self._cache, match_id)
+        if cached is not None:
+            return cached
+        row = self._session.get(AnalyticsLatestModel, match_id, populate_existing=True)
         if row is None:
             return None
-        return analytics_snapshot_from_orm(row)
+        snapshot = analytics_snapshot_from_orm(row)
+        if self._cache is not None:
+            stage_snapshot_for_cache(self._session, self._cache, snapshot, loaded=True)
+        return snapshot
 
     def list_recent_snapshots(self, match_id: str, limit: int) -> list[AnalyticsSnapshot]:
         rows = (
@@ -39,3 +81,43 @@ class AnalyticsRepositoryImpl:
             .all()
         )
         return [analytics_snapshot_from_orm(r) for r in rows]
+
+    def replace_history(
+        self, match_id: str, model_version: str, snapshots: list[AnalyticsSnapshot]
+    ) -> None:
+        self._session.execute(
+            delete(AnalyticsSnapshotModel).where(
+                AnalyticsSnapshotModel.match_id == match_id,
+                AnalyticsSnapshotModel.model_version == model_version,
+            )
+        )
+        if snapshots:
+            self._session.execute(
+                insert(AnalyticsSnapshotModel),
+                [analytics_snapshot_to_history_values(s) for s in snapshots],
+            )
+        self._session.flush()
+
+
+def cached_latest_snapshot(
+    session: Session, cache: LatestSnapshotCache | None, match_id: str
+) -> AnalyticsSnapshot | None:
+    """Cached latest snapshot, unless this session has an uncommitted newer one."""
+    if cache is None or is_staged(session, (_CACHE_KEY, match_id)):
+        return None
+    return cache.get(match_id)
+
+
+def stage_snapshot_for_cache(
+    session: Session, cache: LatestSnapshotCache, snapshot: AnalyticsSnapshot, loaded: bool = False
+) -> None:
+    """Put snapshot in the cache after commit.
+
+    Snapshots loaded by a read only fill an empty entry, so a reader can never replace
+    the newer snapshot a concurrent writer committed meanwhile.
+    """
+    key = (_CACHE_KEY, snapshot.match_id)
+    if loaded:
+        stage_after_commit(session, partial(cache.put_if_absent, snapshot))
+    else:
+        stage_after_commit(session, partial(cache.put, snapshot), key=key)
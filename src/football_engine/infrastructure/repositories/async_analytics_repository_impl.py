@@ -0,0 +1,77 @@
+"""SQLAlchemy asyncio implementation of AsyncAnalyticsRepository."""
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from football_engine.domain.entities import AnalyticsSnapshot
+from football_engine.infrastructure.cache import LatestSnapshotCache
+from football_engine.infrastructure.db.dialect import supports_on_conflict
+from football_engine.infrastructure.db.models import AnalyticsLatestModel, AnalyticsSnapshotModel
+from football_engine.infrastructure.mappers.analytics_mapper import (
+    analytics_snapshot_from_orm,
+    analytics_snapshot_to_orm,
+    analytics_snapshot_to_values,
+)
+from football_engine.infrastructure.repositories.analytics_latest import (
+    SnapshotHistory,
+    latest_upsert_statement,
+)
+from football_engine.infrastructure.repositories.analytics_repository_impl import (
+    cached_latest_snapshot,
+    stage_snapshot_for_cache,
+)
+
+
+class AsyncAnalyticsRepositoryImpl:
+    """Same cache semantics as AnalyticsRepositoryImpl (staged until commit)."""
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        cache: LatestSnapshotCache | None = None,
+        history: SnapshotHistory | None = None,
+    ) -> None:
+        self._session = session
+        self._cache = cache
+        self._history = history
+
+    async def save_snapshot(self, snapshot: AnalyticsSnapshot) -> AnalyticsSnapshot:
+        values = analytics_snapshot_to_values(snapshot)
+        dialect = self._session.get_bind().dialect
+        if supports_on_conflict(dialect):
+            await self._session.execute(latest_upsert_statement(dialect.name), values)
+        else:
+            result = await self._session.execute(
+                update(AnalyticsLatestModel)
+                .where(AnalyticsLatestModel.match_id == snapshot.match_id)
+                .values(**values)
+            )
+            if result.rowcount == 0:
+                self._session.add(AnalyticsLatestModel(**values))
+        if self._history is None or self._history.should_record(snapshot):
+            self._session.add(analytics_snapshot_to_orm(snapshot))
+        await self._session.flush()
+        if self._cache is not None:
+            stage_snapshot_for_cache(self._session.sync_session, self._cache, snapshot)
+        return snapshot
+
+    async def get_latest_snapshot(self, match_id: str) -> AnalyticsSnapshot | None:
+        cached = cached_latest_snapshot(self._session.sync_session, self._cache, match_id)
+        if cached is not None:
+            return cached
+        row = await self._session.get(AnalyticsLatestModel, match_id, populate_existing=True)
+        if row is None:
+            return None
+        snapshot = analytics_snapshot_from_orm(row)
+        if self._cache is not None:
+            stage_snapshot_for_cache(self._session.sync_session, self._cache, snapshot, loaded=True)
+        return snapshot
+
+    async def list_recent_snapshots(self, match_id: str, limit: int) -> list[AnalyticsSnapshot]:
+        rows = await self._session.scalars(
+            select(AnalyticsSnapshotModel)
+            .where(AnalyticsSnapshotModel.match_id == match_id)
+            .order_by(AnalyticsSnapshotModel.id.desc())
+            .limit(limit)
+        )
+        return [analytics_snapshot_from_orm(r) for r in rows]
@@ -0,0 +1,105 @@
+"""SQLAlchemy asyncio implementation of AsyncEventRepository."""
+
+from sqlalchemy import and_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from football_engine.domain.entities import Event
+from football_engine.domain.value_objects import MatchClock, RollingWindow
+from football_engine.infrastructure.cache import SeenEventIds
+from football_engine.infrastructure.db.models import EventModel
+from football_engine.infrastructure.mappers.event_mapper import event_from_orm, event_to_orm
+from football_engine.infrastructure.repositories.event_insert import (
+    first_occurrences,
+    insert_if_new_rows,
+    insert_if_new_statement,
+    supports_insert_if_new,
+)
+from football_engine.infrastructure.repositories.event_repository_impl import remember_event_ids
+
+
+class AsyncEventRepositoryImpl:
+    """See EventRepositoryImpl for the dedup strategy."""
+
+    def __init__(self, session: AsyncSession, seen: SeenEventIds | None = None) -> None:
+        self._session = session
+        self._seen = seen
+
+    async def known_event_ids(self, match_id: str, event_ids: list[str]) -> set[str]:
+        if self._seen is None:
+            return set()
+        return self._seen.known(match_id, event_ids)
+
+    async def add_event_if_new(self, event: Event) -> bool:
+        return event.event_id in await self.add_events_if_new([event])
+
+    async def add_events_if_new(self, events: list[Event]) -> set[str]:
+        if not events:
+            return set()
+        dialect = self._session.get_bind().dialect
+        if not supports_insert_if_new(dialect):
+            existing = await self.list_existing_event_ids([e.event_id for e in events])
+            new_events = [e for e in first_occurrences(events) if e.event_id not in existing]
+            await self.add_events(new_events)
+            inserted = {e.event_id for e in new_events}
+        else:
+            result = await self._session.execute(
+                insert_if_new_statement(dialect.name), insert_if_new_rows(events)
+            )
+            inserted = set(result.scalars())
+        if self._seen is not None:
+            remember_event_ids(self._session.sync_session, self._seen, events)
+        return inserted
+
+    async def list_existing_event_ids(self, event_ids: list[str]) -> set[str]:
+        if not event_ids:
+            return set()
+        rows = await self._session.scalars(
+            select(EventModel.event_id).where(EventModel.event_id.in_(event_ids))
+        )
+        return set(rows)
+
+    async def add_events(self, events: list[Event]) -> None:
+        if not events:
+            return
+        self._session.add_all([event_to_orm(e) for e in events])
+        await self._session.flush()
+
+    async def list_events_in_window(
+        self, match_id: str, end_clock: MatchClock, window: RollingWindow
+    ) -> list[Event]:
+        end_sec = end_clock.total_seconds_in_period()
+        if window.whole_match:
+            # Earlier periods too: every event up to end_clock
+            in_window = EventModel.clock_key <= end_clock.ordering_key()
+        else:
+            in_window = and_(
+                EventModel.period == end_clock.period,
+                EventModel.clock_seconds.between(window.start_second(end_sec), end_sec),
+            )
+        rows = await self._session.scalars(
+            select(EventModel)
+            .where(EventModel.match_id == match_id, in_window)
+            .order_by(EventModel.period, EventModel.clock_seconds, EventModel.id)
+        )
+        return [event_from_orm(r) for r in rows]
+
+    async def list_recent_events(self, match_id: str, limit: int) -> list[Event]:
+        rows = (
+            await self._session.scalars(
+                select(EventModel)
+                .where(EventModel.match_id == match_id)
+                .order_by(EventModel.id.desc())
+                .limit(limit)
+            )
+        ).all()
+        return [event_from_orm(r) for r in reversed(rows)]
+
+    async def list_match_events(self, match_id: str) -> list[Event]:
+        rows = (
+            await self._session.scalars(
+                select(EventModel)
+                .where(EventModel.match_id == match_id)
+                .order_by(EventModel.period, EventModel.clock_seconds, EventModel.id)
+            )
+        ).all()
+        return [event_from_orm(r) for r in rows]
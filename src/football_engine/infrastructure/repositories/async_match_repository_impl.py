@@ -0,0 +1,72 @@
+"""SQLAlchemy asyncio implementation of AsyncMatchRepository."""
+
+from sqlalchemy import exists, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from football_engine.domain.entities import Match
+from football_engine.infrastructure.cache import MatchCache
+from football_engine.infrastructure.db.models import MatchModel
+from football_engine.infrastructure.mappers.match_mapper import (
+    match_from_orm,
+    match_to_orm,
+    match_to_values,
+)
+from football_engine.infrastructure.repositories.match_repository_impl import (
+    drop_match_from_cache,
+    stage_match_for_cache,
+    staged_match,
+)
+
+
+class AsyncMatchRepositoryImpl:
+    """Same cache semantics as MatchRepositoryImpl (staged until commit)."""
+
+    def __init__(self, session: AsyncSession, cache: MatchCache | None = None) -> None:
+        self._session = session
+        self._cache = cache
+
+    async def create_match(self, match: Match) -> Match:
+        m = match_to_orm(match)
+        self._session.add(m)
+        await self._session.flush()
+        created = match_from_orm(m)
+        self._stage(created)
+        return created
+
+    async def get_match(self, match_id: str) -> Match | None:
+        if self._cache is not None:
+            staged = staged_match(self._session.sync_session, match_id)
+            if staged is not None:
+                return staged
+            cached = self._cache.get(match_id)
+            if cached is not None:
+                return cached
+        row = await self._session.scalar(
+            select(MatchModel).where(MatchModel.match_id == match_id).limit(1)
+        )
+        if row is None:
+            return None
+        match = match_from_orm(row)
+        self._stage(match)
+        return match
+
+    async def save_match(self, match: Match, expected_version: int | None = None) -> Match | None:
+        """See MatchRepositoryImpl.save_match."""
+        stmt = update(MatchModel).where(MatchModel.match_id == match.match_id)
+        if expected_version is not None:
+            stmt = stmt.where(MatchModel.version == expected_version)
+        result = await self._session.execute(stmt.values(**match_to_values(match)))
+        if result.rowcount == 0:
+            if expected_version is not None and await self._session.scalar(
+                select(exists().where(MatchModel.match_id == match.match_id))
+            ):
+                if self._cache is not None:
+                    drop_match_from_cache(self._session.sync_session, self._cache, match.match_id)
+                return None
+            return await self.create_match(match)
+        self._stage(match)
+        return match
+
+    def _stage(self, match: Match) -> None:
+        if self._cache is not None:
+            stage_match_for_cache(self._session.sync_session, self._cache, match)
@@ -0,0 +1,51 @@
+"""Idempotent event inserts: INSERT ... ON CONFLICT(event_id) DO NOTHING RETURNING event_id.
+
+One statement both deduplicates and inserts, so there is no SELECT round trip and two
+writers racing on the same event_id cannot hit the unique constraint.
+"""
+
+from functools import cache
+
+from sqlalchemy import Insert
+from sqlalchemy.engine import Dialect
+
+from football_engine.domain.entities import Event
+from football_engine.infrastructure.db.dialect import on_conflict_insert, supports_on_conflict
+from football_engine.infrastructure.db.models import EventModel
+from football_engine.infrastructure.mappers.event_mapper import event_to_values
+
+
+def supports_insert_if_new(dialect: Dialect) -> bool:
+    """ON CONFLICT DO NOTHING with RETURNING (SQLite >= 3.35, PostgreSQL)."""
+    return supports_on_conflict(dialect)
+
+
+@cache
+def insert_if_new_statement(dialect_name: str) -> Insert:
+    """Statement returning the event_ids actually inserted.
+
+    Built once per dialect and executed with a list of row dicts (executemany), so the
+    compiled form is cached and SQLAlchemy batches rows into multi-VALUES round trips.
+    """
+    table = EventModel.__table__
+    return (
+        on_conflict_insert(dialect_name)(table)
+        .on_conflict_do_nothing(index_elements=[table.c.event_id])
+        .returning(table.c.event_id)
+    )
+
+
+def insert_if_new_rows(events: list[Event]) -> list[dict]:
+    """Row dicts for insert_if_new_statement; repeated event_ids keep their first occurrence."""
+    return [event_to_values(e) for e in first_occurrences(events)]
+
+
+def first_occurrences(events: list[Event]) -> list[Event]:
+    """Events with repeated event_ids dropped, first occurrence kept, order preserved."""
+    seen: set[str] = set()
+    unique: list[Event] = []
+    for e in events:
+        if e.event_id not in seen:
+            seen.add(e.event_id)
+            unique.append(e)
+    return unique
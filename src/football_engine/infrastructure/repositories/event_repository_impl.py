@@ -1,44 +1,90 @@
 """SQLAlchemy implementation of EventRepository."""
 
+from functools import partial
+
+from sqlalchemy import and_
+from sqlalchemy.orm import Session
+
 from football_engine.domain.entities import Event
 from football_engine.domain.value_objects import MatchClock, RollingWindow
+from football_engine.infrastructure.cache import SeenEventIds, stage_after_commit
 from football_engine.infrastructure.db.models import EventModel
 from football_engine.infrastructure.mappers.event_mapper import event_from_orm, event_to_orm
-from sqlalchemy.orm import Session
+from football_engine.infrastructure.repositories.event_insert import (
+    first_occurrences,
+    insert_if_new_rows,
+    insert_if_new_statement,
+    supports_insert_if_new,
+)
 
 
 class EventRepositoryImpl:
-    def __init__(self, session: Session) -> None:
+    """Dedup is a single INSERT ... ON CONFLICT DO NOTHING on SQLite and PostgreSQL.
+
+    Other dialects fall back to probe-then-insert. With a SeenEventIds filter, ids are
+    recorded after commit and known duplicates can be answered without the DB.
+    """
+
+    def __init__(self, session: Session, seen: SeenEventIds | None = None) -> None:
         self._session = session
+        self._seen = seen
+
+    def known_event_ids(self, match_id: str, event_ids: list[str]) -> set[str]:
+        if self._seen is None:
+            return set()
+        return self._seen.known(match_id, event_ids)
 
     def add_event_if_new(self, event: Event) -> bool:
-        existing = (
-            self._session.query(EventModel)
-            .where(EventModel.event_id == event.event_id)
-            .first()
+        return event.event_id in self.add_events_if_new([event])
+
+    def add_events_if_new(self, events: list[Event]) -> set[str]:
+        if not events:
+            return set()
+        dialect = self._session.get_bind().dialect
+        if not supports_insert_if_new(dialect):
+            existing = self.list_existing_event_ids([e.event_id for e in events])
+            new_events = [e for e in first_occurrences(events) if e.event_id not in existing]
+            self.add_events(new_events)
+            inserted = {e.event_id for e in new_events}
+        else:
+            result = self._session.execute(
+                insert_if_new_statement(dialect.name), insert_if_new_rows(events)
+            )
+            inserted = set(result.scalars())
+        if self._seen is not None:
+            remember_event_ids(self._session, self._seen, events)
+        return inserted
+
+    def list_existing_event_ids(self, event_ids: list[str]) -> set[str]:
+        if not event_ids:
+            return set()
+        rows = (
+            self._session.query(EventModel.event_id).where(EventModel.event_id.in_(event_ids)).all()
         )
-        if existing is not None:
-            return False
-        m = event_to_orm(event)
-        self._session.add(m)
+        return {r.event_id for r in rows}
+
+    def add_events(self, events: list[Event]) -> None:
+        if not events:
+            return
+        self._session.add_all([event_to_orm(e) for e in events])
         self._session.flush()
-        return True
 
     def list_events_in_window(
         self, match_id: str, end_clock: MatchClock, window: RollingWindow
     ) -> list[Event]:
-        start_minute = max(0, end_clock.minute - window.minutes)
-        start_sec = start_minute * 60
         end_sec = end_clock.total_seconds_in_period()
-        rows = (
-            self._session.query(EventModel)
-            .where(
-                EventModel.match_id == match_id,
+        if window.whole_match:
+            # Earlier periods too: every event up to end_clock
+            in_window = EventModel.clock_key <= end_clock.ordering_key()
+        else:
+            in_window = and_(
                 EventModel.period == end_clock.period,
-                EventModel.minute * 60 + EventModel.second >= start_sec,
-                EventModel.minute * 60 + EventModel.second <= end_sec,
+                EventModel.clock_seconds.between(window.start_second(end_sec), end_sec),
             )
-            .order_by(EventModel.period, EventModel.minute, EventModel.second, EventModel.id)
+        rows = (
+            self._session.query(EventModel)
+            .where(EventModel.match_id == match_id, in_window)
+            .order_by(EventModel.period, EventModel.clock_seconds, EventModel.id)
             .all()
         )
         return [event_from_orm(r) for r in rows]
@@ -52,3 +98,21 @@ class EventRepositoryImpl:
             .all()
         )
         return [event_from_orm(r) for r in reversed(rows)]
+
+    def list_match_events(self, match_id: str) -> list[Event]:
+        rows = (
+            self._session.query(EventModel)
+            .where(EventModel.match_id == match_id)
+            .order_by(EventModel.period, EventModel.clock_seconds, EventModel.id)
+            .all()
+        )
+        return [event_from_orm(r) for r in rows]
+
+
+def remember_event_ids(session: Session, seen: SeenEventIds, events: list[Event]) -> None:
+    """Record event_ids (inserted or already stored) in the filter once the session commits."""
+    by_match: dict[str, list[str]] = {}
+    for e in events:
+        by_match.setdefault(e.match_id, []).append(e.event_id)
+    for match_id, event_ids in by_match.items():
+        stage_after_commit(session, partial(seen.add, match_id, event_ids))
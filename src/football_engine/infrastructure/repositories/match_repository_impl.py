@@ -1,52 +1,105 @@
 """SQLAlchemy implementation of MatchRepository."""
 
+from functools import partial
+
+from sqlalchemy import exists, select, update
+from sqlalchemy.orm import Session
+
 from football_engine.domain.entities import Match
+from football_engine.infrastructure.cache import MatchCache, is_staged, stage_after_commit
 from football_engine.infrastructure.db.models import MatchModel
-from football_engine.infrastructure.mappers.match_mapper import match_from_orm, match_to_orm
-from sqlalchemy.orm import Session
+from football_engine.infrastructure.mappers.match_mapper import (
+    match_from_orm,
+    match_to_orm,
+    match_to_values,
+)
+
+_STAGED_KEY = "match_cache_staged"
 
 
 class MatchRepositoryImpl:
-    def __init__(self, session: Session) -> None:
+    """Optionally backed by a process-level MatchCache.
+
+    Reads go to the cache first. Writes and DB loads are staged on the session and
+    reach the cache only after commit, so a rolled-back transaction never leaks into it.
+    Writes are conditional on the version the caller read, so a stale cached Match (another
+    process wrote the row since) can never overwrite newer state.
+    """
+
+    def __init__(self, session: Session, cache: MatchCache | None = None) -> None:
         self._session = session
+        self._cache = cache
 
     def create_match(self, match: Match) -> Match:
         m = match_to_orm(match)
         self._session.add(m)
         self._session.flush()
-        return match_from_orm(m)
+        created = match_from_orm(m)
+        self._stage(created)
+        return created
 
     def get_match(self, match_id: str) -> Match | None:
-        row = (
-            self._session.query(MatchModel)
-            .where(MatchModel.match_id == match_id)
-            .first()
-        )
+        if self._cache is not None:
+            staged = staged_match(self._session, match_id)
+            if staged is not None:
+                return staged
+            cached = self._cache.get(match_id)
+            if cached is not None:
+                return cached
+        row = self._session.query(MatchModel).where(MatchModel.match_id == match_id).first()
         if row is None:
             return None
-        return match_from_orm(row)
-
-    def save_match(self, match: Match) -> Match:
-        row = (
-            self._session.query(MatchModel)
-            .where(MatchModel.match_id == match.match_id)
-            .first()
-        )
-        if row is None:
-            m = match_to_orm(match)
-            self._session.add(m)
-            self._session.flush()
-            return match_from_orm(m)
-        row.home_team = match.home_team
-        row.away_team = match.away_team
-        row.status = match.status.value
-        row.period = match.clock.period
-        row.minute = match.clock.minute
-        row.second = match.clock.second
-        row.home_score = match.score.home
-        row.away_score = match.score.away
-        row.home_red_cards = match.home_red_cards
-        row.away_red_cards = match.away_red_cards
-        row.version = match.version
-        self._session.flush()
-        return match_from_orm(row)
+        match = match_from_orm(row)
+        self._stage(match)
+        return match
+
+    def save_match(self, match: Match, expected_version: int | None = None) -> Match | None:
+        """Write match; with expected_version only if the row is still at that version.
+
+        None when it is not (another writer got there first): the cached and staged copies
+        are dropped, so get_match reads the row again.
+        """
+        stmt = update(MatchModel).where(MatchModel.match_id == match.match_id)
+        if expected_version is not None:
+            stmt = stmt.where(MatchModel.version == expected_version)
+        result = self._session.execute(stmt.values(**match_to_values(match)))
+        if result.rowcount == 0:
+            if expected_version is not None and self._session.scalar(
+                select(exists().where(MatchModel.match_id == match.match_id))
+            ):
+                self._drop(match.match_id)
+                return None
+            return self.create_match(match)
+        self._stage(match)
+        return match
+
+    def _stage(self, match: Match) -> None:
+        if self._cache is not None:
+            stage_match_for_cache(self._session, self._cache, match)
+
+    def _drop(self, match_id: str) -> None:
+        if self._cache is not None:
+            drop_match_from_cache(self._session, self._cache, match_id)
+
+
+def staged_match(session: Session, match_id: str) -> Match | None:
+    """Match written or loaded earlier in this session's open transaction."""
+    if not is_staged(session, (_STAGED_KEY, match_id)):
+        return None
+    return session.info.get(_STAGED_KEY, {}).get(match_id)
+
+
+def stage_match_for_cache(session: Session, cache: MatchCache, match: Match) -> None:
+    """Queue match for the cache; applied on commit, dropped on rollback."""
+    current = staged_match(session, match.match_id)
+    if current is not None and current.version > match.version:
+        return
+    session.info.setdefault(_STAGED_KEY, {})[match.match_id] = match
+    stage_after_commit(session, partial(cache.put, match), key=(_STAGED_KEY, match.match_id))
+
+
+def drop_match_from_cache(session: Session, cache: MatchCache, match_id: str) -> None:
+    """Forget match_id now and after commit (its cached and staged copies are stale)."""
+    cache.invalidate(match_id)
+    session.info.get(_STAGED_KEY, {}).pop(match_id, None)
+    stage_after_commit(session, partial(cache.invalidate, match_id), key=(_STAGED_KEY, match_id))
@@ -1,4 +1,4 @@
-"""Pytest fixtures. Isolate integration tests with in-memory SQLite."""
+"""Pytest fixtures. Isolate tests with in-memory SQLite."""
 
 import pytest
 from fastapi.testclient import TestClient
@@ -6,11 +6,21 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
-from football_engine.api.dependencies.session import get_db, get_session
+from football_engine.api.dependencies.session import get_session_factory
 from football_engine.infrastructure.db.models import Base
 from football_engine.main import app
 
 
+@pytest.fixture
+def factory() -> sessionmaker:
+    """Session factory on a fresh, empty in-memory DB (StaticPool = single connection)."""
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+
 @pytest.fixture
 def client() -> TestClient:
     """Test client with a fresh in-memory DB per test (StaticPool = single connection)."""
@@ -22,11 +32,8 @@ def client() -> TestClient:
     Base.metadata.create_all(engine)
     factory = sessionmaker(bind=engine, autocommit=False, autoflush=False, expire_on_commit=False)
 
-    def override_get_db():
-        yield from get_session(factory)
-
-    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: factory
     try:
         yield TestClient(app)
     finally:
-        app.dependency_overrides.pop(get_db, None)
+        app.dependency_overrides.pop(get_session_factory, None)
@@ -14,7 +14,7 @@ from football_engine.main import app
 @pytest.fixture
 def client() -> TestClient:
     """Test client with a fresh in-memory DB per test (StaticPool = single connection)."""
-    from football_engine.api.dependencies.session import get_db, get_session
+    from football_engine.api.dependencies.session import get_session_factory
     from football_engine.infrastructure.db.models import Base
 
     engine = create_engine(
@@ -23,18 +23,13 @@ def client() -> TestClient:
         poolclass=StaticPool,
     )
     Base.metadata.create_all(engine)
-    factory = sessionmaker(
-        bind=engine, autocommit=False, autoflush=False, expire_on_commit=False
-    )
-
-    def override_get_db():
-        yield from get_session(factory)
+    factory = sessionmaker(bind=engine, autocommit=False, autoflush=False, expire_on_commit=False)
 
-    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: factory
     try:
         yield TestClient(app)
     finally:
-        app.dependency_overrides.pop(get_db, None)
+        app.dependency_overrides.pop(get_session_factory, None)
 
 
 def test_create_match_and_get_state(client: TestClient) -> None:
@@ -117,3 +112,291 @@ def test_ingest_duplicate_event_is_idempotent(client: TestClient) -> None:
     r2 = client.post("/api/v1/events", json=payload)
     assert r2.status_code == 200
     assert r2.json()["deduplicated"] is True
+
+
+def test_ingest_batch_dedups_and_applies_in_clock_order(client: TestClient) -> None:
+    match_id = f"test-4-{uuid.uuid4().hex[:8]}"
+    client.post(
+        "/api/v1/matches",
+        json={"match_id": match_id, "home_team": "A", "away_team": "B"},
+    )
+    prefix = uuid.uuid4().hex[:8]
+
+    def ev(n: int, minute: int, side: str, event_type: str) -> dict:
+        return {
+            "event_id": f"ev-{prefix}-{n}",
+            "match_id": match_id,
+            "clock": {"period": 1, "minute": minute, "second": 0},
+            "team_side": side,
+            "event_type": event_type,
+        }
+
+    client.post("/api/v1/events", json=ev(1, 2, "HOME", "SHOT"))
+    r = client.post(
+        "/api/v1/events:batch",
+        json={
+            "events": [
+                ev(3, 9, "AWAY", "GOAL"),
+                ev(1, 2, "HOME", "SHOT"),
+                ev(2, 4, "HOME", "GOAL"),
+                ev(3, 9, "AWAY", "GOAL"),
+            ]
+        },
+    )
+    assert r.status_code == 200, r.json()
+    data = r.json()
+    assert [x["deduplicated"] for x in data["results"]] == [False, True, False, True]
+    assert data["match_state"]["score"] == {"home": 1, "away": 1}
+    assert data["match_state"]["clock"]["minute"] == 9
+    assert data["analytics_latest"]["clock"]["minute"] == 9
+    assert data["analytics_latest"]["features_by_window"]["10m"]["HOME"]["shots"] == 1
+
+    latest = client.get(f"/api/v1/matches/{match_id}/analytics/latest").json()
+    assert latest["snapshot_id"] == data["analytics_latest"]["snapshot_id"]
+
+
+def test_ingest_batch_rejects_mixed_matches(client: TestClient) -> None:
+    base = {
+        "clock": {"period": 1, "minute": 1, "second": 0},
+        "team_side": "HOME",
+        "event_type": "SHOT",
+    }
+    r = client.post(
+        "/api/v1/events:batch",
+        json={
+            "events": [
+                {**base, "event_id": "a", "match_id": "m-a"},
+                {**base, "event_id": "b", "match_id": "m-b"},
+            ]
+        },
+    )
+    assert r.status_code == 422
+
+
+def test_ingest_without_wait_is_queued(client: TestClient) -> None:
+    match_id = f"test-5-{uuid.uuid4().hex[:8]}"
+    client.post(
+        "/api/v1/matches",
+        json={"match_id": match_id, "home_team": "A", "away_team": "B"},
+    )
+    r = client.post(
+        "/api/v1/events?wait=false",
+        json={
+            "event_id": f"ev-{uuid.uuid4().hex[:8]}",
+            "match_id": match_id,
+            "clock": {"period": 1, "minute": 3, "second": 0},
+            "team_side": "HOME",
+            "event_type": "GOAL",
+        },
+    )
+    assert r.status_code == 202
+    assert r.json()["queued"] is True
+    # Background broadcast awaited the job before the response cycle finished
+    state = client.get(f"/api/v1/matches/{match_id}/state").json()
+    assert state["score"] == {"home": 1, "away": 0}
+
+
+def test_async_database_url_serves_ingest_and_reads(tmp_path) -> None:
+    """sqlite+aiosqlite: ingest and state/analytics reads run on the async stack."""
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.pool import NullPool
+
+    from football_engine.api.dependencies.session import (
+        get_async_session_factory,
+        get_session_factory,
+    )
+    from football_engine.infrastructure.db.async_session import create_async_engine_and_factory
+    from football_engine.infrastructure.db.models import Base
+
+    db_path = tmp_path / "async.db"
+    engine = create_engine(f"sqlite:///{db_path}", poolclass=NullPool)
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    _, async_factory = create_async_engine_and_factory(f"sqlite+aiosqlite:///{db_path}")
+
+    app.dependency_overrides[get_session_factory] = lambda: factory
+    app.dependency_overrides[get_async_session_factory] = lambda: async_factory
+    try:
+        client = TestClient(app)
+        match_id = f"test-6-{uuid.uuid4().hex[:8]}"
+        client.post(
+            "/api/v1/matches",
+            json={"match_id": match_id, "home_team": "A", "away_team": "B"},
+        )
+        body = {
+            "event_id": f"ev-{uuid.uuid4().hex[:8]}",
+            "match_id": match_id,
+            "clock": {"period": 1, "minute": 9, "second": 0},
+            "team_side": "AWAY",
+            "event_type": "GOAL",
+        }
+        first = client.post("/api/v1/events", json=body).json()
+        again = client.post("/api/v1/events", json=body).json()
+        assert (first["deduplicated"], again["deduplicated"]) == (False, True)
+        assert client.get(f"/api/v1/matches/{match_id}/state").json()["score"] == {
+            "home": 0,
+            "away": 1,
+        }
+        latest = client.get(f"/api/v1/matches/{match_id}/analytics/latest")
+        assert latest.status_code == 200
+    finally:
+        app.dependency_overrides.pop(get_session_factory, None)
+        app.dependency_overrides.pop(get_async_session_factory, None)
+
+
+def test_coalesced_snapshot_is_flushed_and_reflects_all_events(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from dataclasses import replace
+
+    from football_engine.application.services import SnapshotCoalescer
+
+    container = replace(
+        app.state.container, snapshot_coalescer=SnapshotCoalescer("debounce", debounce_ms=1)
+    )
+    monkeypatch.setattr(app.state, "container", container)
+    match_id = f"test-7-{uuid.uuid4().hex[:8]}"
+    client.post(
+        "/api/v1/matches",
+        json={"match_id": match_id, "home_team": "A", "away_team": "B"},
+    )
+    for i in range(3):
+        r = client.post(
+            "/api/v1/events",
+            json={
+                "event_id": f"ev-{uuid.uuid4().hex[:8]}",
+                "match_id": match_id,
+                "clock": {"period": 1, "minute": 12, "second": 0},
+                "team_side": "HOME",
+                "event_type": "CORNER",
+            },
+        )
+        assert r.status_code == 200
+    assert r.json()["match_state"]["version"] == 4
+    latest = client.get(f"/api/v1/matches/{match_id}/analytics/latest").json()
+    assert latest["features_by_window"]["5m"]["HOME"]["corners"] == 3
+
+
+def test_event_stream_rejects_unknown_match_and_bad_filters(client: TestClient) -> None:
+    """The SSE stream itself stays open, so only the error responses are checked here."""
+    match_id = f"test-8-{uuid.uuid4().hex[:8]}"
+    assert client.get(f"/api/v1/matches/{match_id}/events/stream").status_code == 404
+
+    client.post(
+        "/api/v1/matches",
+        json={"match_id": match_id, "home_team": "A", "away_team": "B"},
+    )
+    r = client.get(f"/api/v1/matches/{match_id}/events/stream?team_side=LEFT")
+    assert r.status_code == 422
+    r = client.get(
+        f"/api/v1/matches/{match_id}/events/stream", headers={"Last-Event-ID": "not-a-seq"}
+    )
+    assert r.status_code == 422
+
+
+def test_state_and_analytics_answer_conditional_gets_from_cache(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from football_engine.application.services import (
+        GetLatestAnalyticsService,
+        GetMatchStateService,
+    )
+
+    match_id = f"test-9-{uuid.uuid4().hex[:8]}"
+    client.post(
+        "/api/v1/matches",
+        json={"match_id": match_id, "home_team": "A", "away_team": "B"},
+    )
+
+    def _ingest(second: int) -> None:
+        r = client.post(
+            "/api/v1/events",
+            json={
+                "event_id": f"ev-{uuid.uuid4().hex[:8]}",
+                "match_id": match_id,
+                "clock": {"period": 1, "minute": 3, "second": second},
+                "team_side": "HOME",
+                "event_type": "SHOT",
+            },
+        )
+        assert r.status_code == 200
+
+    _ingest(0)
+    state = client.get(f"/api/v1/matches/{match_id}/state")
+    analytics = client.get(f"/api/v1/matches/{match_id}/analytics/latest")
+    assert state.headers["etag"] == f'"{state.json()["version"]}"'
+    assert analytics.headers["etag"] == f'"{analytics.json()["snapshot_id"]}"'
+
+    def _no_db(*args: object) -> None:
+        raise AssertionError("conditional GET of a hot match went to the repository")
+
+    monkeypatch.setattr(GetMatchStateService, "get", _no_db)
+    monkeypatch.setattr(GetLatestAnalyticsService, "get", _no_db)
+    for path, first in (("state", state), ("analytics/latest", analytics)):
+        r = client.get(
+            f"/api/v1/matches/{match_id}/{path}",
+            headers={"If-None-Match": first.headers["etag"]},
+        )
+        assert r.status_code == 304
+        assert r.content == b""
+    monkeypatch.undo()
+
+    _ingest(30)
+    r = client.get(
+        f"/api/v1/matches/{match_id}/state", headers={"If-None-Match": state.headers["etag"]}
+    )
+    assert r.status_code == 200
+    assert r.json()["version"] == state.json()["version"] + 1
+    assert r.headers["etag"] != state.headers["etag"]
+
+
+def test_state_long_poll_returns_on_next_version_or_times_out(client: TestClient) -> None:
+    import threading
+
+    match_id = f"test-10-{uuid.uuid4().hex[:8]}"
+    version = client.post(
+        "/api/v1/matches",
+        json={"match_id": match_id, "home_team": "A", "away_team": "B"},
+    ).json()["version"]
+    url = f"/api/v1/matches/{match_id}/state"
+
+    r = client.get(url, params={"after_version": version - 1, "wait": 5})
+    assert r.status_code == 200 and r.json()["version"] == version
+
+    r = client.get(url, params={"after_version": version, "wait": 0.05})
+    assert r.status_code == 200 and r.json()["version"] == version
+    etag = r.headers["etag"]
+    assert etag == f'"{version}"'
+
+    r = client.get(
+        url, params={"after_version": version, "wait": 0.05}, headers={"If-None-Match": etag}
+    )
+    assert r.status_code == 304
+
+    responses = []
+    poller = threading.Thread(
+        target=lambda: responses.append(
+            client.get(url, params={"after_version": version, "wait": 10})
+        )
+    )
+    poller.start()
+    app_container = app.state.container
+    for _ in range(200):
+        if app_container.version_waiters.parked(match_id):
+            break
+        threading.Event().wait(0.01)
+    r = client.post(
+        "/api/v1/events",
+        json={
+            "event_id": f"ev-{uuid.uuid4().hex[:8]}",
+            "match_id": match_id,
+            "clock": {"period": 1, "minute": 4, "second": 0},
+            "team_side": "AWAY",
+            "event_type": "CORNER",
+        },
+    )
+    assert r.status_code == 200
+    poller.join(timeout=10)
+
+    assert [p.status_code for p in responses] == [200]
+    assert responses[0].json()["version"] == version + 1
@@ -28,3 +28,14 @@ def test_ready_endpoint_checks_db() -> None:
 
     assert response.status_code == 200
     assert response.json() == {"status": "ready"}
+
+
+def test_stats_reports_metric_recompute_counters() -> None:
+    client = TestClient(app)
+
+    response = client.get("/api/v1/stats")
+
+    assert response.status_code == 200
+    counters = response.json()["analytics"]
+    assert set(counters) == {"metrics_evaluated", "metrics_recomputed", "recompute_ratio"}
+    assert 0.0 <= counters["recompute_ratio"] <= 1.0
@@ -3,6 +3,7 @@
 import uuid
 
 import pytest
+from fastapi import WebSocketDisconnect
 from fastapi.testclient import TestClient
 
 
@@ -74,3 +75,166 @@ def test_websocket_connection_limit(client: TestClient) -> None:
         welcome = ws.receive_json()
         assert welcome["type"] == "connected"
         assert welcome["match_id"] == match_id
+
+
+def test_websocket_delta_mode_sends_keyframe_then_patches(client: TestClient) -> None:
+    """Delta mode: first update is a keyframe, the next a merge patch against it."""
+    from football_engine.api.ws.v2.delta import apply_merge_patch
+
+    match_id = f"test-match-{uuid.uuid4().hex[:8]}"
+    client.post(
+        "/api/v1/matches",
+        json={"match_id": match_id, "home_team": "Team A", "away_team": "Team B"},
+    )
+
+    with client.websocket_connect(f"/ws/v2/matches/{match_id}/stream?mode=delta") as ws:
+        assert ws.receive_json()["type"] == "connected"
+        for i, second in enumerate((10, 20)):
+            resp = client.post(
+                "/api/v1/events",
+                json={
+                    "event_id": f"{match_id}-e{i}",
+                    "match_id": match_id,
+                    "provider_name": "test",
+                    "clock": {"period": 1, "minute": 5, "second": second},
+                    "team_side": "HOME",
+                    "event_type": "SHOT",
+                },
+            )
+            assert resp.status_code == 200
+
+        keyframe = ws.receive_json()
+        delta = ws.receive_json()
+
+    assert keyframe["type"] == "keyframe"
+    assert delta["type"] == "delta"
+    assert delta["seq"] == keyframe["seq"] + 1
+    base = {k: keyframe[k] for k in ("event", "match_state", "analytics_latest")}
+    document = apply_merge_patch(base, delta["patch"])
+    assert document["event"]["event_id"] == f"{match_id}-e1"
+    assert document["match_state"] == resp.json()["match_state"]
+
+
+def test_websocket_reconnect_with_since_replays_missed_updates(client: TestClient) -> None:
+    """Updates ingested while disconnected are replayed on reconnect; duplicates are not."""
+    match_id = f"test-match-{uuid.uuid4().hex[:8]}"
+    client.post(
+        "/api/v1/matches",
+        json={"match_id": match_id, "home_team": "Team A", "away_team": "Team B"},
+    )
+
+    def _ingest(i: int) -> None:
+        resp = client.post(
+            "/api/v1/events",
+            json={
+                "event_id": f"{match_id}-e{i}",
+                "match_id": match_id,
+                "provider_name": "test",
+                "clock": {"period": 1, "minute": 5, "second": i},
+                "team_side": "HOME",
+                "event_type": "SHOT",
+            },
+        )
+        assert resp.status_code == 200
+
+    with client.websocket_connect(f"/ws/v2/matches/{match_id}/stream") as ws:
+        epoch = ws.receive_json()["epoch"]
+        _ingest(1)
+        last_seen = ws.receive_json()["seq"]
+
+    _ingest(2)
+    _ingest(2)  # duplicate: not broadcast
+    _ingest(3)
+
+    with client.websocket_connect(
+        f"/ws/v2/matches/{match_id}/stream?since={last_seen}&epoch={epoch}"
+    ) as ws:
+        assert ws.receive_json()["type"] == "connected"
+        replayed = [ws.receive_json(), ws.receive_json()]
+
+    assert [m["type"] for m in replayed] == ["update", "update"]
+    assert [m["seq"] for m in replayed] == [last_seen + 1, last_seen + 2]
+    assert [m["event"]["event_id"] for m in replayed] == [f"{match_id}-e2", f"{match_id}-e3"]
+
+
+def test_multiplexed_stream_carries_several_matches(client: TestClient) -> None:
+    """One /ws/v2/stream connection subscribes to two matches and gets tagged updates."""
+    match_ids = [f"test-match-{uuid.uuid4().hex[:8]}" for _ in range(2)]
+    for match_id in match_ids:
+        client.post(
+            "/api/v1/matches",
+            json={"match_id": match_id, "home_team": "Team A", "away_team": "Team B"},
+        )
+
+    with client.websocket_connect("/ws/v2/stream") as ws:
+        assert ws.receive_json()["type"] == "connected"
+        ws.send_json({"action": "subscribe", "match_ids": match_ids})
+        ack = ws.receive_json()
+        assert ack == {"type": "subscribed", "match_ids": match_ids, "rejected": []}
+
+        for match_id in reversed(match_ids):
+            resp = client.post(
+                "/api/v1/events",
+                json={
+                    "event_id": f"{match_id}-e1",
+                    "match_id": match_id,
+                    "provider_name": "test",
+                    "clock": {"period": 1, "minute": 1, "second": 0},
+                    "team_side": "AWAY",
+                    "event_type": "CORNER",
+                },
+            )
+            assert resp.status_code == 200
+        updates = [ws.receive_json(), ws.receive_json()]
+
+        ws.send_json({"action": "unsubscribe", "match_ids": match_ids[:1]})
+        assert ws.receive_json() == {"type": "unsubscribed", "match_ids": match_ids[:1]}
+        ws.send_json({"action": "subscribe", "match_ids": "not-a-list"})
+        assert ws.receive_json()["type"] == "error"
+        ws.send_json({"action": "subscribe", "match_ids": match_ids, "filter": ["SHOT"]})
+        assert ws.receive_json() == {"type": "error", "message": "filter must be a JSON object"}
+
+    assert [u["match_id"] for u in updates] == list(reversed(match_ids))
+    assert all(u["type"] == "update" and u["seq"] == 1 for u in updates)
+
+
+def test_websocket_filter_query_selects_and_projects_updates(client: TestClient) -> None:
+    """?event_types=&match_state= sends only matching updates with only the chosen fields."""
+    match_id = f"test-match-{uuid.uuid4().hex[:8]}"
+    client.post(
+        "/api/v1/matches",
+        json={"match_id": match_id, "home_team": "Team A", "away_team": "Team B"},
+    )
+
+    with client.websocket_connect(
+        f"/ws/v2/matches/{match_id}/stream?event_types=SHOT&match_state=score"
+        "&analytics=derived_metrics.momentum"
+    ) as ws:
+        assert ws.receive_json()["type"] == "connected"
+        for i, event_type in enumerate(("CORNER", "SHOT")):
+            resp = client.post(
+                "/api/v1/events",
+                json={
+                    "event_id": f"{match_id}-e{i}",
+                    "match_id": match_id,
+                    "provider_name": "test",
+                    "clock": {"period": 1, "minute": 2, "second": i},
+                    "team_side": "HOME",
+                    "event_type": event_type,
+                },
+            )
+            assert resp.status_code == 200
+        update = ws.receive_json()
+
+    assert update["seq"] == 2
+    assert update["event"]["event_type"] == "SHOT"
+    assert list(update["match_state"]) == ["score"]
+    assert list(update["analytics_latest"]) == ["derived_metrics"]
+    assert list(update["analytics_latest"]["derived_metrics"]) == ["momentum"]
+
+    with (
+        client.websocket_connect(f"/ws/v2/matches/{match_id}/stream?team_side=LEFT") as ws,
+        pytest.raises(WebSocketDisconnect) as closed,
+    ):
+        ws.receive_json()
+    assert closed.value.code == 1008
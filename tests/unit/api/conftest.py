@@ -0,0 +1,75 @@
+"""Stream test fixtures: a recording WebSocket, event-loop settling and a test broadcast."""
+
+import asyncio
+import json
+from collections.abc import Awaitable, Callable
+
+import pytest
+
+from football_engine.api.ws.v2.stream_manager import StreamManager
+
+
+class RecordingWebSocket:
+    """Stands in for a subscriber's WebSocket and records the text frames it is sent. With
+    fail every send raises; with a gate sends wait until it is set (a slow client)."""
+
+    def __init__(self, fail: bool = False, gate: asyncio.Event | None = None) -> None:
+        self.frames: list[str] = []
+        self.closed_with: int | None = None
+        self.fail = fail
+        self.gate = gate
+
+    @property
+    def messages(self) -> list[dict]:
+        return [json.loads(frame) for frame in self.frames]
+
+    async def send_text(self, data: str) -> None:
+        if self.fail:
+            raise RuntimeError("closed")
+        if self.gate is not None:
+            await self.gate.wait()
+        self.frames.append(data)
+
+    async def send_json(self, data: object) -> None:
+        raise AssertionError("broadcast must send pre-encoded text")
+
+    async def close(self, code: int = 1000, reason: str | None = None) -> None:
+        self.closed_with = code
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def _broadcast(
+    manager: StreamManager,
+    i: int,
+    match_id: str = "m1",
+    analytics: dict | None = None,
+    **event_fields: object,
+) -> None:
+    await manager.broadcast(
+        match_id,
+        {"event_id": f"e{i}", **event_fields},
+        {"match_id": match_id, "score": {"home": i, "away": 0}, "version": i},
+        analytics,
+    )
+
+
+@pytest.fixture
+def recording_websocket() -> type[RecordingWebSocket]:
+    """The fake WebSocket class; call it for each connection."""
+    return RecordingWebSocket
+
+
+@pytest.fixture
+def settle() -> Callable[[], Awaitable[None]]:
+    """Yield to the event loop until subscriber writers have sent what is queued."""
+    return _settle
+
+
+@pytest.fixture
+def broadcast() -> Callable[..., Awaitable[None]]:
+    """Broadcast update i of a match: event e<i> (plus event_fields), score and version i."""
+    return _broadcast
@@ -0,0 +1,143 @@
+"""WebSocket broadcast: one encode per update, per-subscriber queues, slow-consumer policies."""
+
+import asyncio
+import json
+import threading
+
+from football_engine.api.ws.v2 import payloads
+from football_engine.api.ws.v2.stream_manager import StreamManager
+from football_engine.api.ws.v2.subscriber import CLOSE_TRY_AGAIN_LATER
+
+
+def _updates(frames: list[str]) -> list[str]:
+    return [json.loads(f)["event"]["event_id"] for f in frames]
+
+
+def test_broadcast_encodes_once_and_drops_failed_subscribers(
+    monkeypatch, recording_websocket, settle
+) -> None:
+    calls: list[dict] = []
+    encode = payloads.encode_frame
+
+    def _counting_encode(payload: dict) -> str:
+        calls.append(payload)
+        return encode(payload)
+
+    monkeypatch.setattr("football_engine.api.ws.v2.stream_manager.encode_frame", _counting_encode)
+    event = {"event_id": "e1", "event_type": "SHOT"}
+    analytics = {"derived_metrics": {"pressure_index": {"HOME": 0.7, "AWAY": 0.3}}}
+
+    async def _scenario() -> None:
+        manager = StreamManager()
+        sockets = [recording_websocket() for _ in range(5)]
+        broken = recording_websocket(fail=True)
+        for ws in [*sockets[:2], broken, *sockets[2:]]:
+            manager.subscribe("m1", ws)
+
+        await manager.broadcast("m1", event, {"match_id": "m1"}, analytics)
+        await settle()
+
+        assert len(calls) == 1
+        frames = {ws.frames[0] for ws in sockets}
+        assert len(frames) == 1
+        assert json.loads(frames.pop()) == {
+            "type": "update",
+            "match_id": "m1",
+            "seq": 1,
+            "event": event,
+            "match_state": {"match_id": "m1"},
+            "analytics_latest": analytics,
+        }
+        assert manager.get_subscriber_count("m1") == 5
+
+    asyncio.run(_scenario())
+
+
+def test_slow_subscriber_does_not_delay_the_others(recording_websocket, settle, broadcast) -> None:
+    async def _scenario() -> None:
+        manager = StreamManager(send_queue_size=4, overflow_policy="drop_oldest")
+        gate = asyncio.Event()
+        slow = recording_websocket(gate=gate)
+        fast = recording_websocket()
+        manager.subscribe("m1", slow)
+        manager.subscribe("m1", fast)
+
+        for i in range(10):
+            await broadcast(manager, i)
+            await settle()
+
+        assert _updates(fast.frames) == [f"e{i}" for i in range(10)]
+        assert slow.frames == []
+        gate.set()
+        await settle()
+        # e0 was in flight when the queue filled; then only the newest 4 were kept
+        assert _updates(slow.frames) == ["e0", "e6", "e7", "e8", "e9"]
+
+    asyncio.run(_scenario())
+
+
+def test_conflate_keeps_only_the_latest_frame(recording_websocket, settle, broadcast) -> None:
+    async def _scenario() -> None:
+        manager = StreamManager(send_queue_size=2, overflow_policy="conflate")
+        gate = asyncio.Event()
+        slow = recording_websocket(gate=gate)
+        manager.subscribe("m1", slow)
+
+        await broadcast(manager, 0)
+        await settle()
+        for i in range(1, 6):
+            await broadcast(manager, i)
+        gate.set()
+        await settle()
+
+        assert _updates(slow.frames) == ["e0", "e5"]
+
+    asyncio.run(_scenario())
+
+
+def test_disconnect_policy_closes_with_1013_and_unsubscribes(
+    recording_websocket, settle, broadcast
+) -> None:
+    async def _scenario() -> None:
+        manager = StreamManager(send_queue_size=2, overflow_policy="disconnect")
+        gate = asyncio.Event()
+        slow = recording_websocket(gate=gate)
+        manager.subscribe("m1", slow)
+
+        await broadcast(manager, 0)
+        await settle()
+        for i in range(1, 4):
+            await broadcast(manager, i)
+        gate.set()
+        await settle()
+
+        assert slow.closed_with == CLOSE_TRY_AGAIN_LATER
+        assert _updates(slow.frames) == ["e0"]
+        assert manager.get_subscriber_count("m1") == 0
+
+    asyncio.run(_scenario())
+
+
+def test_broadcast_from_another_thread_is_delivered_on_the_owner_loop(
+    recording_websocket, settle, broadcast
+) -> None:
+    async def _scenario() -> None:
+        manager = StreamManager()
+        ws = recording_websocket()
+        manager.subscribe("m1", ws)
+
+        thread = threading.Thread(target=lambda: asyncio.run(broadcast(manager, 1)))
+        thread.start()
+        await asyncio.to_thread(thread.join)
+        await settle()
+
+        assert _updates(ws.frames) == ["e1"]
+
+    asyncio.run(_scenario())
+
+
+def test_encoders_agree(monkeypatch) -> None:
+    payload = {"type": "update", "why": ["Pressão alta"], "xg": 0.1, "n": None}
+    fast = payloads.encode_frame(payload)
+    monkeypatch.setattr(payloads, "orjson", None)
+    assert json.loads(fast) == json.loads(payloads.encode_frame(payload)) == payload
@@ -0,0 +1,123 @@
+"""Cross-worker broadcast: two managers (two "workers") joined by Unix datagram sockets."""
+
+import asyncio
+import socket
+import tempfile
+import time
+
+from football_engine.api.ws.v2.bus import UnixDatagramBus
+from football_engine.api.ws.v2.stream_manager import StreamManager
+
+
+async def _wait_for(condition, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        await asyncio.sleep(0.01)
+
+
+def test_update_published_on_one_worker_reaches_subscribers_of_the_other(
+    recording_websocket,
+) -> None:
+    async def _scenario(directory: str) -> None:
+        worker_a, worker_b = StreamManager(), StreamManager()
+        bus_a = UnixDatagramBus(directory, worker_a.deliver)
+        bus_b = UnixDatagramBus(directory, worker_b.deliver)
+        for manager, bus in ((worker_a, bus_a), (worker_b, bus_b)):
+            bus.start()
+            manager.set_bus(bus)
+        on_a, on_b = recording_websocket(), recording_websocket()
+        worker_a.subscribe("m1", on_a)
+        worker_b.subscribe("m1", on_b)
+        try:
+            await worker_a.broadcast("m1", {"event_id": "e1"}, {"version": 1}, None)
+            await _wait_for(lambda: on_a.messages and on_b.messages)
+
+            assert [(m["seq"], m["event"]["event_id"]) for m in on_a.messages] == [(1, "e1")]
+            assert on_b.messages == on_a.messages
+        finally:
+            worker_a.unsubscribe("m1", on_a)
+            worker_b.unsubscribe("m1", on_b)
+            bus_a.close()
+            bus_b.close()
+
+    with tempfile.TemporaryDirectory() as directory:
+        asyncio.run(_scenario(directory))
+
+
+def test_since_from_another_worker_epoch_gets_a_snapshot(recording_websocket) -> None:
+    async def _scenario(directory: str) -> None:
+        worker_a, worker_b = StreamManager(), StreamManager()
+        bus_a = UnixDatagramBus(directory, worker_a.deliver)
+        bus_b = UnixDatagramBus(directory, worker_b.deliver)
+        for manager, bus in ((worker_a, bus_a), (worker_b, bus_b)):
+            bus.start()
+            manager.set_bus(bus)
+        on_a, on_b = recording_websocket(), recording_websocket()
+        worker_a.subscribe("m1", on_a)
+        worker_b.subscribe("m1", on_b)
+        resumed = {epoch: recording_websocket() for epoch in (worker_a.epoch, None, worker_b.epoch)}
+        try:
+            for i in (1, 2):
+                await worker_a.broadcast("m1", {"event_id": f"e{i}"}, {"version": i}, None)
+            await _wait_for(lambda: len(on_b.messages) == 2)
+
+            # A client of worker A saw seq 1, then reconnects to worker B
+            for epoch, ws in resumed.items():
+                worker_b.subscribe("m1", ws)
+                worker_b.resume("m1", ws, since=1, epoch=epoch)
+            await _wait_for(lambda: all(ws.messages for ws in resumed.values()))
+
+            assert worker_a.epoch != worker_b.epoch
+            for epoch in (worker_a.epoch, None):
+                assert [m["type"] for m in resumed[epoch].messages] == ["snapshot"]
+            assert [(m["type"], m["seq"]) for m in resumed[worker_b.epoch].messages] == [
+                ("update", 2)
+            ]
+        finally:
+            for ws in (on_b, *resumed.values()):
+                worker_b.unsubscribe("m1", ws)
+            worker_a.unsubscribe("m1", on_a)
+            bus_a.close()
+            bus_b.close()
+
+    with tempfile.TemporaryDirectory() as directory:
+        asyncio.run(_scenario(directory))
+
+
+def test_publish_removes_sockets_of_dead_workers() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        bus = UnixDatagramBus(directory, lambda match_id, document: None)
+        bus.start()
+        stale = f"{directory}/dead.sock"
+        dead = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        dead.bind(stale)
+        dead.close()
+        try:
+            bus.publish("m1", {"event": None, "match_state": {}, "analytics_latest": None})
+        finally:
+            bus.close()
+
+        assert list(bus.directory.glob("*.sock")) == []
+
+
+def test_match_changed_reaches_the_other_worker() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        changed: list[tuple[str, int]] = []
+        bus_a = UnixDatagramBus(directory, lambda match_id, document: None)
+        bus_b = UnixDatagramBus(
+            directory,
+            lambda match_id, document: None,
+            match_changed=lambda match_id, version: changed.append((match_id, version)),
+        )
+        bus_a.start()
+        bus_b.start()
+        try:
+            bus_a.publish_match_changed("m1", 7)
+            deadline = time.monotonic() + 2.0
+            while not changed and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            bus_a.close()
+            bus_b.close()
+
+        assert changed == [("m1", 7)]
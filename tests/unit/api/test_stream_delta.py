@@ -0,0 +1,126 @@
+"""Delta stream mode: keyframes, JSON Merge Patch deltas and sequence numbers."""
+
+import asyncio
+
+from football_engine.api.ws.v2.delta import apply_merge_patch, merge_patch
+from football_engine.api.ws.v2.stream_manager import StreamManager
+
+
+def _analytics(i: int) -> dict:
+    return {
+        "snapshot_id": f"s{i}",
+        "features_by_window": {"5m": {"HOME": {"shots": i, "corners": 1}, "AWAY": {"shots": 0}}},
+        "derived_metrics": {"pressure_index": {"HOME": 0.5 + i / 100, "AWAY": 0.5 - i / 100}},
+        "why": [f"reason {i}"],
+    }
+
+
+def _document(message: dict) -> dict:
+    return {k: message[k] for k in ("event", "match_state", "analytics_latest")}
+
+
+def test_merge_patch_round_trip() -> None:
+    old = {"a": {"b": 1, "c": 2}, "list": [1, 2], "same": {"x": 1}, "late": None}
+    new = {"a": {"b": 2, "c": 2, "d": None}, "list": [1, 2, 3], "same": {"x": 1}, "late": {}}
+
+    patch = merge_patch(old, new)
+
+    assert patch == {"a": {"b": 2, "d": None}, "list": [1, 2, 3], "late": {}}
+    assert apply_merge_patch(old, patch) == new
+
+
+def test_delta_subscriber_reconstructs_every_update_with_periodic_keyframes(
+    recording_websocket, settle, broadcast
+) -> None:
+    async def _scenario() -> None:
+        manager = StreamManager(keyframe_interval=4)
+        full, delta = recording_websocket(), recording_websocket()
+        manager.subscribe("m1", full)
+        manager.subscribe("m1", delta)
+        manager.set_mode(delta, "delta")
+
+        for i in range(1, 10):
+            await broadcast(manager, i, analytics=_analytics(i), event_type="SHOT")
+        await settle()
+
+        assert [m["seq"] for m in full.messages] == list(range(1, 10))
+        assert [m["seq"] for m in delta.messages] == list(range(1, 10))
+        assert [m["type"] for m in delta.messages] == [
+            "keyframe",
+            "delta",
+            "delta",
+            "keyframe",
+            "delta",
+            "delta",
+            "delta",
+            "keyframe",
+            "delta",
+        ]
+        document: dict = {}
+        for full_message, message in zip(full.messages, delta.messages):
+            if message["type"] == "keyframe":
+                document = _document(message)
+            else:
+                document = apply_merge_patch(document, message["patch"])
+            assert document == _document(full_message)
+
+    asyncio.run(_scenario())
+
+
+def test_switching_to_delta_mid_stream_sends_keyframe_at_once(
+    recording_websocket, settle, broadcast
+) -> None:
+    async def _scenario() -> None:
+        manager = StreamManager()
+        ws = recording_websocket()
+        manager.subscribe("m1", ws)
+        await broadcast(manager, 1, analytics=_analytics(1), event_type="SHOT")
+        await broadcast(manager, 2, analytics=_analytics(2), event_type="SHOT")
+
+        manager.set_mode(ws, "delta")
+        await broadcast(manager, 3, analytics=_analytics(3), event_type="SHOT")
+        await settle()
+
+        assert [(m["type"], m["seq"]) for m in ws.messages] == [
+            ("update", 1),
+            ("update", 2),
+            ("keyframe", 2),
+            ("delta", 3),
+        ]
+
+    asyncio.run(_scenario())
+
+
+def test_dropped_frame_forces_a_keyframe(recording_websocket, settle, broadcast) -> None:
+    async def _scenario() -> None:
+        manager = StreamManager(send_queue_size=1)
+        ws = recording_websocket()
+        subscriber = manager.subscribe("m1", ws)
+        manager.set_mode(ws, "delta")
+        await broadcast(manager, 1, analytics=_analytics(1), event_type="SHOT")
+        await settle()
+        # Two updates while the writer is not running: the second overflows the queue
+        await broadcast(manager, 2, analytics=_analytics(2), event_type="SHOT")
+        await broadcast(manager, 3, analytics=_analytics(3), event_type="SHOT")
+        assert "m1" not in subscriber.last_seq
+        await settle()
+        await broadcast(manager, 4, analytics=_analytics(4), event_type="SHOT")
+        await settle()
+
+        assert [(m["type"], m["seq"]) for m in ws.messages] == [
+            ("keyframe", 1),
+            ("delta", 3),
+            ("keyframe", 4),
+        ]
+
+    asyncio.run(_scenario())
+
+
+def test_null_sets_the_value_instead_of_removing_the_key() -> None:
+    old = {"event": {"event_id": "e1"}, "analytics_latest": {"snapshot_id": "s1"}}
+    new = {"event": {"event_id": "e2"}, "analytics_latest": None}
+
+    patch = merge_patch(old, new)
+
+    assert patch == {"event": {"event_id": "e2"}, "analytics_latest": None}
+    assert apply_merge_patch(old, patch) == new
@@ -0,0 +1,151 @@
+"""Server-side subscription filters: selection, projection and per-filter delta chains."""
+
+import asyncio
+
+import pytest
+
+from football_engine.api.ws.v2.delta import apply_merge_patch
+from football_engine.api.ws.v2.filters import ALL, StreamFilter
+from football_engine.api.ws.v2.stream_manager import StreamManager
+
+
+def _analytics(i: int) -> dict:
+    return {
+        "snapshot_id": f"s{i}",
+        "derived_metrics": {"momentum": {"HOME": i}, "pressure_index": {"HOME": 0.5}},
+    }
+
+
+_EVENTS = [("SHOT", "HOME"), ("PASS", "HOME"), ("SHOT", "AWAY"), ("SHOT", "HOME")]
+
+
+def test_from_dict_parses_lists_and_comma_strings() -> None:
+    parsed = StreamFilter.from_dict(
+        {"event_types": "SHOT,GOAL", "team_side": "HOME", "match_state": ["score", "score.home"]}
+    )
+
+    assert parsed.event_types == frozenset({"SHOT", "GOAL"})
+    assert parsed.team_side == "HOME"
+    assert parsed.match_state_fields == ("score",)
+    assert parsed.analytics_fields is None
+    assert StreamFilter.from_dict(None) is ALL
+    assert StreamFilter.from_dict({"team_side": None}).is_identity
+    with pytest.raises(ValueError):
+        StreamFilter.from_dict({"event_types": ["NOT_AN_EVENT"]})
+    with pytest.raises(ValueError):
+        StreamFilter.from_dict({"team_side": "LEFT"})
+    with pytest.raises(TypeError):
+        StreamFilter.from_dict(["SHOT"])
+
+
+def test_project_keeps_only_selected_paths() -> None:
+    stream_filter = StreamFilter.from_dict(
+        {"match_state": ["score"], "analytics": ["derived_metrics.momentum", "missing.path"]}
+    )
+    document = {
+        "event": {"event_id": "e1"},
+        "match_state": {"score": {"home": 1}, "version": 3},
+        "analytics_latest": {"derived_metrics": {"momentum": {"HOME": 1}, "pressure": 2}},
+    }
+
+    assert stream_filter.project(document) == {
+        "event": {"event_id": "e1"},
+        "match_state": {"score": {"home": 1}},
+        "analytics_latest": {"derived_metrics": {"momentum": {"HOME": 1}}},
+    }
+    assert stream_filter.project({**document, "analytics_latest": None})["analytics_latest"] is None
+
+
+def test_filtered_subscriber_gets_only_matching_projected_updates(
+    recording_websocket, settle, broadcast
+) -> None:
+    async def _scenario() -> None:
+        manager = StreamManager()
+        everything, home_shots = recording_websocket(), recording_websocket()
+        manager.subscribe("m1", everything)
+        manager.subscribe(
+            "m1",
+            home_shots,
+            StreamFilter.from_dict(
+                {"event_types": ["SHOT"], "team_side": "HOME", "match_state": ["score"]}
+            ),
+        )
+        for i, (event_type, team_side) in enumerate(_EVENTS, start=1):
+            await broadcast(
+                manager, i, analytics=_analytics(i), event_type=event_type, team_side=team_side
+            )
+        await settle()
+
+        assert [m["seq"] for m in everything.messages] == [1, 2, 3, 4]
+        assert "version" in everything.messages[0]["match_state"]
+        assert [m["seq"] for m in home_shots.messages] == [1, 4]
+        assert home_shots.messages[1]["match_state"] == {"score": {"home": 4, "away": 0}}
+        assert "version" not in home_shots.messages[1]["match_state"]
+        manager.unsubscribe("m1", everything)
+        manager.unsubscribe("m1", home_shots)
+
+    asyncio.run(_scenario())
+
+
+def test_filtered_delta_chain_patches_against_last_sent_projection(
+    recording_websocket, settle, broadcast
+) -> None:
+    async def _scenario() -> None:
+        manager = StreamManager()
+        ws = recording_websocket()
+        manager.subscribe(
+            "m1",
+            ws,
+            StreamFilter.from_dict(
+                {"event_types": ["SHOT"], "analytics": ["derived_metrics.momentum"]}
+            ),
+        )
+        manager.set_mode(ws, "delta")
+        for i, (event_type, team_side) in enumerate(_EVENTS, start=1):
+            await broadcast(
+                manager, i, analytics=_analytics(i), event_type=event_type, team_side=team_side
+            )
+        await settle()
+
+        assert [(m["type"], m["seq"], m.get("base_seq")) for m in ws.messages] == [
+            ("keyframe", 1, None),
+            ("delta", 3, 1),
+            ("delta", 4, 3),
+        ]
+        document = {k: ws.messages[0][k] for k in ("event", "match_state", "analytics_latest")}
+        for delta in ws.messages[1:]:
+            document = apply_merge_patch(document, delta["patch"])
+        assert document["analytics_latest"] == {"derived_metrics": {"momentum": {"HOME": 4}}}
+        assert document["event"]["event_id"] == "e4"
+        manager.unsubscribe("m1", ws)
+
+    asyncio.run(_scenario())
+
+
+def test_filtered_resume_replays_only_matching_updates(
+    recording_websocket, settle, broadcast
+) -> None:
+    async def _scenario() -> None:
+        manager = StreamManager()
+        watcher = recording_websocket()
+        manager.subscribe("m1", watcher)
+        for i, (event_type, team_side) in enumerate(_EVENTS, start=1):
+            await broadcast(
+                manager, i, analytics=_analytics(i), event_type=event_type, team_side=team_side
+            )
+
+        ws = recording_websocket()
+        away = StreamFilter.from_dict({"team_side": "AWAY", "match_state": ["version"]})
+        manager.subscribe("m1", ws, away)
+        manager.resume("m1", ws, since=1)
+        manager.resume("m1", ws, since=None)
+        await settle()
+
+        assert [(m["type"], m["seq"], m["match_state"]) for m in ws.messages] == [
+            ("update", 3, {"version": 3}),
+            ("snapshot", 4, {"version": 4}),
+        ]
+        manager.unsubscribe("m1", watcher)
+        manager.unsubscribe("m1", ws)
+
+    asyncio.run(_scenario())
@@ -0,0 +1,85 @@
+"""Multiplexed connections: one queue per connection, subscriptions indexed by match."""
+
+import asyncio
+
+from football_engine.api.ws.v2 import stream_manager
+from football_engine.api.ws.v2.stream_manager import StreamManager
+
+
+def test_one_connection_receives_tagged_updates_for_its_matches_only(
+    recording_websocket, settle, broadcast
+) -> None:
+    async def _scenario() -> None:
+        manager = StreamManager()
+        dashboard = recording_websocket()
+        manager.connect(dashboard)
+        subscribed, rejected = manager.subscribe_many(dashboard, ["m1", "m2"])
+
+        await broadcast(manager, 1, "m1")
+        await broadcast(manager, 1, "m3")
+        await broadcast(manager, 1, "m2")
+        manager.unsubscribe("m1", dashboard, close_if_idle=False)
+        await broadcast(manager, 2, "m1")
+        await settle()
+
+        assert (subscribed, rejected) == (["m1", "m2"], [])
+        assert [(m["match_id"], m["seq"]) for m in dashboard.messages] == [("m1", 1), ("m2", 1)]
+        assert manager.get_connection_count() == 1
+        assert manager.get_subscriber_count("m1") == 0
+        assert manager.get_subscriber_count("m2") == 1
+
+        manager.disconnect(dashboard)
+        assert manager.get_connection_count() == 0
+        assert manager.get_subscriber_count("m2") == 0
+
+    asyncio.run(_scenario())
+
+
+def test_connection_limit_counts_connections_not_subscriptions(
+    monkeypatch, recording_websocket
+) -> None:
+    monkeypatch.setattr(stream_manager, "MAX_TOTAL_CONNECTIONS", 2)
+
+    async def _scenario() -> None:
+        manager = StreamManager()
+        first, second = recording_websocket(), recording_websocket()
+        manager.connect(first)
+        manager.connect(second)
+        match_ids = [f"m{i}" for i in range(30)]
+
+        assert manager.subscribe_many(first, match_ids) == (match_ids, [])
+        assert manager.subscribe_many(second, match_ids) == (match_ids, [])
+        assert manager.connect(recording_websocket()) is None
+        manager.disconnect(first)
+        manager.disconnect(second)
+
+    asyncio.run(_scenario())
+
+
+def test_subscribe_catches_up_each_match_from_its_buffer(
+    recording_websocket, settle, broadcast
+) -> None:
+    async def _scenario() -> None:
+        manager = StreamManager()
+        watcher = recording_websocket()
+        manager.subscribe("m1", watcher)
+        manager.subscribe("m2", watcher)
+        for i in (1, 2, 3):
+            await broadcast(manager, i, "m1")
+            await broadcast(manager, i, "m2")
+        await settle()
+
+        dashboard = recording_websocket()
+        manager.connect(dashboard)
+        manager.subscribe_many(dashboard, ["m1", "m2"], since={"m1": 1})
+        await settle()
+
+        assert [(m["type"], m["match_id"], m["seq"]) for m in dashboard.messages] == [
+            ("update", "m1", 2),
+            ("update", "m1", 3),
+            ("snapshot", "m2", 3),
+        ]
+        manager.disconnect(watcher)
+        manager.disconnect(dashboard)
+
+    asyncio.run(_scenario())
@@ -0,0 +1,106 @@
+"""Resumable streams: per-match replay buffer and snapshot fallback, all from memory."""
+
+import asyncio
+
+import pytest
+
+from football_engine.api.ws.v2.stream_manager import StreamManager
+
+
+def _frames(ws) -> list[tuple[str, int]]:
+    return [(m["type"], m["seq"]) for m in ws.messages]
+
+
+@pytest.fixture
+def reconnect(recording_websocket, settle):
+    """A new connection to m1 resumed from since; its recording socket once caught up."""
+
+    async def _reconnect(manager: StreamManager, since: int | None, mode: str = "full"):
+        ws = recording_websocket()
+        manager.subscribe("m1", ws)
+        manager.resume("m1", ws, mode, since)
+        await settle()
+        return ws
+
+    return _reconnect
+
+
+def test_reconnect_replays_missed_frames_buffered_while_nobody_listened(
+    recording_websocket, settle, broadcast, reconnect
+) -> None:
+    async def _scenario() -> None:
+        manager = StreamManager(replay_buffer_size=4)
+        first = recording_websocket()
+        manager.subscribe("m1", first)
+        await broadcast(manager, 1)
+        await broadcast(manager, 2)
+        await settle()
+        manager.unsubscribe("m1", first)
+        await broadcast(manager, 3)
+        await broadcast(manager, 4)
+
+        resumed = await reconnect(manager, since=2)
+        up_to_date = await reconnect(manager, since=4)
+
+        assert _frames(first) == [("update", 1), ("update", 2)]
+        assert _frames(resumed) == [("update", 3), ("update", 4)]
+        assert resumed.messages[-1]["match_state"]["version"] == 4
+        assert up_to_date.messages == []
+
+    asyncio.run(_scenario())
+
+
+def test_snapshot_when_missed_frames_are_gone_or_since_is_unknown(
+    recording_websocket, broadcast, reconnect
+) -> None:
+    async def _scenario() -> None:
+        manager = StreamManager(replay_buffer_size=2)
+        manager.subscribe("m1", recording_websocket())
+        for i in range(1, 6):
+            await broadcast(manager, i)
+
+        too_old = await reconnect(manager, since=1)
+        fresh = await reconnect(manager, since=None)
+        from_restart = await reconnect(manager, since=99)
+
+        for ws in (too_old, fresh, from_restart):
+            assert _frames(ws) == [("snapshot", 5)]
+            assert ws.messages[0]["event"] == {"event_id": "e5"}
+
+    asyncio.run(_scenario())
+
+
+def test_delta_subscriber_continues_with_patches_after_replay(
+    recording_websocket, settle, broadcast, reconnect
+) -> None:
+    async def _scenario() -> None:
+        manager = StreamManager()
+        manager.subscribe("m1", recording_websocket())
+        await broadcast(manager, 1)
+        await broadcast(manager, 2)
+
+        ws = await reconnect(manager, since=1, mode="delta")
+        await broadcast(manager, 3)
+        await settle()
+
+        assert _frames(ws) == [("update", 2), ("delta", 3)]
+
+    asyncio.run(_scenario())
+
+
+def test_untracked_matches_are_not_buffered_and_idle_streams_are_evicted(
+    recording_websocket, broadcast
+) -> None:
+    async def _scenario() -> None:
+        manager = StreamManager(replay_max_matches=1)
+        await broadcast(manager, 1, match_id="never-watched")
+        first = recording_websocket()
+        manager.subscribe("m1", first)
+        await broadcast(manager, 1)
+        manager.unsubscribe("m1", first)
+        manager.subscribe("m2", recording_websocket())
+
+        assert "never-watched" not in manager._streams
+        assert list(manager._streams) == ["m2"]
+
+    asyncio.run(_scenario())
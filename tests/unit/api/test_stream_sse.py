@@ -0,0 +1,63 @@
+"""Server-Sent Events subscribers on the stream fan-out."""
+
+import asyncio
+
+from football_engine.api.ws.v2.sse import SSEChannel, parse_event_id, sse_event
+from football_engine.api.ws.v2.stream_manager import StreamManager
+
+
+async def _chunks(channel: SSEChannel, count: int) -> list[str]:
+    return [await channel.next_chunk(timeout=1.0) for _ in range(count)]
+
+
+def test_sse_subscribers_share_one_framed_update(broadcast) -> None:
+    async def _scenario() -> None:
+        manager = StreamManager()
+        first, second = SSEChannel(), SSEChannel()
+        manager.subscribe("m1", first)
+        manager.subscribe("m1", second)
+
+        await broadcast(manager, 1)
+        [a], [b] = await _chunks(first, 1), await _chunks(second, 1)
+
+        assert a is b
+        assert a.startswith(f"id: {manager.epoch}:1\ndata: {{") and a.endswith("}\n\n")
+        assert '"type":"update"' in a
+        manager.unsubscribe("m1", first)
+        manager.unsubscribe("m1", second)
+
+    asyncio.run(_scenario())
+
+
+def test_sse_resume_after_last_event_id_replays_framed_updates(broadcast) -> None:
+    async def _scenario() -> None:
+        manager = StreamManager()
+        watcher = SSEChannel()
+        manager.subscribe("m1", watcher)
+        for i in (1, 2, 3):
+            await broadcast(manager, i)
+        live = await _chunks(watcher, 3)
+
+        channel = SSEChannel()
+        manager.subscribe("m1", channel)
+        manager.resume("m1", channel, since=1, epoch=manager.epoch)
+        replayed = await _chunks(channel, 2)
+
+        assert replayed == live[1:]
+        assert [chunk.split("\n", 1)[0] for chunk in replayed] == [
+            f"id: {manager.epoch}:2",
+            f"id: {manager.epoch}:3",
+        ]
+        manager.unsubscribe("m1", watcher)
+        manager.unsubscribe("m1", channel)
+
+    asyncio.run(_scenario())
+
+
+def test_sse_event_frames_one_json_line() -> None:
+    assert sse_event("ab12:7", '{"a":1}') == 'id: ab12:7\ndata: {"a":1}\n\n'
+
+
+def test_last_event_id_carries_seq_and_epoch() -> None:
+    assert parse_event_id("ab12:7") == (7, "ab12")
+    assert parse_event_id("7") == (7, None)
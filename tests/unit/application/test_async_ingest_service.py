@@ -0,0 +1,121 @@
+"""Async ingest service on aiosqlite: same outcomes as the sync service."""
+
+import asyncio
+from dataclasses import replace
+from datetime import UTC, datetime
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from football_engine.application.services import (
+    AsyncIngestEventService,
+    CoalescingMode,
+    SnapshotCoalescer,
+)
+from football_engine.domain.entities import Event, Match
+from football_engine.domain.enums import EventType, MatchStatus, TeamSide
+from football_engine.domain.services import AnalyticsEngine
+from football_engine.domain.value_objects import MatchClock, Score
+from football_engine.infrastructure.cache import MatchCache
+from football_engine.infrastructure.db.async_session import async_session_scope
+from football_engine.infrastructure.db.models import Base
+from football_engine.infrastructure.repositories.async_analytics_repository_impl import (
+    AsyncAnalyticsRepositoryImpl,
+)
+from football_engine.infrastructure.repositories.async_event_repository_impl import (
+    AsyncEventRepositoryImpl,
+)
+from football_engine.infrastructure.repositories.async_match_repository_impl import (
+    AsyncMatchRepositoryImpl,
+)
+
+
+def _event(event_id: str, minute: int, event_type: EventType = EventType.SHOT) -> Event:
+    return Event(
+        event_id=event_id,
+        match_id="m1",
+        provider_name="test",
+        provider_event_id=event_id,
+        clock=MatchClock(period=1, minute=minute, second=0),
+        team_side=TeamSide.HOME,
+        event_type=event_type,
+        payload={},
+        ingested_at_utc=datetime.now(UTC),
+    )
+
+
+async def _scenario() -> None:
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+    cache = MatchCache()
+    analytics = AnalyticsEngine()
+
+    def service(db, coalescer: SnapshotCoalescer | None = None) -> AsyncIngestEventService:
+        return AsyncIngestEventService(
+            match_repository=AsyncMatchRepositoryImpl(db, cache),
+            event_repository=AsyncEventRepositoryImpl(db),
+            analytics_repository=AsyncAnalyticsRepositoryImpl(db),
+            analytics_engine=analytics,
+            snapshot_coalescer=coalescer,
+        )
+
+    async with async_session_scope(factory) as db:
+        await AsyncMatchRepositoryImpl(db, cache).create_match(
+            Match(
+                match_id="m1",
+                home_team="A",
+                away_team="B",
+                status=MatchStatus.SCHEDULED,
+                clock=MatchClock(period=1, minute=0, second=0),
+                score=Score(home=0, away=0),
+                home_red_cards=0,
+                away_red_cards=0,
+                version=1,
+            )
+        )
+
+    async with async_session_scope(factory) as db:
+        accepted, dup, match, snapshot = await service(db).ingest(_event("e1", 5, EventType.GOAL))
+    assert (accepted, dup) == (True, False)
+    assert match.score.home == 1
+    assert snapshot is not None
+
+    async with async_session_scope(factory) as db:
+        accepted, dup, match, _ = await service(db).ingest(_event("e1", 5, EventType.GOAL))
+    assert (accepted, dup) == (True, True)
+    assert match.score.home == 1
+
+    async with async_session_scope(factory) as db:
+        accepted, flags, match, _ = await service(db).ingest_batch(
+            "m1", [_event("e1", 5), _event("e2", 7), _event("e2", 7)]
+        )
+    assert flags == [True, False, True]
+    assert cache.get("m1").version == match.version
+
+    # A batch is coalesced like a single event: deferred, then computed by the flush
+    coalescer = SnapshotCoalescer(CoalescingMode.DEBOUNCE)
+    async with async_session_scope(factory) as db:
+        _, _, _, latest = await service(db, coalescer).ingest_batch(
+            "m1", [_event("e3", 8), _event("e4", 9)]
+        )
+    assert latest.features_by_window["5m"]["HOME"]["shots"] == 1
+    assert coalescer.is_pending("m1")
+    async with async_session_scope(factory) as db:
+        event, _, snapshot = await service(db, coalescer).flush_snapshot("m1")
+    assert event.event_id == "e4"
+    assert snapshot.features_by_window["5m"]["HOME"]["shots"] == 3
+
+    async with async_session_scope(factory) as db:
+        unknown = replace(_event("x1", 1), match_id="unknown")
+        assert (await service(db).ingest(unknown))[0] is False
+    await engine.dispose()
+
+
+def test_async_ingest_matches_sync_contract() -> None:
+    asyncio.run(_scenario())
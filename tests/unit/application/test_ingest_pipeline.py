@@ -0,0 +1,31 @@
+"""Ingest pipeline: per-match ordering and bounded backlog."""
+
+import threading
+
+import pytest
+
+from football_engine.application.services import IngestPipeline, IngestQueueFullError
+
+
+def test_jobs_for_one_match_run_in_order() -> None:
+    pipeline = IngestPipeline(workers=3)
+    seen: list[int] = []
+    futures = [pipeline.submit("m1", lambda i=i: seen.append(i)) for i in range(200)]
+    for f in futures:
+        f.result(timeout=5)
+    pipeline.shutdown()
+    assert seen == list(range(200))
+
+
+def test_backlogged_match_is_rejected_without_blocking_others() -> None:
+    pipeline = IngestPipeline(workers=2, max_pending_per_match=2)
+    gate = threading.Event()
+    blocked = [pipeline.submit("m1", gate.wait) for _ in range(2)]
+    with pytest.raises(IngestQueueFullError):
+        pipeline.submit("m1", lambda: None)
+    gate.set()
+    for f in blocked:
+        f.result(timeout=5)
+    assert pipeline.pending("m1") == 0
+    assert pipeline.submit("m1", lambda: "ok").result(timeout=5) == "ok"
+    pipeline.shutdown()
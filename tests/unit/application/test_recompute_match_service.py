@@ -0,0 +1,128 @@
+"""Offline recompute: one event read, timeline bulk-written under its own model_version."""
+
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import sessionmaker
+
+from football_engine.application.services import IngestEventService, RecomputeMatchService
+from football_engine.domain.entities import Event, Match
+from football_engine.domain.enums import EventType, MatchStatus, TeamSide
+from football_engine.domain.services import AnalyticsEngine
+from football_engine.domain.value_objects import MatchClock, Score
+from football_engine.infrastructure.db.models import AnalyticsSnapshotModel
+from football_engine.infrastructure.db.session import session_scope
+from football_engine.infrastructure.repositories.analytics_repository_impl import (
+    AnalyticsRepositoryImpl,
+)
+from football_engine.infrastructure.repositories.event_repository_impl import EventRepositoryImpl
+from football_engine.infrastructure.repositories.match_repository_impl import MatchRepositoryImpl
+
+
+def _event(event_id: str, minute: int, side: TeamSide, event_type: EventType) -> Event:
+    return Event(
+        event_id=event_id,
+        match_id="m1",
+        provider_name="test",
+        provider_event_id=event_id,
+        clock=MatchClock(period=1, minute=minute, second=0),
+        team_side=side,
+        event_type=event_type,
+        payload={"xg": 0.2} if event_type == EventType.SHOT else {},
+        ingested_at_utc=datetime.now(UTC),
+    )
+
+
+@pytest.fixture
+def factory(factory: sessionmaker) -> sessionmaker:
+    """The shared empty DB with match m1 and four ingested events."""
+    analytics = AnalyticsEngine()
+    with session_scope(factory) as db:
+        MatchRepositoryImpl(db).create_match(
+            Match(
+                match_id="m1",
+                home_team="A",
+                away_team="B",
+                status=MatchStatus.SCHEDULED,
+                clock=MatchClock(period=1, minute=0, second=0),
+                score=Score(home=0, away=0),
+                home_red_cards=0,
+                away_red_cards=0,
+                version=1,
+            )
+        )
+    events = [
+        _event("e1", 1, TeamSide.HOME, EventType.SHOT),
+        _event("e2", 3, TeamSide.AWAY, EventType.RED),
+        _event("e3", 3, TeamSide.HOME, EventType.CORNER),
+        _event("e4", 12, TeamSide.AWAY, EventType.SHOT),
+    ]
+    for e in events:
+        with session_scope(factory) as db:
+            IngestEventService(
+                MatchRepositoryImpl(db),
+                EventRepositoryImpl(db),
+                AnalyticsRepositoryImpl(db),
+                analytics,
+            ).ingest(e)
+    return factory
+
+
+def _recompute(factory, model_version: str):
+    with session_scope(factory) as db:
+        return RecomputeMatchService(
+            MatchRepositoryImpl(db), EventRepositoryImpl(db), AnalyticsRepositoryImpl(db)
+        ).recompute("m1", model_version)
+
+
+def _history_count(factory, model_version: str) -> int:
+    with session_scope(factory) as db:
+        return db.scalar(
+            select(func.count())
+            .select_from(AnalyticsSnapshotModel)
+            .where(AnalyticsSnapshotModel.model_version == model_version)
+        )
+
+
+def test_recompute_writes_one_snapshot_per_event_clock_as_live_ingest(factory) -> None:
+    with session_scope(factory) as db:
+        live = AnalyticsRepositoryImpl(db).list_recent_snapshots("m1", limit=10)[::-1]
+
+    snapshots = _recompute(factory, "v1-r1")
+
+    assert [s.clock.minute for s in snapshots] == [1, 3, 12]
+    # Events arrived in clock order, so live snapshots at the same clocks agree
+    live_by_clock = {s.clock: s for s in live}
+    for s in snapshots:
+        assert s.features_by_window == live_by_clock[s.clock].features_by_window
+        assert s.derived_metrics == live_by_clock[s.clock].derived_metrics
+    assert _history_count(factory, "v1-r1") == 3
+    assert _history_count(factory, "v1") == 4
+
+
+def test_recompute_replaces_its_own_version_and_leaves_latest_alone(factory) -> None:
+    with session_scope(factory) as db:
+        latest = AnalyticsRepositoryImpl(db).get_latest_snapshot("m1")
+
+    _recompute(factory, "v1-r1")
+    _recompute(factory, "v1-r1")
+
+    assert _history_count(factory, "v1-r1") == 3
+    with session_scope(factory) as db:
+        assert AnalyticsRepositoryImpl(db).get_latest_snapshot("m1") == latest
+
+
+def test_recompute_refuses_the_live_model_version(factory) -> None:
+    with pytest.raises(ValueError):
+        _recompute(factory, "v1")
+
+
+def test_recompute_unknown_match_is_none(factory) -> None:
+    with session_scope(factory) as db:
+        assert (
+            RecomputeMatchService(
+                MatchRepositoryImpl(db), EventRepositoryImpl(db), AnalyticsRepositoryImpl(db)
+            ).recompute("nope", "v1-r1")
+            is None
+        )
@@ -0,0 +1,102 @@
+"""Two workers (own caches and window state) ingesting the same match on one database."""
+
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from football_engine.application.services import IngestEventService
+from football_engine.domain.entities import Event, Match
+from football_engine.domain.enums import EventType, MatchStatus, TeamSide
+from football_engine.domain.services import AnalyticsEngine
+from football_engine.domain.value_objects import MatchClock, Score
+from football_engine.infrastructure.cache import MatchCache
+from football_engine.infrastructure.repositories.analytics_repository_impl import (
+    AnalyticsRepositoryImpl,
+)
+from football_engine.infrastructure.repositories.event_repository_impl import EventRepositoryImpl
+from football_engine.infrastructure.repositories.match_repository_impl import MatchRepositoryImpl
+
+
+class _Worker:
+    """What one process holds: its own match cache and analytics engine."""
+
+    def __init__(self, factory: sessionmaker) -> None:
+        self.factory = factory
+        self.cache = MatchCache()
+        self.engine = AnalyticsEngine()
+
+    def ingest(self, event: Event):
+        with self.factory() as s:
+            result = IngestEventService(
+                MatchRepositoryImpl(s, self.cache),
+                EventRepositoryImpl(s),
+                AnalyticsRepositoryImpl(s),
+                self.engine,
+            ).ingest(event)
+            s.commit()
+        return result
+
+
+def _event(i: int, minute: int, event_type: EventType) -> Event:
+    return Event(
+        event_id=f"e{i}",
+        match_id="m1",
+        provider_name="test",
+        provider_event_id=str(i),
+        clock=MatchClock(period=1, minute=minute, second=0),
+        team_side=TeamSide.HOME,
+        event_type=event_type,
+        payload=None,
+        ingested_at_utc=datetime.now(UTC),
+    )
+
+
+@pytest.fixture
+def factory(factory: sessionmaker) -> sessionmaker:
+    """The shared empty DB with match m1 live."""
+    with factory() as s:
+        MatchRepositoryImpl(s).create_match(
+            Match(
+                match_id="m1",
+                home_team="A",
+                away_team="B",
+                status=MatchStatus.LIVE,
+                clock=MatchClock(period=1, minute=0, second=0),
+                score=Score(home=0, away=0),
+                home_red_cards=0,
+                away_red_cards=0,
+                version=1,
+            )
+        )
+        s.commit()
+    return factory
+
+
+def test_stale_cached_match_does_not_overwrite_other_workers_goals(
+    factory: sessionmaker,
+) -> None:
+    a, b = _Worker(factory), _Worker(factory)
+    a.ingest(_event(1, 1, EventType.FOUL))
+    b.ingest(_event(2, 2, EventType.GOAL))
+    b.ingest(_event(3, 3, EventType.GOAL))
+
+    # a still caches the match at version 2, before both goals
+    _, _, match, _ = a.ingest(_event(4, 4, EventType.FOUL))
+
+    assert (match.score.home, match.version) == (2, 5)
+    with factory() as s:
+        stored = MatchRepositoryImpl(s).get_match("m1")
+    assert (stored.score.home, stored.version) == (2, 5)
+    assert a.cache.get("m1").version == 5
+
+
+def test_window_state_rebuilds_after_another_worker_ingested(factory: sessionmaker) -> None:
+    a, b = _Worker(factory), _Worker(factory)
+    a.ingest(_event(1, 1, EventType.SHOT))
+    b.ingest(_event(2, 2, EventType.SHOT))
+    b.ingest(_event(3, 3, EventType.SHOT))
+
+    _, _, _, snapshot = a.ingest(_event(4, 4, EventType.SHOT))
+
+    assert snapshot.features_by_window["10m"]["HOME"]["shots"] == 4
@@ -0,0 +1,148 @@
+"""Snapshot coalescing: one snapshot per burst, forced flush on GOAL/RED."""
+
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import sessionmaker
+
+from football_engine.application.services import (
+    CoalescingMode,
+    IngestEventService,
+    SnapshotCoalescer,
+)
+from football_engine.domain.entities import Event, Match
+from football_engine.domain.enums import EventType, MatchStatus, TeamSide
+from football_engine.domain.services import AnalyticsEngine
+from football_engine.domain.value_objects import MatchClock, Score
+from football_engine.infrastructure.db.models import AnalyticsSnapshotModel
+from football_engine.infrastructure.repositories.analytics_repository_impl import (
+    AnalyticsRepositoryImpl,
+)
+from football_engine.infrastructure.repositories.event_repository_impl import EventRepositoryImpl
+from football_engine.infrastructure.repositories.match_repository_impl import MatchRepositoryImpl
+
+
+def _event(i: int, second: int, event_type: EventType = EventType.SHOT) -> Event:
+    return Event(
+        event_id=f"e{i}",
+        match_id="m1",
+        provider_name="test",
+        provider_event_id=str(i),
+        clock=MatchClock(period=1, minute=10, second=second),
+        team_side=TeamSide.HOME,
+        event_type=event_type,
+        payload={"xg": 0.1},
+        ingested_at_utc=datetime.now(UTC),
+    )
+
+
+@pytest.fixture
+def factory(factory: sessionmaker) -> sessionmaker:
+    """The shared empty DB with match m1 live."""
+    with factory() as s:
+        MatchRepositoryImpl(s).create_match(
+            Match(
+                match_id="m1",
+                home_team="A",
+                away_team="B",
+                status=MatchStatus.LIVE,
+                clock=MatchClock(period=1, minute=10, second=0),
+                score=Score(home=0, away=0),
+                home_red_cards=0,
+                away_red_cards=0,
+                version=1,
+            )
+        )
+        s.commit()
+    return factory
+
+
+def _run(factory: sessionmaker, coalescer: SnapshotCoalescer, events: list[Event]) -> list:
+    engine = AnalyticsEngine()
+    results = []
+    for e in events:
+        with factory() as s:
+            service = IngestEventService(
+                MatchRepositoryImpl(s),
+                EventRepositoryImpl(s),
+                AnalyticsRepositoryImpl(s),
+                engine,
+                snapshot_coalescer=coalescer,
+            )
+            results.append(service.ingest(e))
+            s.commit()
+    return results
+
+
+def _flush(factory: sessionmaker, coalescer: SnapshotCoalescer):
+    with factory() as s:
+        service = IngestEventService(
+            MatchRepositoryImpl(s),
+            EventRepositoryImpl(s),
+            AnalyticsRepositoryImpl(s),
+            AnalyticsEngine(),
+            snapshot_coalescer=coalescer,
+        )
+        result = service.flush_snapshot("m1")
+        s.commit()
+    return result
+
+
+def _snapshot_count(factory: sessionmaker) -> int:
+    with factory() as s:
+        return s.scalar(select(func.count()).select_from(AnalyticsSnapshotModel))
+
+
+def test_debounce_defers_burst_to_one_snapshot(factory: sessionmaker) -> None:
+    coalescer = SnapshotCoalescer(CoalescingMode.DEBOUNCE, debounce_ms=0)
+    results = _run(factory, coalescer, [_event(i, 5) for i in range(20)])
+    assert all(accepted and not dup for accepted, dup, _, _ in results)
+    assert results[-1][2].version == 21
+    assert _snapshot_count(factory) == 0
+    assert coalescer.claim_flush("m1") and not coalescer.claim_flush("m1")
+
+    event, match, snapshot = _flush(factory, coalescer)
+    assert event.event_id == "e19"
+    assert match.version == 21
+    assert snapshot.features_by_window["5m"]["HOME"]["shots"] == 20
+    assert _snapshot_count(factory) == 1
+    assert _flush(factory, coalescer) == (None, None, None)
+
+
+def test_clock_second_mode_computes_once_per_second(factory: sessionmaker) -> None:
+    coalescer = SnapshotCoalescer(CoalescingMode.CLOCK_SECOND)
+    events = [_event(i, 5 + i // 4) for i in range(12)]
+    _run(factory, coalescer, events)
+    assert _snapshot_count(factory) == 3
+    assert coalescer.is_pending("m1")
+
+
+def test_goal_and_red_force_flush(factory: sessionmaker) -> None:
+    coalescer = SnapshotCoalescer(CoalescingMode.DEBOUNCE)
+    results = _run(
+        factory,
+        coalescer,
+        [_event(0, 5), _event(1, 5), _event(2, 6, EventType.GOAL), _event(3, 7)],
+    )
+    assert _snapshot_count(factory) == 1
+    assert results[2][3] is not None
+    assert results[2][3].features_by_window["5m"]["HOME"]["shots"] == 2
+    assert coalescer.is_pending("m1")
+
+
+def test_off_mode_never_defers() -> None:
+    assert SnapshotCoalescer().defer("m1", [_event(0, 1)]) is False
+
+
+def test_computed_clocks_are_bounded_and_dropped_at_full_time() -> None:
+    coalescer = SnapshotCoalescer(CoalescingMode.CLOCK_SECOND, max_matches=2)
+    clock = MatchClock(period=1, minute=10, second=5)
+    for match_id in ("m1", "m2", "m3"):
+        coalescer.computed(match_id, clock)
+    coalescer.computed("m3", clock, finished=True)
+
+    # m1 was evicted and m3 finished: their next event computes at once again
+    assert coalescer.defer("m1", [_event(0, 5)]) is False
+    assert coalescer.defer("m3", [_event(0, 5)]) is False
+    assert coalescer.defer("m2", [_event(0, 5)]) is True
@@ -0,0 +1,41 @@
+"""Long-poll waiters: woken by newer versions only, from any thread."""
+
+import asyncio
+import threading
+
+from football_engine.application.services import MatchVersionWaiters
+
+
+def test_notify_wakes_only_waiters_below_the_new_version() -> None:
+    async def _scenario() -> None:
+        waiters = MatchVersionWaiters()
+        behind = waiters.park("m1", after_version=3)
+        ahead = waiters.park("m1", after_version=5)
+        other = waiters.park("m2", after_version=0)
+
+        waiters.notify("m1", 4)
+        await asyncio.sleep(0)
+
+        assert behind.done() and behind.result() == 4
+        assert not ahead.done() and not other.done()
+        assert waiters.parked("m1") == 1
+        for match_id, future in (("m1", behind), ("m1", ahead), ("m2", other)):
+            waiters.release(match_id, future)
+        assert waiters.parked("m1") == waiters.parked("m2") == 0
+
+    asyncio.run(_scenario())
+
+
+def test_notify_from_a_worker_thread_resolves_on_the_owner_loop() -> None:
+    async def _scenario() -> int:
+        waiters = MatchVersionWaiters()
+        parked = waiters.park("m1", after_version=1)
+        worker = threading.Thread(target=waiters.notify, args=("m1", 2))
+        worker.start()
+        try:
+            return await asyncio.wait_for(parked, timeout=1.0)
+        finally:
+            worker.join()
+            waiters.release("m1", parked)
+
+    assert asyncio.run(_scenario()) == 2
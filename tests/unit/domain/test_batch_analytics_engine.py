@@ -0,0 +1,169 @@
+"""Batched NumPy engine gives the same snapshots as AnalyticsEngine.compute per match."""
+
+import random
+from dataclasses import replace
+from datetime import UTC, datetime
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from football_engine.domain.entities import Event, Match
+from football_engine.domain.enums import EventType, MatchStatus, TeamSide
+from football_engine.domain.services.analytics_engine import AnalyticsEngine
+from football_engine.domain.services.batch_analytics_engine import (
+    BatchAnalyticsEngine,
+    EventColumns,
+)
+from football_engine.domain.services.metric_registry import Metric
+from football_engine.domain.services.metrics_v1 import V1_METRICS, round4
+from football_engine.domain.services.window_state import window_start_second
+from football_engine.domain.value_objects import MatchClock, RollingWindow, Score, parse_windows
+
+
+def _events(match_id: str, count: int, rng: random.Random) -> list[Event]:
+    events = []
+    for n in range(count):
+        seconds = rng.randrange(0, 50 * 60)
+        event_type = rng.choice(list(EventType))
+        xg = None
+        if event_type in (EventType.SHOT, EventType.GOAL):
+            xg = round(rng.uniform(0.01, 0.9), 3)
+        events.append(
+            Event(
+                event_id=f"{match_id}-e{n}",
+                match_id=match_id,
+                provider_name="test",
+                provider_event_id=None,
+                clock=MatchClock(
+                    period=rng.choice((1, 2)), minute=seconds // 60, second=seconds % 60
+                ),
+                team_side=rng.choice(list(TeamSide)),
+                event_type=event_type,
+                payload={"xg": xg} if xg is not None else None,
+                ingested_at_utc=datetime.now(UTC),
+            )
+        )
+    return events
+
+
+def _match(match_id: str, rng: random.Random) -> Match:
+    return Match(
+        match_id=match_id,
+        home_team="H",
+        away_team="A",
+        status=MatchStatus.LIVE,
+        clock=MatchClock(period=2, minute=0, second=0),
+        score=Score(home=0, away=0),
+        home_red_cards=rng.randrange(3),
+        away_red_cards=rng.randrange(3),
+        version=1,
+    )
+
+
+def _in_window(events: list[Event], clock: MatchClock, minutes: int) -> list[Event]:
+    """Same selection as EventRepository.list_events_in_window."""
+    end = clock.total_seconds_in_period()
+    start = window_start_second(end, RollingWindow(minutes=minutes))
+    return [
+        e
+        for e in events
+        if e.clock.period == clock.period and start <= e.clock.total_seconds_in_period() <= end
+    ]
+
+
+def _comparable(snapshot) -> tuple:
+    return (
+        snapshot.match_id,
+        snapshot.clock,
+        snapshot.features_by_window,
+        snapshot.derived_metrics,
+        snapshot.deltas,
+        snapshot.why,
+        snapshot.model_version,
+    )
+
+
+def test_batch_matches_per_match_v1_for_many_matches() -> None:
+    rng = random.Random(21)
+    match_ids = [f"m{i}" for i in range(40)]
+    matches = [_match(m, rng) for m in match_ids]
+    # Some matches have no events, some only a handful (zero-pressure branches)
+    events = [_events(m, rng.choice((0, 3, 40, 400)), rng) for m in match_ids]
+    clocks = [
+        MatchClock(period=rng.choice((1, 2)), minute=rng.randrange(0, 50), second=rng.randrange(60))
+        for _ in match_ids
+    ]
+    engine = AnalyticsEngine()
+    previous = [
+        engine.compute(m, _in_window(e, c, 5), [], c, None) if i % 2 else None
+        for i, (m, e, c) in enumerate(zip(matches, events, clocks))
+    ]
+
+    batch = BatchAnalyticsEngine().compute_many(
+        matches, EventColumns.from_events(events), clocks, previous
+    )
+
+    expected = [
+        engine.compute(m, _in_window(e, c, 5), _in_window(e, c, 10), c, p)
+        for m, e, c, p in zip(matches, events, clocks, previous)
+    ]
+    assert [_comparable(s) for s in batch] == [_comparable(s) for s in expected]
+
+
+def test_batch_with_no_events_is_neutral() -> None:
+    match = replace(_match("m1", random.Random(0)), home_red_cards=0, away_red_cards=0)
+    clock = MatchClock(period=1, minute=10, second=0)
+
+    [snapshot] = BatchAnalyticsEngine().compute_many(
+        [match], EventColumns.from_events([[]]), [clock], [None]
+    )
+
+    assert snapshot.derived_metrics["momentum"] == {"HOME": 0.5, "AWAY": 0.5}
+    assert snapshot.why == ["No attacking actions in window"]
+
+
+def test_batch_uses_configured_windows_and_plugged_in_metrics() -> None:
+    rng = random.Random(7)
+    match_ids = [f"m{i}" for i in range(12)]
+    matches = [_match(m, rng) for m in match_ids]
+    events = [
+        sorted(_events(m, rng.choice((0, 30, 200)), rng), key=lambda e: e.clock.ordering_key())
+        for m in match_ids
+    ]
+    clocks = [
+        MatchClock(period=rng.choice((1, 2)), minute=rng.randrange(0, 50), second=rng.randrange(60))
+        for _ in match_ids
+    ]
+    # No batched form: computed per match from the same features
+    foul_gap = Metric(
+        "foul_gap",
+        lambda features, match, inputs: {
+            "HOME": features["half"]["HOME"]["fouls"] - features["half"]["AWAY"]["fouls"],
+            "AWAY": round(inputs["momentum"]["AWAY"] * 2, 4),
+        },
+        features=(("half", "fouls"),),
+        depends_on=("momentum",),
+    )
+    windows = parse_windows("5m,10m,half,full")
+    metrics = V1_METRICS.with_metrics(foul_gap)
+    engine = AnalyticsEngine(windows=windows, metrics=metrics)
+
+    batch = BatchAnalyticsEngine(windows=windows, metrics=metrics).compute_many(
+        matches, EventColumns.from_events(events), clocks, [None] * len(matches)
+    )
+
+    expected = [
+        engine.compute_from_features(m, engine.window_features(e, c), c, None)
+        for m, e, c in zip(matches, events, clocks)
+    ]
+    assert [_comparable(s) for s in batch] == [_comparable(s) for s in expected]
+
+
+def test_round4_matches_python_round() -> None:
+    rng = random.Random(4)
+    values = [rng.uniform(-3, 3) for _ in range(5000)]
+    # Exact and near ties at the fifth decimal
+    values += [k / 20_000 for k in range(-200, 200)] + [0.00005, 1.00005, 2.67565, 0.123450001]
+
+    assert round4(np.array(values)).tolist() == [round(v, 4) for v in values]
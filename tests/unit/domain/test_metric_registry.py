@@ -0,0 +1,189 @@
+"""Metric registry: dependency order, plug-in metrics, recompute only on changed inputs."""
+
+import threading
+from dataclasses import replace
+from datetime import UTC, datetime
+
+import pytest
+
+from football_engine.domain.entities import Event, Match
+from football_engine.domain.enums import EventType, MatchStatus, TeamSide
+from football_engine.domain.services import AnalyticsEngine
+from football_engine.domain.services.metric_registry import (
+    Metric,
+    MetricEvaluator,
+    MetricRegistry,
+)
+from football_engine.domain.services.metrics_v1 import V1_METRICS
+from football_engine.domain.value_objects import MatchClock, Score
+
+# The v1 metrics declared expensive, so they are recomputed only on changed inputs
+SELECTIVE_V1 = MetricRegistry(replace(m, expensive=True) for m in V1_METRICS.metrics)
+
+
+def _match(home_reds: int = 0) -> Match:
+    return Match(
+        match_id="m1",
+        home_team="H",
+        away_team="A",
+        status=MatchStatus.LIVE,
+        clock=MatchClock(period=1, minute=0, second=0),
+        score=Score(home=0, away=0),
+        home_red_cards=home_reds,
+        away_red_cards=0,
+        version=1,
+    )
+
+
+def _event(n: int, minute: int, event_type: EventType) -> Event:
+    return Event(
+        event_id=f"e{n}",
+        match_id="m1",
+        provider_name="test",
+        provider_event_id=None,
+        clock=MatchClock(period=1, minute=minute, second=0),
+        team_side=TeamSide.HOME,
+        event_type=event_type,
+        payload=None,
+        ingested_at_utc=datetime.now(UTC),
+    )
+
+
+def _snapshot(engine: AnalyticsEngine, events: list[Event], minute: int, match: Match):
+    clock = MatchClock(period=1, minute=minute, second=0)
+    features = engine.window_features(events, clock)
+    return engine.compute_from_features(match, features, clock, None)
+
+
+def test_events_that_touch_no_input_recompute_nothing() -> None:
+    engine = AnalyticsEngine(metrics=SELECTIVE_V1)
+    events = [_event(1, 1, EventType.SHOT)]
+    first = _snapshot(engine, events, 1, _match())
+    assert engine.metric_counters()["metrics_recomputed"] == 4
+
+    events.append(_event(2, 2, EventType.FOUL))
+    second = _snapshot(engine, events, 2, _match())
+
+    assert second.derived_metrics == first.derived_metrics
+    assert engine.metric_counters() == {
+        "metrics_evaluated": 8,
+        "metrics_recomputed": 4,
+        "recompute_ratio": 0.5,
+    }
+
+
+def test_red_card_recomputes_only_danger() -> None:
+    engine = AnalyticsEngine(metrics=SELECTIVE_V1)
+    events = [_event(1, 1, EventType.SHOT)]
+    _snapshot(engine, events, 1, _match())
+
+    events.append(_event(2, 2, EventType.RED))
+    after = _snapshot(engine, events, 2, _match(home_reds=1))
+
+    assert engine.metric_counters()["metrics_recomputed"] == 5
+    assert after.derived_metrics["danger_next_5m"] == {"HOME": 0.9, "AWAY": 0.1}
+
+
+def test_cheap_metrics_are_all_computed_without_tracking_changes(monkeypatch) -> None:
+    def no_comparison(*args):
+        raise AssertionError("window vectors compared")
+
+    monkeypatch.setattr(MetricRegistry, "_changed_windows", no_comparison)
+    engine = AnalyticsEngine()
+    events = [_event(1, 1, EventType.SHOT)]
+    first = _snapshot(engine, events, 1, _match())
+    events.append(_event(2, 2, EventType.FOUL))
+    second = _snapshot(engine, events, 2, _match())
+
+    assert not V1_METRICS.selective and SELECTIVE_V1.selective
+    assert second.derived_metrics == first.derived_metrics
+    assert engine.metric_counters()["recompute_ratio"] == 1.0
+
+
+def test_window_expiry_recomputes_without_a_relevant_event() -> None:
+    engine = AnalyticsEngine(metrics=SELECTIVE_V1)
+    events = [_event(1, 1, EventType.SHOT)]
+    _snapshot(engine, events, 1, _match())
+
+    # A FOUL twelve minutes later: the shot has left the 10m window
+    events.append(_event(2, 13, EventType.FOUL))
+    later = _snapshot(engine, events, 13, _match())
+
+    assert later.derived_metrics["pressure_index"] == {"HOME": 0.0, "AWAY": 0.0}
+    assert later.derived_metrics["momentum"] == {"HOME": 0.5, "AWAY": 0.5}
+
+
+def test_window_state_reports_changes_without_comparing_values(monkeypatch) -> None:
+    def no_comparison(*args):
+        raise AssertionError("window vectors compared")
+
+    engine = AnalyticsEngine(metrics=SELECTIVE_V1)
+    clock = MatchClock(period=1, minute=1, second=0)
+    features = engine.rebuild_windows("m1", clock, [_event(1, 1, EventType.SHOT)], version=2)
+    engine.compute_from_features(_match(), features, clock, None)
+    monkeypatch.setattr(MetricRegistry, "_changed_windows", no_comparison)
+
+    clock = MatchClock(period=1, minute=2, second=0)
+    features = engine.observe("m1", [_event(2, 2, EventType.FOUL)], clock, version=3)
+    engine.compute_from_features(_match(), features, clock, None)
+    assert engine.metric_counters()["metrics_recomputed"] == 4
+
+    # The shot expires from the 10m window: pressure inputs changed with no attacking event
+    clock = MatchClock(period=1, minute=13, second=0)
+    features = engine.observe("m1", [_event(3, 13, EventType.FOUL)], clock, version=4)
+    later = engine.compute_from_features(_match(), features, clock, None)
+    assert engine.metric_counters()["metrics_recomputed"] == 8
+    assert later.derived_metrics["pressure_index"] == {"HOME": 0.0, "AWAY": 0.0}
+
+
+def test_matches_evaluate_concurrently() -> None:
+    started, other_done = threading.Event(), threading.Event()
+
+    def slow(features, match, inputs):
+        if match.match_id == "m1":
+            started.set()
+            assert other_done.wait(timeout=2), "m2 waited for m1's evaluation"
+        return {"HOME": 0.0, "AWAY": 0.0}
+
+    evaluator = MetricEvaluator(MetricRegistry([Metric("slow", slow, expensive=True)]))
+    engine = AnalyticsEngine()
+    features = engine.window_features([], MatchClock(period=1, minute=1, second=0))
+    first = threading.Thread(target=evaluator.evaluate, args=(features, _match()))
+    first.start()
+    started.wait(timeout=2)
+    evaluator.evaluate(features, replace(_match(), match_id="m2"))
+    other_done.set()
+    first.join()
+
+    assert evaluator.counters()["metrics_evaluated"] == 2
+
+
+def test_plugged_in_metric_reads_its_dependency() -> None:
+    shot_share = Metric(
+        "shot_pressure_gap",
+        lambda features, match, inputs: {
+            "HOME": round(inputs["pressure_index"]["HOME"] - inputs["pressure_index"]["AWAY"], 4),
+            "AWAY": round(inputs["pressure_index"]["AWAY"] - inputs["pressure_index"]["HOME"], 4),
+        },
+        depends_on=("pressure_index",),
+    )
+    engine = AnalyticsEngine(metrics=V1_METRICS.with_metrics(shot_share))
+
+    snapshot = _snapshot(engine, [_event(1, 1, EventType.SHOT)], 1, _match())
+
+    assert list(snapshot.derived_metrics) == [*V1_METRICS.names, "shot_pressure_gap"]
+    assert snapshot.derived_metrics["shot_pressure_gap"] == {"HOME": 1.0, "AWAY": -1.0}
+
+
+def test_registry_rejects_unknown_dependencies_and_cycles() -> None:
+    def constant(features, match, inputs):
+        return {"HOME": 0.0, "AWAY": 0.0}
+
+    with pytest.raises(ValueError, match="unknown"):
+        MetricRegistry([Metric("a", constant, depends_on=("missing",))])
+    with pytest.raises(ValueError, match="cycle"):
+        MetricRegistry(
+            [Metric("a", constant, depends_on=("b",)), Metric("b", constant, depends_on=("a",))]
+        )
+    with pytest.raises(ValueError, match="duplicate"):
+        MetricRegistry([Metric("a", constant), Metric("a", constant)])
@@ -0,0 +1,143 @@
+"""Prefix-sum timeline gives the snapshots per-clock v1 compute gives with every event known."""
+
+import random
+from dataclasses import replace
+from datetime import UTC, datetime
+
+from football_engine.domain.entities import Event, Match
+from football_engine.domain.enums import EventType, MatchStatus, TeamSide
+from football_engine.domain.services.analytics_engine import AnalyticsEngine
+from football_engine.domain.services.snapshot_timeline import (
+    FeaturePrefixSums,
+    TimelineMode,
+    build_timeline,
+)
+from football_engine.domain.services.window_state import (
+    sweep_window_features,
+    window_start_second,
+)
+from football_engine.domain.value_objects import MatchClock, RollingWindow, Score, parse_windows
+
+
+def _events(count: int, rng: random.Random) -> list[Event]:
+    events = []
+    for n in range(count):
+        seconds = rng.randrange(0, 48 * 60)
+        event_type = rng.choice(list(EventType))
+        xg = round(rng.uniform(0.01, 0.9), 3) if event_type == EventType.SHOT else None
+        events.append(
+            Event(
+                event_id=f"e{n}",
+                match_id="m1",
+                provider_name="test",
+                provider_event_id=None,
+                clock=MatchClock(
+                    period=rng.choice((1, 2)), minute=seconds // 60, second=seconds % 60
+                ),
+                team_side=rng.choice(list(TeamSide)),
+                event_type=event_type,
+                payload={"xg": xg} if xg is not None else None,
+                ingested_at_utc=datetime.now(UTC),
+            )
+        )
+    return events
+
+
+def _kickoff() -> Match:
+    return Match(
+        match_id="m1",
+        home_team="H",
+        away_team="A",
+        status=MatchStatus.SCHEDULED,
+        clock=MatchClock(period=1, minute=0, second=0),
+        score=Score(home=0, away=0),
+        home_red_cards=0,
+        away_red_cards=0,
+        version=1,
+    )
+
+
+def _in_window(events: list[Event], clock: MatchClock, minutes: int) -> list[Event]:
+    """Same selection as EventRepository.list_events_in_window."""
+    end = clock.total_seconds_in_period()
+    start = window_start_second(end, RollingWindow(minutes=minutes))
+    return [
+        e
+        for e in events
+        if e.clock.period == clock.period and start <= e.clock.total_seconds_in_period() <= end
+    ]
+
+
+def _replayed(events: list[Event], clocks: list[MatchClock]) -> list[tuple]:
+    """Per clock: match replayed up to it, v1 compute on the window lists."""
+    engine = AnalyticsEngine()
+    ordered = sorted(events, key=lambda e: e.clock.ordering_key())
+    out, previous = [], None
+    for clock in clocks:
+        match = _kickoff()
+        for e in ordered:
+            if e.clock.ordering_key() <= clock.ordering_key():
+                match = match.apply_event(e)
+        previous = engine.compute(
+            match, _in_window(events, clock, 5), _in_window(events, clock, 10), clock, previous
+        )
+        out.append(_comparable(replace(previous, model_version="v1-test")))
+    return out
+
+
+def _comparable(snapshot) -> tuple:
+    return (
+        snapshot.clock,
+        snapshot.features_by_window,
+        snapshot.derived_metrics,
+        snapshot.deltas,
+        snapshot.why,
+        snapshot.model_version,
+    )
+
+
+def test_event_timeline_matches_per_clock_v1_compute() -> None:
+    events = _events(300, random.Random(22))
+
+    timeline = build_timeline(_kickoff(), events, "v1-test")
+
+    clocks = sorted({e.clock for e in events}, key=MatchClock.ordering_key)
+    assert [s.clock for s in timeline] == clocks
+    assert [_comparable(s) for s in timeline] == _replayed(events, clocks)
+
+
+def test_second_timeline_covers_every_second_up_to_each_period_last_event() -> None:
+    events = _events(40, random.Random(5))
+    sums = FeaturePrefixSums(events)
+
+    timeline = build_timeline(_kickoff(), events, "v1-test", TimelineMode.SECONDS)
+
+    assert len(timeline) == sum(sums.last_second(p) + 1 for p in sums.periods)
+    sampled = timeline[::97]
+    # Deltas are against the previous second, so compare everything else
+    expected = _replayed(events, [s.clock for s in sampled])
+    assert [_comparable(s)[:3] + _comparable(s)[4:] for s in sampled] == [
+        e[:3] + e[4:] for e in expected
+    ]
+
+
+def test_window_past_the_last_event_is_empty() -> None:
+    events = _events(10, random.Random(1))
+    sums = FeaturePrefixSums(events)
+    period = sums.periods[0]
+    late = MatchClock(period=period, minute=sums.last_second(period) // 60 + 11, second=0)
+
+    features = sums.window(late, RollingWindow(minutes=10))
+
+    assert not any(features)
+
+
+def test_prefix_sums_serve_period_and_match_windows() -> None:
+    events = sorted(_events(200, random.Random(9)), key=lambda e: e.clock.ordering_key())
+    windows = parse_windows("1m,5m,10m,15m,half,full")
+
+    timeline = build_timeline(_kickoff(), events, "v1-test", windows=windows)
+
+    for snapshot in timeline[::7]:
+        upto = [e for e in events if e.clock.ordering_key() <= snapshot.clock.ordering_key()]
+        assert snapshot.features_by_window == sweep_window_features(upto, snapshot.clock, windows)
@@ -0,0 +1,59 @@
+"""Compact window features: vectors inside, the stored / API dict form at the boundary."""
+
+from datetime import UTC, datetime
+
+from football_engine.domain.entities import AnalyticsSnapshot
+from football_engine.domain.enums import FeatureName
+from football_engine.domain.value_objects import FEATURE_KEYS, MatchClock, WindowFeatures
+
+STORED = {
+    "5m": {
+        "HOME": {**dict.fromkeys(FEATURE_KEYS, 0), "shots": 2, "xg_sum": 0.31},
+        "AWAY": {**dict.fromkeys(FEATURE_KEYS, 0), "corners": 1, "xg_sum": 0.0},
+    },
+}
+
+
+def test_dict_form_round_trips() -> None:
+    features = WindowFeatures.from_dict(STORED)
+
+    assert features.to_dict() == STORED
+    assert features == STORED
+    assert features["5m"]["HOME"]["shots"] == 2
+    assert features.value("5m", "HOME", FeatureName.XG_SUM) == 0.31
+    assert features.team("10m", "AWAY") == (0,) * len(FeatureName)
+
+
+def test_minus_subtracts_per_window_and_keeps_new_windows() -> None:
+    previous = WindowFeatures.from_dict(STORED)
+    current = WindowFeatures(
+        {
+            "5m": previous.vector("5m")[:6] + (410_000, 3) + previous.vector("5m")[8:],
+            "half": tuple(range(16)),
+        }
+    )
+
+    delta = current.minus(previous)
+
+    assert delta["5m"]["HOME"]["xg_sum"] == 0.1
+    assert delta["5m"]["HOME"]["attacking_actions_count"] == 3
+    assert delta["5m"]["AWAY"]["corners"] == 0
+    assert delta.vector("half") == tuple(range(16))
+
+
+def test_snapshot_accepts_the_stored_form() -> None:
+    snapshot = AnalyticsSnapshot(
+        snapshot_id="s1",
+        match_id="m1",
+        clock=MatchClock(period=1, minute=3, second=0),
+        features_by_window=STORED,
+        derived_metrics={},
+        deltas={"features_by_window": STORED, "derived_metrics": {}},
+        why=[],
+        model_version="v1",
+        created_at_utc=datetime.now(UTC),
+    )
+
+    assert isinstance(snapshot.features_by_window, WindowFeatures)
+    assert snapshot.features_dict() == STORED
+    assert snapshot.deltas_dict() == {"features_by_window": STORED, "derived_metrics": {}}
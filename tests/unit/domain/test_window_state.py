@@ -0,0 +1,166 @@
+"""Incremental window state matches from-scratch aggregation of the same window."""
+
+import random
+from datetime import UTC, datetime
+
+import pytest
+
+from football_engine.domain.entities import Event
+from football_engine.domain.enums import EventType, TeamSide
+from football_engine.domain.services.analytics_engine import _aggregate_events_by_team
+from football_engine.domain.services.window_state import (
+    WindowStateStore,
+    sweep_window_features,
+    window_start_second,
+)
+from football_engine.domain.value_objects import (
+    MatchClock,
+    RollingWindow,
+    WindowFeatures,
+    parse_windows,
+)
+
+WINDOWS = (RollingWindow(minutes=5), RollingWindow(minutes=10))
+WIDE_WINDOWS = parse_windows("1m,3m,5m,10m,15m,half,full")
+
+
+def _event(n: int, period: int, seconds: int, rng: random.Random) -> Event:
+    event_type = rng.choice(list(EventType))
+    payload = {"xg": round(rng.uniform(0.01, 0.9), 3)} if event_type == EventType.SHOT else None
+    return Event(
+        event_id=f"e{n}",
+        match_id="m1",
+        provider_name="test",
+        provider_event_id=None,
+        clock=MatchClock(period=period, minute=seconds // 60, second=seconds % 60),
+        team_side=rng.choice(list(TeamSide)),
+        event_type=event_type,
+        payload=payload,
+        ingested_at_utc=datetime.now(UTC),
+    )
+
+
+def _expected(
+    stored: list[Event], clock: MatchClock, windows: tuple[RollingWindow, ...] = WINDOWS
+) -> WindowFeatures:
+    """Same window semantics as EventRepository.list_events_in_window."""
+    end = clock.total_seconds_in_period()
+    out = {}
+    for w in windows:
+        start = window_start_second(end, w)
+        in_window = [
+            e
+            for e in stored
+            if (w.whole_match and e.clock.period < clock.period)
+            or (
+                e.clock.period == clock.period and start <= e.clock.total_seconds_in_period() <= end
+            )
+        ]
+        out[w.label] = _aggregate_events_by_team(in_window)
+    return WindowFeatures(out)
+
+
+def test_incremental_windows_match_full_aggregation() -> None:
+    rng = random.Random(7)
+    store = WindowStateStore(WINDOWS)
+    stored: list[Event] = []
+    head = {1: 0, 2: 0}
+    for n in range(600):
+        period = 1 if n < 300 else 2
+        # Mostly forward clock with occasional late (out-of-order) events
+        if rng.random() < 0.1:
+            seconds = max(0, head[period] - rng.randint(0, 900))
+        else:
+            seconds = head[period] + rng.randint(0, 40)
+            head[period] = seconds
+        event = _event(n, period, seconds, rng)
+        stored.append(event)
+        features = store.observe("m1", [event], event.clock)
+        if features is None:
+            clock = event.clock
+            widest = [
+                e
+                for e in stored
+                if e.clock.period == clock.period
+                and window_start_second(clock.total_seconds_in_period(), WINDOWS[1])
+                <= e.clock.total_seconds_in_period()
+                <= clock.total_seconds_in_period()
+            ]
+            if n == 0:
+                features = store.rebuild("m1", clock, widest)
+            else:
+                features = _expected(stored, clock)
+        assert features == _expected(stored, event.clock), n
+
+
+def test_miss_until_rebuilt_and_after_invalidate() -> None:
+    rng = random.Random(1)
+    store = WindowStateStore(WINDOWS)
+    event = _event(1, 1, 30, rng)
+    assert store.observe("m1", [event], event.clock) is None
+    store.rebuild("m1", event.clock, [event])
+    later = _event(2, 1, 90, rng)
+    assert store.observe("m1", [later], later.clock) == _expected([event, later], later.clock)
+    store.invalidate("m1")
+    assert store.observe("m1", [], later.clock) is None
+
+
+def test_state_built_at_another_match_version_is_a_miss() -> None:
+    rng = random.Random(2)
+    store = WindowStateStore(WINDOWS)
+    first, second, third = (_event(i, 1, 30 + i, rng) for i in range(3))
+    store.rebuild("m1", first.clock, [first], version=2)
+    assert store.observe("m1", [second], second.clock, version=3) is not None
+
+    # Version 4 was written elsewhere: this state never saw it
+    assert store.observe("m1", [third], third.clock, version=5) is None
+    assert store.observe("m1", [], third.clock, version=5) is None
+
+
+def test_minute_period_and_match_windows_match_full_aggregation() -> None:
+    rng = random.Random(23)
+    store = WindowStateStore(WIDE_WINDOWS)
+    stored: list[Event] = []
+    head = {1: 0, 2: 0}
+    for n in range(600):
+        period = 1 if n < 300 else 2
+        late = rng.random() < 0.1
+        if late:
+            seconds = max(0, head[period] - rng.randint(0, 1500))
+        else:
+            seconds = head[period] + rng.randint(0, 40)
+            head[period] = seconds
+        event = _event(n, period, seconds, rng)
+        stored.append(event)
+        expected = _expected(stored, event.clock, WIDE_WINDOWS)
+        features = store.observe("m1", [event], event.clock)
+        if features is None and not late:
+            widest = [e for e in stored if e.clock.ordering_key() <= event.clock.ordering_key()]
+            features = store.rebuild("m1", event.clock, widest)
+        if features is not None:
+            assert features == expected, n
+
+
+def test_one_sweep_of_the_widest_window_gives_every_window() -> None:
+    rng = random.Random(3)
+    stored = sorted(
+        (_event(n, rng.choice((1, 2)), rng.randrange(0, 50 * 60), rng) for n in range(400)),
+        key=lambda e: e.clock.ordering_key(),
+    )
+    for _ in range(50):
+        seconds = rng.randrange(0, 50 * 60)
+        clock = MatchClock(period=rng.choice((1, 2)), minute=seconds // 60, second=seconds % 60)
+        widest = [e for e in stored if e.clock.ordering_key() <= clock.ordering_key()]
+
+        features = sweep_window_features(widest, clock, WIDE_WINDOWS)
+
+        assert list(features) == [w.label for w in WIDE_WINDOWS]
+        assert features == _expected(stored, clock, WIDE_WINDOWS)
+
+
+def test_window_labels_round_trip() -> None:
+    assert [w.label for w in WIDE_WINDOWS] == ["1m", "3m", "5m", "10m", "15m", "half", "full"]
+    assert max(WIDE_WINDOWS, key=lambda w: w.reach).label == "full"
+    for label in ("0m", "5", "quarter", "m"):
+        with pytest.raises(ValueError):
+            RollingWindow.parse(label)
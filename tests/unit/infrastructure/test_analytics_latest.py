@@ -0,0 +1,97 @@
+"""analytics_latest: upserted on save, latest reads by primary key, history policy."""
+
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from football_engine.domain.entities import AnalyticsSnapshot, Match
+from football_engine.domain.enums import MatchStatus
+from football_engine.domain.value_objects import MatchClock, Score
+from football_engine.infrastructure.db.models import (
+    AnalyticsLatestModel,
+    AnalyticsSnapshotModel,
+    Base,
+)
+from football_engine.infrastructure.repositories.analytics_latest import SnapshotHistory
+from football_engine.infrastructure.repositories.analytics_repository_impl import (
+    AnalyticsRepositoryImpl,
+)
+from football_engine.infrastructure.repositories.match_repository_impl import MatchRepositoryImpl
+
+
+def _snapshot(snapshot_id: str, minute: int, second: int = 0) -> AnalyticsSnapshot:
+    return AnalyticsSnapshot(
+        snapshot_id=snapshot_id,
+        match_id="m1",
+        clock=MatchClock(period=1, minute=minute, second=second),
+        features_by_window={},
+        derived_metrics={"pressure_index": {"HOME": 0.5, "AWAY": 0.5}},
+        deltas={},
+        why=[],
+        model_version="v1",
+        created_at_utc=datetime.now(UTC),
+    )
+
+
+@pytest.fixture
+def session():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)()
+    MatchRepositoryImpl(session).create_match(
+        Match(
+            match_id="m1",
+            home_team="A",
+            away_team="B",
+            status=MatchStatus.LIVE,
+            clock=MatchClock(period=1, minute=0, second=0),
+            score=Score(home=0, away=0),
+            home_red_cards=0,
+            away_red_cards=0,
+            version=1,
+        )
+    )
+    yield session
+    session.close()
+
+
+def _count(session, model) -> int:
+    return session.scalar(select(func.count()).select_from(model))
+
+
+def test_latest_is_upserted_and_read_by_key(session) -> None:
+    repo = AnalyticsRepositoryImpl(session)
+    for i in range(3):
+        repo.save_snapshot(_snapshot(f"s{i}", minute=i))
+    assert _count(session, AnalyticsLatestModel) == 1
+    assert _count(session, AnalyticsSnapshotModel) == 3
+
+    statements: list[str] = []
+    event.listen(session.get_bind(), "before_cursor_execute", lambda *a: statements.append(a[2]))
+    latest = repo.get_latest_snapshot("m1")
+    assert latest.snapshot_id == "s2"
+    assert latest.clock.minute == 2
+    assert "analytics_latest" in statements[0]
+    assert "ORDER BY" not in statements[0]
+
+
+def test_history_can_be_sampled_or_off(session) -> None:
+    sampled = AnalyticsRepositoryImpl(session, history=SnapshotHistory("sampled", 60))
+    for i, (minute, second) in enumerate([(1, 0), (1, 20), (1, 59), (2, 5), (2, 30)]):
+        sampled.save_snapshot(_snapshot(f"s{i}", minute, second))
+    assert _count(session, AnalyticsSnapshotModel) == 2
+
+    off = AnalyticsRepositoryImpl(session, history=SnapshotHistory("off"))
+    off.save_snapshot(_snapshot("s9", 3))
+    assert _count(session, AnalyticsSnapshotModel) == 2
+    assert off.get_latest_snapshot("m1").snapshot_id == "s9"
+
+
+def test_unknown_history_mode_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        SnapshotHistory("weekly")
@@ -0,0 +1,125 @@
+"""In-memory dedup filter: known duplicates are answered without any DB statement."""
+
+from datetime import UTC, datetime
+
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from football_engine.application.services import IngestEventService
+from football_engine.domain.entities import Event, Match
+from football_engine.domain.enums import EventType, MatchStatus, TeamSide
+from football_engine.domain.services import AnalyticsEngine
+from football_engine.domain.value_objects import MatchClock, Score
+from football_engine.infrastructure.cache import LatestSnapshotCache, MatchCache, SeenEventIds
+from football_engine.infrastructure.cache.warmup import warm_live_matches
+from football_engine.infrastructure.repositories.analytics_repository_impl import (
+    AnalyticsRepositoryImpl,
+)
+from football_engine.infrastructure.repositories.event_repository_impl import EventRepositoryImpl
+from football_engine.infrastructure.repositories.match_repository_impl import MatchRepositoryImpl
+
+
+def _event(event_id: str, minute: int = 1) -> Event:
+    return Event(
+        event_id=event_id,
+        match_id="m1",
+        provider_name="test",
+        provider_event_id=event_id,
+        clock=MatchClock(period=1, minute=minute, second=0),
+        team_side=TeamSide.HOME,
+        event_type=EventType.SHOT,
+        payload={"xg": 0.2},
+        ingested_at_utc=datetime.now(UTC),
+    )
+
+
+class _Caches:
+    def __init__(self) -> None:
+        self.matches = MatchCache()
+        self.seen = SeenEventIds()
+        self.snapshots = LatestSnapshotCache()
+        self.engine = AnalyticsEngine()
+
+    def service(self, session) -> IngestEventService:
+        return IngestEventService(
+            match_repository=MatchRepositoryImpl(session, self.matches),
+            event_repository=EventRepositoryImpl(session, self.seen),
+            analytics_repository=AnalyticsRepositoryImpl(session, self.snapshots),
+            analytics_engine=self.engine,
+        )
+
+
+def _create_match(factory: sessionmaker, caches: _Caches) -> None:
+    with factory() as s:
+        MatchRepositoryImpl(s, caches.matches).create_match(
+            Match(
+                match_id="m1",
+                home_team="A",
+                away_team="B",
+                status=MatchStatus.SCHEDULED,
+                clock=MatchClock(period=1, minute=0, second=0),
+                score=Score(home=0, away=0),
+                home_red_cards=0,
+                away_red_cards=0,
+                version=1,
+            )
+        )
+        s.commit()
+
+
+def test_known_duplicate_needs_no_db_access(factory: sessionmaker) -> None:
+    caches = _Caches()
+    _create_match(factory, caches)
+    with factory() as s:
+        _, _, _, first_snapshot = caches.service(s).ingest(_event("e1"))
+        s.commit()
+
+    statements: list[str] = []
+    event.listen(factory.kw["bind"], "before_cursor_execute", lambda *a: statements.append(a[2]))
+    with factory() as s:
+        accepted, dup, match, snapshot = caches.service(s).ingest(_event("e1"))
+        s.commit()
+    assert (accepted, dup, match.version) == (True, True, 2)
+    assert snapshot.snapshot_id == first_snapshot.snapshot_id
+    assert statements == []
+
+
+def test_filter_is_commit_gated(factory: sessionmaker) -> None:
+    caches = _Caches()
+    _create_match(factory, caches)
+    with factory() as s:
+        caches.service(s).ingest_batch("m1", [_event("e1"), _event("e2", 2)])
+        s.rollback()
+    assert caches.seen.known("m1", ["e1", "e2"]) == set()
+    with factory() as s:
+        _, flags, _, _ = caches.service(s).ingest_batch("m1", [_event("e1"), _event("e2", 2)])
+        s.commit()
+    assert flags == [False, False]
+    assert caches.seen.known("m1", ["e1", "e2", "e3"]) == {"e1", "e2"}
+
+
+def test_filter_is_bounded_and_misses_fall_back_to_db(factory: sessionmaker) -> None:
+    caches = _Caches()
+    caches.seen = SeenEventIds(max_ids_per_match=1)
+    _create_match(factory, caches)
+    with factory() as s:
+        caches.service(s).ingest_batch("m1", [_event("e1"), _event("e2", 2)])
+        s.commit()
+    assert caches.seen.known("m1", ["e1", "e2"]) == {"e2"}
+    with factory() as s:
+        accepted, dup, _, _ = caches.service(s).ingest(_event("e1"))
+    assert (accepted, dup) == (True, True)
+
+
+def test_warm_live_matches_loads_ids_and_snapshot(factory: sessionmaker) -> None:
+    caches = _Caches()
+    _create_match(factory, caches)
+    with factory() as s:
+        caches.service(s).ingest_batch("m1", [_event("e1"), _event("e2", 2), _event("e3", 3)])
+        s.commit()
+
+    warm = _Caches()
+    assert warm_live_matches(factory, warm.matches, warm.seen, warm.snapshots, 2) == 1
+    assert warm.seen.known("m1", ["e1", "e2", "e3"]) == {"e2", "e3"}
+    assert warm.matches.get("m1").version == 4
+    assert warm.snapshots.get("m1") is not None
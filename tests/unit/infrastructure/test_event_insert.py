@@ -0,0 +1,91 @@
+"""Conflict-free event dedup: one INSERT per call, no SELECT probe, same contract."""
+
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from football_engine.domain.entities import Event, Match
+from football_engine.domain.enums import EventType, MatchStatus, TeamSide
+from football_engine.domain.value_objects import MatchClock, Score
+from football_engine.infrastructure.db.models import Base
+from football_engine.infrastructure.mappers.match_mapper import match_to_orm
+from football_engine.infrastructure.repositories import event_repository_impl
+from football_engine.infrastructure.repositories.event_repository_impl import EventRepositoryImpl
+
+
+def _event(event_id: str, second: int = 0) -> Event:
+    return Event(
+        event_id=event_id,
+        match_id="m1",
+        provider_name="test",
+        provider_event_id=event_id,
+        clock=MatchClock(period=1, minute=1, second=second),
+        team_side=TeamSide.HOME,
+        event_type=EventType.SHOT,
+        payload={"xg": 0.1},
+        ingested_at_utc=datetime.now(UTC),
+    )
+
+
+@pytest.fixture
+def session_and_statements():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    statements: list[str] = []
+    event.listen(
+        engine, "before_cursor_execute", lambda *args: statements.append(args[2].split()[0])
+    )
+    session = sessionmaker(bind=engine)()
+    session.add(
+        match_to_orm(
+            Match(
+                match_id="m1",
+                home_team="A",
+                away_team="B",
+                status=MatchStatus.LIVE,
+                clock=MatchClock(period=1, minute=0, second=0),
+                score=Score(home=0, away=0),
+                home_red_cards=0,
+                away_red_cards=0,
+                version=1,
+            )
+        )
+    )
+    session.flush()
+    statements.clear()
+    yield session, statements
+    session.close()
+
+
+def test_single_insert_dedups_without_probe(session_and_statements) -> None:
+    session, statements = session_and_statements
+    repo = EventRepositoryImpl(session)
+    assert repo.add_event_if_new(_event("e1")) is True
+    assert repo.add_event_if_new(_event("e1")) is False
+    assert statements == ["INSERT", "INSERT"]
+
+
+def test_bulk_insert_returns_only_new_ids(session_and_statements) -> None:
+    session, statements = session_and_statements
+    repo = EventRepositoryImpl(session)
+    repo.add_event_if_new(_event("e1"))
+    statements.clear()
+    batch = [_event("e1"), _event("e2", 5), _event("e3", 9), _event("e2", 30)]
+    assert repo.add_events_if_new(batch) == {"e2", "e3"}
+    assert statements == ["INSERT"]
+    stored = repo.list_recent_events("m1", limit=10)
+    assert [(e.event_id, e.clock.second) for e in stored] == [("e1", 0), ("e2", 5), ("e3", 9)]
+
+
+def test_fallback_dialect_keeps_contract(session_and_statements, monkeypatch) -> None:
+    session, _ = session_and_statements
+    monkeypatch.setattr(event_repository_impl, "supports_insert_if_new", lambda _: False)
+    repo = EventRepositoryImpl(session)
+    assert repo.add_event_if_new(_event("e1")) is True
+    assert repo.add_event_if_new(_event("e1")) is False
+    assert repo.add_events_if_new([_event("e1"), _event("e2"), _event("e2")]) == {"e2"}
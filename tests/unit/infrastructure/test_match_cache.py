@@ -0,0 +1,78 @@
+"""Write-through match cache: commit-gated, version-checked, no SELECT on hits."""
+
+from dataclasses import replace
+
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from football_engine.domain.entities import Match
+from football_engine.domain.enums import MatchStatus
+from football_engine.domain.value_objects import MatchClock, Score
+from football_engine.infrastructure.cache import MatchCache
+from football_engine.infrastructure.repositories.match_repository_impl import MatchRepositoryImpl
+
+
+def _match(version: int = 1, status: MatchStatus = MatchStatus.LIVE) -> Match:
+    return Match(
+        match_id="m1",
+        home_team="A",
+        away_team="B",
+        status=status,
+        clock=MatchClock(period=1, minute=0, second=0),
+        score=Score(home=0, away=0),
+        home_red_cards=0,
+        away_red_cards=0,
+        version=version,
+    )
+
+
+def test_hot_match_needs_no_select(factory: sessionmaker) -> None:
+    cache = MatchCache()
+    with factory() as s:
+        MatchRepositoryImpl(s, cache).create_match(_match())
+        s.commit()
+
+    statements: list[str] = []
+    engine = factory.kw["bind"]
+    event.listen(engine, "before_cursor_execute", lambda *a: statements.append(a[2]))
+    with factory() as s:
+        repo = MatchRepositoryImpl(s, cache)
+        match = repo.get_match("m1")
+        repo.save_match(replace(match, version=2))
+        assert repo.get_match("m1").version == 2
+        s.commit()
+
+    assert not [q for q in statements if q.lstrip().upper().startswith("SELECT")]
+    assert cache.get("m1").version == 2
+
+
+def test_rollback_does_not_reach_cache(factory: sessionmaker) -> None:
+    cache = MatchCache()
+    with factory() as s:
+        MatchRepositoryImpl(s, cache).create_match(_match())
+        s.commit()
+    with factory() as s:
+        MatchRepositoryImpl(s, cache).save_match(_match(version=2))
+        s.rollback()
+    assert cache.get("m1").version == 1
+
+
+def test_cache_keeps_newest_version_and_drops_finished() -> None:
+    cache = MatchCache()
+    cache.put(_match(version=3))
+    cache.put(_match(version=2))
+    assert cache.get("m1").version == 3
+    cache.put(_match(version=4, status=MatchStatus.FT))
+    assert cache.get("m1") is None
+
+
+def test_cache_expires_and_evicts_lru() -> None:
+    expired = MatchCache(ttl_seconds=-1)
+    expired.put(_match())
+    assert expired.get("m1") is None
+
+    small = MatchCache(max_entries=1)
+    small.put(_match())
+    small.put(replace(_match(), match_id="m2"))
+    assert small.get("m1") is None
+    assert small.get("m2") is not None
@@ -0,0 +1,172 @@
+"""Rolling-window event query: clock_seconds range seek on the (match, period, clock) index."""
+
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from football_engine.application.services import IngestEventService
+from football_engine.domain.entities import Event, Match
+from football_engine.domain.enums import EventType, MatchStatus, TeamSide
+from football_engine.domain.services import AnalyticsEngine
+from football_engine.domain.value_objects import MatchClock, RollingWindow, Score, parse_windows
+from football_engine.infrastructure.db.models import Base, EventModel
+from football_engine.infrastructure.mappers.match_mapper import match_to_orm
+from football_engine.infrastructure.repositories.analytics_repository_impl import (
+    AnalyticsRepositoryImpl,
+)
+from football_engine.infrastructure.repositories.event_repository_impl import EventRepositoryImpl
+from football_engine.infrastructure.repositories.match_repository_impl import MatchRepositoryImpl
+
+
+def _event(event_id: str, period: int, minute: int, second: int) -> Event:
+    return Event(
+        event_id=event_id,
+        match_id="m1",
+        provider_name="test",
+        provider_event_id=event_id,
+        clock=MatchClock(period=period, minute=minute, second=second),
+        team_side=TeamSide.HOME,
+        event_type=EventType.SHOT,
+        payload={"xg": 0.1},
+        ingested_at_utc=datetime.now(UTC),
+    )
+
+
+@pytest.fixture
+def session_and_plans():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    plans: list[str] = []
+
+    def _explain(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and "FROM events" in statement:
+            rows = conn.connection.dbapi_connection.execute(
+                f"EXPLAIN QUERY PLAN {statement}", parameters
+            ).fetchall()
+            plans.extend(row[-1] for row in rows)
+
+    event.listen(engine, "before_cursor_execute", _explain)
+    session = sessionmaker(bind=engine)()
+    session.add(
+        match_to_orm(
+            Match(
+                match_id="m1",
+                home_team="A",
+                away_team="B",
+                status=MatchStatus.LIVE,
+                clock=MatchClock(period=2, minute=0, second=0),
+                score=Score(home=0, away=0),
+                home_red_cards=0,
+                away_red_cards=0,
+                version=1,
+            )
+        )
+    )
+    session.commit()
+    yield session, plans
+    session.close()
+    engine.dispose()
+
+
+def test_window_bounds_are_inclusive_and_period_scoped(session_and_plans):
+    session, _ = session_and_plans
+    repo = EventRepositoryImpl(session)
+    repo.add_events_if_new(
+        [
+            _event("before", 2, 4, 59),
+            _event("start", 2, 5, 0),
+            _event("inside", 2, 10, 30),
+            _event("end", 2, 15, 0),
+            _event("after", 2, 15, 1),
+            _event("other-period", 1, 10, 0),
+        ]
+    )
+    session.commit()
+
+    events = repo.list_events_in_window(
+        "m1", MatchClock(period=2, minute=15, second=0), RollingWindow(minutes=10)
+    )
+
+    assert [e.event_id for e in events] == ["start", "inside", "end"]
+
+
+def test_period_and_match_windows(session_and_plans):
+    session, _ = session_and_plans
+    repo = EventRepositoryImpl(session)
+    repo.add_events_if_new(
+        [
+            _event("first-half", 1, 40, 0),
+            _event("kickoff", 2, 0, 0),
+            _event("inside", 2, 10, 30),
+            _event("after", 2, 15, 1),
+        ]
+    )
+    session.commit()
+    end = MatchClock(period=2, minute=15, second=0)
+
+    half = repo.list_events_in_window("m1", end, RollingWindow.parse("half"))
+    full = repo.list_events_in_window("m1", end, RollingWindow.parse("full"))
+
+    assert [e.event_id for e in half] == ["kickoff", "inside"]
+    assert [e.event_id for e in full] == ["first-half", "kickoff", "inside"]
+
+
+def test_window_query_is_a_range_seek_on_the_clock_index(session_and_plans):
+    session, plans = session_and_plans
+    repo = EventRepositoryImpl(session)
+    repo.add_events_if_new([_event(f"e{i}", 1, i % 45, i % 60) for i in range(50)])
+    session.commit()
+    plans.clear()
+
+    repo.list_events_in_window(
+        "m1", MatchClock(period=1, minute=30, second=0), RollingWindow(minutes=5)
+    )
+
+    assert any("ix_events_match_period_clock" in p and "clock_seconds>" in p for p in plans), plans
+    assert not any("TEMP B-TREE" in p for p in plans), plans
+
+
+def test_stored_clock_key_orders_across_periods(session_and_plans):
+    session, _ = session_and_plans
+    EventRepositoryImpl(session).add_events_if_new(
+        [_event("second-half", 2, 0, 5), _event("first-half-stoppage", 1, 47, 30)]
+    )
+    session.commit()
+
+    rows = session.query(EventModel).order_by(EventModel.clock_key).all()
+
+    assert [r.event_id for r in rows] == ["first-half-stoppage", "second-half"]
+    assert [r.clock_seconds for r in rows] == [47 * 60 + 30, 5]
+
+
+def test_late_ingest_fetches_every_window_in_one_query(session_and_plans):
+    session, _ = session_and_plans
+    engine = AnalyticsEngine(windows=parse_windows("1m,3m,5m,10m,15m,half,full"))
+    service = IngestEventService(
+        MatchRepositoryImpl(session),
+        EventRepositoryImpl(session),
+        AnalyticsRepositoryImpl(session),
+        engine,
+    )
+    service.ingest(_event("first-half", 1, 40, 0))
+    service.ingest(_event("now", 2, 20, 0))
+    session.commit()
+    engine.invalidate_windows("m1")  # cold state: the late event goes to the DB
+    window_queries: list[str] = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        if "FROM events" in statement and "ORDER BY" in statement:
+            window_queries.append(statement)
+
+    event.listen(session.get_bind(), "before_cursor_execute", _count)
+    _, _, _, snapshot = service.ingest(_event("late", 2, 12, 0))
+
+    assert len(window_queries) == 1
+    assert snapshot.features_by_window["full"]["HOME"]["shots"] == 2
+    assert snapshot.features_by_window["half"]["HOME"]["shots"] == 1
+    assert snapshot.features_by_window["1m"]["HOME"]["shots"] == 1